@@ -0,0 +1,13 @@
+"""
+Shared RGB888 to RGB565 lookup tables for the icon converters.
+Requires: numpy (pip install numpy)
+"""
+
+import numpy as np
+
+# Per-channel lookup tables, computed once at import:
+#   rgb565 = R5[r] | G6[g] | B5[b]
+# Indexing these replaces the per-pixel shift/mask arithmetic.
+R5 = (np.arange(256, dtype=np.uint16) >> 3) << 11
+G6 = (np.arange(256, dtype=np.uint16) >> 2) << 5
+B5 = np.arange(256, dtype=np.uint16) >> 3
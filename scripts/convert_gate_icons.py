@@ -1,12 +1,19 @@
 #!/usr/bin/env python3
 """
 Convert gate JPEG icons to LVGL C arrays with transparent white background
-Requires: pillow (pip install pillow)
+Requires: pillow, numpy (pip install pillow numpy)
 """
 
 import os
+import hashlib
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
 from PIL import Image
 
+import _rgb565
+from _rgb565 import R5, G6, B5
+
 # Icon size for display (96x80 pixels to fill gate card)
 ICON_SIZE = (96, 80)
 
@@ -14,82 +21,100 @@ ICON_SIZE = (96, 80)
 INPUT_DIR = os.path.join(os.path.dirname(__file__), "..", "pictures")
 OUTPUT_DIR = os.path.join(os.path.dirname(__file__), "..", "src", "gate_icons")
 
-def rgb888_to_rgb565(r, g, b):
-    """Convert RGB888 to RGB565"""
-    r5 = (r >> 3) & 0x1F
-    g6 = (g >> 2) & 0x3F
-    b5 = (b >> 3) & 0x1F
-    return (r5 << 11) | (g6 << 5) | b5
+# White pixels (all channels at or above this) become fully transparent
+WHITE_THRESHOLD = 240
+
+def rgb_to_rgb565_alpha(arr):
+    """Convert an (h, w, 3) RGB uint8 array to interleaved RGB565 + alpha bytes,
+    making near-white pixels fully transparent"""
+    rgb565 = R5[arr[..., 0]] | G6[arr[..., 1]] | B5[arr[..., 2]]
 
-def is_white(r, g, b, threshold=240):
-    """Check if pixel is close to white"""
-    return r >= threshold and g >= threshold and b >= threshold
+    # Make white pixels transparent, everything else fully opaque
+    white = np.all(arr >= WHITE_THRESHOLD, axis=-1)
+
+    out = np.empty(arr.shape[:2] + (3,), dtype=np.uint8)
+    out[..., 0] = rgb565 & 0xFF           # Low byte
+    out[..., 1] = rgb565 >> 8             # High byte
+    out[..., 2] = np.where(white, 0, 255) # Alpha
+    return out
+
+def is_up_to_date(output_file, input_path):
+    """Check whether an output is newer than its input, this script, and the
+    shared conversion tables"""
+    return os.path.exists(output_file) and os.path.getmtime(output_file) >= max(
+        os.path.getmtime(input_path), os.path.getmtime(__file__),
+        os.path.getmtime(_rgb565.__file__))
 
 def convert_gate_icon(input_path, output_name):
-    """Convert JPEG gate icon to LVGL C array with transparent white background"""
-    
+    """Convert JPEG gate icon to LVGL image with transparent white background:
+    raw pixel payload + .incbin stub"""
+
+    icon_var = output_name.replace("-", "_")
+    output_file = os.path.join(OUTPUT_DIR, f"{icon_var}.cpp")
+    bin_file = os.path.join(OUTPUT_DIR, f"{icon_var}.bin")
+
+    # Skip regeneration when the source icon, this script, and the shared
+    # conversion tables are all unchanged (covers ICON_SIZE, format, and
+    # conversion-math tweaks)
+    if is_up_to_date(output_file, input_path) and is_up_to_date(bin_file, input_path):
+        return output_file
+
     # Open and resize image
     img = Image.open(input_path)
     img = img.convert("RGB")
     img = img.resize(ICON_SIZE, Image.Resampling.LANCZOS)
-    
+
     # Get pixel data
-    pixels = img.load()
+    arr = np.asarray(img, dtype=np.uint8)
     width, height = img.size
-    
-    # Generate C++ file (required for PROGMEM)
-    icon_var = output_name.replace("-", "_")
-    output_file = os.path.join(OUTPUT_DIR, f"{icon_var}.cpp")
-    
+
+    # Write interleaved data (RGB565 + Alpha) as a raw binary payload
+    # LVGL LV_IMG_CF_TRUE_COLOR_ALPHA expects:
+    # Byte 0: Low 8 bits of RGB565
+    # Byte 1: High 8 bits of RGB565
+    # Byte 2: Alpha (0-255)
+    data = rgb_to_rgb565_alpha(arr)
+    data.tofile(bin_file)
+
+    # Emit a tiny stub that embeds the payload via .incbin, so the C++
+    # compiler never has to parse tens of thousands of hex literals.
+    # The .incbin path is relative to the project root, where PlatformIO
+    # invokes the compiler from.
+    bin_ref = f"src/gate_icons/{icon_var}.bin"
+    buf = []
+    buf.append('#include "lvgl.h"\n')
+    buf.append('#include <Arduino.h>\n\n')
+    buf.append(f'// Gate icon: {output_name} ({width}x{height} RGB565 with alpha)\n')
+    buf.append(f'// Pixel data is embedded from {icon_var}.bin\n')
+    # The payload hash makes the stub's content change with the pixels, so
+    # the build system's up-to-date check recompiles it when the .bin does
+    buf.append(f'// Payload SHA-256: {hashlib.sha256(data.tobytes()).hexdigest()}\n')
+    buf.append('__asm__(\n')
+    buf.append('    ".section .rodata\\n"\n')
+    buf.append('    ".balign 4\\n"\n')
+    buf.append(f'    ".global {icon_var}_data\\n"\n')
+    buf.append(f'    "{icon_var}_data:\\n"\n')
+    buf.append(f'    ".incbin \\"{bin_ref}\\"\\n"\n')
+    buf.append('    ".previous\\n"\n')
+    buf.append(');\n')
+    buf.append(f'extern "C" const uint8_t {icon_var}_data[];\n\n')
+
+    # Write LVGL image descriptor with extern for C++ linkage
+    buf.append(f'extern const lv_img_dsc_t {icon_var} = {{\n')
+    buf.append('    .header = {\n')
+    buf.append('        .cf = LV_IMG_CF_TRUE_COLOR_ALPHA,\n')
+    buf.append('        .always_zero = 0,\n')
+    buf.append('        .reserved = 0,\n')
+    buf.append(f'        .w = {width},\n')
+    buf.append(f'        .h = {height},\n')
+    buf.append('    },\n')
+    buf.append(f'    .data_size = {width * height * 3},\n')
+    buf.append(f'    .data = {icon_var}_data,\n')
+    buf.append('};\n')
+
     with open(output_file, 'w') as f:
-        f.write('#include "lvgl.h"\n')
-        f.write('#include <Arduino.h>\n\n')
-        f.write(f'// Gate icon: {output_name} ({width}x{height} RGB565 with alpha)\n')
-        
-        # Write interleaved data (RGB565 + Alpha)
-        # LVGL LV_IMG_CF_TRUE_COLOR_ALPHA expects:
-        # Byte 0: Low 8 bits of RGB565
-        # Byte 1: High 8 bits of RGB565
-        # Byte 2: Alpha (0-255)
-        
-        f.write(f'const uint8_t {icon_var}_data[] PROGMEM = {{\n')
-        
-        for y in range(height):
-            f.write('    ')
-            for x in range(width):
-                r, g, b = pixels[x, y]
-                
-                # Make white pixels transparent
-                if is_white(r, g, b):
-                    a = 0  # Fully transparent
-                else:
-                    a = 255  # Fully opaque
-                
-                # Convert to RGB565
-                rgb565 = rgb888_to_rgb565(r, g, b)
-                
-                # Write bytes: Low, High, Alpha
-                low_byte = rgb565 & 0xFF
-                high_byte = (rgb565 >> 8) & 0xFF
-                
-                f.write(f'0x{low_byte:02X}, 0x{high_byte:02X}, 0x{a:02X}, ')
-            f.write('\n')
-        
-        f.write('};\n\n')
-        
-        # Write LVGL image descriptor with extern for C++ linkage
-        f.write(f'extern const lv_img_dsc_t {icon_var} = {{\n')
-        f.write('    .header = {\n')
-        f.write('        .cf = LV_IMG_CF_TRUE_COLOR_ALPHA,\n')
-        f.write('        .always_zero = 0,\n')
-        f.write('        .reserved = 0,\n')
-        f.write(f'        .w = {width},\n')
-        f.write(f'        .h = {height},\n')
-        f.write('    },\n')
-        f.write(f'    .data_size = {width * height * 3},\n')
-        f.write(f'    .data = {icon_var}_data,\n')
-        f.write('};\n')
-    
+        f.write(''.join(buf))
+
     return output_file
 
 def create_header():
@@ -121,14 +146,21 @@ def main():
         ("gate-close.jpg", "gate_close"),
     ]
     
-    for filename, output_name in icons:
-        input_path = os.path.join(INPUT_DIR, filename)
-        if os.path.exists(input_path):
-            output_file = convert_gate_icon(input_path, output_name)
+    # Convert both icons in parallel (JPEG decode + LANCZOS resize are CPU-bound)
+    with ProcessPoolExecutor() as executor:
+        futures = {}
+        for filename, output_name in icons:
+            input_path = os.path.join(INPUT_DIR, filename)
+            if os.path.exists(input_path):
+                futures[executor.submit(convert_gate_icon, input_path, output_name)] = (filename, output_name)
+            else:
+                print(f"✗ {filename:20} -> NOT FOUND")
+
+        for future in as_completed(futures):
+            filename, output_name = futures[future]
+            output_file = future.result()
             size_kb = os.path.getsize(output_file) / 1024
             print(f"✓ {filename:20} -> {output_name:20} ({size_kb:.1f} KB)")
-        else:
-            print(f"✗ {filename:20} -> NOT FOUND")
     
     print()
     
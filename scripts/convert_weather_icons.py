@@ -1,13 +1,20 @@
 #!/usr/bin/env python3
 """
 Convert PNG weather icons to LVGL C arrays
-Requires: pillow (pip install pillow)
+Requires: pillow, numpy (pip install pillow numpy)
 """
 
 import os
 import sys
+import hashlib
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
 from PIL import Image
 
+import _rgb565
+from _rgb565 import R5, G6, B5
+
 # Icon size for display (96x96 pixels for larger display)
 ICON_SIZE = (96, 96)
 
@@ -15,71 +22,92 @@ ICON_SIZE = (96, 96)
 INPUT_DIR = os.path.join(os.path.dirname(__file__), "..", "pictures", "weather")
 OUTPUT_DIR = os.path.join(os.path.dirname(__file__), "..", "src", "weather_icons")
 
-def rgb888_to_rgb565(r, g, b):
-    """Convert RGB888 to RGB565"""
-    r5 = (r >> 3) & 0x1F
-    g6 = (g >> 2) & 0x3F
-    b5 = (b >> 3) & 0x1F
-    return (r5 << 11) | (g6 << 5) | b5
+def rgba_to_rgb565_alpha(arr):
+    """Convert an (h, w, 4) RGBA uint8 array to interleaved RGB565 + alpha bytes"""
+    rgb565 = R5[arr[..., 0]] | G6[arr[..., 1]] | B5[arr[..., 2]]
+
+    out = np.empty(arr.shape[:2] + (3,), dtype=np.uint8)
+    out[..., 0] = rgb565 & 0xFF       # Low byte
+    out[..., 1] = rgb565 >> 8         # High byte
+    out[..., 2] = arr[..., 3]         # Alpha
+    return out
+
+def is_up_to_date(output_file, input_path):
+    """Check whether an output is newer than its input, this script, and the
+    shared conversion tables"""
+    return os.path.exists(output_file) and os.path.getmtime(output_file) >= max(
+        os.path.getmtime(input_path), os.path.getmtime(__file__),
+        os.path.getmtime(_rgb565.__file__))
 
 def convert_icon(input_path, output_name):
-    """Convert PNG icon to LVGL C array with alpha channel"""
-    
+    """Convert PNG icon to LVGL image: raw pixel payload + .incbin stub"""
+
+    icon_var = output_name.replace("-", "_")
+    output_file = os.path.join(OUTPUT_DIR, f"{icon_var}.cpp")
+    bin_file = os.path.join(OUTPUT_DIR, f"{icon_var}.bin")
+
+    # Skip regeneration when the source icon, this script, and the shared
+    # conversion tables are all unchanged (covers ICON_SIZE, format, and
+    # conversion-math tweaks)
+    if is_up_to_date(output_file, input_path) and is_up_to_date(bin_file, input_path):
+        return output_file
+
     # Open and resize image
     img = Image.open(input_path)
     img = img.convert("RGBA")  # Ensure RGBA mode
     img = img.resize(ICON_SIZE, Image.Resampling.LANCZOS)
-    
+
     # Get pixel data
-    pixels = img.load()
+    arr = np.asarray(img, dtype=np.uint8)
     width, height = img.size
-    
-    # Generate C++ file (required for PROGMEM)
-    icon_var = output_name.replace("-", "_")
-    output_file = os.path.join(OUTPUT_DIR, f"{icon_var}.cpp")
-    
+
+    # Write interleaved data (RGB565 + Alpha) as a raw binary payload
+    # LVGL LV_IMG_CF_TRUE_COLOR_ALPHA expects:
+    # Byte 0: Low 8 bits of RGB565
+    # Byte 1: High 8 bits of RGB565
+    # Byte 2: Alpha (0-255)
+    data = rgba_to_rgb565_alpha(arr)
+    data.tofile(bin_file)
+
+    # Emit a tiny stub that embeds the payload via .incbin, so the C++
+    # compiler never has to parse tens of thousands of hex literals.
+    # The .incbin path is relative to the project root, where PlatformIO
+    # invokes the compiler from.
+    bin_ref = f"src/weather_icons/{icon_var}.bin"
+    buf = []
+    buf.append('#include "lvgl.h"\n')
+    buf.append('#include <Arduino.h>\n\n')
+    buf.append(f'// Weather icon: {output_name} ({width}x{height} RGB565 with alpha)\n')
+    buf.append(f'// Pixel data is embedded from {icon_var}.bin\n')
+    # The payload hash makes the stub's content change with the pixels, so
+    # the build system's up-to-date check recompiles it when the .bin does
+    buf.append(f'// Payload SHA-256: {hashlib.sha256(data.tobytes()).hexdigest()}\n')
+    buf.append('__asm__(\n')
+    buf.append('    ".section .rodata\\n"\n')
+    buf.append('    ".balign 4\\n"\n')
+    buf.append(f'    ".global {icon_var}_data\\n"\n')
+    buf.append(f'    "{icon_var}_data:\\n"\n')
+    buf.append(f'    ".incbin \\"{bin_ref}\\"\\n"\n')
+    buf.append('    ".previous\\n"\n')
+    buf.append(');\n')
+    buf.append(f'extern "C" const uint8_t {icon_var}_data[];\n\n')
+
+    # Write LVGL image descriptor with extern for C++ linkage
+    buf.append(f'extern const lv_img_dsc_t {icon_var} = {{\n')
+    buf.append('    .header = {\n')
+    buf.append('        .cf = LV_IMG_CF_TRUE_COLOR_ALPHA,\n')
+    buf.append('        .always_zero = 0,\n')
+    buf.append('        .reserved = 0,\n')
+    buf.append(f'        .w = {width},\n')
+    buf.append(f'        .h = {height},\n')
+    buf.append('    },\n')
+    buf.append(f'    .data_size = {width * height * 3},\n')
+    buf.append(f'    .data = {icon_var}_data,\n')
+    buf.append('};\n')
+
     with open(output_file, 'w') as f:
-        f.write('#include "lvgl.h"\n')
-        f.write('#include <Arduino.h>\n\n')
-        f.write(f'// Weather icon: {output_name} ({width}x{height} RGB565 with alpha)\n')
-        
-        # Write interleaved data (RGB565 + Alpha)
-        # LVGL LV_IMG_CF_TRUE_COLOR_ALPHA expects:
-        # Byte 0: Low 8 bits of RGB565
-        # Byte 1: High 8 bits of RGB565
-        # Byte 2: Alpha (0-255)
-        
-        f.write(f'const uint8_t {icon_var}_data[] PROGMEM = {{\n')
-        
-        for y in range(height):
-            f.write('    ')
-            for x in range(width):
-                r, g, b, a = pixels[x, y]
-                # Convert to RGB565
-                rgb565 = rgb888_to_rgb565(r, g, b)
-                
-                # Write bytes: Low, High, Alpha
-                low_byte = rgb565 & 0xFF
-                high_byte = (rgb565 >> 8) & 0xFF
-                
-                f.write(f'0x{low_byte:02X}, 0x{high_byte:02X}, 0x{a:02X}, ')
-            f.write('\n')
-        
-        f.write('};\n\n')
-        
-        # Write LVGL image descriptor with extern for C++ linkage
-        f.write(f'extern const lv_img_dsc_t {icon_var} = {{\n')
-        f.write('    .header = {\n')
-        f.write('        .cf = LV_IMG_CF_TRUE_COLOR_ALPHA,\n')
-        f.write('        .always_zero = 0,\n')
-        f.write('        .reserved = 0,\n')
-        f.write(f'        .w = {width},\n')
-        f.write(f'        .h = {height},\n')
-        f.write('    },\n')
-        f.write(f'    .data_size = {width * height * 3},\n')
-        f.write(f'    .data = {icon_var}_data,\n')
-        f.write('};\n')
-    
+        f.write(''.join(buf))
+
     return output_file
 
 def create_header():
@@ -141,22 +169,31 @@ def main():
         "thunder-rain.png": "thunder_rain",
     }
     
+    # Each conversion is independent and CPU-bound, so fan out across cores
     converted = []
-    for input_name, output_name in icons.items():
-        input_path = os.path.join(INPUT_DIR, input_name)
-        
-        if not os.path.exists(input_path):
-            print(f"⚠ Skipping {input_name} (not found)")
-            continue
-        
-        try:
-            output_file = convert_icon(input_path, output_name)
-            size = os.path.getsize(output_file)
-            print(f"✓ {output_name:20} -> {os.path.basename(output_file):25} ({size:,} bytes)")
-            converted.append(output_name)
-        except Exception as e:
-            print(f"✗ {output_name:20} Failed: {e}")
-    
+    failed_count = 0
+    with ProcessPoolExecutor() as executor:
+        futures = {}
+        for input_name, output_name in icons.items():
+            input_path = os.path.join(INPUT_DIR, input_name)
+
+            if not os.path.exists(input_path):
+                print(f"⚠ Skipping {input_name} (not found)")
+                continue
+
+            futures[executor.submit(convert_icon, input_path, output_name)] = output_name
+
+        for future in as_completed(futures):
+            output_name = futures[future]
+            try:
+                output_file = future.result()
+                size = os.path.getsize(output_file)
+                print(f"✓ {output_name:20} -> {os.path.basename(output_file):25} ({size:,} bytes)")
+                converted.append(output_name)
+            except Exception as e:
+                print(f"✗ {output_name:20} Failed: {e}")
+                failed_count += 1
+
     if converted:
         header_file = create_header()
         print("-" * 60)
@@ -165,7 +202,12 @@ def main():
         print("\nTo use in code:")
         print('  #include "weather_icons/weather_icons.h"')
         print('  lv_img_set_src(img, &clear_day);')
-    
+
+    # A failed conversion must fail the build, not leave a stale icon behind
+    if failed_count > 0:
+        print(f"\nFailed: {failed_count} icons")
+        return 1
+
     return 0
 
 if __name__ == "__main__":
@@ -3,11 +3,14 @@
 Download weather icons from Visual Crossing Weather Icons repository
 https://github.com/visualcrossing/WeatherIcons
 License: LGPL-3.0
+Requires: requests (pip install requests)
 """
 
 import os
-import urllib.request
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import requests
 
 # Base URL for PNG icons (1st Set - Color)
 BASE_URL = "https://raw.githubusercontent.com/visualcrossing/WeatherIcons/main/PNG/1st%20Set%20-%20Color/"
@@ -41,21 +44,51 @@ def download_icons():
     
     success_count = 0
     failed_count = 0
-    
-    for icon_name in ICONS:
+
+    # One session reuses a single TCP/TLS connection to GitHub for all icons
+    session = requests.Session()
+
+    def download_icon(icon_name):
+        """Fetch one icon; returns (icon_name, size or None, cached, error or None)"""
         url = BASE_URL + icon_name
         output_path = os.path.join(OUTPUT_DIR, icon_name)
-        
+        etag_path = output_path + ".etag"
+
+        # Send the cached ETag so GitHub can answer 304 for unchanged icons
+        headers = {}
+        if os.path.exists(output_path) and os.path.exists(etag_path):
+            with open(etag_path) as f:
+                headers["If-None-Match"] = f.read().strip()
+
         try:
-            print(f"Downloading {icon_name}...", end=" ")
-            urllib.request.urlretrieve(url, output_path)
-            size = os.path.getsize(output_path)
-            print(f"✓ ({size:,} bytes)")
-            success_count += 1
+            response = session.get(url, headers=headers, timeout=30)
+            if response.status_code == 304:
+                return icon_name, os.path.getsize(output_path), True, None
+            response.raise_for_status()
+
+            with open(output_path, 'wb') as f:
+                f.write(response.content)
+            etag = response.headers.get("ETag")
+            if etag:
+                with open(etag_path, 'w') as f:
+                    f.write(etag)
+            return icon_name, len(response.content), False, None
         except Exception as e:
-            print(f"✗ Failed: {e}")
-            failed_count += 1
-    
+            return icon_name, None, False, e
+
+    # Fetch all icons concurrently so downloads overlap network latency
+    with ThreadPoolExecutor(max_workers=len(ICONS)) as executor:
+        futures = [executor.submit(download_icon, icon_name) for icon_name in ICONS]
+        for future in as_completed(futures):
+            icon_name, size, cached, error = future.result()
+            if error is None:
+                status = "unchanged" if cached else f"{size:,} bytes"
+                print(f"✓ {icon_name} ({status})")
+                success_count += 1
+            else:
+                print(f"✗ {icon_name} Failed: {error}")
+                failed_count += 1
+
     print("-" * 60)
     print(f"Downloaded: {success_count}/{len(ICONS)} icons")
     
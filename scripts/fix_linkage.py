@@ -1,31 +1,37 @@
 import os
 import glob
+import re
+
+# Remove only the extern "C" guard pair emitted by the LVGL image converter.
+# A blanket '}\n' replace would also strip struct/function terminators.
+EXTERN_C_OPEN_RE = re.compile(r'#ifdef __cplusplus\s*\nextern "C" \{\s*\n#endif\s*\n')
+EXTERN_C_CLOSE_RE = re.compile(r'#ifdef __cplusplus\s*\n\}\s*\n#endif\s*\n')
+
+# Add extern to const definitions for C++ external linkage
+# Match: const lv_img_dsc_t name = {
+EXTERN_RE = re.compile(r'^(const lv_img_dsc_t \w+ = \{)', re.MULTILINE)
+
+# Collapse runs of blank lines left behind by the removals
+MULTI_NEWLINE_RE = re.compile(r'\n{3,}')
 
 def fix_file(filepath):
     with open(filepath, 'r') as f:
         content = f.read()
     
     # Remove extern "C" blocks
-    content = content.replace('#ifdef __cplusplus\nextern "C" {\n#endif\n', '')
-    content = content.replace('#ifdef __cplusplus\n}\n#endif\n', '')
-    content = content.replace('extern "C" {\n', '')
-    content = content.replace('}\n', '')
-    
-    # Add extern to const definitions for C++ external linkage
-    # Match: const lv_img_dsc_t name = {
-    lines = content.splitlines()
-    new_lines = []
-    for line in lines:
-        if line.startswith('const lv_img_dsc_t ') and ' = {' in line:
-            line = 'extern ' + line
-        new_lines.append(line)
-    
-    new_content = '\n'.join(new_lines)
-    
-    # Clean up multiple newlines
-    while '\n\n\n' in new_content:
-        new_content = new_content.replace('\n\n\n', '\n\n')
-        
+    new_content = EXTERN_C_OPEN_RE.sub('', content)
+    new_content = EXTERN_C_CLOSE_RE.sub('', new_content)
+
+    new_content = EXTERN_RE.sub(r'extern \1', new_content)
+
+    new_content = MULTI_NEWLINE_RE.sub('\n\n', new_content)
+
+    # Skip the write when already fixed, leaving the mtime alone so
+    # PlatformIO does not recompile untouched files
+    if new_content == content:
+        print(f"Already fixed {filepath}")
+        return
+
     with open(filepath, 'w') as f:
         f.write(new_content)
     print(f"Fixed {filepath}")
@@ -41,8 +47,11 @@ for f in glob.glob('src/weather_icons/*.cpp'):
 header_path = 'src/weather_icons/weather_icons.h'
 with open(header_path, 'r') as f:
     content = f.read()
-content = content.replace('#ifdef __cplusplus\nextern "C" {\n#endif\n', '')
-content = content.replace('#ifdef __cplusplus\n}\n#endif\n', '')
-with open(header_path, 'w') as f:
-    f.write(content)
-print(f"Fixed {header_path}")
+new_content = EXTERN_C_OPEN_RE.sub('', content)
+new_content = EXTERN_C_CLOSE_RE.sub('', new_content)
+if new_content != content:
+    with open(header_path, 'w') as f:
+        f.write(new_content)
+    print(f"Fixed {header_path}")
+else:
+    print(f"Already fixed {header_path}")
@@ -6,9 +6,11 @@ Downloads Montserrat font and generates C files for LVGL.
 
 import os
 import sys
+import shutil
 import subprocess
 import urllib.request
 import ssl
+import hashlib
 from pathlib import Path
 
 # Disable SSL verification for font download
@@ -23,6 +25,8 @@ SRC_DIR = PROJECT_ROOT / "src"
 # Font configuration
 MONTSERRAT_URL = "https://github.com/JulietaUla/Montserrat/raw/master/fonts/ttf/Montserrat-Regular.ttf"
 FONT_FILE = FONTS_DIR / "Montserrat-Regular.ttf"
+# SHA-256 of the pinned Montserrat-Regular.ttf
+MONTSERRAT_SHA256 = "3e8abe50c44c82e2242e97d1ec8c0d385c4890cdc50447bcdb8605c81a38cfb2"
 
 # Font sizes to generate with extended character support
 FONT_SIZES = [20]  # 20pt for person names
@@ -33,16 +37,42 @@ FONT_SIZES = [20]  # 20pt for person names
 # Latin Extended-A: 0x100-0x17F (Ā to ſ) - includes ā, ē, ī, ō, ū, etc.
 CHAR_RANGES = "0x20-0x7F,0xA0-0xFF,0x100-0x17F"
 
+def sha256_of(path):
+    """Compute the SHA-256 hex digest of a file, streaming in 1MB chunks."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        while chunk := f.read(1 << 20):
+            digest.update(chunk)
+    return digest.hexdigest()
+
 def download_font():
-    """Download Montserrat font if not already present."""
+    """Download Montserrat font if not already present and verified."""
     if FONT_FILE.exists():
-        print(f"✓ Font already exists: {FONT_FILE}")
-        return True
-    
+        if sha256_of(FONT_FILE) == MONTSERRAT_SHA256:
+            print(f"✓ Font already exists: {FONT_FILE}")
+            return True
+        print(f"! Existing font failed checksum, re-downloading: {FONT_FILE}")
+
     print(f"→ Downloading Montserrat font...")
     try:
         FONTS_DIR.mkdir(parents=True, exist_ok=True)
-        urllib.request.urlretrieve(MONTSERRAT_URL, FONT_FILE)
+
+        # Stream into a temp file, hashing as we go, and only move it into
+        # place once the checksum matches — a failed download never leaves
+        # a partial or tampered font behind
+        tmp_file = FONT_FILE.with_suffix(".ttf.part")
+        digest = hashlib.sha256()
+        with urllib.request.urlopen(MONTSERRAT_URL) as response, open(tmp_file, 'wb') as f:
+            while chunk := response.read(1 << 20):
+                digest.update(chunk)
+                f.write(chunk)
+
+        if digest.hexdigest() != MONTSERRAT_SHA256:
+            tmp_file.unlink()
+            print(f"✗ Downloaded font failed SHA-256 verification")
+            return False
+
+        os.replace(tmp_file, FONT_FILE)
         print(f"✓ Downloaded to: {FONT_FILE}")
         return True
     except Exception as e:
@@ -51,9 +81,13 @@ def download_font():
 
 def check_lv_font_conv():
     """Check if lv_font_conv is installed."""
+    # A PATH lookup is microseconds; only fall back to spawning the tool
+    # (Node startup is ~300ms) when which() comes up empty
+    if shutil.which("lv_font_conv"):
+        return True
     try:
-        result = subprocess.run(["lv_font_conv", "--help"], 
-                              capture_output=True, 
+        result = subprocess.run(["lv_font_conv", "--help"],
+                              capture_output=True,
                               text=True)
         return result.returncode == 0
     except FileNotFoundError:
@@ -81,7 +115,14 @@ def install_lv_font_conv():
 def generate_font(size):
     """Generate LVGL font C file for specified size."""
     output_file = SRC_DIR / f"montserrat_extended_{size}.c"
-    
+
+    # Skip regeneration when neither the TTF nor this script changed
+    # (the script mtime covers CHAR_RANGES and bpp tweaks)
+    if output_file.exists() and output_file.stat().st_mtime >= max(
+            FONT_FILE.stat().st_mtime, Path(__file__).stat().st_mtime):
+        print(f"✓ Up to date: {output_file}")
+        return True
+
     print(f"→ Generating {size}pt font with Latin Extended support...")
     
     cmd = [
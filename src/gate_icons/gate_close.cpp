@@ -2,88 +2,17 @@
 #include <Arduino.h>
 
 // Gate icon: gate_close (96x80 RGB565 with alpha)
-const uint8_t gate_close_data[] PROGMEM = {
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFE, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0x9C, 0xFF, 0xFF, 0x19, 0xF7, 0xFF, 0x95, 0xEE, 0xFF, 0x12, 0xEE, 0xFF, 0xAF, 0xED, 0xFF, 0x6C, 0xE5, 0xFF, 0xE8, 0xCB, 0xFF, 0x2E, 0xDD, 0xFF, 0x6C, 0xE5, 0xFF, 0x4C, 0xE5, 0xFF, 0x8E, 0xE5, 0xFF, 0x11, 0xEE, 0xFF, 0xB6, 0xF6, 0xFF, 0x5B, 0xF7, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFE, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFE, 0xFF, 0x00, 0x96, 0xFF, 0xFF, 0x94, 0xFF, 0xFF, 0x74, 0xFF, 0xFF, 0x93, 0xFF, 0xFF, 0x95, 0xFF, 0xFF, 0xDD, 0xFF, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xDE, 0xFF, 0x00, 0x3A, 0xF7, 0xFF, 0x75, 0xEE, 0xFF, 0xAF, 0xED, 0xFF, 0x0B, 0xE5, 0xFF, 0xA7, 0xDC, 0xFF, 0x45, 0xDC, 0xFF, 0x04, 0xDC, 0xFF, 0xE4, 0xD3, 0xFF, 0xE4, 0xDB, 0xFF, 0x41, 0xAA, 0xFF, 0x84, 0xCB, 0xFF, 0x04, 0xDC, 0xFF, 0xC3, 0xD3, 0xFF, 0xE3, 0xDB, 0xFF, 0xE3, 0xDB, 0xFF, 0xE4, 0xD3, 0xFF, 0x46, 0xDC, 0xFF, 0xCA, 0xDC, 0xFF, 0xB0, 0xE5, 0xFF, 0xB7, 0xF6, 0xFF, 0xBD, 0xFF, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xBB, 0xFF, 0xFF, 0x32, 0xF7, 0xFF, 0xEC, 0xF6, 0xFF, 0xCB, 0xF6, 0xFF, 0xCF, 0xF6, 0xFF, 0x37, 0xF7, 0xFF, 0xFE, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xDD, 0xFF, 0xFF, 0x2E, 0xFF, 0xFF, 0x2C, 0xFF, 0xFF, 0x54, 0xFF, 0xFF, 0x76, 0xFF, 0xFF, 0x53, 0xFF, 0xFF, 0x2D, 0xFF, 0xFF, 0x2E, 0xFF, 0xFF, 0xBA, 0xFF, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0x5B, 0xF7, 0xFF, 0x74, 0xEE, 0xFF, 0x6E, 0xE5, 0xFF, 0xA8, 0xDC, 0xFF, 0x45, 0xDC, 0xFF, 0x03, 0xDC, 0xFF, 0xA3, 0xD3, 0xFF, 0x42, 0xCB, 0xFF, 0xA2, 0xB2, 0xFF, 0x02, 0xC3, 0xFF, 0xE4, 0xD3, 0xFF, 0xE4, 0xDB, 0xFF, 0x42, 0xAA, 0xFF, 0x84, 0xCB, 0xFF, 0x04, 0xDC, 0xFF, 0x83, 0xCB, 0xFF, 0x82, 0xB2, 0xFF, 0xA2, 0xBA, 0xFF, 0x43, 0xCB, 0xFF, 0x83, 0xD3, 0xFF, 0xA3, 0xD3, 0xFF, 0xA3, 0xD3, 0xFF, 0xC4, 0xD3, 0xFF, 0x67, 0xDC, 0xFF, 0x8F, 0xE5, 0xFF, 0xD8, 0xF6, 0xFF, 0xDF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0x98, 0xFF, 0xFF, 0xEE, 0xF6, 0xFF, 0xCE, 0xF6, 0xFF, 0xA9, 0xF6, 0xFF, 0x65, 0xF6, 0xFF, 0x46, 0xEE, 0xFF, 0x0A, 0xEE, 0xFF, 0x71, 0xEE, 0xFF, 0xDE, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0x11, 0xF7, 0xFF, 0xA5, 0xF6, 0xFF, 0xE8, 0xF6, 0xFF, 0x0C, 0xF7, 0xFF, 0x0D, 0xF7, 0xFF, 0xEB, 0xF6, 0xFF, 0xEA, 0xF6, 0xFF, 0xC8, 0xF6, 0xFF, 0xCA, 0xF6, 0xFF, 0xDD, 0xFF, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xBE, 0xFF, 0x00, 0xD7, 0xF6, 0xFF, 0xAF, 0xE5, 0xFF, 0xC9, 0xDC, 0xFF, 0x25, 0xDC, 0xFF, 0x04, 0xD4, 0xFF, 0xC3, 0xD3, 0xFF, 0xC2, 0xBA, 0xFF, 0xE1, 0x99, 0xFF, 0x40, 0x89, 0xFF, 0xE0, 0x80, 0xFF, 0x60, 0x68, 0xFF, 0xE1, 0x99, 0xFF, 0x24, 0xDC, 0xFF, 0xC4, 0xD3, 0xFF, 0x42, 0xAA, 0xFF, 0x64, 0xCB, 0xFF, 0xE4, 0xDB, 0xFF, 0x23, 0xCB, 0xFF, 0xE0, 0x78, 0xFF, 0x80, 0x68, 0xFF, 0xE0, 0x78, 0xFF, 0x40, 0x89, 0xFF, 0x01, 0xA2, 0xFF, 0xE2, 0xC2, 0xFF, 0x83, 0xD3, 0xFF, 0x63, 0xCB, 0xFF, 0x62, 0xCB, 0xFF, 0xA4, 0xD3, 0xFF, 0x8A, 0xDC, 0xFF, 0x34, 0xEE, 0xFF, 0xBD, 0xFF, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xDC, 0xFF, 0xFF, 0xCB, 0xF6, 0xFF, 0xCF, 0xF6, 0xFF, 0xD1, 0xF6, 0xFF, 0x69, 0xEE, 0xFF, 0x05, 0xEE, 0xFF, 0xC5, 0xED, 0xFF, 0xA7, 0xE5, 0xFF, 0x67, 0xDD, 0xFF, 0x92, 0xEE, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xDE, 0xFF, 0x00, 0x07, 0xEE, 0xFF, 0x03, 0xEE, 0xFF, 0x23, 0xEE, 0xFF, 0x43, 0xEE, 0xFF, 0x43, 0xEE, 0xFF, 0x44, 0xEE, 0xFF, 0x24, 0xEE, 0xFF, 0x24, 0xEE, 0xFF, 0xC2, 0xED, 0xFF, 0x57, 0xF7, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xBD, 0xFF, 0xFF, 0xB6, 0xF6, 0xFF, 0x6D, 0xE5, 0xFF, 0x87, 0xDC, 0xFF, 0x04, 0xDC, 0xFF, 0xA3, 0xD3, 0xFF, 0xC4, 0xD3, 0xFF, 0x04, 0xDC, 0xFF, 0x02, 0xC3, 0xFF, 0xE0, 0x80, 0xFF, 0x00, 0x89, 0xFF, 0x81, 0x99, 0xFF, 0xE1, 0xA9, 0xFF, 0xC1, 0xA9, 0xFF, 0xA2, 0xBA, 0xFF, 0x04, 0xDC, 0xFF, 0xC4, 0xD3, 0xFF, 0x42, 0xAA, 0xFF, 0x64, 0xC3, 0xFF, 0xE4, 0xDB, 0xFF, 0x23, 0xC3, 0xFF, 0xA1, 0x99, 0xFF, 0x01, 0xAA, 0xFF, 0x01, 0xAA, 0xFF, 0x61, 0x99, 0xFF, 0xC0, 0x78, 0xFF, 0x60, 0x91, 0xFF, 0x83, 0xD3, 0xFF, 0x63, 0xCB, 0xFF, 0x43, 0xCB, 0xFF, 0x43, 0xD3, 0xFF, 0x62, 0xD3, 0xFF, 0x63, 0xCB, 0xFF, 0x27, 0xD4, 0xFF, 0xF3, 0xED, 0xFF, 0xBD, 0xFF, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0x55, 0xFF, 0xFF, 0x64, 0xF6, 0xFF, 0x67, 0xF6, 0xFF, 0x26, 0xEE, 0xFF, 0xE3, 0xED, 0xFF, 0x62, 0xE5, 0xFF, 0x03, 0xDD, 0xFF, 0xE3, 0xDC, 0xFF, 0xC2, 0xD4, 0xFF, 0x68, 0xDD, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xDE, 0xFF, 0x00, 0x25, 0xDD, 0xFF, 0x00, 0xDD, 0xFF, 0x41, 0xE5, 0xFF, 0x41, 0xE5, 0xFF, 0x61, 0xE5, 0xFF, 0x61, 0xE5, 0xFF, 0x41, 0xE5, 0xFF, 0x41, 0xE5, 0xFF, 0xE0, 0xE4, 0xFF, 0x17, 0xF7, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xDE, 0xFF, 0x00, 0xB6, 0xF6, 0xFF, 0x4C, 0xE5, 0xFF, 0x66, 0xDC, 0xFF, 0x03, 0xDC, 0xFF, 0x62, 0xD3, 0xFF, 0x21, 0xAA, 0xFF, 0x81, 0x91, 0xFF, 0xA3, 0xD3, 0xFF, 0x04, 0xDC, 0xFF, 0xE2, 0xBA, 0xFF, 0xC1, 0xA1, 0xFF, 0xC2, 0xC2, 0xFF, 0x22, 0xCB, 0xFF, 0x82, 0xD3, 0xFF, 0x82, 0xD3, 0xFF, 0x62, 0xD3, 0xFF, 0xE4, 0xD3, 0xFF, 0xC4, 0xD3, 0xFF, 0x22, 0xAA, 0xFF, 0x43, 0xC3, 0xFF, 0xE4, 0xD3, 0xFF, 0x03, 0xC3, 0xFF, 0x01, 0xAA, 0xFF, 0x42, 0xD3, 0xFF, 0xC2, 0xDB, 0xFF, 0xA2, 0xDB, 0xFF, 0x02, 0xCB, 0xFF, 0x81, 0xBA, 0xFF, 0xA4, 0xD3, 0xFF, 0x63, 0xCB, 0xFF, 0x82, 0xB2, 0xFF, 0x40, 0x81, 0xFF, 0x62, 0xB2, 0xFF, 0x23, 0xCB, 0xFF, 0x43, 0xCB, 0xFF, 0x42, 0xCB, 0xFF, 0x07, 0xD4, 0xFF, 0x14, 0xEE, 0xFF, 0xDE, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0x33, 0xF7, 0xFF, 0xE0, 0xED, 0xFF, 0xE2, 0xED, 0xFF, 0x81, 0xE5, 0xFF, 0x21, 0xE5, 0xFF, 0xC1, 0xDC, 0xFF, 0x61, 0xD4, 0xFF, 0x41, 0xD4, 0xFF, 0x40, 0xD4, 0xFF, 0x28, 0xDD, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0x30, 0xE6, 0xFF, 0xA0, 0xD4, 0xFF, 0x64, 0xE5, 0xFF, 0x64, 0xE5, 0xFF, 0x84, 0xE5, 0xFF, 0x64, 0xE5, 0xFF, 0x64, 0xE5, 0xFF, 0x01, 0xE5, 0xFF, 0x46, 0xE5, 0xFF, 0xBD, 0xFF, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xD8, 0xF6, 0xFF, 0x4D, 0xE5, 0xFF, 0x45, 0xDC, 0xFF, 0xE3, 0xDB, 0xFF, 0x42, 0xCB, 0xFF, 0x21, 0xAA, 0xFF, 0x00, 0x81, 0xFF, 0xA0, 0x70, 0xFF, 0x20, 0x81, 0xFF, 0xC4, 0xD3, 0xFF, 0xE4, 0xDB, 0xFF, 0xE3, 0xC2, 0xFF, 0x41, 0xBA, 0xFF, 0xE2, 0xDB, 0xFF, 0x43, 0xE4, 0xFF, 0x63, 0xE4, 0xFF, 0x63, 0xE4, 0xFF, 0xC2, 0xDB, 0xFF, 0xC4, 0xD3, 0xFF, 0xA3, 0xD3, 0xFF, 0x22, 0xAA, 0xFF, 0x43, 0xC3, 0xFF, 0xC3, 0xD3, 0xFF, 0x03, 0xC3, 0xFF, 0x21, 0xB2, 0xFF, 0xA2, 0xD3, 0xFF, 0x42, 0xDC, 0xFF, 0x43, 0xE4, 0xFF, 0x22, 0xE4, 0xFF, 0x82, 0xD3, 0xFF, 0xA4, 0xD3, 0xFF, 0x63, 0xCB, 0xFF, 0x62, 0xB2, 0xFF, 0xA0, 0x68, 0xFF, 0xA0, 0x70, 0xFF, 0x20, 0x81, 0xFF, 0x41, 0xAA, 0xFF, 0x22, 0xCB, 0xFF, 0x22, 0xCB, 0xFF, 0x22, 0xCB, 0xFF, 0x49, 0xD4, 0xFF, 0x96, 0xEE, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0x9B, 0xFF, 0xFF, 0x83, 0xE5, 0xFF, 0x61, 0xE5, 0xFF, 0x43, 0xE5, 0xFF, 0xE3, 0xDC, 0xFF, 0xA3, 0xDC, 0xFF, 0x82, 0xD4, 0xFF, 0x62, 0xD4, 0xFF, 0xE0, 0xCB, 0xFF, 0x73, 0xE6, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0x50, 0xEE, 0xFF, 0x03, 0xDD, 0xFF, 0xE2, 0xDC, 0xFF, 0x02, 0xE5, 0xFF, 0x02, 0xE5, 0xFF, 0x02, 0xE5, 0xFF, 0x88, 0xE5, 0xFF, 0x7A, 0xFF, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0x7B, 0xF7, 0xFF, 0xAF, 0xED, 0xFF, 0x46, 0xDC, 0xFF, 0xE4, 0xD3, 0xFF, 0xC3, 0xD3, 0xFF, 0x61, 0xB2, 0xFF, 0x00, 0x81, 0xFF, 0x00, 0x89, 0xFF, 0xA1, 0xA1, 0xFF, 0x21, 0xB2, 0xFF, 0x41, 0xBA, 0xFF, 0xC3, 0xD3, 0xFF, 0xE4, 0xD3, 0xFF, 0xC2, 0xC2, 0xFF, 0xA1, 0xC2, 0xFF, 0x63, 0xE4, 0xFF, 0x83, 0xE4, 0xFF, 0xA3, 0xE4, 0xFF, 0x83, 0xE4, 0xFF, 0xC2, 0xDB, 0xFF, 0xA4, 0xD3, 0xFF, 0xA3, 0xD3, 0xFF, 0x22, 0xAA, 0xFF, 0x23, 0xC3, 0xFF, 0xC3, 0xD3, 0xFF, 0xE3, 0xC2, 0xFF, 0x21, 0xB2, 0xFF, 0xA2, 0xDB, 0xFF, 0x63, 0xE4, 0xFF, 0x63, 0xE4, 0xFF, 0x62, 0xE4, 0xFF, 0xC2, 0xDB, 0xFF, 0x83, 0xD3, 0xFF, 0x63, 0xCB, 0xFF, 0x62, 0xB2, 0xFF, 0xC1, 0xA9, 0xFF, 0x61, 0xB2, 0xFF, 0xA1, 0x99, 0xFF, 0xE0, 0x80, 0xFF, 0x20, 0x89, 0xFF, 0xA2, 0xBA, 0xFF, 0x23, 0xCB, 0xFF, 0x02, 0xC3, 0xFF, 0x23, 0xCB, 0xFF, 0xED, 0xDC, 0xFF, 0x5C, 0xF7, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0x38, 0xF7, 0xFF, 0x67, 0xE5, 0xFF, 0xE2, 0xDC, 0xFF, 0xA1, 0xDC, 0xFF, 0x61, 0xDC, 0xFF, 0x21, 0xD4, 0xFF, 0x22, 0xD4, 0xFF, 0x11, 0xE6, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0x7E, 0xEF, 0xFF, 0x3D, 0xE7, 0xFF, 0x5D, 0xEF, 0xFF, 0x5E, 0xEF, 0xFF, 0xF4, 0xD5, 0xFF, 0x8D, 0xBC, 0xFF, 0xCE, 0xC4, 0xFF, 0xCD, 0xC4, 0xFF, 0x2F, 0xCD, 0xFF, 0xFB, 0xE6, 0xFF, 0x7E, 0xEF, 0xFF, 0x5D, 0xEF, 0xFF, 0x7D, 0xEF, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xDE, 0xFF, 0x00, 0x74, 0xEE, 0xFF, 0xA8, 0xDC, 0xFF, 0xE4, 0xDB, 0xFF, 0xC3, 0xD3, 0xFF, 0xE4, 0xD3, 0xFF, 0x63, 0xCB, 0xFF, 0x40, 0x91, 0xFF, 0xA1, 0xA1, 0xFF, 0x81, 0xC2, 0xFF, 0x02, 0xCB, 0xFF, 0x82, 0xD3, 0xFF, 0x62, 0xD3, 0xFF, 0xA3, 0xD3, 0xFF, 0xC4, 0xD3, 0xFF, 0xC2, 0xBA, 0xFF, 0xC1, 0xC2, 0xFF, 0x83, 0xE4, 0xFF, 0xA3, 0xE4, 0xFF, 0xA3, 0xE4, 0xFF, 0xA3, 0xE4, 0xFF, 0xC2, 0xDB, 0xFF, 0xA4, 0xD3, 0xFF, 0xA3, 0xD3, 0xFF, 0x22, 0xAA, 0xFF, 0x23, 0xC3, 0xFF, 0xC3, 0xD3, 0xFF, 0xE3, 0xC2, 0xFF, 0x21, 0xB2, 0xFF, 0xA2, 0xDB, 0xFF, 0x63, 0xE4, 0xFF, 0x63, 0xE4, 0xFF, 0x62, 0xE4, 0xFF, 0xC2, 0xDB, 0xFF, 0x83, 0xD3, 0xFF, 0x63, 0xCB, 0xFF, 0x62, 0xB2, 0xFF, 0x21, 0xB2, 0xFF, 0x62, 0xD3, 0xFF, 0xA2, 0xDB, 0xFF, 0x02, 0xCB, 0xFF, 0xA0, 0xA1, 0xFF, 0x01, 0xAA, 0xFF, 0x43, 0xCB, 0xFF, 0x03, 0xC3, 0xFF, 0x03, 0xC3, 0xFF, 0xE2, 0xC2, 0xFF, 0x86, 0xCB, 0xFF, 0xF4, 0xE5, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0x9E, 0xF7, 0x00, 0x7D, 0xEF, 0xFF, 0x9E, 0xEF, 0xFF, 0x1A, 0xE7, 0xFF, 0x6F, 0xD5, 0xFF, 0xCD, 0xC4, 0xFF, 0x6D, 0xBC, 0xFF, 0x2C, 0xB4, 0xFF, 0xB4, 0xCD, 0xFF, 0x1C, 0xDF, 0xFF, 0xFB, 0xDE, 0xFF, 0xDB, 0xDE, 0xFF, 0x7D, 0xEF, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0x9A, 0xD6, 0xFF, 0xD7, 0xBD, 0xFF, 0x18, 0xC6, 0xFF, 0x18, 0xC6, 0xFF, 0x7A, 0xC6, 0xFF, 0x9B, 0xCE, 0xFF, 0x9B, 0xCE, 0xFF, 0x9B, 0xCE, 0xFF, 0x9B, 0xCE, 0xFF, 0x59, 0xCE, 0xFF, 0x38, 0xC6, 0xFF, 0x38, 0xC6, 0xFF, 0x59, 0xD6, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0x39, 0xF7, 0xFF, 0x4C, 0xE5, 0xFF, 0x24, 0xDC, 0xFF, 0xA3, 0xD3, 0xFF, 0xE2, 0xC2, 0xFF, 0x42, 0xCB, 0xFF, 0xC4, 0xD3, 0xFF, 0x43, 0xCB, 0xFF, 0xE1, 0xA9, 0xFF, 0xE1, 0xCA, 0xFF, 0xA2, 0xD3, 0xFF, 0x22, 0xDC, 0xFF, 0x43, 0xE4, 0xFF, 0xC2, 0xDB, 0xFF, 0x83, 0xD3, 0xFF, 0xC4, 0xD3, 0xFF, 0xC2, 0xBA, 0xFF, 0xC1, 0xC2, 0xFF, 0x83, 0xE4, 0xFF, 0xA3, 0xE4, 0xFF, 0xA3, 0xE4, 0xFF, 0xA3, 0xE4, 0xFF, 0xC2, 0xDB, 0xFF, 0x84, 0xD3, 0xFF, 0x83, 0xD3, 0xFF, 0x22, 0xA2, 0xFF, 0x23, 0xC3, 0xFF, 0xA3, 0xD3, 0xFF, 0xE3, 0xC2, 0xFF, 0x21, 0xB2, 0xFF, 0xA2, 0xD3, 0xFF, 0x62, 0xE4, 0xFF, 0x63, 0xE4, 0xFF, 0x62, 0xE4, 0xFF, 0xC2, 0xDB, 0xFF, 0x63, 0xCB, 0xFF, 0x43, 0xCB, 0xFF, 0x62, 0xB2, 0xFF, 0x41, 0xB2, 0xFF, 0x82, 0xD3, 0xFF, 0x02, 0xDC, 0xFF, 0x02, 0xDC, 0xFF, 0x82, 0xDB, 0xFF, 0x02, 0xCB, 0xFF, 0x43, 0xCB, 0xFF, 0x02, 0xC3, 0xFF, 0x82, 0xB2, 0xFF, 0xA2, 0xBA, 0xFF, 0x02, 0xC3, 0xFF, 0xE2, 0xC2, 0xFF, 0x4A, 0xD4, 0xFF, 0x1A, 0xF7, 0xFF, 0xFF, 0xFF, 0x00, 0xDF, 0xFF, 0x00, 0xDB, 0xDE, 0xFF, 0xDB, 0xDE, 0xFF, 0xBA, 0xD6, 0xFF, 0x9B, 0xD6, 0xFF, 0x9B, 0xCE, 0xFF, 0x5A, 0xC6, 0xFF, 0x19, 0xBE, 0xFF, 0xD8, 0xB5, 0xFF, 0x76, 0xAD, 0xFF, 0x14, 0xA5, 0xFF, 0x55, 0xAD, 0xFF, 0x35, 0xA5, 0xFF, 0xBA, 0xD6, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0x79, 0xCE, 0xFF, 0x72, 0x94, 0xFF, 0x14, 0xA5, 0xFF, 0x34, 0xA5, 0xFF, 0x34, 0xA5, 0xFF, 0x34, 0xAD, 0xFF, 0x34, 0xAD, 0xFF, 0x34, 0xAD, 0xFF, 0x34, 0xAD, 0xFF, 0x55, 0xB5, 0xFF, 0x75, 0xB5, 0xFF, 0xD2, 0xAC, 0xFF, 0xD7, 0xCD, 0xFF, 0xFF, 0xFF, 0x00, 0x12, 0xEE, 0xFF, 0x46, 0xDC, 0xFF, 0xC3, 0xD3, 0xFF, 0x63, 0xD3, 0xFF, 0xE1, 0xA1, 0xFF, 0xA0, 0x68, 0xFF, 0x22, 0xC3, 0xFF, 0xE4, 0xD3, 0xFF, 0x43, 0xCB, 0xFF, 0x41, 0xBA, 0xFF, 0xE2, 0xDB, 0xFF, 0x63, 0xE4, 0xFF, 0x63, 0xE4, 0xFF, 0x83, 0xE4, 0xFF, 0xE2, 0xDB, 0xFF, 0x83, 0xD3, 0xFF, 0xA3, 0xD3, 0xFF, 0xC2, 0xBA, 0xFF, 0xC1, 0xC2, 0xFF, 0x63, 0xE4, 0xFF, 0xA3, 0xE4, 0xFF, 0xA3, 0xE4, 0xFF, 0xA3, 0xEC, 0xFF, 0xC2, 0xDB, 0xFF, 0x83, 0xCB, 0xFF, 0x83, 0xD3, 0xFF, 0x02, 0xA2, 0xFF, 0x02, 0xC3, 0xFF, 0xA3, 0xD3, 0xFF, 0xE2, 0xBA, 0xFF, 0x21, 0xB2, 0xFF, 0xA2, 0xD3, 0xFF, 0x42, 0xE4, 0xFF, 0x63, 0xE4, 0xFF, 0x62, 0xE4, 0xFF, 0xA2, 0xDB, 0xFF, 0x63, 0xCB, 0xFF, 0x43, 0xCB, 0xFF, 0x62, 0xB2, 0xFF, 0x61, 0xBA, 0xFF, 0xA2, 0xD3, 0xFF, 0x02, 0xDC, 0xFF, 0x22, 0xDC, 0xFF, 0xC2, 0xDB, 0xFF, 0x42, 0xD3, 0xFF, 0x43, 0xCB, 0xFF, 0x03, 0xCB, 0xFF, 0xC1, 0x99, 0xFF, 0xA0, 0x60, 0xFF, 0x21, 0xAA, 0xFF, 0xE2, 0xC2, 0xFF, 0xC1, 0xC2, 0xFF, 0x24, 0xC3, 0xFF, 0xB2, 0xDD, 0xFF, 0xFF, 0xFF, 0x00, 0x79, 0xD6, 0xFF, 0xD7, 0xC5, 0xFF, 0x38, 0xCE, 0xFF, 0xD7, 0xBD, 0xFF, 0x96, 0xB5, 0xFF, 0x54, 0xAD, 0xFF, 0xF3, 0xA4, 0xFF, 0xD3, 0x9C, 0xFF, 0xB3, 0x9C, 0xFF, 0xD3, 0x9C, 0xFF, 0xF3, 0x9C, 0xFF, 0x92, 0x94, 0xFF, 0xDB, 0xDE, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xBE, 0xF7, 0x00, 0x54, 0xB5, 0xFF, 0x0B, 0x6B, 0xFF, 0xAA, 0x5A, 0xFF, 0xCA, 0x62, 0xFF, 0xCA, 0x62, 0xFF, 0xCA, 0x62, 0xFF, 0xCA, 0x62, 0xFF, 0xEA, 0x6A, 0xFF, 0xEA, 0x72, 0xFF, 0x89, 0x72, 0xFF, 0x70, 0xA4, 0xFF, 0x74, 0xCD, 0xFF, 0x48, 0xD4, 0xFF, 0x83, 0xD3, 0xFF, 0x83, 0xD3, 0xFF, 0xE2, 0xC2, 0xFF, 0x40, 0x89, 0xFF, 0xC0, 0x78, 0xFF, 0x21, 0x89, 0xFF, 0x42, 0xCB, 0xFF, 0xC3, 0xD3, 0xFF, 0x23, 0xCB, 0xFF, 0x61, 0xBA, 0xFF, 0x22, 0xE4, 0xFF, 0x83, 0xE4, 0xFF, 0x83, 0xE4, 0xFF, 0xA3, 0xE4, 0xFF, 0x02, 0xDC, 0xFF, 0x63, 0xD3, 0xFF, 0xA3, 0xD3, 0xFF, 0xA2, 0xBA, 0xFF, 0xC1, 0xC2, 0xFF, 0x62, 0xE4, 0xFF, 0xA3, 0xE4, 0xFF, 0xA3, 0xE4, 0xFF, 0xA3, 0xE4, 0xFF, 0xC2, 0xDB, 0xFF, 0x63, 0xCB, 0xFF, 0x63, 0xD3, 0xFF, 0x01, 0xA2, 0xFF, 0x02, 0xBB, 0xFF, 0x83, 0xD3, 0xFF, 0xC3, 0xBA, 0xFF, 0x21, 0xB2, 0xFF, 0xA2, 0xD3, 0xFF, 0x42, 0xE4, 0xFF, 0x63, 0xE4, 0xFF, 0x62, 0xE4, 0xFF, 0xA2, 0xDB, 0xFF, 0x63, 0xCB, 0xFF, 0x43, 0xCB, 0xFF, 0x62, 0xB2, 0xFF, 0x61, 0xBA, 0xFF, 0xA2, 0xD3, 0xFF, 0x02, 0xDC, 0xFF, 0x22, 0xDC, 0xFF, 0xE2, 0xDB, 0xFF, 0x42, 0xD3, 0xFF, 0x43, 0xCB, 0xFF, 0x02, 0xC3, 0xFF, 0xE2, 0xA1, 0xFF, 0x00, 0x79, 0xFF, 0xC0, 0x70, 0xFF, 0xA1, 0x99, 0xFF, 0xA2, 0xBA, 0xFF, 0xC2, 0xBA, 0xFF, 0x61, 0xB2, 0xFF, 0xCA, 0xC3, 0xFF, 0xF6, 0xCD, 0xFF, 0x70, 0x9C, 0xFF, 0xA9, 0x6A, 0xFF, 0xEB, 0x6A, 0xFF, 0xCA, 0x62, 0xFF, 0xAA, 0x62, 0xFF, 0xCA, 0x62, 0xFF, 0xCA, 0x62, 0xFF, 0xEB, 0x62, 0xFF, 0xEB, 0x62, 0xFF, 0x6C, 0x73, 0xFF, 0xB6, 0xBD, 0xFF, 0xDF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xF0, 0x7B, 0xFF, 0xCC, 0x5A, 0xFF, 0x2D, 0x63, 0xFF, 0x4E, 0x6B, 0xFF, 0x4E, 0x6B, 0xFF, 0x6E, 0x6B, 0xFF, 0x6E, 0x73, 0xFF, 0x4D, 0x73, 0xFF, 0x2C, 0x7B, 0xFF, 0x71, 0xA4, 0xFF, 0xC2, 0x91, 0xFF, 0x81, 0xBA, 0xFF, 0x43, 0xCB, 0xFF, 0x61, 0xB2, 0xFF, 0x00, 0x81, 0xFF, 0x40, 0x91, 0xFF, 0x21, 0xB2, 0xFF, 0x41, 0xBA, 0xFF, 0x22, 0xCB, 0xFF, 0xA3, 0xD3, 0xFF, 0x23, 0xC3, 0xFF, 0x81, 0xBA, 0xFF, 0x42, 0xE4, 0xFF, 0x83, 0xE4, 0xFF, 0x83, 0xE4, 0xFF, 0xA3, 0xE4, 0xFF, 0x02, 0xDC, 0xFF, 0x63, 0xD3, 0xFF, 0xA3, 0xD3, 0xFF, 0xA2, 0xBA, 0xFF, 0xA1, 0xC2, 0xFF, 0x62, 0xE4, 0xFF, 0x83, 0xE4, 0xFF, 0x83, 0xE4, 0xFF, 0x82, 0xE4, 0xFF, 0xA2, 0xD3, 0xFF, 0x63, 0xCB, 0xFF, 0x63, 0xCB, 0xFF, 0x01, 0xA2, 0xFF, 0xE2, 0xBA, 0xFF, 0x83, 0xD3, 0xFF, 0xC2, 0xBA, 0xFF, 0x21, 0xB2, 0xFF, 0xA2, 0xD3, 0xFF, 0x42, 0xE4, 0xFF, 0x42, 0xE4, 0xFF, 0x42, 0xE4, 0xFF, 0xA2, 0xDB, 0xFF, 0x43, 0xCB, 0xFF, 0x43, 0xCB, 0xFF, 0x42, 0xB2, 0xFF, 0x41, 0xBA, 0xFF, 0x82, 0xD3, 0xFF, 0x02, 0xDC, 0xFF, 0x22, 0xDC, 0xFF, 0xE2, 0xDB, 0xFF, 0x42, 0xD3, 0xFF, 0x23, 0xCB, 0xFF, 0xE2, 0xC2, 0xFF, 0xE1, 0xA1, 0xFF, 0xE1, 0xA9, 0xFF, 0x41, 0xB2, 0xFF, 0x40, 0x91, 0xFF, 0x40, 0x89, 0xFF, 0x61, 0xB2, 0xFF, 0xA2, 0xBA, 0xFF, 0x00, 0xB2, 0xFF, 0x84, 0xB2, 0xFF, 0x54, 0xBD, 0xFF, 0x51, 0x94, 0xFF, 0x72, 0x94, 0xFF, 0x31, 0x8C, 0xFF, 0xD0, 0x7B, 0xFF, 0x6E, 0x6B, 0xFF, 0x4E, 0x6B, 0xFF, 0x6E, 0x6B, 0xFF, 0x2D, 0x6B, 0xFF, 0xB3, 0x94, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0x72, 0x8C, 0xFF, 0xF0, 0x7B, 0xFF, 0x52, 0x8C, 0xFF, 0x73, 0x8C, 0xFF, 0x93, 0x94, 0xFF, 0x93, 0x94, 0xFF, 0x92, 0x94, 0xFF, 0x51, 0x8C, 0xFF, 0xCF, 0x83, 0xFF, 0x01, 0x61, 0xFF, 0xA0, 0x99, 0xFF, 0xC2, 0xBA, 0xFF, 0x01, 0xAA, 0xFF, 0x00, 0x89, 0xFF, 0xC0, 0xA9, 0xFF, 0x81, 0xC2, 0xFF, 0x42, 0xD3, 0xFF, 0x42, 0xD3, 0xFF, 0x22, 0xCB, 0xFF, 0xA3, 0xD3, 0xFF, 0x03, 0xC3, 0xFF, 0x81, 0xC2, 0xFF, 0x42, 0xE4, 0xFF, 0xA3, 0xE4, 0xFF, 0xA3, 0xE4, 0xFF, 0xA3, 0xE4, 0xFF, 0x02, 0xDC, 0xFF, 0x42, 0xCB, 0xFF, 0x83, 0xD3, 0xFF, 0xA2, 0xBA, 0xFF, 0xA1, 0xC2, 0xFF, 0x42, 0xE4, 0xFF, 0x83, 0xE4, 0xFF, 0x83, 0xE4, 0xFF, 0x82, 0xE4, 0xFF, 0xA2, 0xD3, 0xFF, 0x63, 0xCB, 0xFF, 0x63, 0xCB, 0xFF, 0x01, 0xA2, 0xFF, 0xE2, 0xBA, 0xFF, 0x63, 0xCB, 0xFF, 0xC2, 0xBA, 0xFF, 0x21, 0xB2, 0xFF, 0x82, 0xD3, 0xFF, 0x22, 0xDC, 0xFF, 0x42, 0xE4, 0xFF, 0x42, 0xE4, 0xFF, 0x82, 0xDB, 0xFF, 0x43, 0xCB, 0xFF, 0x23, 0xC3, 0xFF, 0x42, 0xB2, 0xFF, 0x61, 0xBA, 0xFF, 0xA2, 0xD3, 0xFF, 0x02, 0xDC, 0xFF, 0x22, 0xDC, 0xFF, 0xE2, 0xDB, 0xFF, 0x22, 0xD3, 0xFF, 0x23, 0xC3, 0xFF, 0xE2, 0xC2, 0xFF, 0xE1, 0xA1, 0xFF, 0x01, 0xAA, 0xFF, 0x02, 0xCB, 0xFF, 0x21, 0xCB, 0xFF, 0xE1, 0xA9, 0xFF, 0x20, 0x91, 0xFF, 0x41, 0xB2, 0xFF, 0xA3, 0xBA, 0xFF, 0x00, 0xAA, 0xFF, 0x66, 0x8A, 0xFF, 0xB8, 0xB5, 0xFF, 0x96, 0xB5, 0xFF, 0x76, 0xAD, 0xFF, 0xF4, 0x9C, 0xFF, 0x93, 0x94, 0xFF, 0x31, 0x84, 0xFF, 0x11, 0x84, 0xFF, 0xD0, 0x7B, 0xFF, 0x14, 0xA5, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xD4, 0x9C, 0xFF, 0x52, 0x8C, 0xFF, 0xB3, 0x94, 0xFF, 0xD4, 0x9C, 0xFF, 0xD4, 0x9C, 0xFF, 0xF4, 0x9C, 0xFF, 0xD4, 0x9C, 0xFF, 0xB3, 0x9C, 0xFF, 0xF0, 0x83, 0xFF, 0x43, 0x69, 0xFF, 0x01, 0xA2, 0xFF, 0xA2, 0xBA, 0xFF, 0x60, 0x99, 0xFF, 0xE1, 0xA9, 0xFF, 0xE1, 0xCA, 0xFF, 0x82, 0xD3, 0xFF, 0x02, 0xDC, 0xFF, 0x82, 0xD3, 0xFF, 0x22, 0xCB, 0xFF, 0x83, 0xD3, 0xFF, 0x03, 0xC3, 0xFF, 0x81, 0xBA, 0xFF, 0x42, 0xE4, 0xFF, 0x83, 0xE4, 0xFF, 0xA3, 0xE4, 0xFF, 0xA3, 0xE4, 0xFF, 0xE2, 0xDB, 0xFF, 0x42, 0xCB, 0xFF, 0x83, 0xCB, 0xFF, 0x82, 0xBA, 0xFF, 0xA1, 0xC2, 0xFF, 0x42, 0xE4, 0xFF, 0x63, 0xE4, 0xFF, 0x82, 0xE4, 0xFF, 0x82, 0xE4, 0xFF, 0x82, 0xD3, 0xFF, 0x43, 0xCB, 0xFF, 0x43, 0xCB, 0xFF, 0x01, 0xA2, 0xFF, 0xC2, 0xBA, 0xFF, 0x63, 0xCB, 0xFF, 0xC2, 0xBA, 0xFF, 0x21, 0xB2, 0xFF, 0x82, 0xD3, 0xFF, 0x22, 0xDC, 0xFF, 0x42, 0xDC, 0xFF, 0x42, 0xE4, 0xFF, 0x82, 0xD3, 0xFF, 0x23, 0xCB, 0xFF, 0x23, 0xCB, 0xFF, 0x42, 0xB2, 0xFF, 0x41, 0xBA, 0xFF, 0x82, 0xD3, 0xFF, 0xE2, 0xDB, 0xFF, 0x02, 0xDC, 0xFF, 0xE2, 0xDB, 0xFF, 0x22, 0xCB, 0xFF, 0x23, 0xC3, 0xFF, 0xE2, 0xC2, 0xFF, 0xE1, 0xA1, 0xFF, 0x21, 0xB2, 0xFF, 0x22, 0xCB, 0xFF, 0x82, 0xD3, 0xFF, 0x62, 0xD3, 0xFF, 0x41, 0xBA, 0xFF, 0x21, 0xB2, 0xFF, 0xC2, 0xBA, 0xFF, 0x01, 0xAA, 0xFF, 0x47, 0x82, 0xFF, 0x76, 0xAD, 0xFF, 0x76, 0xB5, 0xFF, 0x56, 0xAD, 0xFF, 0xF4, 0x9C, 0xFF, 0xB3, 0x94, 0xFF, 0x52, 0x8C, 0xFF, 0x11, 0x84, 0xFF, 0xD0, 0x7B, 0xFF, 0x34, 0xA5, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xF4, 0x9C, 0xFF, 0x93, 0x8C, 0xFF, 0xD4, 0x9C, 0xFF, 0xF4, 0x9C, 0xFF, 0xF4, 0x9C, 0xFF, 0x15, 0xA5, 0xFF, 0xF4, 0x9C, 0xFF, 0xB3, 0x9C, 0xFF, 0x10, 0x8C, 0xFF, 0x43, 0x69, 0xFF, 0x01, 0xAA, 0xFF, 0xC3, 0xBA, 0xFF, 0xE1, 0xA9, 0xFF, 0xE1, 0xC2, 0xFF, 0xC2, 0xDB, 0xFF, 0x02, 0xDC, 0xFF, 0x42, 0xE4, 0xFF, 0xA2, 0xDB, 0xFF, 0x02, 0xCB, 0xFF, 0x83, 0xCB, 0xFF, 0x03, 0xC3, 0xFF, 0x61, 0xBA, 0xFF, 0x42, 0xE4, 0xFF, 0x83, 0xE4, 0xFF, 0x83, 0xE4, 0xFF, 0xA3, 0xE4, 0xFF, 0xE2, 0xDB, 0xFF, 0x22, 0xCB, 0xFF, 0x63, 0xCB, 0xFF, 0x82, 0xBA, 0xFF, 0xA1, 0xC2, 0xFF, 0x22, 0xE4, 0xFF, 0x62, 0xE4, 0xFF, 0x62, 0xE4, 0xFF, 0x62, 0xE4, 0xFF, 0x82, 0xD3, 0xFF, 0x43, 0xCB, 0xFF, 0x43, 0xCB, 0xFF, 0xE1, 0xA1, 0xFF, 0xC2, 0xBA, 0xFF, 0x63, 0xCB, 0xFF, 0xA2, 0xBA, 0xFF, 0x01, 0xB2, 0xFF, 0x82, 0xD3, 0xFF, 0x22, 0xDC, 0xFF, 0x42, 0xDC, 0xFF, 0x42, 0xE4, 0xFF, 0x61, 0xD3, 0xFF, 0x23, 0xCB, 0xFF, 0x23, 0xC3, 0xFF, 0x42, 0xB2, 0xFF, 0x41, 0xBA, 0xFF, 0x82, 0xD3, 0xFF, 0xE2, 0xDB, 0xFF, 0x02, 0xDC, 0xFF, 0xC2, 0xDB, 0xFF, 0x22, 0xCB, 0xFF, 0x03, 0xC3, 0xFF, 0xC2, 0xC2, 0xFF, 0xE1, 0xA1, 0xFF, 0x21, 0xB2, 0xFF, 0x22, 0xCB, 0xFF, 0x82, 0xD3, 0xFF, 0xA2, 0xD3, 0xFF, 0x41, 0xD3, 0xFF, 0xC2, 0xC2, 0xFF, 0xE3, 0xBA, 0xFF, 0x00, 0xAA, 0xFF, 0x46, 0x7A, 0xFF, 0x76, 0xAD, 0xFF, 0x76, 0xAD, 0xFF, 0x55, 0xAD, 0xFF, 0xF4, 0x9C, 0xFF, 0xB3, 0x94, 0xFF, 0x52, 0x8C, 0xFF, 0x31, 0x84, 0xFF, 0xD0, 0x7B, 0xFF, 0x34, 0xA5, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xF5, 0x9C, 0xFF, 0x93, 0x94, 0xFF, 0xF4, 0x9C, 0xFF, 0xF4, 0x9C, 0xFF, 0x15, 0xA5, 0xFF, 0x15, 0xA5, 0xFF, 0x14, 0xA5, 0xFF, 0xD3, 0x9C, 0xFF, 0x10, 0x8C, 0xFF, 0x63, 0x71, 0xFF, 0x21, 0xB2, 0xFF, 0xC3, 0xBA, 0xFF, 0x41, 0xB2, 0xFF, 0xA2, 0xDB, 0xFF, 0x22, 0xDC, 0xFF, 0x42, 0xDC, 0xFF, 0x62, 0xE4, 0xFF, 0xA2, 0xDB, 0xFF, 0x02, 0xC3, 0xFF, 0x63, 0xCB, 0xFF, 0xE2, 0xC2, 0xFF, 0x61, 0xBA, 0xFF, 0x22, 0xE4, 0xFF, 0x82, 0xE4, 0xFF, 0x82, 0xE4, 0xFF, 0x83, 0xE4, 0xFF, 0xE2, 0xDB, 0xFF, 0x22, 0xCB, 0xFF, 0x63, 0xCB, 0xFF, 0x82, 0xBA, 0xFF, 0xA1, 0xC2, 0xFF, 0x22, 0xE4, 0xFF, 0x62, 0xE4, 0xFF, 0x62, 0xE4, 0xFF, 0x62, 0xE4, 0xFF, 0x62, 0xD3, 0xFF, 0x23, 0xCB, 0xFF, 0x43, 0xCB, 0xFF, 0xE1, 0xA1, 0xFF, 0xC2, 0xBA, 0xFF, 0x63, 0xCB, 0xFF, 0xA2, 0xBA, 0xFF, 0x01, 0xB2, 0xFF, 0x82, 0xD3, 0xFF, 0x22, 0xDC, 0xFF, 0x22, 0xDC, 0xFF, 0x22, 0xE4, 0xFF, 0x61, 0xD3, 0xFF, 0x23, 0xCB, 0xFF, 0x02, 0xC3, 0xFF, 0x42, 0xAA, 0xFF, 0x41, 0xBA, 0xFF, 0x62, 0xD3, 0xFF, 0xE2, 0xDB, 0xFF, 0x02, 0xDC, 0xFF, 0xC2, 0xDB, 0xFF, 0x02, 0xCB, 0xFF, 0x03, 0xC3, 0xFF, 0xC2, 0xBA, 0xFF, 0xE1, 0xA1, 0xFF, 0x21, 0xB2, 0xFF, 0x22, 0xCB, 0xFF, 0x82, 0xD3, 0xFF, 0xA2, 0xD3, 0xFF, 0x61, 0xD3, 0xFF, 0xC2, 0xC2, 0xFF, 0xE3, 0xBA, 0xFF, 0x00, 0xAA, 0xFF, 0x47, 0x7A, 0xFF, 0x76, 0xAD, 0xFF, 0x56, 0xAD, 0xFF, 0x55, 0xAD, 0xFF, 0xF4, 0x9C, 0xFF, 0xB3, 0x94, 0xFF, 0x52, 0x8C, 0xFF, 0x31, 0x84, 0xFF, 0xF0, 0x7B, 0xFF, 0x34, 0xA5, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xF5, 0x9C, 0xFF, 0x93, 0x94, 0xFF, 0xF4, 0x9C, 0xFF, 0xF4, 0x9C, 0xFF, 0x15, 0xA5, 0xFF, 0x15, 0xA5, 0xFF, 0x14, 0xA5, 0xFF, 0xD3, 0x9C, 0xFF, 0x10, 0x8C, 0xFF, 0x83, 0x79, 0xFF, 0x41, 0xB2, 0xFF, 0xC2, 0xBA, 0xFF, 0x61, 0xBA, 0xFF, 0xE2, 0xDB, 0xFF, 0x22, 0xDC, 0xFF, 0x42, 0xE4, 0xFF, 0x62, 0xE4, 0xFF, 0xC2, 0xDB, 0xFF, 0xE2, 0xC2, 0xFF, 0x63, 0xCB, 0xFF, 0xE2, 0xC2, 0xFF, 0x61, 0xBA, 0xFF, 0x22, 0xE4, 0xFF, 0x62, 0xE4, 0xFF, 0x82, 0xE4, 0xFF, 0x82, 0xE4, 0xFF, 0xC2, 0xDB, 0xFF, 0x22, 0xCB, 0xFF, 0x63, 0xCB, 0xFF, 0x82, 0xBA, 0xFF, 0x81, 0xC2, 0xFF, 0x22, 0xE4, 0xFF, 0x42, 0xE4, 0xFF, 0x62, 0xE4, 0xFF, 0x62, 0xE4, 0xFF, 0x62, 0xD3, 0xFF, 0x22, 0xCB, 0xFF, 0x23, 0xCB, 0xFF, 0xE1, 0xA1, 0xFF, 0xA2, 0xBA, 0xFF, 0x43, 0xCB, 0xFF, 0xA2, 0xBA, 0xFF, 0x01, 0xB2, 0xFF, 0x82, 0xD3, 0xFF, 0x02, 0xDC, 0xFF, 0x22, 0xDC, 0xFF, 0x22, 0xDC, 0xFF, 0x61, 0xD3, 0xFF, 0x02, 0xCB, 0xFF, 0x02, 0xC3, 0xFF, 0x42, 0xAA, 0xFF, 0x41, 0xBA, 0xFF, 0x62, 0xD3, 0xFF, 0xE2, 0xDB, 0xFF, 0xE2, 0xDB, 0xFF, 0xC2, 0xDB, 0xFF, 0x01, 0xCB, 0xFF, 0x02, 0xC3, 0xFF, 0xC2, 0xBA, 0xFF, 0xE1, 0xA1, 0xFF, 0x41, 0xB2, 0xFF, 0x22, 0xCB, 0xFF, 0x82, 0xD3, 0xFF, 0xA2, 0xD3, 0xFF, 0x61, 0xD3, 0xFF, 0xC2, 0xC2, 0xFF, 0xC3, 0xBA, 0xFF, 0xE0, 0xA9, 0xFF, 0x46, 0x7A, 0xFF, 0x76, 0xAD, 0xFF, 0x56, 0xAD, 0xFF, 0x35, 0xA5, 0xFF, 0xF4, 0x9C, 0xFF, 0xB3, 0x94, 0xFF, 0x52, 0x8C, 0xFF, 0x31, 0x84, 0xFF, 0xF0, 0x7B, 0xFF, 0x34, 0xA5, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0x15, 0x9D, 0xFF, 0x93, 0x94, 0xFF, 0xF4, 0x9C, 0xFF, 0xF4, 0x9C, 0xFF, 0x15, 0xA5, 0xFF, 0x15, 0xA5, 0xFF, 0x14, 0xA5, 0xFF, 0xD3, 0x9C, 0xFF, 0x10, 0x8C, 0xFF, 0xA3, 0x79, 0xFF, 0x61, 0xBA, 0xFF, 0xC2, 0xBA, 0xFF, 0x61, 0xBA, 0xFF, 0x02, 0xDC, 0xFF, 0x42, 0xDC, 0xFF, 0x42, 0xE4, 0xFF, 0x62, 0xE4, 0xFF, 0xC2, 0xDB, 0xFF, 0xE2, 0xC2, 0xFF, 0x63, 0xCB, 0xFF, 0xE2, 0xC2, 0xFF, 0x61, 0xBA, 0xFF, 0x22, 0xE4, 0xFF, 0x62, 0xE4, 0xFF, 0x62, 0xE4, 0xFF, 0x82, 0xE4, 0xFF, 0xC2, 0xDB, 0xFF, 0x02, 0xCB, 0xFF, 0x43, 0xCB, 0xFF, 0x82, 0xBA, 0xFF, 0x81, 0xBA, 0xFF, 0x22, 0xE4, 0xFF, 0x42, 0xE4, 0xFF, 0x42, 0xE4, 0xFF, 0x42, 0xE4, 0xFF, 0x41, 0xD3, 0xFF, 0x22, 0xCB, 0xFF, 0x23, 0xCB, 0xFF, 0xE1, 0xA1, 0xFF, 0xA2, 0xBA, 0xFF, 0x43, 0xCB, 0xFF, 0xA2, 0xBA, 0xFF, 0x01, 0xB2, 0xFF, 0x62, 0xD3, 0xFF, 0x02, 0xDC, 0xFF, 0x22, 0xDC, 0xFF, 0x22, 0xE4, 0xFF, 0x61, 0xD3, 0xFF, 0x02, 0xC3, 0xFF, 0x02, 0xC3, 0xFF, 0x22, 0xAA, 0xFF, 0x41, 0xBA, 0xFF, 0x62, 0xD3, 0xFF, 0xC2, 0xDB, 0xFF, 0xE2, 0xDB, 0xFF, 0xC2, 0xDB, 0xFF, 0x01, 0xCB, 0xFF, 0xE2, 0xC2, 0xFF, 0xC2, 0xBA, 0xFF, 0xE1, 0xA1, 0xFF, 0x41, 0xB2, 0xFF, 0x22, 0xCB, 0xFF, 0x82, 0xD3, 0xFF, 0xA2, 0xD3, 0xFF, 0x61, 0xD3, 0xFF, 0xC2, 0xC2, 0xFF, 0xC2, 0xBA, 0xFF, 0xE0, 0xA9, 0xFF, 0x46, 0x7A, 0xFF, 0x76, 0xAD, 0xFF, 0x55, 0xAD, 0xFF, 0x35, 0xA5, 0xFF, 0xF4, 0x9C, 0xFF, 0xB3, 0x94, 0xFF, 0x52, 0x8C, 0xFF, 0x31, 0x84, 0xFF, 0xF0, 0x7B, 0xFF, 0x35, 0xA5, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0x15, 0x9D, 0xFF, 0x93, 0x94, 0xFF, 0xF4, 0x9C, 0xFF, 0xF4, 0x9C, 0xFF, 0x15, 0xA5, 0xFF, 0x15, 0xA5, 0xFF, 0x14, 0xA5, 0xFF, 0xD3, 0x9C, 0xFF, 0x10, 0x8C, 0xFF, 0xA3, 0x79, 0xFF, 0x61, 0xBA, 0xFF, 0xA2, 0xBA, 0xFF, 0x61, 0xBA, 0xFF, 0xE2, 0xDB, 0xFF, 0x22, 0xDC, 0xFF, 0x42, 0xE4, 0xFF, 0x62, 0xE4, 0xFF, 0xA2, 0xDB, 0xFF, 0xC2, 0xC2, 0xFF, 0x43, 0xCB, 0xFF, 0xE2, 0xC2, 0xFF, 0x61, 0xBA, 0xFF, 0x02, 0xDC, 0xFF, 0x62, 0xE4, 0xFF, 0x62, 0xE4, 0xFF, 0x62, 0xE4, 0xFF, 0xA2, 0xDB, 0xFF, 0x02, 0xCB, 0xFF, 0x43, 0xCB, 0xFF, 0x62, 0xBA, 0xFF, 0x81, 0xBA, 0xFF, 0x02, 0xDC, 0xFF, 0x42, 0xE4, 0xFF, 0x42, 0xE4, 0xFF, 0x42, 0xE4, 0xFF, 0x42, 0xD3, 0xFF, 0x02, 0xC3, 0xFF, 0x23, 0xCB, 0xFF, 0xE1, 0xA1, 0xFF, 0xA2, 0xB2, 0xFF, 0x23, 0xCB, 0xFF, 0x82, 0xBA, 0xFF, 0x01, 0xAA, 0xFF, 0x61, 0xD3, 0xFF, 0x02, 0xDC, 0xFF, 0x02, 0xDC, 0xFF, 0x02, 0xDC, 0xFF, 0x41, 0xD3, 0xFF, 0x02, 0xC3, 0xFF, 0x02, 0xC3, 0xFF, 0x22, 0xAA, 0xFF, 0x41, 0xBA, 0xFF, 0x62, 0xD3, 0xFF, 0xC2, 0xDB, 0xFF, 0xE2, 0xDB, 0xFF, 0xC2, 0xDB, 0xFF, 0xE1, 0xCA, 0xFF, 0xE2, 0xC2, 0xFF, 0xC2, 0xBA, 0xFF, 0xE1, 0xA1, 0xFF, 0x41, 0xB2, 0xFF, 0x21, 0xCB, 0xFF, 0x82, 0xD3, 0xFF, 0xA2, 0xD3, 0xFF, 0x61, 0xD3, 0xFF, 0xC1, 0xC2, 0xFF, 0xC2, 0xBA, 0xFF, 0xE0, 0xA9, 0xFF, 0x26, 0x7A, 0xFF, 0x76, 0xAD, 0xFF, 0x55, 0xAD, 0xFF, 0x35, 0xA5, 0xFF, 0xF4, 0x9C, 0xFF, 0xB3, 0x94, 0xFF, 0x52, 0x8C, 0xFF, 0x31, 0x84, 0xFF, 0xF0, 0x7B, 0xFF, 0x35, 0xA5, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xF4, 0x9C, 0xFF, 0x93, 0x94, 0xFF, 0xF4, 0x9C, 0xFF, 0xF4, 0x9C, 0xFF, 0x15, 0xA5, 0xFF, 0x15, 0xA5, 0xFF, 0x14, 0xA5, 0xFF, 0xD3, 0x9C, 0xFF, 0x10, 0x8C, 0xFF, 0xA3, 0x81, 0xFF, 0x61, 0xBA, 0xFF, 0xA2, 0xBA, 0xFF, 0x61, 0xBA, 0xFF, 0xE2, 0xDB, 0xFF, 0x22, 0xDC, 0xFF, 0x22, 0xDC, 0xFF, 0x42, 0xE4, 0xFF, 0xA1, 0xD3, 0xFF, 0xC2, 0xC2, 0xFF, 0x43, 0xCB, 0xFF, 0xC2, 0xC2, 0xFF, 0x61, 0xBA, 0xFF, 0x02, 0xDC, 0xFF, 0x62, 0xE4, 0xFF, 0x62, 0xE4, 0xFF, 0x62, 0xE4, 0xFF, 0xA2, 0xD3, 0xFF, 0xE2, 0xC2, 0xFF, 0x43, 0xCB, 0xFF, 0x62, 0xB2, 0xFF, 0x81, 0xBA, 0xFF, 0x02, 0xDC, 0xFF, 0x42, 0xDC, 0xFF, 0x42, 0xDC, 0xFF, 0x22, 0xE4, 0xFF, 0x41, 0xCB, 0xFF, 0x02, 0xC3, 0xFF, 0x22, 0xCB, 0xFF, 0xE1, 0x99, 0xFF, 0x82, 0xB2, 0xFF, 0x23, 0xCB, 0xFF, 0x82, 0xBA, 0xFF, 0x01, 0xAA, 0xFF, 0x62, 0xD3, 0xFF, 0xE2, 0xDB, 0xFF, 0x02, 0xDC, 0xFF, 0x02, 0xDC, 0xFF, 0x41, 0xD3, 0xFF, 0xE2, 0xC2, 0xFF, 0xE2, 0xC2, 0xFF, 0x22, 0xAA, 0xFF, 0x41, 0xB2, 0xFF, 0x62, 0xD3, 0xFF, 0xC2, 0xDB, 0xFF, 0xE2, 0xDB, 0xFF, 0xA1, 0xDB, 0xFF, 0xE1, 0xCA, 0xFF, 0xE2, 0xC2, 0xFF, 0xA2, 0xBA, 0xFF, 0xE1, 0xA1, 0xFF, 0x21, 0xB2, 0xFF, 0x22, 0xCB, 0xFF, 0x82, 0xD3, 0xFF, 0x82, 0xD3, 0xFF, 0x41, 0xD3, 0xFF, 0xA1, 0xC2, 0xFF, 0xC2, 0xBA, 0xFF, 0xE0, 0xA9, 0xFF, 0x26, 0x7A, 0xFF, 0x56, 0xAD, 0xFF, 0x55, 0xAD, 0xFF, 0x35, 0xA5, 0xFF, 0xF4, 0x9C, 0xFF, 0x93, 0x94, 0xFF, 0x52, 0x8C, 0xFF, 0x31, 0x84, 0xFF, 0xF0, 0x7B, 0xFF, 0x35, 0xA5, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xF4, 0x9C, 0xFF, 0x93, 0x94, 0xFF, 0xF4, 0x9C, 0xFF, 0xF4, 0x9C, 0xFF, 0x15, 0xA5, 0xFF, 0x14, 0xA5, 0xFF, 0xF4, 0xA4, 0xFF, 0xD3, 0x9C, 0xFF, 0x10, 0x8C, 0xFF, 0xA3, 0x81, 0xFF, 0x61, 0xBA, 0xFF, 0xA2, 0xBA, 0xFF, 0x61, 0xBA, 0xFF, 0xE2, 0xDB, 0xFF, 0x22, 0xDC, 0xFF, 0x22, 0xDC, 0xFF, 0x42, 0xE4, 0xFF, 0x82, 0xD3, 0xFF, 0xA2, 0xC2, 0xFF, 0x23, 0xCB, 0xFF, 0xC2, 0xC2, 0xFF, 0x41, 0xBA, 0xFF, 0x02, 0xDC, 0xFF, 0x42, 0xE4, 0xFF, 0x42, 0xE4, 0xFF, 0x62, 0xE4, 0xFF, 0xA2, 0xD3, 0xFF, 0xE2, 0xC2, 0xFF, 0x23, 0xCB, 0xFF, 0x62, 0xB2, 0xFF, 0x81, 0xBA, 0xFF, 0x02, 0xDC, 0xFF, 0x22, 0xDC, 0xFF, 0x42, 0xE4, 0xFF, 0x22, 0xE4, 0xFF, 0x21, 0xCB, 0xFF, 0x02, 0xC3, 0xFF, 0x02, 0xCB, 0xFF, 0xE1, 0x99, 0xFF, 0x82, 0xB2, 0xFF, 0x22, 0xCB, 0xFF, 0x82, 0xB2, 0xFF, 0x01, 0xAA, 0xFF, 0x62, 0xD3, 0xFF, 0xE2, 0xDB, 0xFF, 0x02, 0xDC, 0xFF, 0xE2, 0xDB, 0xFF, 0x21, 0xD3, 0xFF, 0xE2, 0xC2, 0xFF, 0xE2, 0xC2, 0xFF, 0x21, 0xAA, 0xFF, 0x41, 0xB2, 0xFF, 0x62, 0xD3, 0xFF, 0xC2, 0xDB, 0xFF, 0xC2, 0xDB, 0xFF, 0xA2, 0xDB, 0xFF, 0xE1, 0xCA, 0xFF, 0xE2, 0xC2, 0xFF, 0xA2, 0xBA, 0xFF, 0xE1, 0xA1, 0xFF, 0x21, 0xB2, 0xFF, 0x22, 0xCB, 0xFF, 0x62, 0xD3, 0xFF, 0x82, 0xD3, 0xFF, 0x41, 0xD3, 0xFF, 0xA1, 0xC2, 0xFF, 0xA2, 0xBA, 0xFF, 0xE0, 0xA9, 0xFF, 0x26, 0x7A, 0xFF, 0x56, 0xAD, 0xFF, 0x35, 0xAD, 0xFF, 0x35, 0xA5, 0xFF, 0xF4, 0x9C, 0xFF, 0x93, 0x94, 0xFF, 0x52, 0x8C, 0xFF, 0x31, 0x84, 0xFF, 0xF0, 0x7B, 0xFF, 0x35, 0xA5, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xF4, 0x9C, 0xFF, 0x93, 0x94, 0xFF, 0xD4, 0x9C, 0xFF, 0xF4, 0x9C, 0xFF, 0xF4, 0xA4, 0xFF, 0x14, 0xA5, 0xFF, 0xF4, 0x9C, 0xFF, 0xB3, 0x9C, 0xFF, 0x10, 0x8C, 0xFF, 0xA3, 0x81, 0xFF, 0x61, 0xBA, 0xFF, 0xA2, 0xBA, 0xFF, 0x41, 0xBA, 0xFF, 0xE1, 0xDB, 0xFF, 0x22, 0xDC, 0xFF, 0x22, 0xE4, 0xFF, 0x42, 0xE4, 0xFF, 0x81, 0xD3, 0xFF, 0xA1, 0xC2, 0xFF, 0x22, 0xC3, 0xFF, 0xC2, 0xBA, 0xFF, 0x41, 0xBA, 0xFF, 0xE2, 0xDB, 0xFF, 0x42, 0xE4, 0xFF, 0x42, 0xE4, 0xFF, 0x42, 0xE4, 0xFF, 0x81, 0xD3, 0xFF, 0xE2, 0xC2, 0xFF, 0x22, 0xC3, 0xFF, 0x62, 0xB2, 0xFF, 0x61, 0xBA, 0xFF, 0xE2, 0xDB, 0xFF, 0x22, 0xDC, 0xFF, 0x22, 0xDC, 0xFF, 0x02, 0xE4, 0xFF, 0x21, 0xCB, 0xFF, 0xE2, 0xC2, 0xFF, 0x02, 0xC3, 0xFF, 0xC1, 0x99, 0xFF, 0x81, 0xB2, 0xFF, 0x22, 0xCB, 0xFF, 0x82, 0xB2, 0xFF, 0x01, 0xAA, 0xFF, 0x42, 0xD3, 0xFF, 0xE2, 0xDB, 0xFF, 0xE2, 0xDB, 0xFF, 0xE2, 0xDB, 0xFF, 0x21, 0xD3, 0xFF, 0xE2, 0xC2, 0xFF, 0xE2, 0xC2, 0xFF, 0x21, 0xAA, 0xFF, 0x41, 0xB2, 0xFF, 0x62, 0xD3, 0xFF, 0xA2, 0xDB, 0xFF, 0xC2, 0xDB, 0xFF, 0x81, 0xDB, 0xFF, 0xC1, 0xCA, 0xFF, 0xC2, 0xBA, 0xFF, 0xA2, 0xBA, 0xFF, 0xE1, 0xA1, 0xFF, 0x21, 0xB2, 0xFF, 0x01, 0xCB, 0xFF, 0x62, 0xD3, 0xFF, 0x82, 0xD3, 0xFF, 0x41, 0xD3, 0xFF, 0xA1, 0xC2, 0xFF, 0xA2, 0xBA, 0xFF, 0xE0, 0xA1, 0xFF, 0x26, 0x7A, 0xFF, 0x56, 0xAD, 0xFF, 0x35, 0xAD, 0xFF, 0x15, 0xA5, 0xFF, 0xF4, 0x9C, 0xFF, 0x93, 0x94, 0xFF, 0x52, 0x8C, 0xFF, 0x31, 0x84, 0xFF, 0xF0, 0x7B, 0xFF, 0x35, 0xA5, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xF4, 0x9C, 0xFF, 0x73, 0x8C, 0xFF, 0xD4, 0x9C, 0xFF, 0xF4, 0x9C, 0xFF, 0xF4, 0x9C, 0xFF, 0x14, 0xA5, 0xFF, 0xF4, 0x9C, 0xFF, 0xB3, 0x9C, 0xFF, 0x10, 0x8C, 0xFF, 0xA3, 0x81, 0xFF, 0x61, 0xBA, 0xFF, 0xA2, 0xBA, 0xFF, 0x41, 0xBA, 0xFF, 0xC1, 0xDB, 0xFF, 0x02, 0xDC, 0xFF, 0x22, 0xDC, 0xFF, 0x22, 0xE4, 0xFF, 0x61, 0xD3, 0xFF, 0xA1, 0xBA, 0xFF, 0x22, 0xC3, 0xFF, 0xA2, 0xBA, 0xFF, 0x41, 0xBA, 0xFF, 0xE1, 0xDB, 0xFF, 0x22, 0xE4, 0xFF, 0x22, 0xE4, 0xFF, 0x22, 0xE4, 0xFF, 0x61, 0xD3, 0xFF, 0xC2, 0xC2, 0xFF, 0x22, 0xC3, 0xFF, 0x42, 0xB2, 0xFF, 0x61, 0xBA, 0xFF, 0xE1, 0xDB, 0xFF, 0x22, 0xDC, 0xFF, 0x22, 0xE4, 0xFF, 0x02, 0xE4, 0xFF, 0x01, 0xCB, 0xFF, 0xE2, 0xC2, 0xFF, 0x02, 0xC3, 0xFF, 0xC1, 0x99, 0xFF, 0x81, 0xB2, 0xFF, 0x02, 0xCB, 0xFF, 0x82, 0xB2, 0xFF, 0x01, 0xAA, 0xFF, 0x42, 0xD3, 0xFF, 0xC2, 0xDB, 0xFF, 0xE2, 0xDB, 0xFF, 0xE2, 0xDB, 0xFF, 0x01, 0xD3, 0xFF, 0xC2, 0xC2, 0xFF, 0xE2, 0xC2, 0xFF, 0x01, 0xAA, 0xFF, 0x41, 0xB2, 0xFF, 0x42, 0xD3, 0xFF, 0xA2, 0xDB, 0xFF, 0xC2, 0xDB, 0xFF, 0x81, 0xDB, 0xFF, 0xC1, 0xCA, 0xFF, 0xC2, 0xBA, 0xFF, 0xA2, 0xBA, 0xFF, 0xE1, 0xA1, 0xFF, 0x21, 0xB2, 0xFF, 0x01, 0xCB, 0xFF, 0x62, 0xD3, 0xFF, 0x82, 0xD3, 0xFF, 0x21, 0xD3, 0xFF, 0x81, 0xC2, 0xFF, 0xA2, 0xBA, 0xFF, 0xE0, 0xA1, 0xFF, 0x26, 0x7A, 0xFF, 0x56, 0xAD, 0xFF, 0x35, 0xAD, 0xFF, 0x15, 0xA5, 0xFF, 0xF4, 0x9C, 0xFF, 0x93, 0x94, 0xFF, 0x52, 0x8C, 0xFF, 0x31, 0x84, 0xFF, 0xF0, 0x7B, 0xFF, 0x35, 0xA5, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xF4, 0x9C, 0xFF, 0x72, 0x8C, 0xFF, 0xD4, 0x9C, 0xFF, 0xF4, 0x9C, 0xFF, 0xF4, 0x9C, 0xFF, 0x14, 0x9D, 0xFF, 0xF4, 0x9C, 0xFF, 0xB3, 0x9C, 0xFF, 0x10, 0x8C, 0xFF, 0xA3, 0x81, 0xFF, 0x61, 0xBA, 0xFF, 0xC2, 0xBA, 0xFF, 0x82, 0xBA, 0xFF, 0xC2, 0xDB, 0xFF, 0x02, 0xDC, 0xFF, 0x02, 0xDC, 0xFF, 0x22, 0xE4, 0xFF, 0x82, 0xD3, 0xFF, 0xC2, 0xC2, 0xFF, 0x02, 0xC3, 0xFF, 0xE2, 0xC2, 0xFF, 0x81, 0xBA, 0xFF, 0xE2, 0xDB, 0xFF, 0x22, 0xE4, 0xFF, 0x22, 0xE4, 0xFF, 0x22, 0xE4, 0xFF, 0x82, 0xD3, 0xFF, 0xE2, 0xC2, 0xFF, 0x02, 0xC3, 0xFF, 0x82, 0xBA, 0xFF, 0x81, 0xC2, 0xFF, 0xC2, 0xDB, 0xFF, 0x02, 0xDC, 0xFF, 0x02, 0xE4, 0xFF, 0x02, 0xE4, 0xFF, 0x42, 0xD3, 0xFF, 0xE2, 0xC2, 0xFF, 0xE2, 0xC2, 0xFF, 0xC1, 0x99, 0xFF, 0x61, 0xB2, 0xFF, 0x02, 0xC3, 0xFF, 0xA2, 0xBA, 0xFF, 0x01, 0xB2, 0xFF, 0x21, 0xD3, 0xFF, 0xC2, 0xDB, 0xFF, 0xC2, 0xDB, 0xFF, 0xC2, 0xDB, 0xFF, 0x42, 0xD3, 0xFF, 0xE2, 0xC2, 0xFF, 0xC2, 0xBA, 0xFF, 0x42, 0xAA, 0xFF, 0x21, 0xB2, 0xFF, 0x21, 0xD3, 0xFF, 0x82, 0xDB, 0xFF, 0xA2, 0xDB, 0xFF, 0x61, 0xD3, 0xFF, 0xE2, 0xCA, 0xFF, 0xE2, 0xC2, 0xFF, 0xA2, 0xBA, 0xFF, 0x01, 0xA2, 0xFF, 0x01, 0xB2, 0xFF, 0xE1, 0xCA, 0xFF, 0x41, 0xD3, 0xFF, 0x61, 0xD3, 0xFF, 0x01, 0xD3, 0xFF, 0xC2, 0xC2, 0xFF, 0xA2, 0xBA, 0xFF, 0xC0, 0xA1, 0xFF, 0x26, 0x7A, 0xFF, 0x56, 0xAD, 0xFF, 0x35, 0xAD, 0xFF, 0x15, 0xA5, 0xFF, 0xD4, 0x9C, 0xFF, 0x93, 0x94, 0xFF, 0x52, 0x8C, 0xFF, 0x31, 0x84, 0xFF, 0xF0, 0x7B, 0xFF, 0x35, 0xA5, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xF4, 0x9C, 0xFF, 0x72, 0x8C, 0xFF, 0xD4, 0x9C, 0xFF, 0xD4, 0x9C, 0xFF, 0xF4, 0x9C, 0xFF, 0xF4, 0x9C, 0xFF, 0xF4, 0x9C, 0xFF, 0xB3, 0x9C, 0xFF, 0x10, 0x8C, 0xFF, 0xA3, 0x79, 0xFF, 0x61, 0xBA, 0xFF, 0xC2, 0xBA, 0xFF, 0xA5, 0xCB, 0xFF, 0x07, 0xD4, 0xFF, 0x27, 0xD4, 0xFF, 0x27, 0xD4, 0xFF, 0x48, 0xDC, 0xFF, 0x06, 0xD4, 0xFF, 0x23, 0xCB, 0xFF, 0xE2, 0xC2, 0xFF, 0x23, 0xC3, 0xFF, 0xE6, 0xD3, 0xFF, 0x48, 0xDC, 0xFF, 0x48, 0xDC, 0xFF, 0x68, 0xDC, 0xFF, 0x68, 0xDC, 0xFF, 0x27, 0xD4, 0xFF, 0x23, 0xC3, 0xFF, 0xE2, 0xC2, 0xFF, 0x23, 0xCB, 0xFF, 0xE6, 0xD3, 0xFF, 0x27, 0xDC, 0xFF, 0x27, 0xDC, 0xFF, 0x27, 0xDC, 0xFF, 0x27, 0xDC, 0xFF, 0xC6, 0xD3, 0xFF, 0xE2, 0xC2, 0xFF, 0xE2, 0xC2, 0xFF, 0xC1, 0x99, 0xFF, 0x61, 0xB2, 0xFF, 0xE2, 0xC2, 0xFF, 0xE2, 0xC2, 0xFF, 0x64, 0xCB, 0xFF, 0xC5, 0xD3, 0xFF, 0xC5, 0xD3, 0xFF, 0xC5, 0xD3, 0xFF, 0xC5, 0xD3, 0xFF, 0xC6, 0xD3, 0xFF, 0x03, 0xC3, 0xFF, 0xA2, 0xBA, 0xFF, 0xE3, 0xBA, 0xFF, 0x44, 0xCB, 0xFF, 0x84, 0xCB, 0xFF, 0x84, 0xCB, 0xFF, 0x84, 0xD3, 0xFF, 0x84, 0xCB, 0xFF, 0x85, 0xCB, 0xFF, 0xC2, 0xBA, 0xFF, 0x82, 0xBA, 0xFF, 0xC3, 0xBA, 0xFF, 0x03, 0xC3, 0xFF, 0x23, 0xCB, 0xFF, 0x43, 0xCB, 0xFF, 0x23, 0xCB, 0xFF, 0x23, 0xCB, 0xFF, 0x44, 0xC3, 0xFF, 0x82, 0xB2, 0xFF, 0xC0, 0xA1, 0xFF, 0x26, 0x7A, 0xFF, 0x35, 0xAD, 0xFF, 0x35, 0xA5, 0xFF, 0x15, 0xA5, 0xFF, 0xD4, 0x9C, 0xFF, 0x93, 0x94, 0xFF, 0x52, 0x8C, 0xFF, 0x31, 0x84, 0xFF, 0xF0, 0x7B, 0xFF, 0x35, 0xA5, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xF4, 0x9C, 0xFF, 0x72, 0x8C, 0xFF, 0xD4, 0x9C, 0xFF, 0xD4, 0x9C, 0xFF, 0xF4, 0x9C, 0xFF, 0xF4, 0x9C, 0xFF, 0xF4, 0x9C, 0xFF, 0xB3, 0x9C, 0xFF, 0x10, 0x8C, 0xFF, 0xA3, 0x79, 0xFF, 0x41, 0xBA, 0xFF, 0xA2, 0xBA, 0xFF, 0xA2, 0xBA, 0xFF, 0xA2, 0xBA, 0xFF, 0xA2, 0xBA, 0xFF, 0xA2, 0xBA, 0xFF, 0xC2, 0xBA, 0xFF, 0xC2, 0xC2, 0xFF, 0xE2, 0xC2, 0xFF, 0xE2, 0xC2, 0xFF, 0xE2, 0xC2, 0xFF, 0xE2, 0xC2, 0xFF, 0xC2, 0xC2, 0xFF, 0xC2, 0xBA, 0xFF, 0xC2, 0xBA, 0xFF, 0xC2, 0xC2, 0xFF, 0xC2, 0xC2, 0xFF, 0xE2, 0xC2, 0xFF, 0xE2, 0xC2, 0xFF, 0xE2, 0xC2, 0xFF, 0xE2, 0xC2, 0xFF, 0xC2, 0xBA, 0xFF, 0xC2, 0xBA, 0xFF, 0xC2, 0xBA, 0xFF, 0xC2, 0xBA, 0xFF, 0xC2, 0xC2, 0xFF, 0xC2, 0xBA, 0xFF, 0xE2, 0xC2, 0xFF, 0xC1, 0x99, 0xFF, 0x61, 0xB2, 0xFF, 0xE2, 0xC2, 0xFF, 0xC2, 0xBA, 0xFF, 0xC2, 0xC2, 0xFF, 0xA2, 0xBA, 0xFF, 0xA2, 0xBA, 0xFF, 0xA2, 0xBA, 0xFF, 0xA2, 0xBA, 0xFF, 0xA2, 0xBA, 0xFF, 0xA2, 0xBA, 0xFF, 0xA2, 0xBA, 0xFF, 0xA2, 0xBA, 0xFF, 0xA2, 0xBA, 0xFF, 0xA2, 0xBA, 0xFF, 0xA2, 0xBA, 0xFF, 0x82, 0xBA, 0xFF, 0xA2, 0xBA, 0xFF, 0x81, 0xBA, 0xFF, 0x82, 0xBA, 0xFF, 0x82, 0xBA, 0xFF, 0x82, 0xBA, 0xFF, 0x82, 0xBA, 0xFF, 0x82, 0xB2, 0xFF, 0x62, 0xB2, 0xFF, 0x62, 0xB2, 0xFF, 0x62, 0xB2, 0xFF, 0x41, 0xB2, 0xFF, 0x62, 0xB2, 0xFF, 0xC0, 0xA1, 0xFF, 0x26, 0x7A, 0xFF, 0x35, 0xAD, 0xFF, 0x35, 0xA5, 0xFF, 0x15, 0xA5, 0xFF, 0xD4, 0x9C, 0xFF, 0x93, 0x94, 0xFF, 0x52, 0x8C, 0xFF, 0x31, 0x84, 0xFF, 0xF0, 0x7B, 0xFF, 0x35, 0xA5, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xF4, 0x9C, 0xFF, 0x72, 0x8C, 0xFF, 0xB3, 0x94, 0xFF, 0xD4, 0x9C, 0xFF, 0xF4, 0x9C, 0xFF, 0xF4, 0x9C, 0xFF, 0xF4, 0x9C, 0xFF, 0xB3, 0x9C, 0xFF, 0x10, 0x8C, 0xFF, 0xA3, 0x79, 0xFF, 0x41, 0xB2, 0xFF, 0x82, 0xBA, 0xFF, 0x60, 0x89, 0xFF, 0xE0, 0x78, 0xFF, 0x00, 0x81, 0xFF, 0x00, 0x79, 0xFF, 0x00, 0x79, 0xFF, 0x00, 0x79, 0xFF, 0x41, 0xB2, 0xFF, 0xE2, 0xC2, 0xFF, 0x82, 0xBA, 0xFF, 0x40, 0x81, 0xFF, 0x00, 0x79, 0xFF, 0x00, 0x81, 0xFF, 0x00, 0x81, 0xFF, 0x00, 0x79, 0xFF, 0x20, 0x81, 0xFF, 0x81, 0xBA, 0xFF, 0xE2, 0xC2, 0xFF, 0x41, 0xB2, 0xFF, 0x00, 0x79, 0xFF, 0x00, 0x79, 0xFF, 0x00, 0x81, 0xFF, 0x00, 0x81, 0xFF, 0xE0, 0x78, 0xFF, 0x80, 0x91, 0xFF, 0xC2, 0xC2, 0xFF, 0xE2, 0xC2, 0xFF, 0xC1, 0x99, 0xFF, 0x41, 0xAA, 0xFF, 0xE2, 0xC2, 0xFF, 0x82, 0xB2, 0xFF, 0x20, 0x81, 0xFF, 0xE0, 0x78, 0xFF, 0x00, 0x81, 0xFF, 0x00, 0x81, 0xFF, 0xE0, 0x78, 0xFF, 0x20, 0x81, 0xFF, 0x81, 0xB2, 0xFF, 0xC2, 0xBA, 0xFF, 0x21, 0xAA, 0xFF, 0x00, 0x79, 0xFF, 0x00, 0x79, 0xFF, 0x00, 0x79, 0xFF, 0x00, 0x81, 0xFF, 0xE0, 0x70, 0xFF, 0x60, 0x89, 0xFF, 0x82, 0xBA, 0xFF, 0x82, 0xBA, 0xFF, 0xE1, 0xA1, 0xFF, 0x00, 0x79, 0xFF, 0x00, 0x79, 0xFF, 0x00, 0x79, 0xFF, 0x00, 0x79, 0xFF, 0xC0, 0x70, 0xFF, 0x81, 0x91, 0xFF, 0x62, 0xB2, 0xFF, 0xC0, 0xA1, 0xFF, 0x26, 0x7A, 0xFF, 0x35, 0xA5, 0xFF, 0x35, 0xA5, 0xFF, 0x15, 0xA5, 0xFF, 0xD4, 0x9C, 0xFF, 0x93, 0x94, 0xFF, 0x52, 0x8C, 0xFF, 0x31, 0x84, 0xFF, 0xF0, 0x7B, 0xFF, 0x35, 0xAD, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xF4, 0x9C, 0xFF, 0x72, 0x8C, 0xFF, 0xB3, 0x94, 0xFF, 0xD4, 0x9C, 0xFF, 0xF4, 0x9C, 0xFF, 0xF4, 0x9C, 0xFF, 0xF4, 0x9C, 0xFF, 0xB3, 0x9C, 0xFF, 0x10, 0x84, 0xFF, 0xA3, 0x79, 0xFF, 0x41, 0xB2, 0xFF, 0xA2, 0xBA, 0xFF, 0x41, 0x89, 0xFF, 0x80, 0x99, 0xFF, 0xC1, 0xA1, 0xFF, 0xC1, 0xA1, 0xFF, 0xA1, 0x99, 0xFF, 0x20, 0x89, 0xFF, 0x41, 0xAA, 0xFF, 0xE2, 0xC2, 0xFF, 0x82, 0xBA, 0xFF, 0x40, 0x89, 0xFF, 0xA1, 0x99, 0xFF, 0xC1, 0xA1, 0xFF, 0xC1, 0xA1, 0xFF, 0xA1, 0x99, 0xFF, 0x40, 0x89, 0xFF, 0x81, 0xBA, 0xFF, 0xE2, 0xC2, 0xFF, 0x21, 0xAA, 0xFF, 0x40, 0x89, 0xFF, 0xC1, 0xA1, 0xFF, 0xC1, 0xA1, 0xFF, 0xC1, 0xA1, 0xFF, 0x60, 0x91, 0xFF, 0x81, 0x91, 0xFF, 0xC2, 0xC2, 0xFF, 0xC2, 0xC2, 0xFF, 0xC1, 0x99, 0xFF, 0x41, 0xAA, 0xFF, 0xE2, 0xC2, 0xFF, 0x62, 0xB2, 0xFF, 0x40, 0x89, 0xFF, 0xA1, 0xA1, 0xFF, 0xC1, 0xA1, 0xFF, 0xC1, 0xA1, 0xFF, 0x81, 0x99, 0xFF, 0x40, 0x89, 0xFF, 0xA2, 0xBA, 0xFF, 0xC2, 0xBA, 0xFF, 0xE1, 0xA1, 0xFF, 0x61, 0x91, 0xFF, 0xC1, 0xA1, 0xFF, 0xC1, 0xA1, 0xFF, 0xC1, 0xA1, 0xFF, 0x60, 0x91, 0xFF, 0x61, 0x91, 0xFF, 0xC2, 0xBA, 0xFF, 0x82, 0xBA, 0xFF, 0xA1, 0x99, 0xFF, 0x61, 0x91, 0xFF, 0xC1, 0xA1, 0xFF, 0xC1, 0xA1, 0xFF, 0xC1, 0xA1, 0xFF, 0x20, 0x89, 0xFF, 0xA1, 0x91, 0xFF, 0xA2, 0xBA, 0xFF, 0xC0, 0xA1, 0xFF, 0x26, 0x7A, 0xFF, 0x35, 0xA5, 0xFF, 0x15, 0xA5, 0xFF, 0x14, 0xA5, 0xFF, 0xD4, 0x9C, 0xFF, 0x93, 0x94, 0xFF, 0x52, 0x8C, 0xFF, 0x31, 0x84, 0xFF, 0xF0, 0x7B, 0xFF, 0x35, 0xAD, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xF4, 0x9C, 0xFF, 0x52, 0x8C, 0xFF, 0xB3, 0x94, 0xFF, 0xD4, 0x9C, 0xFF, 0xD4, 0x9C, 0xFF, 0xF4, 0x9C, 0xFF, 0xD4, 0x9C, 0xFF, 0xB3, 0x9C, 0xFF, 0x10, 0x84, 0xFF, 0xA3, 0x79, 0xFF, 0x41, 0xB2, 0xFF, 0xA2, 0xBA, 0xFF, 0xC1, 0xA1, 0xFF, 0x61, 0xBA, 0xFF, 0xA1, 0xC2, 0xFF, 0xA1, 0xC2, 0xFF, 0x81, 0xBA, 0xFF, 0xE1, 0xA9, 0xFF, 0x41, 0xB2, 0xFF, 0xC2, 0xC2, 0xFF, 0x82, 0xBA, 0xFF, 0xC1, 0xA1, 0xFF, 0x81, 0xBA, 0xFF, 0xA1, 0xC2, 0xFF, 0xA1, 0xC2, 0xFF, 0x81, 0xBA, 0xFF, 0xE1, 0xA9, 0xFF, 0x81, 0xBA, 0xFF, 0xE2, 0xC2, 0xFF, 0x42, 0xAA, 0xFF, 0xE1, 0xA9, 0xFF, 0xA1, 0xC2, 0xFF, 0xA1, 0xC2, 0xFF, 0xA1, 0xC2, 0xFF, 0x41, 0xB2, 0xFF, 0x01, 0xAA, 0xFF, 0xC2, 0xC2, 0xFF, 0xC2, 0xC2, 0xFF, 0xC1, 0x99, 0xFF, 0x41, 0xAA, 0xFF, 0xE2, 0xC2, 0xFF, 0x62, 0xB2, 0xFF, 0xC1, 0xA1, 0xFF, 0x81, 0xBA, 0xFF, 0xA1, 0xC2, 0xFF, 0xA1, 0xC2, 0xFF, 0x61, 0xBA, 0xFF, 0xC1, 0xA9, 0xFF, 0xA2, 0xBA, 0xFF, 0xC2, 0xBA, 0xFF, 0x01, 0xA2, 0xFF, 0x01, 0xAA, 0xFF, 0xA1, 0xC2, 0xFF, 0xA1, 0xC2, 0xFF, 0xA1, 0xC2, 0xFF, 0x21, 0xB2, 0xFF, 0xE1, 0xA9, 0xFF, 0xC2, 0xBA, 0xFF, 0x82, 0xB2, 0xFF, 0xC1, 0x99, 0xFF, 0x01, 0xB2, 0xFF, 0x81, 0xBA, 0xFF, 0x81, 0xBA, 0xFF, 0x81, 0xBA, 0xFF, 0xE1, 0xA9, 0xFF, 0xE1, 0xA9, 0xFF, 0x82, 0xBA, 0xFF, 0xC0, 0xA1, 0xFF, 0x06, 0x72, 0xFF, 0x35, 0xA5, 0xFF, 0x15, 0xA5, 0xFF, 0x14, 0xA5, 0xFF, 0xD4, 0x9C, 0xFF, 0x93, 0x94, 0xFF, 0x52, 0x8C, 0xFF, 0x31, 0x84, 0xFF, 0xF0, 0x83, 0xFF, 0x55, 0xAD, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xF4, 0x9C, 0xFF, 0x52, 0x8C, 0xFF, 0xB3, 0x94, 0xFF, 0xD4, 0x9C, 0xFF, 0xD4, 0x9C, 0xFF, 0xF4, 0x9C, 0xFF, 0xD4, 0x9C, 0xFF, 0xB3, 0x9C, 0xFF, 0x10, 0x84, 0xFF, 0x83, 0x79, 0xFF, 0x41, 0xB2, 0xFF, 0x82, 0xBA, 0xFF, 0xE1, 0xA9, 0xFF, 0xE1, 0xCA, 0xFF, 0x21, 0xCB, 0xFF, 0x21, 0xCB, 0xFF, 0x01, 0xCB, 0xFF, 0x41, 0xBA, 0xFF, 0x41, 0xB2, 0xFF, 0xC2, 0xC2, 0xFF, 0x82, 0xBA, 0xFF, 0xE1, 0xA9, 0xFF, 0xE1, 0xCA, 0xFF, 0x21, 0xCB, 0xFF, 0x21, 0xCB, 0xFF, 0x01, 0xCB, 0xFF, 0x41, 0xBA, 0xFF, 0x81, 0xBA, 0xFF, 0xE2, 0xC2, 0xFF, 0x22, 0xAA, 0xFF, 0x01, 0xAA, 0xFF, 0x01, 0xCB, 0xFF, 0x21, 0xCB, 0xFF, 0x01, 0xCB, 0xFF, 0xC1, 0xC2, 0xFF, 0x41, 0xB2, 0xFF, 0xA2, 0xBA, 0xFF, 0xC2, 0xC2, 0xFF, 0xA1, 0x91, 0xFF, 0x41, 0xAA, 0xFF, 0xE2, 0xC2, 0xFF, 0x42, 0xB2, 0xFF, 0xC1, 0xA1, 0xFF, 0xC1, 0xC2, 0xFF, 0x01, 0xCB, 0xFF, 0x01, 0xCB, 0xFF, 0xE1, 0xC2, 0xFF, 0x21, 0xB2, 0xFF, 0xA2, 0xBA, 0xFF, 0xA2, 0xBA, 0xFF, 0x01, 0xA2, 0xFF, 0x01, 0xB2, 0xFF, 0xE1, 0xC2, 0xFF, 0x01, 0xCB, 0xFF, 0x01, 0xCB, 0xFF, 0xA1, 0xC2, 0xFF, 0x21, 0xB2, 0xFF, 0xA2, 0xBA, 0xFF, 0x82, 0xB2, 0xFF, 0xC1, 0x99, 0xFF, 0x21, 0xB2, 0xFF, 0xA1, 0xC2, 0xFF, 0xC1, 0xC2, 0xFF, 0xE1, 0xC2, 0xFF, 0x61, 0xBA, 0xFF, 0x21, 0xB2, 0xFF, 0x82, 0xB2, 0xFF, 0xC0, 0xA1, 0xFF, 0x06, 0x72, 0xFF, 0x35, 0xA5, 0xFF, 0x15, 0xA5, 0xFF, 0xF4, 0xA4, 0xFF, 0xD4, 0x9C, 0xFF, 0x93, 0x94, 0xFF, 0x52, 0x8C, 0xFF, 0x31, 0x84, 0xFF, 0x10, 0x84, 0xFF, 0x55, 0xAD, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xD4, 0x9C, 0xFF, 0x52, 0x8C, 0xFF, 0xB3, 0x94, 0xFF, 0xD3, 0x9C, 0xFF, 0xD4, 0x9C, 0xFF, 0xF4, 0x9C, 0xFF, 0xD4, 0x9C, 0xFF, 0x93, 0x9C, 0xFF, 0xF0, 0x8B, 0xFF, 0x83, 0x79, 0xFF, 0x21, 0xB2, 0xFF, 0x82, 0xB2, 0xFF, 0x01, 0xAA, 0xFF, 0x41, 0xD3, 0xFF, 0x81, 0xD3, 0xFF, 0x61, 0xD3, 0xFF, 0x61, 0xD3, 0xFF, 0xA1, 0xC2, 0xFF, 0x41, 0xB2, 0xFF, 0xC2, 0xC2, 0xFF, 0x82, 0xB2, 0xFF, 0x01, 0xAA, 0xFF, 0x41, 0xD3, 0xFF, 0x81, 0xD3, 0xFF, 0x61, 0xD3, 0xFF, 0x61, 0xD3, 0xFF, 0xA1, 0xC2, 0xFF, 0x81, 0xBA, 0xFF, 0xC2, 0xC2, 0xFF, 0x21, 0xAA, 0xFF, 0x21, 0xB2, 0xFF, 0x61, 0xD3, 0xFF, 0x61, 0xD3, 0xFF, 0x61, 0xD3, 0xFF, 0x21, 0xCB, 0xFF, 0x61, 0xBA, 0xFF, 0xA2, 0xBA, 0xFF, 0xC2, 0xC2, 0xFF, 0xA1, 0x91, 0xFF, 0x21, 0xAA, 0xFF, 0xC2, 0xC2, 0xFF, 0x42, 0xB2, 0xFF, 0xE1, 0xA9, 0xFF, 0x01, 0xCB, 0xFF, 0x61, 0xD3, 0xFF, 0x61, 0xD3, 0xFF, 0x41, 0xCB, 0xFF, 0x61, 0xBA, 0xFF, 0x82, 0xBA, 0xFF, 0xA2, 0xBA, 0xFF, 0x01, 0xA2, 0xFF, 0x21, 0xB2, 0xFF, 0x01, 0xCB, 0xFF, 0x41, 0xD3, 0xFF, 0x41, 0xD3, 0xFF, 0xE1, 0xCA, 0xFF, 0x41, 0xBA, 0xFF, 0xA2, 0xBA, 0xFF, 0x82, 0xB2, 0xFF, 0xC1, 0x99, 0xFF, 0x21, 0xB2, 0xFF, 0xE1, 0xC2, 0xFF, 0x01, 0xCB, 0xFF, 0x21, 0xCB, 0xFF, 0xA1, 0xC2, 0xFF, 0x21, 0xB2, 0xFF, 0x82, 0xB2, 0xFF, 0xA0, 0xA1, 0xFF, 0x06, 0x72, 0xFF, 0x15, 0xA5, 0xFF, 0x15, 0xA5, 0xFF, 0xF4, 0x9C, 0xFF, 0xD4, 0x9C, 0xFF, 0x93, 0x94, 0xFF, 0x52, 0x8C, 0xFF, 0x52, 0x84, 0xFF, 0x11, 0x84, 0xFF, 0x55, 0xAD, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xD4, 0x9C, 0xFF, 0x52, 0x8C, 0xFF, 0xB3, 0x94, 0xFF, 0xB3, 0x94, 0xFF, 0xD4, 0x9C, 0xFF, 0xD4, 0x9C, 0xFF, 0xD4, 0x9C, 0xFF, 0x93, 0x9C, 0xFF, 0xF0, 0x8B, 0xFF, 0x83, 0x79, 0xFF, 0x21, 0xB2, 0xFF, 0x82, 0xB2, 0xFF, 0x01, 0xAA, 0xFF, 0x41, 0xD3, 0xFF, 0xA1, 0xD3, 0xFF, 0x81, 0xD3, 0xFF, 0x81, 0xD3, 0xFF, 0xC1, 0xC2, 0xFF, 0x41, 0xB2, 0xFF, 0xC2, 0xBA, 0xFF, 0x62, 0xB2, 0xFF, 0x01, 0xB2, 0xFF, 0x61, 0xD3, 0xFF, 0xA1, 0xD3, 0xFF, 0x81, 0xD3, 0xFF, 0x81, 0xD3, 0xFF, 0xC1, 0xC2, 0xFF, 0x81, 0xBA, 0xFF, 0xC2, 0xC2, 0xFF, 0x21, 0xAA, 0xFF, 0x41, 0xB2, 0xFF, 0x61, 0xD3, 0xFF, 0x82, 0xD3, 0xFF, 0x81, 0xD3, 0xFF, 0x41, 0xD3, 0xFF, 0x81, 0xBA, 0xFF, 0xA2, 0xBA, 0xFF, 0xC2, 0xBA, 0xFF, 0xA1, 0x91, 0xFF, 0x21, 0xAA, 0xFF, 0xC2, 0xC2, 0xFF, 0x42, 0xAA, 0xFF, 0xE1, 0xA9, 0xFF, 0x01, 0xCB, 0xFF, 0x61, 0xD3, 0xFF, 0x61, 0xD3, 0xFF, 0x41, 0xD3, 0xFF, 0x81, 0xC2, 0xFF, 0x81, 0xBA, 0xFF, 0xA2, 0xBA, 0xFF, 0x01, 0xA2, 0xFF, 0x21, 0xB2, 0xFF, 0x21, 0xCB, 0xFF, 0x61, 0xD3, 0xFF, 0x61, 0xD3, 0xFF, 0x01, 0xCB, 0xFF, 0x41, 0xBA, 0xFF, 0x82, 0xBA, 0xFF, 0x81, 0xB2, 0xFF, 0xC1, 0x99, 0xFF, 0x21, 0xB2, 0xFF, 0xE1, 0xC2, 0xFF, 0x21, 0xCB, 0xFF, 0x41, 0xD3, 0xFF, 0xC1, 0xCA, 0xFF, 0x21, 0xB2, 0xFF, 0x62, 0xB2, 0xFF, 0xA0, 0xA1, 0xFF, 0x06, 0x72, 0xFF, 0x15, 0xA5, 0xFF, 0x14, 0xA5, 0xFF, 0xF4, 0x9C, 0xFF, 0xD4, 0x9C, 0xFF, 0x93, 0x94, 0xFF, 0x52, 0x8C, 0xFF, 0x52, 0x8C, 0xFF, 0x11, 0x84, 0xFF, 0x55, 0xAD, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xD4, 0x9C, 0xFF, 0x52, 0x8C, 0xFF, 0xB3, 0x94, 0xFF, 0xB3, 0x94, 0xFF, 0xD4, 0x9C, 0xFF, 0xD4, 0x9C, 0xFF, 0xD4, 0x9C, 0xFF, 0x93, 0x9C, 0xFF, 0xF0, 0x8B, 0xFF, 0x83, 0x79, 0xFF, 0x21, 0xB2, 0xFF, 0x62, 0xB2, 0xFF, 0x01, 0xB2, 0xFF, 0x61, 0xD3, 0xFF, 0xA1, 0xD3, 0xFF, 0x81, 0xD3, 0xFF, 0x82, 0xD3, 0xFF, 0xE1, 0xC2, 0xFF, 0x21, 0xB2, 0xFF, 0xC2, 0xBA, 0xFF, 0x62, 0xB2, 0xFF, 0x01, 0xB2, 0xFF, 0x61, 0xD3, 0xFF, 0xA2, 0xD3, 0xFF, 0xA2, 0xD3, 0xFF, 0xA1, 0xD3, 0xFF, 0xC1, 0xC2, 0xFF, 0x61, 0xBA, 0xFF, 0xC2, 0xC2, 0xFF, 0x21, 0xAA, 0xFF, 0x41, 0xB2, 0xFF, 0x81, 0xD3, 0xFF, 0xA2, 0xD3, 0xFF, 0x81, 0xD3, 0xFF, 0x61, 0xD3, 0xFF, 0x81, 0xBA, 0xFF, 0x81, 0xBA, 0xFF, 0xC2, 0xBA, 0xFF, 0xA1, 0x91, 0xFF, 0x21, 0xAA, 0xFF, 0xC2, 0xC2, 0xFF, 0x42, 0xAA, 0xFF, 0xE1, 0xA9, 0xFF, 0x01, 0xCB, 0xFF, 0x81, 0xD3, 0xFF, 0x81, 0xD3, 0xFF, 0x61, 0xD3, 0xFF, 0xA1, 0xC2, 0xFF, 0x81, 0xBA, 0xFF, 0xA2, 0xBA, 0xFF, 0x01, 0xA2, 0xFF, 0x21, 0xB2, 0xFF, 0x21, 0xCB, 0xFF, 0x61, 0xD3, 0xFF, 0x61, 0xD3, 0xFF, 0x21, 0xCB, 0xFF, 0x61, 0xBA, 0xFF, 0x82, 0xB2, 0xFF, 0x61, 0xB2, 0xFF, 0xC1, 0x99, 0xFF, 0x21, 0xB2, 0xFF, 0xE1, 0xC2, 0xFF, 0x21, 0xCB, 0xFF, 0x41, 0xD3, 0xFF, 0xC1, 0xCA, 0xFF, 0x21, 0xB2, 0xFF, 0x62, 0xB2, 0xFF, 0xA0, 0xA1, 0xFF, 0x06, 0x72, 0xFF, 0x15, 0xA5, 0xFF, 0x14, 0xA5, 0xFF, 0xF4, 0x9C, 0xFF, 0xD4, 0x9C, 0xFF, 0x93, 0x94, 0xFF, 0x52, 0x8C, 0xFF, 0x52, 0x8C, 0xFF, 0x11, 0x84, 0xFF, 0x55, 0xAD, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xD4, 0x9C, 0xFF, 0x52, 0x8C, 0xFF, 0x93, 0x94, 0xFF, 0xB3, 0x94, 0xFF, 0xD4, 0x9C, 0xFF, 0xD4, 0x9C, 0xFF, 0xD3, 0x9C, 0xFF, 0x93, 0x9C, 0xFF, 0xF0, 0x8B, 0xFF, 0x83, 0x79, 0xFF, 0x21, 0xB2, 0xFF, 0x62, 0xB2, 0xFF, 0x01, 0xB2, 0xFF, 0x61, 0xD3, 0xFF, 0xA1, 0xD3, 0xFF, 0xA1, 0xD3, 0xFF, 0x81, 0xD3, 0xFF, 0xC1, 0xC2, 0xFF, 0x21, 0xB2, 0xFF, 0xA2, 0xBA, 0xFF, 0x61, 0xB2, 0xFF, 0x01, 0xB2, 0xFF, 0x61, 0xD3, 0xFF, 0xA1, 0xD3, 0xFF, 0xA2, 0xD3, 0xFF, 0xA1, 0xDB, 0xFF, 0xC1, 0xC2, 0xFF, 0x61, 0xB2, 0xFF, 0xC2, 0xBA, 0xFF, 0x21, 0xAA, 0xFF, 0x41, 0xB2, 0xFF, 0x81, 0xD3, 0xFF, 0xA1, 0xD3, 0xFF, 0xA1, 0xD3, 0xFF, 0x61, 0xD3, 0xFF, 0x81, 0xBA, 0xFF, 0x81, 0xBA, 0xFF, 0xA2, 0xBA, 0xFF, 0xA1, 0x91, 0xFF, 0x21, 0xAA, 0xFF, 0xC2, 0xC2, 0xFF, 0x41, 0xAA, 0xFF, 0xE1, 0xA9, 0xFF, 0x01, 0xCB, 0xFF, 0x81, 0xD3, 0xFF, 0x81, 0xD3, 0xFF, 0x61, 0xD3, 0xFF, 0xA1, 0xC2, 0xFF, 0x81, 0xBA, 0xFF, 0xA2, 0xBA, 0xFF, 0x01, 0xA2, 0xFF, 0x21, 0xB2, 0xFF, 0x21, 0xCB, 0xFF, 0x61, 0xD3, 0xFF, 0x61, 0xD3, 0xFF, 0x21, 0xCB, 0xFF, 0x61, 0xBA, 0xFF, 0x82, 0xB2, 0xFF, 0x62, 0xB2, 0xFF, 0xC1, 0x99, 0xFF, 0x21, 0xB2, 0xFF, 0xE1, 0xC2, 0xFF, 0x21, 0xCB, 0xFF, 0x41, 0xCB, 0xFF, 0xE1, 0xCA, 0xFF, 0x41, 0xB2, 0xFF, 0x62, 0xB2, 0xFF, 0xA0, 0x99, 0xFF, 0x06, 0x72, 0xFF, 0x15, 0xA5, 0xFF, 0xF4, 0xA4, 0xFF, 0xF4, 0x9C, 0xFF, 0xD4, 0x9C, 0xFF, 0x93, 0x94, 0xFF, 0x52, 0x8C, 0xFF, 0x52, 0x8C, 0xFF, 0x11, 0x84, 0xFF, 0x55, 0xAD, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xD4, 0x9C, 0xFF, 0x32, 0x84, 0xFF, 0x93, 0x94, 0xFF, 0xB3, 0x94, 0xFF, 0xD4, 0x9C, 0xFF, 0xD4, 0x9C, 0xFF, 0xD3, 0x9C, 0xFF, 0x93, 0x94, 0xFF, 0xF0, 0x8B, 0xFF, 0x83, 0x79, 0xFF, 0x21, 0xB2, 0xFF, 0x62, 0xB2, 0xFF, 0x01, 0xB2, 0xFF, 0x61, 0xD3, 0xFF, 0xA1, 0xD3, 0xFF, 0xA1, 0xD3, 0xFF, 0x81, 0xD3, 0xFF, 0xC1, 0xC2, 0xFF, 0x21, 0xB2, 0xFF, 0xA2, 0xBA, 0xFF, 0x61, 0xB2, 0xFF, 0x01, 0xB2, 0xFF, 0x61, 0xD3, 0xFF, 0xA2, 0xD3, 0xFF, 0xA2, 0xD3, 0xFF, 0xA1, 0xD3, 0xFF, 0xC1, 0xC2, 0xFF, 0x61, 0xB2, 0xFF, 0xC2, 0xBA, 0xFF, 0x21, 0xAA, 0xFF, 0x41, 0xB2, 0xFF, 0x81, 0xD3, 0xFF, 0xA1, 0xD3, 0xFF, 0xA1, 0xD3, 0xFF, 0x61, 0xD3, 0xFF, 0x81, 0xBA, 0xFF, 0x82, 0xBA, 0xFF, 0xA2, 0xBA, 0xFF, 0xA1, 0x91, 0xFF, 0x21, 0xA2, 0xFF, 0xC2, 0xC2, 0xFF, 0x41, 0xAA, 0xFF, 0xE1, 0xA9, 0xFF, 0x01, 0xCB, 0xFF, 0x81, 0xD3, 0xFF, 0x81, 0xD3, 0xFF, 0x61, 0xD3, 0xFF, 0xA1, 0xC2, 0xFF, 0x61, 0xB2, 0xFF, 0x82, 0xBA, 0xFF, 0x01, 0xA2, 0xFF, 0x21, 0xB2, 0xFF, 0x21, 0xCB, 0xFF, 0x61, 0xD3, 0xFF, 0x61, 0xD3, 0xFF, 0x21, 0xCB, 0xFF, 0x61, 0xBA, 0xFF, 0x82, 0xB2, 0xFF, 0x62, 0xB2, 0xFF, 0xC1, 0x99, 0xFF, 0x21, 0xB2, 0xFF, 0xE1, 0xC2, 0xFF, 0x21, 0xCB, 0xFF, 0x41, 0xD3, 0xFF, 0xE1, 0xCA, 0xFF, 0x21, 0xB2, 0xFF, 0x62, 0xB2, 0xFF, 0xA0, 0x99, 0xFF, 0x06, 0x72, 0xFF, 0x15, 0xA5, 0xFF, 0xF4, 0xA4, 0xFF, 0xF4, 0x9C, 0xFF, 0xD4, 0x9C, 0xFF, 0x93, 0x94, 0xFF, 0x52, 0x8C, 0xFF, 0x52, 0x8C, 0xFF, 0x11, 0x84, 0xFF, 0x55, 0xAD, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xD4, 0x9C, 0xFF, 0x32, 0x84, 0xFF, 0x93, 0x94, 0xFF, 0xB3, 0x94, 0xFF, 0xB3, 0x94, 0xFF, 0xD4, 0x9C, 0xFF, 0xD3, 0x9C, 0xFF, 0x93, 0x94, 0xFF, 0xF0, 0x8B, 0xFF, 0x83, 0x79, 0xFF, 0x21, 0xB2, 0xFF, 0x62, 0xB2, 0xFF, 0x01, 0xAA, 0xFF, 0x61, 0xD3, 0xFF, 0xA1, 0xD3, 0xFF, 0x81, 0xD3, 0xFF, 0x81, 0xD3, 0xFF, 0xC1, 0xC2, 0xFF, 0x21, 0xAA, 0xFF, 0xA2, 0xBA, 0xFF, 0x61, 0xB2, 0xFF, 0x01, 0xB2, 0xFF, 0x61, 0xD3, 0xFF, 0xA1, 0xD3, 0xFF, 0xA2, 0xD3, 0xFF, 0xA1, 0xD3, 0xFF, 0xC1, 0xC2, 0xFF, 0x61, 0xB2, 0xFF, 0xA2, 0xBA, 0xFF, 0x21, 0xAA, 0xFF, 0x41, 0xB2, 0xFF, 0x81, 0xD3, 0xFF, 0x81, 0xD3, 0xFF, 0x81, 0xD3, 0xFF, 0x61, 0xD3, 0xFF, 0x81, 0xBA, 0xFF, 0x81, 0xB2, 0xFF, 0xA2, 0xBA, 0xFF, 0xA1, 0x91, 0xFF, 0x01, 0xA2, 0xFF, 0xA2, 0xBA, 0xFF, 0x21, 0xAA, 0xFF, 0xE1, 0xA9, 0xFF, 0x01, 0xCB, 0xFF, 0x61, 0xD3, 0xFF, 0x81, 0xD3, 0xFF, 0x61, 0xD3, 0xFF, 0x81, 0xC2, 0xFF, 0x61, 0xB2, 0xFF, 0x82, 0xBA, 0xFF, 0xE1, 0xA1, 0xFF, 0x21, 0xB2, 0xFF, 0x21, 0xCB, 0xFF, 0x41, 0xD3, 0xFF, 0x41, 0xD3, 0xFF, 0x21, 0xCB, 0xFF, 0x41, 0xBA, 0xFF, 0x81, 0xB2, 0xFF, 0x62, 0xB2, 0xFF, 0xC1, 0x99, 0xFF, 0x21, 0xB2, 0xFF, 0xE1, 0xC2, 0xFF, 0x21, 0xCB, 0xFF, 0x21, 0xCB, 0xFF, 0xC1, 0xCA, 0xFF, 0x21, 0xB2, 0xFF, 0x42, 0xB2, 0xFF, 0xA0, 0x99, 0xFF, 0x06, 0x72, 0xFF, 0x14, 0xA5, 0xFF, 0xF4, 0xA4, 0xFF, 0xF4, 0x9C, 0xFF, 0xB3, 0x94, 0xFF, 0x93, 0x94, 0xFF, 0x52, 0x8C, 0xFF, 0x52, 0x8C, 0xFF, 0x11, 0x84, 0xFF, 0x55, 0xAD, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xD4, 0x9C, 0xFF, 0x32, 0x84, 0xFF, 0x93, 0x94, 0xFF, 0xB3, 0x94, 0xFF, 0xB3, 0x94, 0xFF, 0xD3, 0x9C, 0xFF, 0xB3, 0x9C, 0xFF, 0x92, 0x94, 0xFF, 0xF0, 0x8B, 0xFF, 0x83, 0x79, 0xFF, 0x21, 0xB2, 0xFF, 0x62, 0xB2, 0xFF, 0x01, 0xAA, 0xFF, 0x61, 0xD3, 0xFF, 0xA1, 0xD3, 0xFF, 0x81, 0xD3, 0xFF, 0x81, 0xD3, 0xFF, 0xC1, 0xC2, 0xFF, 0x21, 0xAA, 0xFF, 0xA2, 0xBA, 0xFF, 0x61, 0xB2, 0xFF, 0x01, 0xB2, 0xFF, 0x61, 0xD3, 0xFF, 0xA1, 0xD3, 0xFF, 0xA1, 0xD3, 0xFF, 0xA1, 0xD3, 0xFF, 0xC1, 0xC2, 0xFF, 0x41, 0xB2, 0xFF, 0xA2, 0xBA, 0xFF, 0x01, 0xAA, 0xFF, 0x41, 0xB2, 0xFF, 0x61, 0xD3, 0xFF, 0x81, 0xD3, 0xFF, 0x81, 0xD3, 0xFF, 0x61, 0xD3, 0xFF, 0x81, 0xBA, 0xFF, 0x61, 0xB2, 0xFF, 0xA2, 0xBA, 0xFF, 0xA1, 0x91, 0xFF, 0x01, 0xA2, 0xFF, 0xA2, 0xBA, 0xFF, 0x21, 0xAA, 0xFF, 0xE1, 0xA9, 0xFF, 0x01, 0xCB, 0xFF, 0x61, 0xD3, 0xFF, 0x61, 0xD3, 0xFF, 0x61, 0xD3, 0xFF, 0x81, 0xC2, 0xFF, 0x61, 0xB2, 0xFF, 0x82, 0xBA, 0xFF, 0xE1, 0xA1, 0xFF, 0x21, 0xB2, 0xFF, 0x01, 0xCB, 0xFF, 0x41, 0xD3, 0xFF, 0x41, 0xD3, 0xFF, 0x21, 0xCB, 0xFF, 0x41, 0xBA, 0xFF, 0x61, 0xB2, 0xFF, 0x61, 0xB2, 0xFF, 0xC1, 0x99, 0xFF, 0x21, 0xB2, 0xFF, 0xC1, 0xC2, 0xFF, 0x21, 0xCB, 0xFF, 0x21, 0xCB, 0xFF, 0xC1, 0xCA, 0xFF, 0x21, 0xB2, 0xFF, 0x42, 0xB2, 0xFF, 0xA0, 0x99, 0xFF, 0x06, 0x72, 0xFF, 0xF4, 0xA4, 0xFF, 0xF4, 0xA4, 0xFF, 0xF4, 0x9C, 0xFF, 0xB3, 0x94, 0xFF, 0x93, 0x94, 0xFF, 0x52, 0x8C, 0xFF, 0x52, 0x8C, 0xFF, 0x11, 0x84, 0xFF, 0x55, 0xAD, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xD4, 0x9C, 0xFF, 0x32, 0x84, 0xFF, 0x93, 0x94, 0xFF, 0x93, 0x94, 0xFF, 0xB3, 0x94, 0xFF, 0xD3, 0x9C, 0xFF, 0xB3, 0x94, 0xFF, 0x92, 0x94, 0xFF, 0xF0, 0x83, 0xFF, 0x83, 0x79, 0xFF, 0x01, 0xAA, 0xFF, 0x62, 0xB2, 0xFF, 0x01, 0xAA, 0xFF, 0x41, 0xD3, 0xFF, 0x81, 0xD3, 0xFF, 0x81, 0xD3, 0xFF, 0x81, 0xD3, 0xFF, 0xC1, 0xC2, 0xFF, 0x01, 0xAA, 0xFF, 0xA1, 0xBA, 0xFF, 0x41, 0xB2, 0xFF, 0x01, 0xB2, 0xFF, 0x61, 0xD3, 0xFF, 0xA1, 0xD3, 0xFF, 0xA1, 0xD3, 0xFF, 0x81, 0xD3, 0xFF, 0xC1, 0xC2, 0xFF, 0x41, 0xB2, 0xFF, 0xA2, 0xBA, 0xFF, 0x01, 0xAA, 0xFF, 0x21, 0xB2, 0xFF, 0x61, 0xD3, 0xFF, 0x82, 0xD3, 0xFF, 0x81, 0xD3, 0xFF, 0x61, 0xD3, 0xFF, 0x61, 0xBA, 0xFF, 0x61, 0xB2, 0xFF, 0xA2, 0xBA, 0xFF, 0xA1, 0x91, 0xFF, 0x01, 0xA2, 0xFF, 0xA2, 0xBA, 0xFF, 0x21, 0xAA, 0xFF, 0xE1, 0xA9, 0xFF, 0x01, 0xCB, 0xFF, 0x61, 0xD3, 0xFF, 0x61, 0xD3, 0xFF, 0x61, 0xD3, 0xFF, 0x81, 0xC2, 0xFF, 0x61, 0xB2, 0xFF, 0x82, 0xB2, 0xFF, 0xE1, 0xA1, 0xFF, 0x21, 0xB2, 0xFF, 0x01, 0xCB, 0xFF, 0x41, 0xD3, 0xFF, 0x41, 0xD3, 0xFF, 0x21, 0xCB, 0xFF, 0x41, 0xBA, 0xFF, 0x62, 0xB2, 0xFF, 0x62, 0xB2, 0xFF, 0xC1, 0x99, 0xFF, 0x21, 0xB2, 0xFF, 0xE1, 0xC2, 0xFF, 0x21, 0xCB, 0xFF, 0x21, 0xCB, 0xFF, 0xC1, 0xCA, 0xFF, 0x21, 0xB2, 0xFF, 0x42, 0xB2, 0xFF, 0xA0, 0x99, 0xFF, 0x06, 0x72, 0xFF, 0xF4, 0xA4, 0xFF, 0xF4, 0xA4, 0xFF, 0xD4, 0x9C, 0xFF, 0xB3, 0x94, 0xFF, 0x72, 0x94, 0xFF, 0x52, 0x8C, 0xFF, 0x52, 0x8C, 0xFF, 0x11, 0x84, 0xFF, 0x55, 0xAD, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xD4, 0x9C, 0xFF, 0x31, 0x84, 0xFF, 0x93, 0x94, 0xFF, 0x93, 0x94, 0xFF, 0xB3, 0x94, 0xFF, 0xB3, 0x94, 0xFF, 0xB3, 0x94, 0xFF, 0x92, 0x94, 0xFF, 0xF0, 0x83, 0xFF, 0x83, 0x79, 0xFF, 0x01, 0xAA, 0xFF, 0x62, 0xB2, 0xFF, 0x01, 0xAA, 0xFF, 0x41, 0xD3, 0xFF, 0x81, 0xD3, 0xFF, 0x81, 0xD3, 0xFF, 0x81, 0xD3, 0xFF, 0xC1, 0xC2, 0xFF, 0x01, 0xAA, 0xFF, 0x81, 0xBA, 0xFF, 0x41, 0xB2, 0xFF, 0x01, 0xB2, 0xFF, 0x61, 0xD3, 0xFF, 0xA1, 0xD3, 0xFF, 0x81, 0xD3, 0xFF, 0x81, 0xD3, 0xFF, 0xC1, 0xC2, 0xFF, 0x41, 0xB2, 0xFF, 0xA2, 0xBA, 0xFF, 0x01, 0xAA, 0xFF, 0x21, 0xB2, 0xFF, 0x61, 0xD3, 0xFF, 0x81, 0xD3, 0xFF, 0x81, 0xD3, 0xFF, 0x61, 0xD3, 0xFF, 0x61, 0xBA, 0xFF, 0x61, 0xB2, 0xFF, 0xA2, 0xBA, 0xFF, 0xA1, 0x91, 0xFF, 0x01, 0xA2, 0xFF, 0xA1, 0xBA, 0xFF, 0x21, 0xAA, 0xFF, 0xE1, 0xA9, 0xFF, 0x01, 0xCB, 0xFF, 0x61, 0xD3, 0xFF, 0x61, 0xD3, 0xFF, 0x61, 0xD3, 0xFF, 0x81, 0xC2, 0xFF, 0x61, 0xB2, 0xFF, 0x82, 0xB2, 0xFF, 0xE1, 0xA1, 0xFF, 0x21, 0xB2, 0xFF, 0x01, 0xCB, 0xFF, 0x41, 0xD3, 0xFF, 0x41, 0xD3, 0xFF, 0x01, 0xCB, 0xFF, 0x41, 0xBA, 0xFF, 0x61, 0xB2, 0xFF, 0x62, 0xB2, 0xFF, 0xA1, 0x99, 0xFF, 0x21, 0xB2, 0xFF, 0xC1, 0xC2, 0xFF, 0x01, 0xCB, 0xFF, 0x21, 0xCB, 0xFF, 0xC1, 0xC2, 0xFF, 0x21, 0xB2, 0xFF, 0x42, 0xAA, 0xFF, 0xA0, 0x99, 0xFF, 0xE6, 0x71, 0xFF, 0xF4, 0xA4, 0xFF, 0xF4, 0x9C, 0xFF, 0xD4, 0x9C, 0xFF, 0xB3, 0x94, 0xFF, 0x72, 0x8C, 0xFF, 0x52, 0x8C, 0xFF, 0x52, 0x8C, 0xFF, 0x11, 0x84, 0xFF, 0x55, 0xAD, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xD4, 0x9C, 0xFF, 0x11, 0x84, 0xFF, 0x73, 0x8C, 0xFF, 0x93, 0x94, 0xFF, 0xB3, 0x94, 0xFF, 0xB3, 0x94, 0xFF, 0xB3, 0x94, 0xFF, 0x92, 0x94, 0xFF, 0xF0, 0x83, 0xFF, 0x83, 0x79, 0xFF, 0x00, 0xAA, 0xFF, 0x62, 0xB2, 0xFF, 0x01, 0xAA, 0xFF, 0x41, 0xD3, 0xFF, 0x81, 0xD3, 0xFF, 0x61, 0xD3, 0xFF, 0x81, 0xD3, 0xFF, 0xC1, 0xC2, 0xFF, 0x01, 0xAA, 0xFF, 0x81, 0xBA, 0xFF, 0x41, 0xB2, 0xFF, 0x01, 0xB2, 0xFF, 0x61, 0xD3, 0xFF, 0x81, 0xD3, 0xFF, 0x81, 0xD3, 0xFF, 0x81, 0xD3, 0xFF, 0xC1, 0xC2, 0xFF, 0x41, 0xB2, 0xFF, 0x82, 0xBA, 0xFF, 0x01, 0xAA, 0xFF, 0x21, 0xB2, 0xFF, 0x61, 0xD3, 0xFF, 0x81, 0xD3, 0xFF, 0x81, 0xD3, 0xFF, 0x41, 0xD3, 0xFF, 0x61, 0xBA, 0xFF, 0x61, 0xB2, 0xFF, 0x82, 0xBA, 0xFF, 0xA1, 0x91, 0xFF, 0x01, 0xA2, 0xFF, 0xA2, 0xBA, 0xFF, 0x21, 0xAA, 0xFF, 0xE1, 0xA9, 0xFF, 0x01, 0xCB, 0xFF, 0x41, 0xD3, 0xFF, 0x61, 0xD3, 0xFF, 0x41, 0xD3, 0xFF, 0x81, 0xC2, 0xFF, 0x41, 0xB2, 0xFF, 0x81, 0xB2, 0xFF, 0xE1, 0xA1, 0xFF, 0x21, 0xB2, 0xFF, 0x01, 0xCB, 0xFF, 0x41, 0xD3, 0xFF, 0x41, 0xD3, 0xFF, 0x01, 0xCB, 0xFF, 0x41, 0xBA, 0xFF, 0x61, 0xB2, 0xFF, 0x62, 0xB2, 0xFF, 0xA1, 0x99, 0xFF, 0x21, 0xB2, 0xFF, 0xC1, 0xC2, 0xFF, 0x01, 0xCB, 0xFF, 0x21, 0xCB, 0xFF, 0xC1, 0xC2, 0xFF, 0x21, 0xB2, 0xFF, 0x41, 0xAA, 0xFF, 0xA0, 0x99, 0xFF, 0xE6, 0x71, 0xFF, 0xF4, 0xA4, 0xFF, 0xD4, 0x9C, 0xFF, 0xD4, 0x9C, 0xFF, 0xB3, 0x94, 0xFF, 0x72, 0x8C, 0xFF, 0x52, 0x8C, 0xFF, 0x52, 0x8C, 0xFF, 0x11, 0x84, 0xFF, 0x55, 0xAD, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xD3, 0x9C, 0xFF, 0x11, 0x84, 0xFF, 0x72, 0x8C, 0xFF, 0x93, 0x94, 0xFF, 0xB3, 0x94, 0xFF, 0xB3, 0x94, 0xFF, 0xB3, 0x94, 0xFF, 0x92, 0x94, 0xFF, 0xF0, 0x83, 0xFF, 0x83, 0x71, 0xFF, 0x00, 0xAA, 0xFF, 0x42, 0xB2, 0xFF, 0x01, 0xAA, 0xFF, 0x41, 0xD3, 0xFF, 0x81, 0xD3, 0xFF, 0x61, 0xD3, 0xFF, 0x61, 0xD3, 0xFF, 0xA1, 0xC2, 0xFF, 0x01, 0xAA, 0xFF, 0x82, 0xBA, 0xFF, 0x42, 0xB2, 0xFF, 0x01, 0xB2, 0xFF, 0x41, 0xD3, 0xFF, 0x81, 0xD3, 0xFF, 0x81, 0xD3, 0xFF, 0x81, 0xD3, 0xFF, 0xA1, 0xC2, 0xFF, 0x41, 0xB2, 0xFF, 0x82, 0xBA, 0xFF, 0x01, 0xAA, 0xFF, 0x21, 0xB2, 0xFF, 0x41, 0xD3, 0xFF, 0x81, 0xD3, 0xFF, 0x81, 0xD3, 0xFF, 0x41, 0xD3, 0xFF, 0x61, 0xBA, 0xFF, 0x61, 0xB2, 0xFF, 0x82, 0xBA, 0xFF, 0xA1, 0x91, 0xFF, 0xE1, 0xA1, 0xFF, 0x82, 0xBA, 0xFF, 0x21, 0xAA, 0xFF, 0xE1, 0xA9, 0xFF, 0xE1, 0xCA, 0xFF, 0x41, 0xD3, 0xFF, 0x61, 0xD3, 0xFF, 0x41, 0xD3, 0xFF, 0x61, 0xC2, 0xFF, 0x41, 0xB2, 0xFF, 0x62, 0xB2, 0xFF, 0xE1, 0xA1, 0xFF, 0x21, 0xB2, 0xFF, 0x01, 0xCB, 0xFF, 0x21, 0xCB, 0xFF, 0x41, 0xD3, 0xFF, 0x01, 0xCB, 0xFF, 0x21, 0xBA, 0xFF, 0x61, 0xB2, 0xFF, 0x42, 0xB2, 0xFF, 0xC1, 0x99, 0xFF, 0x21, 0xB2, 0xFF, 0xC1, 0xC2, 0xFF, 0x01, 0xCB, 0xFF, 0x21, 0xCB, 0xFF, 0xC1, 0xC2, 0xFF, 0x21, 0xB2, 0xFF, 0x41, 0xAA, 0xFF, 0x80, 0x99, 0xFF, 0xE6, 0x71, 0xFF, 0xD4, 0x9C, 0xFF, 0xD4, 0x9C, 0xFF, 0xD4, 0x9C, 0xFF, 0xB3, 0x94, 0xFF, 0x72, 0x8C, 0xFF, 0x52, 0x8C, 0xFF, 0x52, 0x8C, 0xFF, 0x11, 0x84, 0xFF, 0x55, 0xAD, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xD3, 0x94, 0xFF, 0x11, 0x84, 0xFF, 0x72, 0x8C, 0xFF, 0x93, 0x94, 0xFF, 0x93, 0x94, 0xFF, 0xB3, 0x94, 0xFF, 0xB3, 0x94, 0xFF, 0x72, 0x94, 0xFF, 0xF0, 0x83, 0xFF, 0x83, 0x71, 0xFF, 0x00, 0xAA, 0xFF, 0x42, 0xB2, 0xFF, 0xE1, 0xA9, 0xFF, 0x21, 0xD3, 0xFF, 0x81, 0xD3, 0xFF, 0x61, 0xD3, 0xFF, 0x61, 0xD3, 0xFF, 0xA1, 0xC2, 0xFF, 0x01, 0xAA, 0xFF, 0x82, 0xBA, 0xFF, 0x41, 0xB2, 0xFF, 0xE1, 0xB1, 0xFF, 0x41, 0xD3, 0xFF, 0x81, 0xD3, 0xFF, 0x81, 0xD3, 0xFF, 0x61, 0xD3, 0xFF, 0xA1, 0xC2, 0xFF, 0x21, 0xB2, 0xFF, 0x82, 0xBA, 0xFF, 0x01, 0xAA, 0xFF, 0x21, 0xB2, 0xFF, 0x41, 0xD3, 0xFF, 0x61, 0xD3, 0xFF, 0x61, 0xD3, 0xFF, 0x41, 0xD3, 0xFF, 0x41, 0xBA, 0xFF, 0x61, 0xB2, 0xFF, 0x82, 0xBA, 0xFF, 0x81, 0x91, 0xFF, 0xE1, 0xA1, 0xFF, 0x82, 0xBA, 0xFF, 0x21, 0xAA, 0xFF, 0xE1, 0xA9, 0xFF, 0xE1, 0xCA, 0xFF, 0x41, 0xD3, 0xFF, 0x41, 0xD3, 0xFF, 0x41, 0xD3, 0xFF, 0x61, 0xBA, 0xFF, 0x41, 0xB2, 0xFF, 0x62, 0xB2, 0xFF, 0xE1, 0xA1, 0xFF, 0x21, 0xB2, 0xFF, 0x01, 0xCB, 0xFF, 0x21, 0xD3, 0xFF, 0x41, 0xD3, 0xFF, 0x01, 0xCB, 0xFF, 0x21, 0xB2, 0xFF, 0x61, 0xB2, 0xFF, 0x41, 0xB2, 0xFF, 0xA1, 0x99, 0xFF, 0x21, 0xB2, 0xFF, 0xC1, 0xC2, 0xFF, 0x01, 0xCB, 0xFF, 0x21, 0xCB, 0xFF, 0xA1, 0xC2, 0xFF, 0x01, 0xB2, 0xFF, 0x42, 0xAA, 0xFF, 0x80, 0x99, 0xFF, 0xE6, 0x71, 0xFF, 0xD4, 0x9C, 0xFF, 0xD4, 0x9C, 0xFF, 0xD4, 0x9C, 0xFF, 0xB3, 0x94, 0xFF, 0x72, 0x8C, 0xFF, 0x52, 0x8C, 0xFF, 0x52, 0x8C, 0xFF, 0x11, 0x84, 0xFF, 0x55, 0xAD, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xD3, 0x9C, 0xFF, 0x11, 0x84, 0xFF, 0x72, 0x8C, 0xFF, 0x93, 0x94, 0xFF, 0x93, 0x94, 0xFF, 0xB3, 0x94, 0xFF, 0xB3, 0x94, 0xFF, 0x72, 0x94, 0xFF, 0xF0, 0x83, 0xFF, 0x83, 0x71, 0xFF, 0xE0, 0xA9, 0xFF, 0x42, 0xB2, 0xFF, 0x01, 0xB2, 0xFF, 0x01, 0xD3, 0xFF, 0x61, 0xD3, 0xFF, 0x41, 0xD3, 0xFF, 0x41, 0xD3, 0xFF, 0xA1, 0xC2, 0xFF, 0x21, 0xAA, 0xFF, 0x81, 0xB2, 0xFF, 0x42, 0xB2, 0xFF, 0x01, 0xB2, 0xFF, 0x21, 0xD3, 0xFF, 0x61, 0xD3, 0xFF, 0x61, 0xD3, 0xFF, 0x41, 0xD3, 0xFF, 0xA1, 0xC2, 0xFF, 0x41, 0xB2, 0xFF, 0x81, 0xBA, 0xFF, 0x21, 0xAA, 0xFF, 0x21, 0xB2, 0xFF, 0x21, 0xD3, 0xFF, 0x41, 0xD3, 0xFF, 0x41, 0xD3, 0xFF, 0x21, 0xD3, 0xFF, 0x61, 0xBA, 0xFF, 0x61, 0xB2, 0xFF, 0x82, 0xBA, 0xFF, 0x81, 0x91, 0xFF, 0xE1, 0xA1, 0xFF, 0x81, 0xBA, 0xFF, 0x41, 0xAA, 0xFF, 0xE1, 0xA9, 0xFF, 0xC1, 0xC2, 0xFF, 0x21, 0xCB, 0xFF, 0x21, 0xD3, 0xFF, 0x01, 0xD3, 0xFF, 0x81, 0xC2, 0xFF, 0x61, 0xB2, 0xFF, 0x62, 0xB2, 0xFF, 0x01, 0xA2, 0xFF, 0x01, 0xB2, 0xFF, 0xC1, 0xC2, 0xFF, 0x01, 0xCB, 0xFF, 0x01, 0xCB, 0xFF, 0xC1, 0xCA, 0xFF, 0x41, 0xBA, 0xFF, 0x61, 0xB2, 0xFF, 0x41, 0xB2, 0xFF, 0xC1, 0x99, 0xFF, 0xE1, 0xA9, 0xFF, 0x81, 0xC2, 0xFF, 0xC1, 0xC2, 0xFF, 0xE1, 0xCA, 0xFF, 0x81, 0xC2, 0xFF, 0x21, 0xB2, 0xFF, 0x42, 0xAA, 0xFF, 0x80, 0x99, 0xFF, 0xE6, 0x71, 0xFF, 0xD4, 0x9C, 0xFF, 0xD4, 0x9C, 0xFF, 0xD4, 0x9C, 0xFF, 0xB3, 0x94, 0xFF, 0x72, 0x8C, 0xFF, 0x52, 0x8C, 0xFF, 0x52, 0x8C, 0xFF, 0x11, 0x84, 0xFF, 0x55, 0xAD, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xB3, 0x9C, 0xFF, 0x11, 0x84, 0xFF, 0x72, 0x8C, 0xFF, 0x72, 0x8C, 0xFF, 0x93, 0x94, 0xFF, 0xB3, 0x94, 0xFF, 0x93, 0x94, 0xFF, 0x72, 0x94, 0xFF, 0xF0, 0x83, 0xFF, 0x83, 0x71, 0xFF, 0xE0, 0xA9, 0xFF, 0x62, 0xB2, 0xFF, 0x24, 0xC3, 0xFF, 0x86, 0xCB, 0xFF, 0x86, 0xCB, 0xFF, 0x86, 0xCB, 0xFF, 0xA6, 0xCB, 0xFF, 0x44, 0xC3, 0xFF, 0x82, 0xBA, 0xFF, 0x61, 0xB2, 0xFF, 0x82, 0xBA, 0xFF, 0x45, 0xC3, 0xFF, 0xA6, 0xCB, 0xFF, 0xA6, 0xCB, 0xFF, 0xA6, 0xCB, 0xFF, 0xC6, 0xCB, 0xFF, 0x65, 0xCB, 0xFF, 0x82, 0xBA, 0xFF, 0x61, 0xB2, 0xFF, 0xA2, 0xBA, 0xFF, 0x45, 0xC3, 0xFF, 0x86, 0xCB, 0xFF, 0xA6, 0xCB, 0xFF, 0xA6, 0xCB, 0xFF, 0xA6, 0xCB, 0xFF, 0x24, 0xC3, 0xFF, 0x61, 0xB2, 0xFF, 0x82, 0xBA, 0xFF, 0xA1, 0x91, 0xFF, 0xE1, 0xA1, 0xFF, 0x81, 0xBA, 0xFF, 0x82, 0xB2, 0xFF, 0xE3, 0xC2, 0xFF, 0x45, 0xCB, 0xFF, 0x65, 0xCB, 0xFF, 0x65, 0xCB, 0xFF, 0x65, 0xCB, 0xFF, 0x45, 0xCB, 0xFF, 0xA2, 0xBA, 0xFF, 0x61, 0xB2, 0xFF, 0x82, 0xB2, 0xFF, 0xE3, 0xBA, 0xFF, 0x24, 0xC3, 0xFF, 0x24, 0xC3, 0xFF, 0x24, 0xC3, 0xFF, 0x24, 0xC3, 0xFF, 0x24, 0xC3, 0xFF, 0x62, 0xB2, 0xFF, 0x41, 0xAA, 0xFF, 0x62, 0xB2, 0xFF, 0xA3, 0xBA, 0xFF, 0xE3, 0xBA, 0xFF, 0xE3, 0xC2, 0xFF, 0xE3, 0xC2, 0xFF, 0xE3, 0xC2, 0xFF, 0xE4, 0xBA, 0xFF, 0x21, 0xAA, 0xFF, 0x80, 0x99, 0xFF, 0xE6, 0x71, 0xFF, 0xD4, 0x9C, 0xFF, 0xD3, 0x9C, 0xFF, 0xB3, 0x94, 0xFF, 0x93, 0x94, 0xFF, 0x72, 0x8C, 0xFF, 0x52, 0x8C, 0xFF, 0x52, 0x8C, 0xFF, 0x11, 0x84, 0xFF, 0x55, 0xAD, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xB3, 0x94, 0xFF, 0x11, 0x7C, 0xFF, 0x52, 0x8C, 0xFF, 0x72, 0x8C, 0xFF, 0x93, 0x94, 0xFF, 0x93, 0x94, 0xFF, 0x93, 0x94, 0xFF, 0x72, 0x94, 0xFF, 0xF0, 0x83, 0xFF, 0x42, 0x71, 0xFF, 0xE0, 0xA9, 0xFF, 0x21, 0xAA, 0xFF, 0x41, 0xB2, 0xFF, 0x61, 0xB2, 0xFF, 0x61, 0xB2, 0xFF, 0x61, 0xB2, 0xFF, 0x61, 0xB2, 0xFF, 0x61, 0xB2, 0xFF, 0x41, 0xB2, 0xFF, 0x41, 0xB2, 0xFF, 0x41, 0xB2, 0xFF, 0x61, 0xBA, 0xFF, 0x61, 0xBA, 0xFF, 0x61, 0xBA, 0xFF, 0x61, 0xBA, 0xFF, 0x61, 0xBA, 0xFF, 0x61, 0xBA, 0xFF, 0x41, 0xB2, 0xFF, 0x41, 0xB2, 0xFF, 0x61, 0xB2, 0xFF, 0x81, 0xBA, 0xFF, 0x81, 0xBA, 0xFF, 0x61, 0xBA, 0xFF, 0x61, 0xBA, 0xFF, 0x61, 0xBA, 0xFF, 0x61, 0xB2, 0xFF, 0x41, 0xB2, 0xFF, 0x61, 0xBA, 0xFF, 0x60, 0x89, 0xFF, 0xC0, 0xA1, 0xFF, 0x61, 0xBA, 0xFF, 0x41, 0xB2, 0xFF, 0x61, 0xB2, 0xFF, 0x81, 0xB2, 0xFF, 0x61, 0xB2, 0xFF, 0x61, 0xB2, 0xFF, 0x61, 0xB2, 0xFF, 0x61, 0xB2, 0xFF, 0x41, 0xB2, 0xFF, 0x41, 0xB2, 0xFF, 0x41, 0xB2, 0xFF, 0x61, 0xB2, 0xFF, 0x62, 0xB2, 0xFF, 0x61, 0xB2, 0xFF, 0x61, 0xB2, 0xFF, 0x61, 0xB2, 0xFF, 0x41, 0xB2, 0xFF, 0x21, 0xB2, 0xFF, 0x21, 0xB2, 0xFF, 0x41, 0xB2, 0xFF, 0x41, 0xB2, 0xFF, 0x41, 0xB2, 0xFF, 0x41, 0xB2, 0xFF, 0x41, 0xAA, 0xFF, 0x21, 0xAA, 0xFF, 0x01, 0xAA, 0xFF, 0x01, 0xAA, 0xFF, 0x60, 0x99, 0xFF, 0xC5, 0x69, 0xFF, 0xD4, 0x9C, 0xFF, 0xD4, 0x9C, 0xFF, 0xB3, 0x94, 0xFF, 0x93, 0x94, 0xFF, 0x72, 0x8C, 0xFF, 0x52, 0x8C, 0xFF, 0x52, 0x8C, 0xFF, 0x11, 0x84, 0xFF, 0x55, 0xAD, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xB3, 0x94, 0xFF, 0x11, 0x7C, 0xFF, 0x52, 0x8C, 0xFF, 0x72, 0x8C, 0xFF, 0x93, 0x94, 0xFF, 0x93, 0x94, 0xFF, 0x93, 0x94, 0xFF, 0x72, 0x94, 0xFF, 0xF0, 0x83, 0xFF, 0xE6, 0x71, 0xFF, 0x82, 0x89, 0xFF, 0xC2, 0x89, 0xFF, 0xC2, 0x91, 0xFF, 0xC2, 0x91, 0xFF, 0xC2, 0x91, 0xFF, 0xC2, 0x91, 0xFF, 0xC2, 0x91, 0xFF, 0xC2, 0x91, 0xFF, 0xC2, 0x91, 0xFF, 0xC2, 0x91, 0xFF, 0xC2, 0x91, 0xFF, 0xC2, 0x91, 0xFF, 0xC2, 0x91, 0xFF, 0xC2, 0x91, 0xFF, 0xC2, 0x91, 0xFF, 0xC2, 0x91, 0xFF, 0xC2, 0x91, 0xFF, 0xC2, 0x91, 0xFF, 0xE2, 0x91, 0xFF, 0xC2, 0x91, 0xFF, 0xC2, 0x91, 0xFF, 0xC2, 0x91, 0xFF, 0xC2, 0x91, 0xFF, 0xC2, 0x91, 0xFF, 0xC2, 0x91, 0xFF, 0xC2, 0x91, 0xFF, 0xC2, 0x91, 0xFF, 0xE2, 0x91, 0xFF, 0xA3, 0x81, 0xFF, 0xC3, 0x89, 0xFF, 0xE2, 0x91, 0xFF, 0xE2, 0x91, 0xFF, 0xC2, 0x91, 0xFF, 0xC2, 0x91, 0xFF, 0xC2, 0x91, 0xFF, 0xC2, 0x91, 0xFF, 0xC2, 0x91, 0xFF, 0xC2, 0x91, 0xFF, 0xC2, 0x91, 0xFF, 0xC2, 0x91, 0xFF, 0xC2, 0x91, 0xFF, 0xC2, 0x91, 0xFF, 0xC2, 0x91, 0xFF, 0xC2, 0x91, 0xFF, 0xC2, 0x91, 0xFF, 0xC2, 0x91, 0xFF, 0xC2, 0x91, 0xFF, 0xC2, 0x91, 0xFF, 0xC2, 0x91, 0xFF, 0xC2, 0x91, 0xFF, 0xC2, 0x91, 0xFF, 0xC2, 0x91, 0xFF, 0xC2, 0x91, 0xFF, 0xC2, 0x89, 0xFF, 0xA2, 0x89, 0xFF, 0xA2, 0x89, 0xFF, 0xA2, 0x89, 0xFF, 0x62, 0x81, 0xFF, 0x89, 0x72, 0xFF, 0xD3, 0x9C, 0xFF, 0xB3, 0x9C, 0xFF, 0xB3, 0x94, 0xFF, 0x93, 0x94, 0xFF, 0x72, 0x8C, 0xFF, 0x31, 0x84, 0xFF, 0x32, 0x84, 0xFF, 0x11, 0x84, 0xFF, 0x75, 0xAD, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xD3, 0x94, 0xFF, 0xF1, 0x7B, 0xFF, 0x52, 0x8C, 0xFF, 0x72, 0x8C, 0xFF, 0x93, 0x94, 0xFF, 0x93, 0x94, 0xFF, 0x93, 0x94, 0xFF, 0x72, 0x8C, 0xFF, 0xF0, 0x83, 0xFF, 0xDB, 0xDE, 0xFF, 0x5D, 0xEF, 0xFF, 0x3C, 0xEF, 0xFF, 0x3C, 0xEF, 0xFF, 0x3C, 0xEF, 0xFF, 0x3C, 0xEF, 0xFF, 0x3C, 0xEF, 0xFF, 0x3C, 0xEF, 0xFF, 0x3C, 0xEF, 0xFF, 0x3C, 0xEF, 0xFF, 0x3C, 0xEF, 0xFF, 0x3C, 0xEF, 0xFF, 0x3C, 0xEF, 0xFF, 0x3C, 0xEF, 0xFF, 0x3C, 0xEF, 0xFF, 0x3C, 0xEF, 0xFF, 0x3C, 0xEF, 0xFF, 0x3C, 0xEF, 0xFF, 0x3C, 0xEF, 0xFF, 0x3C, 0xEF, 0xFF, 0x3C, 0xEF, 0xFF, 0x3C, 0xEF, 0xFF, 0x3C, 0xEF, 0xFF, 0x3C, 0xEF, 0xFF, 0x3C, 0xEF, 0xFF, 0x3C, 0xEF, 0xFF, 0x3C, 0xEF, 0xFF, 0x3C, 0xEF, 0xFF, 0x3C, 0xEF, 0xFF, 0x7D, 0xF7, 0xFF, 0x7D, 0xEF, 0xFF, 0x3C, 0xEF, 0xFF, 0x3C, 0xEF, 0xFF, 0x3C, 0xEF, 0xFF, 0x3C, 0xEF, 0xFF, 0x3C, 0xEF, 0xFF, 0x3C, 0xEF, 0xFF, 0x3C, 0xEF, 0xFF, 0x3C, 0xEF, 0xFF, 0x3C, 0xEF, 0xFF, 0x3C, 0xEF, 0xFF, 0x3C, 0xEF, 0xFF, 0x3C, 0xEF, 0xFF, 0x3C, 0xEF, 0xFF, 0x3C, 0xEF, 0xFF, 0x3C, 0xEF, 0xFF, 0x3C, 0xEF, 0xFF, 0x3C, 0xEF, 0xFF, 0x3C, 0xEF, 0xFF, 0x3C, 0xEF, 0xFF, 0x3C, 0xEF, 0xFF, 0x3C, 0xEF, 0xFF, 0x3C, 0xEF, 0xFF, 0x3C, 0xEF, 0xFF, 0x3C, 0xEF, 0xFF, 0x3C, 0xEF, 0xFF, 0x3C, 0xEF, 0xFF, 0x3C, 0xEF, 0xFF, 0x7D, 0xEF, 0xFF, 0xDB, 0xDE, 0xFF, 0x92, 0x94, 0xFF, 0xD4, 0x9C, 0xFF, 0xB3, 0x94, 0xFF, 0x93, 0x94, 0xFF, 0x72, 0x8C, 0xFF, 0x51, 0x8C, 0xFF, 0x31, 0x84, 0xFF, 0x11, 0x84, 0xFF, 0x76, 0xAD, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0x93, 0x94, 0xFF, 0xF0, 0x7B, 0xFF, 0x32, 0x84, 0xFF, 0x52, 0x8C, 0xFF, 0x72, 0x8C, 0xFF, 0x93, 0x8C, 0xFF, 0x72, 0x8C, 0xFF, 0x52, 0x8C, 0xFF, 0xAF, 0x7B, 0xFF, 0x1C, 0xE7, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFB, 0xDE, 0xFF, 0x72, 0x8C, 0xFF, 0xB3, 0x94, 0xFF, 0x93, 0x94, 0xFF, 0x73, 0x8C, 0xFF, 0x52, 0x8C, 0xFF, 0x31, 0x84, 0xFF, 0x31, 0x84, 0xFF, 0x11, 0x7C, 0xFF, 0x55, 0xAD, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0x34, 0xA5, 0xFF, 0xF0, 0x7B, 0xFF, 0x31, 0x84, 0xFF, 0x31, 0x8C, 0xFF, 0x51, 0x8C, 0xFF, 0x51, 0x8C, 0xFF, 0x51, 0x8C, 0xFF, 0x51, 0x8C, 0xFF, 0x31, 0x8C, 0xFF, 0x5D, 0xEF, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0x3C, 0xE7, 0xFF, 0x71, 0x94, 0xFF, 0x72, 0x8C, 0xFF, 0x51, 0x8C, 0xFF, 0x51, 0x8C, 0xFF, 0x31, 0x8C, 0xFF, 0x31, 0x84, 0xFF, 0x31, 0x8C, 0xFF, 0x10, 0x84, 0xFF, 0xB7, 0xBD, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xDF, 0xFF, 0x00, 0xDF, 0xFF, 0x00, 0xDF, 0xFF, 0x00, 0xDF, 0xFF, 0x00, 0xDF, 0xFF, 0x00, 0xDF, 0xFF, 0x00, 0xDF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xDF, 0xFF, 0x00, 0xDE, 0xFF, 0x00, 0xDE, 0xFF, 0x00, 0xDF, 0xFF, 0x00, 0xDF, 0xFF, 0x00, 0xDF, 0xFF, 0x00, 0xDF, 0xFF, 0x00, 0xDF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-};
+// Pixel data is embedded from gate_close.bin
+// Payload SHA-256: a6e20465ae152d18cb57aa8f1fd8faa307a6f3d11742e043ac9149c2a1ae4d7e
+__asm__(
+    ".section .rodata\n"
+    ".balign 4\n"
+    ".global gate_close_data\n"
+    "gate_close_data:\n"
+    ".incbin \"src/gate_icons/gate_close.bin\"\n"
+    ".previous\n"
+);
+extern "C" const uint8_t gate_close_data[];
 
 extern const lv_img_dsc_t gate_close = {
     .header = {
@@ -2,88 +2,17 @@
 #include <Arduino.h>
 
 // Gate icon: gate_open (96x80 RGB565 with alpha)
-const uint8_t gate_open_data[] PROGMEM = {
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xDF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xBE, 0xFF, 0x00, 0xF8, 0xF6, 0xFF, 0x32, 0xEE, 0xFF, 0x4D, 0xE5, 0xFF, 0xAB, 0xDC, 0xFF, 0x5C, 0xF7, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0x19, 0xF7, 0xFF, 0xEB, 0xE4, 0xFF, 0x6F, 0xE5, 0xFF, 0x14, 0xE6, 0xFF, 0xD9, 0xEE, 0xFF, 0xBE, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xBA, 0xFF, 0xFF, 0x95, 0xFF, 0xFF, 0x95, 0xFF, 0xFF, 0x95, 0xFF, 0xFF, 0xB8, 0xFF, 0xFF, 0xFE, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0x9D, 0xFF, 0xFF, 0x75, 0xEE, 0xFF, 0x4D, 0xE5, 0xFF, 0x46, 0xDC, 0xFF, 0x43, 0xCB, 0xFF, 0xC1, 0xC2, 0xFF, 0x20, 0xB2, 0xFF, 0x98, 0xEE, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0x33, 0xEE, 0xFF, 0x80, 0xD3, 0xFF, 0x24, 0xDC, 0xFF, 0x66, 0xDC, 0xFF, 0xCA, 0xDC, 0xFF, 0x4F, 0xE5, 0xFF, 0x36, 0xE6, 0xFF, 0x9E, 0xF7, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xDD, 0xFF, 0xFF, 0x55, 0xFF, 0xFF, 0x0F, 0xF7, 0xFF, 0xEF, 0xF6, 0xFF, 0x13, 0xF7, 0xFF, 0x9A, 0xFF, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0x72, 0xFF, 0xFF, 0x2C, 0xFF, 0xFF, 0x53, 0xFF, 0xFF, 0x76, 0xFF, 0xFF, 0x73, 0xFF, 0xFF, 0x4E, 0xFF, 0xFF, 0x4F, 0xFF, 0xFF, 0xDB, 0xFF, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xBE, 0xFF, 0x00, 0x96, 0xEE, 0xFF, 0x4D, 0xED, 0xFF, 0x46, 0xDC, 0xFF, 0x22, 0xCB, 0xFF, 0x61, 0xBA, 0xFF, 0x01, 0xB2, 0xFF, 0xE1, 0xA9, 0xFF, 0x00, 0xB2, 0xFF, 0xB9, 0xEE, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0x54, 0xEE, 0xFF, 0x40, 0xD3, 0xFF, 0x22, 0xCB, 0xFF, 0x81, 0xDB, 0xFF, 0x03, 0xDC, 0xFF, 0x66, 0xDC, 0xFF, 0xCB, 0xDC, 0xFF, 0x0E, 0xDD, 0xFF, 0x36, 0xE6, 0xFF, 0xDF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xBA, 0xFF, 0xFF, 0xEF, 0xF6, 0xFF, 0xCC, 0xF6, 0xFF, 0xA7, 0xF6, 0xFF, 0x65, 0xF6, 0xFF, 0x46, 0xEE, 0xFF, 0x2B, 0xEE, 0xFF, 0xD5, 0xEE, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0x55, 0xFF, 0xFF, 0xC6, 0xF6, 0xFF, 0x09, 0xF7, 0xFF, 0x0E, 0xF7, 0xFF, 0x2F, 0xFF, 0xFF, 0x0D, 0xF7, 0xFF, 0x0B, 0xF7, 0xFF, 0xE9, 0xF6, 0xFF, 0xEC, 0xF6, 0xFF, 0xDE, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFA, 0xF6, 0xFF, 0xD1, 0xED, 0xFF, 0xA8, 0xE4, 0xFF, 0x63, 0xCB, 0xFF, 0x61, 0xBA, 0xFF, 0xE0, 0xA9, 0xFF, 0x81, 0x99, 0xFF, 0x80, 0x58, 0xFF, 0x60, 0x91, 0xFF, 0x20, 0xB2, 0xFF, 0xB9, 0xEE, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0x54, 0xEE, 0xFF, 0x60, 0xD3, 0xFF, 0xC1, 0x99, 0xFF, 0xE0, 0x70, 0xFF, 0x61, 0xBA, 0xFF, 0x41, 0xCB, 0xFF, 0xE3, 0xDB, 0xFF, 0x88, 0xDC, 0xFF, 0xCB, 0xDC, 0xFF, 0x0F, 0xDD, 0xFF, 0x1B, 0xEF, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xDD, 0xFF, 0xFF, 0xCD, 0xF6, 0xFF, 0xF0, 0xF6, 0xFF, 0xD1, 0xF6, 0xFF, 0x69, 0xF6, 0xFF, 0x25, 0xEE, 0xFF, 0xE5, 0xED, 0xFF, 0xC8, 0xE5, 0xFF, 0x88, 0xE5, 0xFF, 0x16, 0xF7, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0x4A, 0xEE, 0xFF, 0x23, 0xEE, 0xFF, 0x44, 0xEE, 0xFF, 0x64, 0xF6, 0xFF, 0x65, 0xF6, 0xFF, 0x64, 0xF6, 0xFF, 0x45, 0xF6, 0xFF, 0x45, 0xF6, 0xFF, 0x03, 0xEE, 0xFF, 0x36, 0xF7, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xDE, 0xFF, 0x00, 0x56, 0xEE, 0xFF, 0x6E, 0xE5, 0xFF, 0x06, 0xD4, 0xFF, 0xA1, 0xC2, 0xFF, 0x41, 0xB2, 0xFF, 0x01, 0xB2, 0xFF, 0xC0, 0xA9, 0xFF, 0xC0, 0xB1, 0xFF, 0x60, 0x58, 0xFF, 0xC1, 0xA1, 0xFF, 0x40, 0xB2, 0xFF, 0xDA, 0xEE, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0x75, 0xEE, 0xFF, 0x60, 0xD3, 0xFF, 0xE1, 0xA1, 0xFF, 0xE0, 0x78, 0xFF, 0xC0, 0xCA, 0xFF, 0x41, 0xBA, 0xFF, 0x61, 0xD3, 0xFF, 0x81, 0xD3, 0xFF, 0x24, 0xDC, 0xFF, 0xCA, 0xDC, 0xFF, 0x8C, 0xD4, 0xFF, 0x16, 0xE6, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0x54, 0xF7, 0xFF, 0x65, 0xF6, 0xFF, 0x89, 0xF6, 0xFF, 0x47, 0xEE, 0xFF, 0xE4, 0xED, 0xFF, 0x83, 0xE5, 0xFF, 0x23, 0xE5, 0xFF, 0x04, 0xDD, 0xFF, 0xC2, 0xDC, 0xFF, 0xCB, 0xE5, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0x67, 0xDD, 0xFF, 0x20, 0xE5, 0xFF, 0x61, 0xE5, 0xFF, 0x61, 0xE5, 0xFF, 0x81, 0xE5, 0xFF, 0x81, 0xE5, 0xFF, 0x61, 0xE5, 0xFF, 0x61, 0xE5, 0xFF, 0x00, 0xE5, 0xFF, 0xD4, 0xF6, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0x7D, 0xF7, 0xFF, 0xF4, 0xED, 0xFF, 0x2C, 0xE5, 0xFF, 0x84, 0xCB, 0xFF, 0x40, 0xBA, 0xFF, 0xC0, 0xA9, 0xFF, 0x21, 0xB2, 0xFF, 0x41, 0xBA, 0xFF, 0x80, 0xCA, 0xFF, 0x20, 0xBA, 0xFF, 0xA0, 0x68, 0xFF, 0xC1, 0xA9, 0xFF, 0x41, 0xB2, 0xFF, 0xFA, 0xEE, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0x76, 0xEE, 0xFF, 0x40, 0xD3, 0xFF, 0xE1, 0xA9, 0xFF, 0x80, 0x99, 0xFF, 0xA1, 0xEC, 0xFF, 0x01, 0xE4, 0xFF, 0x82, 0xD3, 0xFF, 0x41, 0xCB, 0xFF, 0x01, 0xCB, 0xFF, 0xC2, 0xDB, 0xFF, 0x88, 0xDC, 0xFF, 0x8A, 0xD4, 0xFF, 0x51, 0xDD, 0xFF, 0xBE, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0x11, 0xF7, 0xFF, 0x00, 0xEE, 0xFF, 0x02, 0xEE, 0xFF, 0xA1, 0xE5, 0xFF, 0x41, 0xE5, 0xFF, 0xC1, 0xDC, 0xFF, 0x61, 0xD4, 0xFF, 0x61, 0xD4, 0xFF, 0x40, 0xD4, 0xFF, 0x69, 0xDD, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0x10, 0xE6, 0xFF, 0x80, 0xD4, 0xFF, 0x44, 0xE5, 0xFF, 0x44, 0xE5, 0xFF, 0x64, 0xE5, 0xFF, 0x44, 0xE5, 0xFF, 0x43, 0xE5, 0xFF, 0x02, 0xE5, 0xFF, 0xE2, 0xDC, 0xFF, 0x7B, 0xF7, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0x1B, 0xF7, 0xFF, 0xB2, 0xE5, 0xFF, 0xEA, 0xE4, 0xFF, 0x02, 0xC3, 0xFF, 0x20, 0xB2, 0xFF, 0x21, 0x79, 0xFF, 0xE0, 0x70, 0xFF, 0x41, 0xBA, 0xFF, 0x61, 0xBA, 0xFF, 0xC0, 0xD2, 0xFF, 0x20, 0xBA, 0xFF, 0xA0, 0x70, 0xFF, 0xE1, 0xA9, 0xFF, 0x41, 0xB2, 0xFF, 0x1B, 0xF7, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0x96, 0xEE, 0xFF, 0x40, 0xD3, 0xFF, 0xE1, 0xB1, 0xFF, 0x60, 0x99, 0xFF, 0xC1, 0xEC, 0xFF, 0xC1, 0xEC, 0xFF, 0xC1, 0xDB, 0xFF, 0x01, 0xCB, 0xFF, 0x00, 0x79, 0xFF, 0x41, 0xA2, 0xFF, 0x61, 0xD3, 0xFF, 0x47, 0xDC, 0xFF, 0x6A, 0xDC, 0xFF, 0xAE, 0xD4, 0xFF, 0x5D, 0xF7, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0x78, 0xF7, 0xFF, 0x60, 0xE5, 0xFF, 0x82, 0xE5, 0xFF, 0x22, 0xE5, 0xFF, 0xE2, 0xDC, 0xFF, 0x82, 0xD4, 0xFF, 0x62, 0xD4, 0xFF, 0x62, 0xD4, 0xFF, 0xE0, 0xCB, 0xFF, 0x73, 0xE6, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFE, 0xFF, 0x00, 0x0E, 0xE6, 0xFF, 0x23, 0xE5, 0xFF, 0x43, 0xE5, 0xFF, 0x42, 0xE5, 0xFF, 0x42, 0xE5, 0xFF, 0x43, 0xE5, 0xFF, 0x45, 0xE5, 0xFF, 0xF5, 0xF6, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xD9, 0xEE, 0xFF, 0x91, 0xE5, 0xFF, 0xA9, 0xDC, 0xFF, 0xA1, 0xBA, 0xFF, 0xE1, 0xA9, 0xFF, 0xC1, 0xA9, 0xFF, 0x60, 0x58, 0xFF, 0x00, 0x79, 0xFF, 0x41, 0xBA, 0xFF, 0x61, 0xBA, 0xFF, 0xC0, 0xD2, 0xFF, 0x40, 0xBA, 0xFF, 0xC0, 0x78, 0xFF, 0xE1, 0xA9, 0xFF, 0x41, 0xB2, 0xFF, 0x1B, 0xF7, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xB7, 0xEE, 0xFF, 0x40, 0xD3, 0xFF, 0x01, 0xB2, 0xFF, 0x40, 0x99, 0xFF, 0xA1, 0xEC, 0xFF, 0xC1, 0xEC, 0xFF, 0xA1, 0xDB, 0xFF, 0x21, 0xD3, 0xFF, 0xC0, 0x70, 0xFF, 0x00, 0x79, 0xFF, 0xE1, 0xCA, 0xFF, 0x01, 0xCB, 0xFF, 0x05, 0xDC, 0xFF, 0x89, 0xDC, 0xFF, 0x4C, 0xCC, 0xFF, 0x1B, 0xEF, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xB2, 0xEE, 0xFF, 0x24, 0xE5, 0xFF, 0x03, 0xDD, 0xFF, 0xC2, 0xDC, 0xFF, 0x81, 0xDC, 0xFF, 0x61, 0xDC, 0xFF, 0x21, 0xD4, 0xFF, 0xAE, 0xE5, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xBE, 0xF7, 0x00, 0x7E, 0xEF, 0xFF, 0x9E, 0xF7, 0x00, 0x9E, 0xF7, 0x00, 0xD2, 0xD5, 0xFF, 0x49, 0xC4, 0xFF, 0x69, 0xC4, 0xFF, 0x69, 0xC4, 0xFF, 0xCB, 0xCC, 0xFF, 0xB7, 0xE6, 0xFF, 0xBF, 0xF7, 0x00, 0x9E, 0xF7, 0x00, 0x9E, 0xF7, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0x98, 0xEE, 0xFF, 0x71, 0xE5, 0xFF, 0x68, 0xDC, 0xFF, 0x60, 0xBA, 0xFF, 0x01, 0xB2, 0xFF, 0x00, 0xB2, 0xFF, 0x40, 0xC2, 0xFF, 0xC0, 0x68, 0xFF, 0x20, 0x81, 0xFF, 0x41, 0xBA, 0xFF, 0x61, 0xBA, 0xFF, 0xE0, 0xD2, 0xFF, 0x40, 0xBA, 0xFF, 0xC0, 0x78, 0xFF, 0xE0, 0xA9, 0xFF, 0x42, 0xB2, 0xFF, 0x3C, 0xF7, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xB7, 0xF6, 0xFF, 0x20, 0xCB, 0xFF, 0x01, 0xB2, 0xFF, 0x40, 0x99, 0xFF, 0x81, 0xEC, 0xFF, 0xC1, 0xEC, 0xFF, 0xA1, 0xD3, 0xFF, 0x01, 0xCB, 0xFF, 0xE0, 0x80, 0xFF, 0xE0, 0xA1, 0xFF, 0x01, 0xE4, 0xFF, 0xE1, 0xCA, 0xFF, 0x21, 0xCB, 0xFF, 0xC4, 0xD3, 0xFF, 0x48, 0xDC, 0xFF, 0xEA, 0xCB, 0xFF, 0xFB, 0xEE, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xBE, 0xF7, 0x00, 0xBE, 0xF7, 0x00, 0xBF, 0xF7, 0x00, 0xB7, 0xEE, 0xFF, 0x0B, 0xD5, 0xFF, 0x89, 0xC4, 0xFF, 0x29, 0xBC, 0xFF, 0xE8, 0xB3, 0xFF, 0xB3, 0xD5, 0xFF, 0x5D, 0xEF, 0xFF, 0x5D, 0xEF, 0xFF, 0x5D, 0xEF, 0xFF, 0xBE, 0xF7, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xDB, 0xDE, 0xFF, 0xF8, 0xBD, 0xFF, 0x39, 0xC6, 0xFF, 0x39, 0xC6, 0xFF, 0x7A, 0xCE, 0xFF, 0x7B, 0xCE, 0xFF, 0x7B, 0xCE, 0xFF, 0x7B, 0xCE, 0xFF, 0x9B, 0xCE, 0xFF, 0x7A, 0xCE, 0xFF, 0x59, 0xCE, 0xFF, 0x39, 0xCE, 0xFF, 0x59, 0xCE, 0xFF, 0xFF, 0xFF, 0x00, 0x98, 0xEE, 0xFF, 0x70, 0xE5, 0xFF, 0x68, 0xDC, 0xFF, 0x40, 0xBA, 0xFF, 0x21, 0xB2, 0xFF, 0x41, 0xB2, 0xFF, 0xA0, 0xCA, 0xFF, 0x80, 0xC2, 0xFF, 0xC0, 0x70, 0xFF, 0x40, 0x89, 0xFF, 0x41, 0xBA, 0xFF, 0x61, 0xBA, 0xFF, 0x00, 0xD3, 0xFF, 0x40, 0xBA, 0xFF, 0xC0, 0x80, 0xFF, 0xE0, 0xA9, 0xFF, 0x42, 0xB2, 0xFF, 0x5C, 0xF7, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xD8, 0xF6, 0xFF, 0x20, 0xCB, 0xFF, 0x01, 0xB2, 0xFF, 0x20, 0x91, 0xFF, 0x81, 0xE4, 0xFF, 0xC1, 0xEC, 0xFF, 0xA1, 0xD3, 0xFF, 0x01, 0xCB, 0xFF, 0xE0, 0x88, 0xFF, 0x00, 0xA2, 0xFF, 0xC1, 0xEC, 0xFF, 0x21, 0xE4, 0xFF, 0x41, 0xD3, 0xFF, 0x21, 0xCB, 0xFF, 0xA3, 0xD3, 0xFF, 0x48, 0xD4, 0xFF, 0xEA, 0xC3, 0xFF, 0xFB, 0xEE, 0xFF, 0xFF, 0xFF, 0x00, 0xDB, 0xDE, 0xFF, 0xDB, 0xDE, 0xFF, 0xBA, 0xD6, 0xFF, 0xBB, 0xD6, 0xFF, 0x7B, 0xCE, 0xFF, 0x3A, 0xC6, 0xFF, 0xF9, 0xBD, 0xFF, 0xB8, 0xB5, 0xFF, 0x97, 0xAD, 0xFF, 0x35, 0xA5, 0xFF, 0x55, 0xAD, 0xFF, 0x55, 0xAD, 0xFF, 0xFB, 0xDE, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xBA, 0xD6, 0xFF, 0xB3, 0x9C, 0xFF, 0x55, 0xAD, 0xFF, 0x76, 0xAD, 0xFF, 0x75, 0xB5, 0xFF, 0x96, 0xB5, 0xFF, 0x96, 0xB5, 0xFF, 0x96, 0xB5, 0xFF, 0x96, 0xB5, 0xFF, 0xB6, 0xB5, 0xFF, 0xB7, 0xBD, 0xFF, 0x55, 0xB5, 0xFF, 0x18, 0xC6, 0xFF, 0x57, 0xE6, 0xFF, 0x0F, 0xDD, 0xFF, 0x48, 0xDC, 0xFF, 0x40, 0xBA, 0xFF, 0xE1, 0xA9, 0xFF, 0x21, 0xB2, 0xFF, 0x61, 0xBA, 0xFF, 0xA0, 0xCA, 0xFF, 0x80, 0xCA, 0xFF, 0xE0, 0x78, 0xFF, 0x60, 0x91, 0xFF, 0x21, 0xB2, 0xFF, 0x61, 0xBA, 0xFF, 0x00, 0xD3, 0xFF, 0x40, 0xBA, 0xFF, 0xE0, 0x80, 0xFF, 0xE0, 0xA9, 0xFF, 0x42, 0xB2, 0xFF, 0x7C, 0xF7, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xD8, 0xF6, 0xFF, 0x20, 0xCB, 0xFF, 0x01, 0xB2, 0xFF, 0x00, 0x91, 0xFF, 0x61, 0xE4, 0xFF, 0xC1, 0xEC, 0xFF, 0xA1, 0xD3, 0xFF, 0x01, 0xCB, 0xFF, 0xE0, 0x88, 0xFF, 0x00, 0xA2, 0xFF, 0xC1, 0xEC, 0xFF, 0x81, 0xE4, 0xFF, 0x61, 0xD3, 0xFF, 0xE1, 0xCA, 0xFF, 0xC1, 0xCA, 0xFF, 0xA3, 0xD3, 0xFF, 0x28, 0xD4, 0xFF, 0xA9, 0xC3, 0xFF, 0xDA, 0xE6, 0xFF, 0xDB, 0xD6, 0xFF, 0x59, 0xCE, 0xFF, 0x9A, 0xCE, 0xFF, 0x38, 0xC6, 0xFF, 0xF7, 0xBD, 0xFF, 0x96, 0xB5, 0xFF, 0x35, 0xAD, 0xFF, 0x14, 0xA5, 0xFF, 0xF3, 0xA4, 0xFF, 0x14, 0xA5, 0xFF, 0x14, 0xA5, 0xFF, 0xD3, 0x9C, 0xFF, 0x1C, 0xE7, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0x9E, 0xF7, 0x00, 0xF3, 0xA4, 0xFF, 0x4C, 0x73, 0xFF, 0x0B, 0x6B, 0xFF, 0x0B, 0x6B, 0xFF, 0x0B, 0x6B, 0xFF, 0x0B, 0x6B, 0xFF, 0x2B, 0x6B, 0xFF, 0x2C, 0x73, 0xFF, 0x4C, 0x73, 0xFF, 0x0B, 0x73, 0xFF, 0x50, 0x9C, 0xFF, 0x70, 0xB4, 0xFF, 0x4B, 0xD4, 0xFF, 0x28, 0xD4, 0xFF, 0x60, 0xBA, 0xFF, 0x81, 0x91, 0xFF, 0x20, 0x79, 0xFF, 0x21, 0xB2, 0xFF, 0x61, 0xBA, 0xFF, 0xC0, 0xCA, 0xFF, 0xA0, 0xCA, 0xFF, 0xE0, 0x80, 0xFF, 0x60, 0x91, 0xFF, 0x21, 0xB2, 0xFF, 0x61, 0xBA, 0xFF, 0xE0, 0xD2, 0xFF, 0x40, 0xBA, 0xFF, 0xE0, 0x80, 0xFF, 0xC0, 0xA9, 0xFF, 0x63, 0xB2, 0xFF, 0x7D, 0xF7, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xF9, 0xF6, 0xFF, 0x21, 0xCB, 0xFF, 0x01, 0xB2, 0xFF, 0x00, 0x91, 0xFF, 0x40, 0xE4, 0xFF, 0xA1, 0xEC, 0xFF, 0x81, 0xD3, 0xFF, 0xE1, 0xCA, 0xFF, 0xE0, 0x88, 0xFF, 0x00, 0xA2, 0xFF, 0xA1, 0xEC, 0xFF, 0x81, 0xE4, 0xFF, 0x61, 0xD3, 0xFF, 0xC1, 0xC2, 0xFF, 0x41, 0x81, 0xFF, 0x81, 0xB2, 0xFF, 0xA3, 0xD3, 0xFF, 0xE7, 0xD3, 0xFF, 0x48, 0xBB, 0xFF, 0x34, 0xBD, 0xFF, 0x91, 0x9C, 0xFF, 0x4C, 0x73, 0xFF, 0x4C, 0x73, 0xFF, 0x2C, 0x6B, 0xFF, 0x0B, 0x6B, 0xFF, 0x0B, 0x6B, 0xFF, 0x0B, 0x6B, 0xFF, 0x2C, 0x6B, 0xFF, 0x2C, 0x6B, 0xFF, 0x8D, 0x7B, 0xFF, 0x55, 0xB5, 0xFF, 0xDF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0x10, 0x84, 0xFF, 0x8B, 0x52, 0xFF, 0xEC, 0x5A, 0xFF, 0xEC, 0x5A, 0xFF, 0x0D, 0x63, 0xFF, 0x2D, 0x63, 0xFF, 0x4D, 0x6B, 0xFF, 0x4D, 0x6B, 0xFF, 0x4C, 0x73, 0xFF, 0x51, 0x9C, 0xFF, 0x25, 0x92, 0xFF, 0x86, 0xCB, 0xFF, 0x61, 0xBA, 0xFF, 0xE1, 0xA9, 0xFF, 0x60, 0x48, 0xFF, 0x20, 0x79, 0xFF, 0x41, 0xBA, 0xFF, 0x61, 0xBA, 0xFF, 0xE0, 0xCA, 0xFF, 0xA0, 0xCA, 0xFF, 0x00, 0x81, 0xFF, 0x60, 0x91, 0xFF, 0x21, 0xB2, 0xFF, 0x61, 0xBA, 0xFF, 0xE0, 0xD2, 0xFF, 0x20, 0xBA, 0xFF, 0xE0, 0x80, 0xFF, 0xC0, 0xA9, 0xFF, 0x63, 0xB2, 0xFF, 0x9D, 0xF7, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xF9, 0xF6, 0xFF, 0x01, 0xCB, 0xFF, 0x01, 0xB2, 0xFF, 0x00, 0x89, 0xFF, 0x20, 0xE4, 0xFF, 0xA1, 0xEC, 0xFF, 0x81, 0xD3, 0xFF, 0xE1, 0xCA, 0xFF, 0x00, 0x89, 0xFF, 0xE0, 0xA1, 0xFF, 0xA0, 0xEC, 0xFF, 0x81, 0xE4, 0xFF, 0x41, 0xD3, 0xFF, 0xE1, 0xCA, 0xFF, 0xE0, 0x68, 0xFF, 0xE0, 0x68, 0xFF, 0xE1, 0xCA, 0xFF, 0x83, 0xCB, 0xFF, 0x86, 0xCB, 0xFF, 0x85, 0xA2, 0xFF, 0xF3, 0xAC, 0xFF, 0x10, 0x84, 0xFF, 0x10, 0x84, 0xFF, 0xCF, 0x7B, 0xFF, 0x6E, 0x6B, 0xFF, 0x2D, 0x63, 0xFF, 0x2D, 0x63, 0xFF, 0x4D, 0x6B, 0xFF, 0xEC, 0x62, 0xFF, 0xD3, 0x9C, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xB3, 0x94, 0xFF, 0xB0, 0x73, 0xFF, 0x32, 0x84, 0xFF, 0x52, 0x8C, 0xFF, 0x72, 0x8C, 0xFF, 0x72, 0x8C, 0xFF, 0x72, 0x8C, 0xFF, 0x52, 0x8C, 0xFF, 0x51, 0x8C, 0xFF, 0x84, 0x69, 0xFF, 0x22, 0xA2, 0xFF, 0x82, 0xBA, 0xFF, 0xE1, 0xA9, 0xFF, 0xE0, 0xA9, 0xFF, 0x80, 0x58, 0xFF, 0x40, 0x89, 0xFF, 0x21, 0xB2, 0xFF, 0x61, 0xBA, 0xFF, 0xE0, 0xD2, 0xFF, 0xC0, 0xCA, 0xFF, 0x00, 0x81, 0xFF, 0x60, 0x91, 0xFF, 0x21, 0xB2, 0xFF, 0x60, 0xBA, 0xFF, 0xE0, 0xD2, 0xFF, 0x20, 0xBA, 0xFF, 0xE0, 0x80, 0xFF, 0xC0, 0xA9, 0xFF, 0x83, 0xB2, 0xFF, 0xBE, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0x1A, 0xF7, 0xFF, 0x01, 0xCB, 0xFF, 0x01, 0xB2, 0xFF, 0xE0, 0x88, 0xFF, 0x00, 0xDC, 0xFF, 0x80, 0xEC, 0xFF, 0x61, 0xD3, 0xFF, 0xE1, 0xCA, 0xFF, 0x00, 0x91, 0xFF, 0xE0, 0xA1, 0xFF, 0x81, 0xEC, 0xFF, 0x61, 0xE4, 0xFF, 0x41, 0xD3, 0xFF, 0xE1, 0xCA, 0xFF, 0x00, 0x79, 0xFF, 0x00, 0x79, 0xFF, 0x01, 0xD3, 0xFF, 0xC1, 0xC2, 0xFF, 0x84, 0xD3, 0xFF, 0x03, 0xC3, 0xFF, 0x09, 0x9B, 0xFF, 0xF8, 0xBD, 0xFF, 0x97, 0xB5, 0xFF, 0x56, 0xAD, 0xFF, 0xF4, 0x9C, 0xFF, 0x72, 0x8C, 0xFF, 0x11, 0x84, 0xFF, 0x11, 0x84, 0xFF, 0xD0, 0x7B, 0xFF, 0x76, 0xAD, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xF4, 0x9C, 0xFF, 0x31, 0x84, 0xFF, 0xB3, 0x94, 0xFF, 0xB3, 0x94, 0xFF, 0xD4, 0x9C, 0xFF, 0xD4, 0x9C, 0xFF, 0xD4, 0x9C, 0xFF, 0xB3, 0x9C, 0xFF, 0x52, 0x8C, 0xFF, 0x86, 0x9A, 0xFF, 0x21, 0xB2, 0xFF, 0xE1, 0xA9, 0xFF, 0x20, 0xB2, 0xFF, 0x40, 0xBA, 0xFF, 0x80, 0x60, 0xFF, 0x41, 0x89, 0xFF, 0x21, 0xB2, 0xFF, 0x61, 0xBA, 0xFF, 0xE0, 0xD2, 0xFF, 0xC0, 0xCA, 0xFF, 0x00, 0x89, 0xFF, 0x60, 0x91, 0xFF, 0x01, 0xB2, 0xFF, 0x60, 0xBA, 0xFF, 0xE0, 0xD2, 0xFF, 0x20, 0xB2, 0xFF, 0xE0, 0x80, 0xFF, 0xC0, 0xA9, 0xFF, 0x84, 0xB2, 0xFF, 0xBE, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0x3B, 0xF7, 0xFF, 0x01, 0xCB, 0xFF, 0x01, 0xB2, 0xFF, 0xE0, 0x88, 0xFF, 0xE0, 0xDB, 0xFF, 0x80, 0xEC, 0xFF, 0x61, 0xD3, 0xFF, 0xC1, 0xC2, 0xFF, 0x00, 0x91, 0xFF, 0xC0, 0xA1, 0xFF, 0x80, 0xEC, 0xFF, 0x61, 0xE4, 0xFF, 0x41, 0xCB, 0xFF, 0xC1, 0xC2, 0xFF, 0x00, 0x81, 0xFF, 0x20, 0x81, 0xFF, 0x01, 0xE4, 0xFF, 0x21, 0xCB, 0xFF, 0xC1, 0xC2, 0xFF, 0x42, 0xD3, 0xFF, 0x0B, 0xBC, 0xFF, 0x97, 0xAD, 0xFF, 0x76, 0xB5, 0xFF, 0x55, 0xAD, 0xFF, 0xF4, 0x9C, 0xFF, 0x93, 0x94, 0xFF, 0x31, 0x84, 0xFF, 0x11, 0x84, 0xFF, 0xD0, 0x7B, 0xFF, 0x76, 0xAD, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0x35, 0xA5, 0xFF, 0x72, 0x8C, 0xFF, 0xD4, 0x9C, 0xFF, 0xF4, 0x9C, 0xFF, 0xF4, 0x9C, 0xFF, 0x14, 0xA5, 0xFF, 0xF4, 0xA4, 0xFF, 0xD4, 0x9C, 0xFF, 0x92, 0x94, 0xFF, 0x45, 0x92, 0xFF, 0xC0, 0xA9, 0xFF, 0x21, 0xB2, 0xFF, 0xA0, 0xCA, 0xFF, 0x60, 0xBA, 0xFF, 0xA0, 0x68, 0xFF, 0x61, 0x91, 0xFF, 0x21, 0xB2, 0xFF, 0x40, 0xBA, 0xFF, 0xE0, 0xD2, 0xFF, 0xC0, 0xCA, 0xFF, 0x00, 0x89, 0xFF, 0x60, 0x99, 0xFF, 0x01, 0xB2, 0xFF, 0x40, 0xBA, 0xFF, 0xC0, 0xD2, 0xFF, 0x00, 0xB2, 0xFF, 0xE0, 0x80, 0xFF, 0xA0, 0xA9, 0xFF, 0x84, 0xB2, 0xFF, 0xDE, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0x3B, 0xF7, 0xFF, 0x01, 0xCB, 0xFF, 0x00, 0xB2, 0xFF, 0xE0, 0x88, 0xFF, 0xC0, 0xDB, 0xFF, 0x61, 0xEC, 0xFF, 0x61, 0xD3, 0xFF, 0xC1, 0xC2, 0xFF, 0x00, 0x91, 0xFF, 0xC0, 0xA1, 0xFF, 0x60, 0xEC, 0xFF, 0x41, 0xE4, 0xFF, 0x21, 0xCB, 0xFF, 0xC1, 0xC2, 0xFF, 0x00, 0x81, 0xFF, 0x20, 0x89, 0xFF, 0x21, 0xE4, 0xFF, 0x01, 0xDC, 0xFF, 0x01, 0xCB, 0xFF, 0xA0, 0xC2, 0xFF, 0x68, 0xAB, 0xFF, 0xB7, 0xB5, 0xFF, 0x76, 0xB5, 0xFF, 0x55, 0xAD, 0xFF, 0xF4, 0x9C, 0xFF, 0x93, 0x94, 0xFF, 0x52, 0x8C, 0xFF, 0x31, 0x84, 0xFF, 0xD0, 0x7B, 0xFF, 0x76, 0xAD, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0x35, 0xA5, 0xFF, 0x72, 0x8C, 0xFF, 0xF4, 0x9C, 0xFF, 0xF4, 0x9C, 0xFF, 0x15, 0xA5, 0xFF, 0x15, 0xA5, 0xFF, 0x15, 0xA5, 0xFF, 0xF4, 0xA4, 0xFF, 0xB3, 0x94, 0xFF, 0x24, 0x92, 0xFF, 0xC0, 0xA9, 0xFF, 0x61, 0xC2, 0xFF, 0xA0, 0xCA, 0xFF, 0x60, 0xC2, 0xFF, 0xC0, 0x70, 0xFF, 0x61, 0x91, 0xFF, 0x01, 0xB2, 0xFF, 0x41, 0xBA, 0xFF, 0xE0, 0xD2, 0xFF, 0xC0, 0xCA, 0xFF, 0x00, 0x89, 0xFF, 0x60, 0x91, 0xFF, 0x01, 0xAA, 0xFF, 0x40, 0xBA, 0xFF, 0xC0, 0xD2, 0xFF, 0x00, 0xB2, 0xFF, 0xE0, 0x80, 0xFF, 0xA0, 0xA9, 0xFF, 0xA5, 0xB2, 0xFF, 0xDF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0x5C, 0xF7, 0xFF, 0x02, 0xCB, 0xFF, 0x00, 0xB2, 0xFF, 0xC0, 0x88, 0xFF, 0xC0, 0xDB, 0xFF, 0x60, 0xE4, 0xFF, 0x41, 0xD3, 0xFF, 0xC1, 0xC2, 0xFF, 0x00, 0x89, 0xFF, 0xA0, 0x99, 0xFF, 0x60, 0xEC, 0xFF, 0x41, 0xE4, 0xFF, 0x21, 0xCB, 0xFF, 0xC1, 0xC2, 0xFF, 0x00, 0x89, 0xFF, 0x20, 0x89, 0xFF, 0x01, 0xE4, 0xFF, 0x61, 0xE4, 0xFF, 0x81, 0xD3, 0xFF, 0x80, 0xC2, 0xFF, 0x28, 0xAB, 0xFF, 0x97, 0xAD, 0xFF, 0x76, 0xAD, 0xFF, 0x56, 0xAD, 0xFF, 0xF4, 0x9C, 0xFF, 0x93, 0x94, 0xFF, 0x52, 0x8C, 0xFF, 0x31, 0x84, 0xFF, 0xD0, 0x7B, 0xFF, 0x76, 0xAD, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0x35, 0xA5, 0xFF, 0x93, 0x8C, 0xFF, 0xF4, 0x9C, 0xFF, 0xF4, 0x9C, 0xFF, 0x15, 0xA5, 0xFF, 0x15, 0xA5, 0xFF, 0x15, 0xA5, 0xFF, 0xF4, 0xA4, 0xFF, 0xB3, 0x9C, 0xFF, 0x25, 0x92, 0xFF, 0xC0, 0xA9, 0xFF, 0x81, 0xC2, 0xFF, 0xC0, 0xCA, 0xFF, 0x80, 0xC2, 0xFF, 0xC0, 0x70, 0xFF, 0x60, 0x91, 0xFF, 0x01, 0xB2, 0xFF, 0x41, 0xBA, 0xFF, 0xE0, 0xD2, 0xFF, 0xC0, 0xCA, 0xFF, 0x00, 0x89, 0xFF, 0x60, 0x91, 0xFF, 0x01, 0xAA, 0xFF, 0x40, 0xBA, 0xFF, 0xC0, 0xD2, 0xFF, 0xE0, 0xB1, 0xFF, 0xE0, 0x80, 0xFF, 0xA0, 0xA9, 0xFF, 0xC5, 0xB2, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0x7C, 0xF7, 0xFF, 0x02, 0xC3, 0xFF, 0x00, 0xB2, 0xFF, 0xC0, 0x80, 0xFF, 0xA0, 0xDB, 0xFF, 0x40, 0xE4, 0xFF, 0x41, 0xD3, 0xFF, 0xA1, 0xC2, 0xFF, 0x00, 0x89, 0xFF, 0xA0, 0x99, 0xFF, 0x40, 0xEC, 0xFF, 0x40, 0xE4, 0xFF, 0x21, 0xCB, 0xFF, 0xA1, 0xC2, 0xFF, 0x00, 0x89, 0xFF, 0x20, 0x89, 0xFF, 0x00, 0xE4, 0xFF, 0x41, 0xE4, 0xFF, 0x81, 0xD3, 0xFF, 0x60, 0xC2, 0xFF, 0x28, 0xAB, 0xFF, 0x97, 0xAD, 0xFF, 0x76, 0xAD, 0xFF, 0x35, 0xA5, 0xFF, 0xF4, 0x9C, 0xFF, 0x93, 0x94, 0xFF, 0x52, 0x8C, 0xFF, 0x31, 0x84, 0xFF, 0xD0, 0x7B, 0xFF, 0x76, 0xAD, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0x55, 0xA5, 0xFF, 0x73, 0x8C, 0xFF, 0xF4, 0x9C, 0xFF, 0xF4, 0x9C, 0xFF, 0x15, 0xA5, 0xFF, 0x15, 0xA5, 0xFF, 0x15, 0xA5, 0xFF, 0xF4, 0xA4, 0xFF, 0xB3, 0x9C, 0xFF, 0x45, 0x92, 0xFF, 0xC0, 0xA9, 0xFF, 0x81, 0xC2, 0xFF, 0xC0, 0xCA, 0xFF, 0x80, 0xC2, 0xFF, 0xC0, 0x78, 0xFF, 0x40, 0x91, 0xFF, 0x01, 0xAA, 0xFF, 0x41, 0xBA, 0xFF, 0xE0, 0xCA, 0xFF, 0xA0, 0xCA, 0xFF, 0x00, 0x81, 0xFF, 0x60, 0x91, 0xFF, 0xE1, 0xA9, 0xFF, 0x40, 0xBA, 0xFF, 0xA0, 0xD2, 0xFF, 0xE0, 0xB1, 0xFF, 0xE0, 0x80, 0xFF, 0x80, 0xA1, 0xFF, 0xC6, 0xB2, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0x7D, 0xFF, 0xFF, 0x02, 0xC3, 0xFF, 0x00, 0xB2, 0xFF, 0xC0, 0x80, 0xFF, 0x80, 0xD3, 0xFF, 0x40, 0xE4, 0xFF, 0x41, 0xD3, 0xFF, 0xA1, 0xC2, 0xFF, 0x00, 0x89, 0xFF, 0xA0, 0x99, 0xFF, 0x20, 0xE4, 0xFF, 0x20, 0xE4, 0xFF, 0x01, 0xCB, 0xFF, 0xA1, 0xC2, 0xFF, 0x00, 0x89, 0xFF, 0x20, 0x89, 0xFF, 0x01, 0xE4, 0xFF, 0x41, 0xE4, 0xFF, 0x81, 0xD3, 0xFF, 0x60, 0xBA, 0xFF, 0x28, 0xAB, 0xFF, 0x97, 0xAD, 0xFF, 0x56, 0xAD, 0xFF, 0x35, 0xA5, 0xFF, 0xF4, 0x9C, 0xFF, 0x93, 0x94, 0xFF, 0x52, 0x8C, 0xFF, 0x31, 0x84, 0xFF, 0xD0, 0x7B, 0xFF, 0x76, 0xAD, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0x55, 0xA5, 0xFF, 0x73, 0x8C, 0xFF, 0xF4, 0x9C, 0xFF, 0xF4, 0x9C, 0xFF, 0x15, 0xA5, 0xFF, 0x15, 0xA5, 0xFF, 0x15, 0xA5, 0xFF, 0xF4, 0xA4, 0xFF, 0xB3, 0x9C, 0xFF, 0x45, 0x92, 0xFF, 0xC0, 0xA9, 0xFF, 0x81, 0xC2, 0xFF, 0xE0, 0xCA, 0xFF, 0x80, 0xC2, 0xFF, 0xC0, 0x78, 0xFF, 0x40, 0x91, 0xFF, 0x01, 0xAA, 0xFF, 0x41, 0xBA, 0xFF, 0xC0, 0xCA, 0xFF, 0xA0, 0xCA, 0xFF, 0x00, 0x81, 0xFF, 0x60, 0x91, 0xFF, 0xE1, 0xA9, 0xFF, 0x40, 0xBA, 0xFF, 0xA0, 0xD2, 0xFF, 0xC0, 0xA9, 0xFF, 0xE0, 0x80, 0xFF, 0x80, 0xA1, 0xFF, 0xE6, 0xB2, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0x9D, 0xFF, 0xFF, 0x03, 0xC3, 0xFF, 0x00, 0xB2, 0xFF, 0xC0, 0x80, 0xFF, 0x60, 0xD3, 0xFF, 0x40, 0xE4, 0xFF, 0x21, 0xCB, 0xFF, 0x81, 0xC2, 0xFF, 0x00, 0x89, 0xFF, 0x80, 0x99, 0xFF, 0x20, 0xE4, 0xFF, 0x00, 0xE4, 0xFF, 0x01, 0xCB, 0xFF, 0xA1, 0xC2, 0xFF, 0x00, 0x89, 0xFF, 0x20, 0x89, 0xFF, 0xE0, 0xE3, 0xFF, 0x21, 0xE4, 0xFF, 0x61, 0xD3, 0xFF, 0x60, 0xBA, 0xFF, 0x08, 0xA3, 0xFF, 0x97, 0xAD, 0xFF, 0x56, 0xAD, 0xFF, 0x35, 0xA5, 0xFF, 0xF4, 0x9C, 0xFF, 0x93, 0x94, 0xFF, 0x52, 0x8C, 0xFF, 0x31, 0x84, 0xFF, 0xD0, 0x7B, 0xFF, 0x76, 0xAD, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0x35, 0xA5, 0xFF, 0x73, 0x8C, 0xFF, 0xF4, 0x9C, 0xFF, 0xF4, 0x9C, 0xFF, 0x15, 0xA5, 0xFF, 0x15, 0xA5, 0xFF, 0x15, 0xA5, 0xFF, 0xF4, 0xA4, 0xFF, 0xB3, 0x9C, 0xFF, 0x45, 0x92, 0xFF, 0xC0, 0xA9, 0xFF, 0x81, 0xC2, 0xFF, 0xE0, 0xCA, 0xFF, 0xA0, 0xC2, 0xFF, 0xC0, 0x78, 0xFF, 0x40, 0x91, 0xFF, 0xE1, 0xA9, 0xFF, 0x41, 0xBA, 0xFF, 0xC0, 0xCA, 0xFF, 0xA0, 0xCA, 0xFF, 0x00, 0x81, 0xFF, 0x60, 0x91, 0xFF, 0xE1, 0xA9, 0xFF, 0x20, 0xBA, 0xFF, 0xA0, 0xD2, 0xFF, 0xC0, 0xA9, 0xFF, 0xE0, 0x80, 0xFF, 0x80, 0xA1, 0xFF, 0x07, 0xB3, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0x9D, 0xFF, 0xFF, 0x03, 0xC3, 0xFF, 0x00, 0xB2, 0xFF, 0xC0, 0x80, 0xFF, 0x60, 0xD3, 0xFF, 0x20, 0xE4, 0xFF, 0x21, 0xCB, 0xFF, 0x81, 0xC2, 0xFF, 0x00, 0x89, 0xFF, 0x80, 0x99, 0xFF, 0x00, 0xE4, 0xFF, 0x00, 0xE4, 0xFF, 0x01, 0xCB, 0xFF, 0x81, 0xC2, 0xFF, 0x00, 0x89, 0xFF, 0x20, 0x89, 0xFF, 0xE0, 0xE3, 0xFF, 0x21, 0xE4, 0xFF, 0x61, 0xD3, 0xFF, 0x40, 0xBA, 0xFF, 0x08, 0xA3, 0xFF, 0x77, 0xAD, 0xFF, 0x56, 0xAD, 0xFF, 0x35, 0xA5, 0xFF, 0xF4, 0x9C, 0xFF, 0x93, 0x94, 0xFF, 0x52, 0x84, 0xFF, 0x31, 0x84, 0xFF, 0xF0, 0x7B, 0xFF, 0x96, 0xAD, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0x35, 0xA5, 0xFF, 0x72, 0x8C, 0xFF, 0xF4, 0x9C, 0xFF, 0xF4, 0x9C, 0xFF, 0x15, 0xA5, 0xFF, 0x15, 0xA5, 0xFF, 0x14, 0xA5, 0xFF, 0xF4, 0xA4, 0xFF, 0xB3, 0x9C, 0xFF, 0x45, 0x92, 0xFF, 0xA0, 0xA9, 0xFF, 0x81, 0xC2, 0xFF, 0xE0, 0xCA, 0xFF, 0xA0, 0xC2, 0xFF, 0xE0, 0x78, 0xFF, 0x40, 0x89, 0xFF, 0xE1, 0xA9, 0xFF, 0x20, 0xBA, 0xFF, 0xC0, 0xCA, 0xFF, 0x80, 0xCA, 0xFF, 0x00, 0x81, 0xFF, 0x60, 0x91, 0xFF, 0xE1, 0xA9, 0xFF, 0x20, 0xBA, 0xFF, 0xA0, 0xD2, 0xFF, 0xA0, 0xA9, 0xFF, 0xC0, 0x78, 0xFF, 0x60, 0xA1, 0xFF, 0x27, 0xB3, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xBE, 0xFF, 0x00, 0x24, 0xC3, 0xFF, 0xE0, 0xB1, 0xFF, 0x80, 0x80, 0xFF, 0x40, 0xD3, 0xFF, 0x20, 0xE4, 0xFF, 0x21, 0xCB, 0xFF, 0x81, 0xC2, 0xFF, 0x00, 0x89, 0xFF, 0x60, 0x91, 0xFF, 0x00, 0xE4, 0xFF, 0xE0, 0xE3, 0xFF, 0xE1, 0xCA, 0xFF, 0x81, 0xBA, 0xFF, 0x00, 0x89, 0xFF, 0x20, 0x89, 0xFF, 0xE0, 0xE3, 0xFF, 0x21, 0xE4, 0xFF, 0x41, 0xD3, 0xFF, 0x40, 0xBA, 0xFF, 0x08, 0xA3, 0xFF, 0x77, 0xAD, 0xFF, 0x55, 0xAD, 0xFF, 0x35, 0xA5, 0xFF, 0xF4, 0x9C, 0xFF, 0x93, 0x94, 0xFF, 0x52, 0x8C, 0xFF, 0x31, 0x84, 0xFF, 0xF0, 0x7B, 0xFF, 0x96, 0xAD, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0x35, 0xA5, 0xFF, 0x72, 0x8C, 0xFF, 0xD4, 0x9C, 0xFF, 0xF4, 0x9C, 0xFF, 0xF4, 0x9C, 0xFF, 0x14, 0xA5, 0xFF, 0x14, 0xA5, 0xFF, 0xF4, 0xA4, 0xFF, 0xB3, 0x9C, 0xFF, 0x45, 0x92, 0xFF, 0xA0, 0xA9, 0xFF, 0x81, 0xC2, 0xFF, 0xE0, 0xD2, 0xFF, 0xA0, 0xCA, 0xFF, 0xE0, 0x78, 0xFF, 0x40, 0x89, 0xFF, 0xE0, 0xA9, 0xFF, 0x20, 0xB2, 0xFF, 0xC0, 0xCA, 0xFF, 0xA0, 0xCA, 0xFF, 0xE0, 0x80, 0xFF, 0x40, 0x91, 0xFF, 0xE0, 0xA9, 0xFF, 0x00, 0xBA, 0xFF, 0x40, 0xC2, 0xFF, 0x80, 0xA1, 0xFF, 0x61, 0x91, 0xFF, 0xA0, 0xA9, 0xFF, 0x28, 0xB3, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xBE, 0xFF, 0x00, 0x24, 0xC3, 0xFF, 0x40, 0xBA, 0xFF, 0x61, 0x99, 0xFF, 0x01, 0xCB, 0xFF, 0xE0, 0xE3, 0xFF, 0x01, 0xCB, 0xFF, 0x81, 0xC2, 0xFF, 0xE0, 0x88, 0xFF, 0x40, 0x91, 0xFF, 0xE0, 0xE3, 0xFF, 0xE0, 0xE3, 0xFF, 0xE1, 0xCA, 0xFF, 0x81, 0xBA, 0xFF, 0xE0, 0x88, 0xFF, 0x20, 0x89, 0xFF, 0xC0, 0xE3, 0xFF, 0x00, 0xE4, 0xFF, 0x41, 0xCB, 0xFF, 0x20, 0xBA, 0xFF, 0x08, 0xA3, 0xFF, 0x77, 0xAD, 0xFF, 0x55, 0xAD, 0xFF, 0x35, 0xA5, 0xFF, 0xF4, 0x9C, 0xFF, 0x93, 0x94, 0xFF, 0x52, 0x8C, 0xFF, 0x31, 0x84, 0xFF, 0xF0, 0x7B, 0xFF, 0x96, 0xAD, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0x35, 0xA5, 0xFF, 0x72, 0x8C, 0xFF, 0xD4, 0x9C, 0xFF, 0xF4, 0x9C, 0xFF, 0xF4, 0x9C, 0xFF, 0x15, 0xA5, 0xFF, 0x14, 0xA5, 0xFF, 0xF4, 0xA4, 0xFF, 0xB3, 0x9C, 0xFF, 0x25, 0x92, 0xFF, 0xA0, 0xA9, 0xFF, 0x81, 0xC2, 0xFF, 0xE0, 0xCA, 0xFF, 0xA0, 0xCA, 0xFF, 0xE0, 0x78, 0xFF, 0x40, 0x89, 0xFF, 0xE0, 0xA9, 0xFF, 0x20, 0xB2, 0xFF, 0x80, 0xCA, 0xFF, 0x20, 0xC2, 0xFF, 0x00, 0x89, 0xFF, 0xC1, 0xA1, 0xFF, 0xC0, 0xA9, 0xFF, 0x01, 0xB2, 0xFF, 0xA3, 0xBA, 0xFF, 0xA3, 0xBA, 0xFF, 0xC3, 0xC2, 0xFF, 0x80, 0xA1, 0xFF, 0x48, 0xBB, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xDE, 0xFF, 0x00, 0x04, 0xC3, 0xFF, 0xC1, 0xC2, 0xFF, 0x83, 0xD3, 0xFF, 0x43, 0xD3, 0xFF, 0x63, 0xD3, 0xFF, 0xE1, 0xCA, 0xFF, 0x81, 0xC2, 0xFF, 0x81, 0x99, 0xFF, 0x60, 0x99, 0xFF, 0xA0, 0xE3, 0xFF, 0xC0, 0xDB, 0xFF, 0xE1, 0xC2, 0xFF, 0x61, 0xBA, 0xFF, 0xE0, 0x80, 0xFF, 0x20, 0x89, 0xFF, 0xC0, 0xE3, 0xFF, 0x00, 0xE4, 0xFF, 0x41, 0xCB, 0xFF, 0x20, 0xBA, 0xFF, 0xE8, 0xA2, 0xFF, 0x77, 0xAD, 0xFF, 0x35, 0xAD, 0xFF, 0x15, 0xA5, 0xFF, 0xD4, 0x9C, 0xFF, 0x93, 0x94, 0xFF, 0x52, 0x8C, 0xFF, 0x31, 0x84, 0xFF, 0xF0, 0x7B, 0xFF, 0x96, 0xB5, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0x35, 0xA5, 0xFF, 0x72, 0x8C, 0xFF, 0xD4, 0x9C, 0xFF, 0xD4, 0x9C, 0xFF, 0xF4, 0x9C, 0xFF, 0x14, 0x9D, 0xFF, 0x14, 0xA5, 0xFF, 0xF4, 0x9C, 0xFF, 0xB3, 0x9C, 0xFF, 0x25, 0x92, 0xFF, 0xA0, 0xA1, 0xFF, 0x61, 0xC2, 0xFF, 0xC0, 0xCA, 0xFF, 0x40, 0xC2, 0xFF, 0xC0, 0x78, 0xFF, 0x61, 0x91, 0xFF, 0xE0, 0xA9, 0xFF, 0x01, 0xB2, 0xFF, 0xA3, 0xC2, 0xFF, 0xA3, 0xC2, 0xFF, 0xC3, 0xC2, 0xFF, 0x82, 0xBA, 0xFF, 0xC0, 0xA9, 0xFF, 0x01, 0xAA, 0xFF, 0x01, 0xAA, 0xFF, 0xA0, 0xA1, 0xFF, 0x80, 0x99, 0xFF, 0x20, 0x99, 0xFF, 0x69, 0xBB, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xDF, 0xFF, 0x00, 0x45, 0xC3, 0xFF, 0x00, 0xB2, 0xFF, 0x21, 0xAA, 0xFF, 0x81, 0xBA, 0xFF, 0xC1, 0xC2, 0xFF, 0xA1, 0xC2, 0xFF, 0x80, 0xBA, 0xFF, 0x43, 0xCB, 0xFF, 0x64, 0xD3, 0xFF, 0x64, 0xD3, 0xFF, 0x63, 0xD3, 0xFF, 0xC1, 0xC2, 0xFF, 0x81, 0xBA, 0xFF, 0x20, 0x89, 0xFF, 0x00, 0x89, 0xFF, 0x80, 0xDB, 0xFF, 0xE0, 0xE3, 0xFF, 0x21, 0xCB, 0xFF, 0x20, 0xBA, 0xFF, 0xE8, 0x9A, 0xFF, 0x76, 0xAD, 0xFF, 0x35, 0xAD, 0xFF, 0x15, 0xA5, 0xFF, 0xD4, 0x9C, 0xFF, 0x93, 0x94, 0xFF, 0x52, 0x8C, 0xFF, 0x31, 0x84, 0xFF, 0xF0, 0x7B, 0xFF, 0x96, 0xB5, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0x35, 0xA5, 0xFF, 0x52, 0x8C, 0xFF, 0xD4, 0x9C, 0xFF, 0xD4, 0x9C, 0xFF, 0xF4, 0x9C, 0xFF, 0x14, 0x9D, 0xFF, 0xF4, 0xA4, 0xFF, 0xF4, 0x9C, 0xFF, 0xB3, 0x9C, 0xFF, 0x25, 0x92, 0xFF, 0xA0, 0xA1, 0xFF, 0x41, 0xBA, 0xFF, 0x82, 0xC2, 0xFF, 0x82, 0xBA, 0xFF, 0xA3, 0xBA, 0xFF, 0x83, 0xBA, 0xFF, 0xE0, 0xA9, 0xFF, 0x01, 0xB2, 0xFF, 0x62, 0xBA, 0xFF, 0x21, 0xB2, 0xFF, 0xC0, 0xA9, 0xFF, 0x80, 0xA1, 0xFF, 0xC0, 0xA9, 0xFF, 0x60, 0x99, 0xFF, 0x00, 0x89, 0xFF, 0xC0, 0x68, 0xFF, 0x81, 0x50, 0xFF, 0x20, 0x91, 0xFF, 0x8A, 0xBB, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0x45, 0xC3, 0xFF, 0xA0, 0xA1, 0xFF, 0x60, 0x50, 0xFF, 0xC0, 0x70, 0xFF, 0x20, 0x91, 0xFF, 0x21, 0xB2, 0xFF, 0x61, 0xBA, 0xFF, 0x40, 0xB2, 0xFF, 0x81, 0xC2, 0xFF, 0xE1, 0xC2, 0xFF, 0x02, 0xCB, 0xFF, 0x81, 0xC2, 0xFF, 0x81, 0xBA, 0xFF, 0x24, 0xC3, 0xFF, 0x04, 0xC3, 0xFF, 0x44, 0xD3, 0xFF, 0x83, 0xD3, 0xFF, 0x01, 0xCB, 0xFF, 0x20, 0xB2, 0xFF, 0xE8, 0x9A, 0xFF, 0x76, 0xAD, 0xFF, 0x35, 0xA5, 0xFF, 0x15, 0xA5, 0xFF, 0xD4, 0x9C, 0xFF, 0x93, 0x94, 0xFF, 0x52, 0x8C, 0xFF, 0x31, 0x84, 0xFF, 0xF0, 0x7B, 0xFF, 0x96, 0xB5, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0x35, 0xA5, 0xFF, 0x52, 0x8C, 0xFF, 0xD4, 0x9C, 0xFF, 0xD4, 0x9C, 0xFF, 0xF4, 0x9C, 0xFF, 0xF4, 0x9C, 0xFF, 0xF4, 0xA4, 0xFF, 0xF4, 0x9C, 0xFF, 0xB3, 0x94, 0xFF, 0x25, 0x8A, 0xFF, 0xA0, 0xA1, 0xFF, 0x41, 0xB2, 0xFF, 0xA3, 0xBA, 0xFF, 0x82, 0xBA, 0xFF, 0x41, 0xBA, 0xFF, 0xE0, 0xA9, 0xFF, 0xC0, 0xA9, 0xFF, 0xA0, 0xA1, 0xFF, 0x20, 0x91, 0xFF, 0x00, 0x89, 0xFF, 0x80, 0x58, 0xFF, 0x00, 0x79, 0xFF, 0xC0, 0xA9, 0xFF, 0x80, 0xA1, 0xFF, 0xA0, 0xB1, 0xFF, 0x00, 0x81, 0xFF, 0xA1, 0x58, 0xFF, 0x40, 0x99, 0xFF, 0xAA, 0xBB, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0x46, 0xC3, 0xFF, 0xE0, 0xB1, 0xFF, 0x80, 0x58, 0xFF, 0x40, 0x91, 0xFF, 0x60, 0xA1, 0xFF, 0xE1, 0xA9, 0xFF, 0x61, 0xC2, 0xFF, 0x00, 0x71, 0xFF, 0xA0, 0x60, 0xFF, 0x40, 0x91, 0xFF, 0xA0, 0xA1, 0xFF, 0x61, 0xBA, 0xFF, 0x61, 0xBA, 0xFF, 0xA1, 0xC2, 0xFF, 0x02, 0xCB, 0xFF, 0x23, 0xCB, 0xFF, 0x44, 0xCB, 0xFF, 0xC2, 0xC2, 0xFF, 0x20, 0xB2, 0xFF, 0xC8, 0x9A, 0xFF, 0x76, 0xAD, 0xFF, 0x35, 0xA5, 0xFF, 0x15, 0xA5, 0xFF, 0xD4, 0x9C, 0xFF, 0x93, 0x94, 0xFF, 0x52, 0x8C, 0xFF, 0x31, 0x84, 0xFF, 0xF0, 0x7B, 0xFF, 0x96, 0xB5, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0x35, 0xA5, 0xFF, 0x52, 0x8C, 0xFF, 0xD4, 0x9C, 0xFF, 0xD4, 0x9C, 0xFF, 0xF4, 0x9C, 0xFF, 0xF4, 0x9C, 0xFF, 0xF4, 0x9C, 0xFF, 0xD4, 0x9C, 0xFF, 0x93, 0x94, 0xFF, 0x25, 0x8A, 0xFF, 0xA0, 0xA9, 0xFF, 0xC0, 0xA1, 0xFF, 0x60, 0x91, 0xFF, 0x40, 0x91, 0xFF, 0xE0, 0x70, 0xFF, 0x00, 0x81, 0xFF, 0xC0, 0xA9, 0xFF, 0xA0, 0xA1, 0xFF, 0x80, 0xA1, 0xFF, 0xA0, 0xA9, 0xFF, 0x60, 0x50, 0xFF, 0x20, 0x81, 0xFF, 0xC0, 0xA9, 0xFF, 0xE0, 0xB1, 0xFF, 0x00, 0xC2, 0xFF, 0x20, 0x89, 0xFF, 0xC1, 0x68, 0xFF, 0x40, 0x99, 0xFF, 0xCB, 0xBB, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0x66, 0xC3, 0xFF, 0xC0, 0xA9, 0xFF, 0xA0, 0x70, 0xFF, 0x40, 0xB2, 0xFF, 0x00, 0xD3, 0xFF, 0x81, 0xC2, 0xFF, 0x61, 0xBA, 0xFF, 0x00, 0x79, 0xFF, 0x60, 0x58, 0xFF, 0x60, 0xA1, 0xFF, 0x20, 0x91, 0xFF, 0x21, 0xB2, 0xFF, 0x61, 0xBA, 0xFF, 0x20, 0x81, 0xFF, 0x20, 0x79, 0xFF, 0xA0, 0x99, 0xFF, 0x00, 0xAA, 0xFF, 0x81, 0xBA, 0xFF, 0x20, 0xB2, 0xFF, 0xC8, 0x9A, 0xFF, 0x56, 0xAD, 0xFF, 0x35, 0xA5, 0xFF, 0x15, 0xA5, 0xFF, 0xD4, 0x9C, 0xFF, 0x93, 0x94, 0xFF, 0x52, 0x8C, 0xFF, 0x31, 0x84, 0xFF, 0xF0, 0x7B, 0xFF, 0x96, 0xB5, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0x35, 0xA5, 0xFF, 0x52, 0x8C, 0xFF, 0xB3, 0x94, 0xFF, 0xD4, 0x9C, 0xFF, 0xF4, 0x9C, 0xFF, 0xF4, 0x9C, 0xFF, 0xF4, 0x9C, 0xFF, 0xD3, 0x9C, 0xFF, 0x93, 0x94, 0xFF, 0x05, 0x8A, 0xFF, 0xA0, 0xA1, 0xFF, 0x80, 0x99, 0xFF, 0x60, 0x99, 0xFF, 0x60, 0x99, 0xFF, 0x40, 0x48, 0xFF, 0xE0, 0x70, 0xFF, 0xC1, 0xA9, 0xFF, 0xE0, 0xA9, 0xFF, 0x20, 0xC2, 0xFF, 0x00, 0xBA, 0xFF, 0x80, 0x60, 0xFF, 0x20, 0x89, 0xFF, 0xC0, 0xA1, 0xFF, 0x00, 0xB2, 0xFF, 0x20, 0xC2, 0xFF, 0x20, 0x89, 0xFF, 0xC1, 0x68, 0xFF, 0x40, 0x99, 0xFF, 0xEC, 0xC3, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0x87, 0xC3, 0xFF, 0xC0, 0xA9, 0xFF, 0xA0, 0x70, 0xFF, 0x60, 0xBA, 0xFF, 0x80, 0xDB, 0xFF, 0xC1, 0xC2, 0xFF, 0x41, 0xBA, 0xFF, 0x00, 0x81, 0xFF, 0xE0, 0x78, 0xFF, 0xE0, 0xD2, 0xFF, 0x80, 0xC2, 0xFF, 0x61, 0xBA, 0xFF, 0x41, 0xBA, 0xFF, 0xC0, 0x68, 0xFF, 0x40, 0x50, 0xFF, 0x20, 0x91, 0xFF, 0x00, 0x89, 0xFF, 0x01, 0xAA, 0xFF, 0x20, 0xBA, 0xFF, 0xC8, 0x92, 0xFF, 0x56, 0xAD, 0xFF, 0x35, 0xA5, 0xFF, 0x15, 0xA5, 0xFF, 0xD4, 0x9C, 0xFF, 0x93, 0x94, 0xFF, 0x52, 0x8C, 0xFF, 0x31, 0x84, 0xFF, 0xF0, 0x7B, 0xFF, 0x96, 0xB5, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0x35, 0xA5, 0xFF, 0x52, 0x8C, 0xFF, 0xB3, 0x94, 0xFF, 0xD4, 0x9C, 0xFF, 0xD4, 0x9C, 0xFF, 0xF4, 0x9C, 0xFF, 0xF4, 0x9C, 0xFF, 0xD4, 0x9C, 0xFF, 0x93, 0x94, 0xFF, 0x05, 0x8A, 0xFF, 0xA0, 0xA1, 0xFF, 0x00, 0xB2, 0xFF, 0x40, 0xC2, 0xFF, 0x20, 0xBA, 0xFF, 0xA0, 0x60, 0xFF, 0x20, 0x81, 0xFF, 0xC1, 0xA1, 0xFF, 0xE0, 0xB1, 0xFF, 0x40, 0xC2, 0xFF, 0x00, 0xB2, 0xFF, 0x80, 0x60, 0xFF, 0x40, 0x89, 0xFF, 0xC1, 0xA1, 0xFF, 0x00, 0xB2, 0xFF, 0x20, 0xC2, 0xFF, 0x20, 0x89, 0xFF, 0xE1, 0x70, 0xFF, 0x40, 0x99, 0xFF, 0x0C, 0xC4, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0x88, 0xC3, 0xFF, 0xC0, 0xA9, 0xFF, 0xA1, 0x70, 0xFF, 0x60, 0xBA, 0xFF, 0xA0, 0xDB, 0xFF, 0xE1, 0xC2, 0xFF, 0x41, 0xBA, 0xFF, 0x00, 0x81, 0xFF, 0x00, 0x79, 0xFF, 0x40, 0xDB, 0xFF, 0x40, 0xD3, 0xFF, 0x81, 0xBA, 0xFF, 0x41, 0xBA, 0xFF, 0xE0, 0x70, 0xFF, 0xC0, 0x70, 0xFF, 0x80, 0xC2, 0xFF, 0x20, 0xBA, 0xFF, 0x41, 0xBA, 0xFF, 0x00, 0xB2, 0xFF, 0xC8, 0x92, 0xFF, 0x56, 0xA5, 0xFF, 0x15, 0xA5, 0xFF, 0x15, 0xA5, 0xFF, 0xD4, 0x9C, 0xFF, 0x93, 0x94, 0xFF, 0x52, 0x8C, 0xFF, 0x31, 0x84, 0xFF, 0xF0, 0x7B, 0xFF, 0x96, 0xB5, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0x35, 0xA5, 0xFF, 0x52, 0x8C, 0xFF, 0xB3, 0x94, 0xFF, 0xD4, 0x9C, 0xFF, 0xD4, 0x9C, 0xFF, 0xF4, 0x9C, 0xFF, 0xF4, 0x9C, 0xFF, 0xD3, 0x9C, 0xFF, 0x93, 0x94, 0xFF, 0x05, 0x8A, 0xFF, 0x80, 0xA1, 0xFF, 0x20, 0xB2, 0xFF, 0x60, 0xC2, 0xFF, 0x20, 0xBA, 0xFF, 0xA0, 0x60, 0xFF, 0x20, 0x81, 0xFF, 0xC1, 0xA1, 0xFF, 0x00, 0xB2, 0xFF, 0x40, 0xC2, 0xFF, 0x00, 0xB2, 0xFF, 0xA0, 0x68, 0xFF, 0x40, 0x89, 0xFF, 0xC1, 0xA1, 0xFF, 0x00, 0xB2, 0xFF, 0x20, 0xC2, 0xFF, 0x20, 0x89, 0xFF, 0xE1, 0x70, 0xFF, 0x20, 0x99, 0xFF, 0x2D, 0xC4, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0x88, 0xC3, 0xFF, 0xC0, 0xA9, 0xFF, 0xA1, 0x70, 0xFF, 0x60, 0xB2, 0xFF, 0xA0, 0xDB, 0xFF, 0xE1, 0xC2, 0xFF, 0x41, 0xB2, 0xFF, 0x00, 0x89, 0xFF, 0x00, 0x81, 0xFF, 0x60, 0xDB, 0xFF, 0x60, 0xDB, 0xFF, 0xA1, 0xC2, 0xFF, 0x41, 0xB2, 0xFF, 0xE0, 0x78, 0xFF, 0x00, 0x79, 0xFF, 0x20, 0xD3, 0xFF, 0x20, 0xD3, 0xFF, 0xA1, 0xC2, 0xFF, 0xE0, 0xB1, 0xFF, 0xC8, 0x92, 0xFF, 0x56, 0xA5, 0xFF, 0x15, 0xA5, 0xFF, 0xF4, 0x9C, 0xFF, 0xD4, 0x9C, 0xFF, 0x93, 0x94, 0xFF, 0x52, 0x8C, 0xFF, 0x31, 0x84, 0xFF, 0xF0, 0x7B, 0xFF, 0x96, 0xB5, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0x35, 0xA5, 0xFF, 0x32, 0x84, 0xFF, 0xB3, 0x94, 0xFF, 0xB3, 0x94, 0xFF, 0xD4, 0x9C, 0xFF, 0xF4, 0x9C, 0xFF, 0xF4, 0x9C, 0xFF, 0xD3, 0x9C, 0xFF, 0x93, 0x94, 0xFF, 0x05, 0x8A, 0xFF, 0x80, 0xA1, 0xFF, 0x20, 0xB2, 0xFF, 0x80, 0xC2, 0xFF, 0x20, 0xBA, 0xFF, 0xA0, 0x68, 0xFF, 0x20, 0x81, 0xFF, 0xC1, 0xA1, 0xFF, 0x00, 0xB2, 0xFF, 0x60, 0xC2, 0xFF, 0x00, 0xBA, 0xFF, 0xA0, 0x68, 0xFF, 0x40, 0x89, 0xFF, 0xA1, 0xA1, 0xFF, 0x00, 0xB2, 0xFF, 0x20, 0xC2, 0xFF, 0x20, 0x89, 0xFF, 0xE1, 0x78, 0xFF, 0x20, 0x99, 0xFF, 0x4E, 0xC4, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xA9, 0xC3, 0xFF, 0xC0, 0xA9, 0xFF, 0xA0, 0x70, 0xFF, 0x60, 0xB2, 0xFF, 0xA0, 0xDB, 0xFF, 0xE1, 0xC2, 0xFF, 0x41, 0xB2, 0xFF, 0x20, 0x89, 0xFF, 0x00, 0x81, 0xFF, 0x60, 0xDB, 0xFF, 0x80, 0xDB, 0xFF, 0xA1, 0xC2, 0xFF, 0x21, 0xB2, 0xFF, 0xE0, 0x78, 0xFF, 0x00, 0x79, 0xFF, 0x40, 0xDB, 0xFF, 0x80, 0xD3, 0xFF, 0xC1, 0xC2, 0xFF, 0xE0, 0xB1, 0xFF, 0xA8, 0x92, 0xFF, 0x56, 0xA5, 0xFF, 0x15, 0xA5, 0xFF, 0xF4, 0x9C, 0xFF, 0xD4, 0x9C, 0xFF, 0x93, 0x94, 0xFF, 0x52, 0x8C, 0xFF, 0x52, 0x84, 0xFF, 0xF0, 0x83, 0xFF, 0x96, 0xB5, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0x15, 0xA5, 0xFF, 0x32, 0x84, 0xFF, 0xB3, 0x94, 0xFF, 0xB3, 0x94, 0xFF, 0xD4, 0x9C, 0xFF, 0xF4, 0x9C, 0xFF, 0xF4, 0x9C, 0xFF, 0xD3, 0x9C, 0xFF, 0x93, 0x94, 0xFF, 0x05, 0x8A, 0xFF, 0x80, 0xA1, 0xFF, 0x21, 0xB2, 0xFF, 0x80, 0xC2, 0xFF, 0x40, 0xBA, 0xFF, 0xA0, 0x68, 0xFF, 0x20, 0x81, 0xFF, 0xC0, 0xA1, 0xFF, 0x00, 0xB2, 0xFF, 0x60, 0xC2, 0xFF, 0x00, 0xBA, 0xFF, 0xA0, 0x68, 0xFF, 0x40, 0x91, 0xFF, 0xA1, 0xA1, 0xFF, 0x00, 0xB2, 0xFF, 0x40, 0xC2, 0xFF, 0x20, 0x89, 0xFF, 0xE1, 0x78, 0xFF, 0x20, 0x99, 0xFF, 0x6E, 0xCC, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xC9, 0xC3, 0xFF, 0xA0, 0xA9, 0xFF, 0xA0, 0x78, 0xFF, 0x40, 0xB2, 0xFF, 0x80, 0xDB, 0xFF, 0xE1, 0xC2, 0xFF, 0x21, 0xB2, 0xFF, 0x20, 0x89, 0xFF, 0x00, 0x81, 0xFF, 0x40, 0xDB, 0xFF, 0x80, 0xDB, 0xFF, 0x81, 0xC2, 0xFF, 0x21, 0xB2, 0xFF, 0xC0, 0x78, 0xFF, 0x00, 0x81, 0xFF, 0x60, 0xDB, 0xFF, 0x80, 0xDB, 0xFF, 0xC1, 0xC2, 0xFF, 0xE0, 0xA9, 0xFF, 0xA8, 0x92, 0xFF, 0x56, 0xA5, 0xFF, 0x15, 0xA5, 0xFF, 0xF4, 0x9C, 0xFF, 0xD4, 0x9C, 0xFF, 0x93, 0x94, 0xFF, 0x52, 0x8C, 0xFF, 0x52, 0x84, 0xFF, 0x11, 0x84, 0xFF, 0x96, 0xB5, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0x15, 0xA5, 0xFF, 0x32, 0x84, 0xFF, 0xB3, 0x94, 0xFF, 0xB3, 0x94, 0xFF, 0xD4, 0x9C, 0xFF, 0xD4, 0x9C, 0xFF, 0xF4, 0x9C, 0xFF, 0xD3, 0x9C, 0xFF, 0x92, 0x94, 0xFF, 0x04, 0x8A, 0xFF, 0x80, 0xA1, 0xFF, 0x21, 0xB2, 0xFF, 0x80, 0xC2, 0xFF, 0x40, 0xBA, 0xFF, 0xA0, 0x68, 0xFF, 0x00, 0x81, 0xFF, 0xC0, 0xA1, 0xFF, 0x00, 0xB2, 0xFF, 0x60, 0xC2, 0xFF, 0x20, 0xBA, 0xFF, 0xA0, 0x68, 0xFF, 0x40, 0x91, 0xFF, 0xA1, 0xA1, 0xFF, 0x00, 0xB2, 0xFF, 0x20, 0xC2, 0xFF, 0x20, 0x89, 0xFF, 0xE1, 0x78, 0xFF, 0x20, 0x99, 0xFF, 0x8F, 0xCC, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xEA, 0xC3, 0xFF, 0xA0, 0xA9, 0xFF, 0xA0, 0x78, 0xFF, 0x20, 0xB2, 0xFF, 0x80, 0xDB, 0xFF, 0xC1, 0xC2, 0xFF, 0x21, 0xB2, 0xFF, 0x20, 0x89, 0xFF, 0x00, 0x79, 0xFF, 0x40, 0xDB, 0xFF, 0x60, 0xDB, 0xFF, 0x81, 0xBA, 0xFF, 0x21, 0xB2, 0xFF, 0xC0, 0x78, 0xFF, 0x00, 0x79, 0xFF, 0x40, 0xDB, 0xFF, 0x81, 0xDB, 0xFF, 0xC1, 0xC2, 0xFF, 0xE0, 0xA9, 0xFF, 0xA8, 0x92, 0xFF, 0x56, 0xA5, 0xFF, 0x14, 0xA5, 0xFF, 0xF4, 0x9C, 0xFF, 0xD4, 0x9C, 0xFF, 0x93, 0x94, 0xFF, 0x52, 0x8C, 0xFF, 0x52, 0x84, 0xFF, 0x11, 0x84, 0xFF, 0x96, 0xB5, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0x15, 0xA5, 0xFF, 0x32, 0x84, 0xFF, 0x93, 0x94, 0xFF, 0xB3, 0x94, 0xFF, 0xD4, 0x9C, 0xFF, 0xD4, 0x9C, 0xFF, 0xD4, 0x9C, 0xFF, 0xD3, 0x9C, 0xFF, 0x92, 0x94, 0xFF, 0x05, 0x8A, 0xFF, 0x80, 0x99, 0xFF, 0x21, 0xB2, 0xFF, 0x80, 0xC2, 0xFF, 0x40, 0xBA, 0xFF, 0xA0, 0x70, 0xFF, 0x00, 0x81, 0xFF, 0xC1, 0xA1, 0xFF, 0x00, 0xB2, 0xFF, 0x60, 0xC2, 0xFF, 0x20, 0xBA, 0xFF, 0xA0, 0x70, 0xFF, 0x40, 0x91, 0xFF, 0xA1, 0xA1, 0xFF, 0x00, 0xB2, 0xFF, 0x20, 0xC2, 0xFF, 0x20, 0x89, 0xFF, 0xE1, 0x78, 0xFF, 0x20, 0x99, 0xFF, 0xD0, 0xCC, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0x0A, 0xC4, 0xFF, 0xA0, 0xA9, 0xFF, 0xA1, 0x70, 0xFF, 0x00, 0xAA, 0xFF, 0x60, 0xDB, 0xFF, 0xC1, 0xC2, 0xFF, 0x21, 0xB2, 0xFF, 0x20, 0x89, 0xFF, 0xE0, 0x78, 0xFF, 0x40, 0xD3, 0xFF, 0x60, 0xDB, 0xFF, 0x81, 0xBA, 0xFF, 0x21, 0xB2, 0xFF, 0xC0, 0x78, 0xFF, 0x00, 0x79, 0xFF, 0x40, 0xDB, 0xFF, 0x80, 0xD3, 0xFF, 0xC1, 0xC2, 0xFF, 0xC0, 0xA9, 0xFF, 0xA7, 0x92, 0xFF, 0x56, 0xA5, 0xFF, 0x14, 0xA5, 0xFF, 0xF4, 0x9C, 0xFF, 0xB3, 0x9C, 0xFF, 0x93, 0x94, 0xFF, 0x52, 0x8C, 0xFF, 0x52, 0x8C, 0xFF, 0x11, 0x84, 0xFF, 0x96, 0xB5, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0x15, 0xA5, 0xFF, 0x31, 0x84, 0xFF, 0x93, 0x94, 0xFF, 0xB3, 0x94, 0xFF, 0xD4, 0x9C, 0xFF, 0xD4, 0x9C, 0xFF, 0xD4, 0x9C, 0xFF, 0xB3, 0x9C, 0xFF, 0x92, 0x94, 0xFF, 0x05, 0x8A, 0xFF, 0x80, 0x99, 0xFF, 0x21, 0xB2, 0xFF, 0x80, 0xC2, 0xFF, 0x60, 0xBA, 0xFF, 0xC0, 0x70, 0xFF, 0x00, 0x81, 0xFF, 0xA1, 0xA1, 0xFF, 0x01, 0xAA, 0xFF, 0x60, 0xC2, 0xFF, 0x20, 0xB2, 0xFF, 0xA0, 0x70, 0xFF, 0x40, 0x89, 0xFF, 0xA1, 0xA1, 0xFF, 0x00, 0xB2, 0xFF, 0x20, 0xC2, 0xFF, 0x20, 0x89, 0xFF, 0xE1, 0x78, 0xFF, 0x20, 0x99, 0xFF, 0xF0, 0xCC, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0x2B, 0xC4, 0xFF, 0xA0, 0xA9, 0xFF, 0xA0, 0x78, 0xFF, 0x00, 0xAA, 0xFF, 0x60, 0xDB, 0xFF, 0xC1, 0xC2, 0xFF, 0x21, 0xB2, 0xFF, 0x20, 0x89, 0xFF, 0xE0, 0x78, 0xFF, 0x20, 0xD3, 0xFF, 0x60, 0xD3, 0xFF, 0x81, 0xBA, 0xFF, 0x21, 0xB2, 0xFF, 0xC0, 0x78, 0xFF, 0xE0, 0x78, 0xFF, 0x40, 0xD3, 0xFF, 0x80, 0xD3, 0xFF, 0xC1, 0xC2, 0xFF, 0xC0, 0xA9, 0xFF, 0xA8, 0x92, 0xFF, 0x36, 0xA5, 0xFF, 0x14, 0xA5, 0xFF, 0xF4, 0x9C, 0xFF, 0xB3, 0x94, 0xFF, 0x93, 0x94, 0xFF, 0x52, 0x8C, 0xFF, 0x52, 0x8C, 0xFF, 0x11, 0x84, 0xFF, 0x96, 0xB5, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0x15, 0xA5, 0xFF, 0x31, 0x84, 0xFF, 0x93, 0x94, 0xFF, 0xB3, 0x94, 0xFF, 0xB3, 0x94, 0xFF, 0xD4, 0x9C, 0xFF, 0xD4, 0x9C, 0xFF, 0xB3, 0x9C, 0xFF, 0x92, 0x94, 0xFF, 0x05, 0x8A, 0xFF, 0x80, 0x99, 0xFF, 0x21, 0xB2, 0xFF, 0xA0, 0xC2, 0xFF, 0x60, 0xC2, 0xFF, 0xC0, 0x70, 0xFF, 0x00, 0x81, 0xFF, 0xA1, 0xA1, 0xFF, 0x01, 0xB2, 0xFF, 0x60, 0xC2, 0xFF, 0x20, 0xBA, 0xFF, 0xA0, 0x70, 0xFF, 0x40, 0x89, 0xFF, 0xA1, 0xA1, 0xFF, 0x01, 0xB2, 0xFF, 0x20, 0xC2, 0xFF, 0x20, 0x81, 0xFF, 0xE1, 0x78, 0xFF, 0x20, 0x91, 0xFF, 0x11, 0xCD, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0x2C, 0xCC, 0xFF, 0xA0, 0xA1, 0xFF, 0xC0, 0x78, 0xFF, 0xE0, 0xA9, 0xFF, 0x60, 0xDB, 0xFF, 0xC1, 0xC2, 0xFF, 0x21, 0xB2, 0xFF, 0x20, 0x89, 0xFF, 0xE0, 0x78, 0xFF, 0x20, 0xD3, 0xFF, 0x61, 0xD3, 0xFF, 0x81, 0xBA, 0xFF, 0x01, 0xB2, 0xFF, 0xC0, 0x78, 0xFF, 0x00, 0x79, 0xFF, 0x40, 0xD3, 0xFF, 0x80, 0xD3, 0xFF, 0xC1, 0xC2, 0xFF, 0xC0, 0xA9, 0xFF, 0xA7, 0x92, 0xFF, 0x36, 0xA5, 0xFF, 0xF4, 0xA4, 0xFF, 0xF4, 0x9C, 0xFF, 0xB3, 0x94, 0xFF, 0x93, 0x94, 0xFF, 0x52, 0x8C, 0xFF, 0x52, 0x8C, 0xFF, 0x10, 0x84, 0xFF, 0xB6, 0xB5, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0x15, 0xA5, 0xFF, 0x11, 0x84, 0xFF, 0x93, 0x94, 0xFF, 0xB3, 0x94, 0xFF, 0xB3, 0x94, 0xFF, 0xD4, 0x9C, 0xFF, 0xD3, 0x9C, 0xFF, 0xB3, 0x9C, 0xFF, 0x92, 0x94, 0xFF, 0x05, 0x8A, 0xFF, 0x60, 0x99, 0xFF, 0x21, 0xB2, 0xFF, 0xA0, 0xC2, 0xFF, 0x60, 0xC2, 0xFF, 0xA0, 0x70, 0xFF, 0x00, 0x81, 0xFF, 0xA1, 0xA1, 0xFF, 0x01, 0xAA, 0xFF, 0x60, 0xC2, 0xFF, 0x00, 0xB2, 0xFF, 0xA0, 0x70, 0xFF, 0x40, 0x89, 0xFF, 0xA1, 0x99, 0xFF, 0x01, 0xB2, 0xFF, 0x20, 0xC2, 0xFF, 0x00, 0x81, 0xFF, 0xE0, 0x78, 0xFF, 0x20, 0x91, 0xFF, 0x32, 0xD5, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0x4C, 0xCC, 0xFF, 0x80, 0xA1, 0xFF, 0xA0, 0x70, 0xFF, 0xE0, 0xA1, 0xFF, 0x40, 0xDB, 0xFF, 0xC1, 0xC2, 0xFF, 0x21, 0xB2, 0xFF, 0x20, 0x89, 0xFF, 0xE0, 0x78, 0xFF, 0x00, 0xD3, 0xFF, 0x41, 0xD3, 0xFF, 0x81, 0xBA, 0xFF, 0x00, 0xB2, 0xFF, 0xC0, 0x78, 0xFF, 0xE0, 0x78, 0xFF, 0x20, 0xD3, 0xFF, 0x61, 0xD3, 0xFF, 0xA1, 0xC2, 0xFF, 0xC0, 0xA9, 0xFF, 0xA7, 0x92, 0xFF, 0x35, 0xA5, 0xFF, 0xF4, 0xA4, 0xFF, 0xF4, 0x9C, 0xFF, 0xB3, 0x94, 0xFF, 0x72, 0x8C, 0xFF, 0x52, 0x8C, 0xFF, 0x52, 0x8C, 0xFF, 0x11, 0x84, 0xFF, 0xB6, 0xB5, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0x15, 0xA5, 0xFF, 0x11, 0x84, 0xFF, 0x93, 0x94, 0xFF, 0x93, 0x94, 0xFF, 0xB3, 0x94, 0xFF, 0xD4, 0x9C, 0xFF, 0xD3, 0x9C, 0xFF, 0xB3, 0x94, 0xFF, 0x92, 0x94, 0xFF, 0x04, 0x8A, 0xFF, 0x60, 0x99, 0xFF, 0x21, 0xB2, 0xFF, 0x80, 0xC2, 0xFF, 0x60, 0xBA, 0xFF, 0xC0, 0x70, 0xFF, 0x00, 0x81, 0xFF, 0xA1, 0xA1, 0xFF, 0x01, 0xAA, 0xFF, 0x60, 0xC2, 0xFF, 0x00, 0xB2, 0xFF, 0xA0, 0x70, 0xFF, 0x40, 0x91, 0xFF, 0xA1, 0x99, 0xFF, 0xE0, 0xB1, 0xFF, 0xC0, 0xB9, 0xFF, 0xE0, 0x80, 0xFF, 0x41, 0x89, 0xFF, 0x40, 0x91, 0xFF, 0x53, 0xD5, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0x6D, 0xCC, 0xFF, 0xA0, 0xA9, 0xFF, 0x21, 0x81, 0xFF, 0xA0, 0xA1, 0xFF, 0x00, 0xDB, 0xFF, 0xC1, 0xC2, 0xFF, 0x21, 0xB2, 0xFF, 0x20, 0x89, 0xFF, 0xE0, 0x78, 0xFF, 0x00, 0xD3, 0xFF, 0x41, 0xD3, 0xFF, 0x81, 0xBA, 0xFF, 0x01, 0xAA, 0xFF, 0xC0, 0x78, 0xFF, 0x00, 0x79, 0xFF, 0x20, 0xD3, 0xFF, 0x61, 0xD3, 0xFF, 0xA1, 0xBA, 0xFF, 0xC0, 0xA1, 0xFF, 0x87, 0x92, 0xFF, 0x35, 0xA5, 0xFF, 0xF4, 0x9C, 0xFF, 0xD4, 0x9C, 0xFF, 0xB3, 0x94, 0xFF, 0x72, 0x8C, 0xFF, 0x52, 0x8C, 0xFF, 0x52, 0x8C, 0xFF, 0x11, 0x84, 0xFF, 0xB6, 0xB5, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0x15, 0xA5, 0xFF, 0x11, 0x84, 0xFF, 0x93, 0x94, 0xFF, 0x93, 0x94, 0xFF, 0xB3, 0x94, 0xFF, 0xB3, 0x94, 0xFF, 0xD3, 0x9C, 0xFF, 0xB3, 0x94, 0xFF, 0x92, 0x94, 0xFF, 0x04, 0x82, 0xFF, 0x60, 0x99, 0xFF, 0x21, 0xB2, 0xFF, 0x80, 0xC2, 0xFF, 0x40, 0xBA, 0xFF, 0xC0, 0x70, 0xFF, 0x00, 0x81, 0xFF, 0xA1, 0x99, 0xFF, 0x00, 0xAA, 0xFF, 0x60, 0xC2, 0xFF, 0x00, 0xB2, 0xFF, 0x80, 0x68, 0xFF, 0x40, 0x89, 0xFF, 0xA1, 0x99, 0xFF, 0xA1, 0xA1, 0xFF, 0xE2, 0xA9, 0xFF, 0x43, 0xAA, 0xFF, 0x63, 0xB2, 0xFF, 0x20, 0x91, 0xFF, 0x53, 0xD5, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0x6D, 0xCC, 0xFF, 0xA0, 0xA9, 0xFF, 0xE4, 0xC2, 0xFF, 0xA3, 0xC2, 0xFF, 0xA2, 0xC2, 0xFF, 0x61, 0xBA, 0xFF, 0x21, 0xB2, 0xFF, 0x00, 0x89, 0xFF, 0xA0, 0x70, 0xFF, 0x00, 0xD3, 0xFF, 0x40, 0xD3, 0xFF, 0x61, 0xBA, 0xFF, 0x01, 0xAA, 0xFF, 0xC0, 0x78, 0xFF, 0xE0, 0x78, 0xFF, 0x20, 0xD3, 0xFF, 0x61, 0xD3, 0xFF, 0xA1, 0xBA, 0xFF, 0xA0, 0xA1, 0xFF, 0x87, 0x92, 0xFF, 0x35, 0xA5, 0xFF, 0xF4, 0x9C, 0xFF, 0xD4, 0x9C, 0xFF, 0xB3, 0x94, 0xFF, 0x72, 0x8C, 0xFF, 0x52, 0x8C, 0xFF, 0x52, 0x8C, 0xFF, 0x11, 0x84, 0xFF, 0xB7, 0xB5, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0x15, 0xA5, 0xFF, 0x11, 0x84, 0xFF, 0x93, 0x94, 0xFF, 0x93, 0x94, 0xFF, 0xB3, 0x94, 0xFF, 0xB3, 0x94, 0xFF, 0xB3, 0x9C, 0xFF, 0x93, 0x94, 0xFF, 0x92, 0x94, 0xFF, 0x04, 0x82, 0xFF, 0x60, 0x99, 0xFF, 0x21, 0xB2, 0xFF, 0x80, 0xC2, 0xFF, 0x40, 0xC2, 0xFF, 0xC0, 0x70, 0xFF, 0x00, 0x81, 0xFF, 0xA1, 0xA1, 0xFF, 0xC0, 0xA9, 0xFF, 0xE0, 0xB1, 0xFF, 0xA0, 0xA1, 0xFF, 0x81, 0x91, 0xFF, 0xC1, 0xA1, 0xFF, 0xA1, 0x99, 0xFF, 0x22, 0xAA, 0xFF, 0x21, 0xAA, 0xFF, 0x80, 0x99, 0xFF, 0x20, 0x91, 0xFF, 0x61, 0x89, 0xFF, 0x37, 0xDE, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0x52, 0xD5, 0xFF, 0x60, 0x91, 0xFF, 0xA0, 0xA1, 0xFF, 0x00, 0xB2, 0xFF, 0x81, 0xBA, 0xFF, 0x82, 0xBA, 0xFF, 0x21, 0xB2, 0xFF, 0x22, 0xAA, 0xFF, 0xC2, 0x99, 0xFF, 0x81, 0xC2, 0xFF, 0xE0, 0xD2, 0xFF, 0x61, 0xBA, 0xFF, 0x01, 0xAA, 0xFF, 0xC0, 0x70, 0xFF, 0xE0, 0x78, 0xFF, 0x00, 0xD3, 0xFF, 0x41, 0xD3, 0xFF, 0xA1, 0xBA, 0xFF, 0xA0, 0xA1, 0xFF, 0x87, 0x92, 0xFF, 0x35, 0xA5, 0xFF, 0xF4, 0x9C, 0xFF, 0xD4, 0x9C, 0xFF, 0xB3, 0x94, 0xFF, 0x72, 0x8C, 0xFF, 0x52, 0x8C, 0xFF, 0x52, 0x8C, 0xFF, 0x11, 0x84, 0xFF, 0xB7, 0xB5, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0x15, 0xA5, 0xFF, 0x11, 0x84, 0xFF, 0x73, 0x8C, 0xFF, 0x93, 0x94, 0xFF, 0xB3, 0x94, 0xFF, 0xB3, 0x94, 0xFF, 0xB3, 0x94, 0xFF, 0x93, 0x94, 0xFF, 0x72, 0x94, 0xFF, 0x04, 0x82, 0xFF, 0x60, 0x99, 0xFF, 0x21, 0xB2, 0xFF, 0x80, 0xC2, 0xFF, 0x20, 0xBA, 0xFF, 0x80, 0x68, 0xFF, 0x20, 0x81, 0xFF, 0xA0, 0xA1, 0xFF, 0xC1, 0xA1, 0xFF, 0x43, 0xB2, 0xFF, 0x63, 0xB2, 0xFF, 0x62, 0xB2, 0xFF, 0xA0, 0xA1, 0xFF, 0x20, 0x91, 0xFF, 0x20, 0x89, 0xFF, 0xC3, 0x91, 0xFF, 0x4A, 0xA3, 0xFF, 0x33, 0xC5, 0xFF, 0x1B, 0xEF, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xBA, 0xE6, 0xFF, 0xF2, 0xC4, 0xFF, 0x29, 0xAB, 0xFF, 0xE2, 0x99, 0xFF, 0x80, 0x99, 0xFF, 0xA0, 0xA1, 0xFF, 0x40, 0xBA, 0xFF, 0xE2, 0xC2, 0xFF, 0xE3, 0xC2, 0xFF, 0xC3, 0xC2, 0xFF, 0x41, 0xB2, 0xFF, 0x01, 0xAA, 0xFF, 0xC0, 0x78, 0xFF, 0xC0, 0x70, 0xFF, 0xE0, 0xD2, 0xFF, 0x40, 0xD3, 0xFF, 0x81, 0xBA, 0xFF, 0xA0, 0xA1, 0xFF, 0x87, 0x8A, 0xFF, 0x15, 0xA5, 0xFF, 0xF4, 0x9C, 0xFF, 0xD4, 0x9C, 0xFF, 0xB3, 0x94, 0xFF, 0x72, 0x8C, 0xFF, 0x52, 0x8C, 0xFF, 0x52, 0x8C, 0xFF, 0x11, 0x84, 0xFF, 0xB7, 0xB5, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0x14, 0xA5, 0xFF, 0x11, 0x84, 0xFF, 0x72, 0x8C, 0xFF, 0x93, 0x94, 0xFF, 0x93, 0x94, 0xFF, 0xB3, 0x94, 0xFF, 0xB3, 0x94, 0xFF, 0x93, 0x94, 0xFF, 0x72, 0x94, 0xFF, 0x05, 0x82, 0xFF, 0x60, 0x99, 0xFF, 0xE1, 0xA9, 0xFF, 0xE1, 0xB1, 0xFF, 0xE1, 0xA9, 0xFF, 0x02, 0xA2, 0xFF, 0x22, 0xAA, 0xFF, 0xC1, 0xA1, 0xFF, 0xC1, 0xA1, 0xFF, 0xA0, 0xA1, 0xFF, 0x20, 0x91, 0xFF, 0x40, 0x89, 0xFF, 0x45, 0x9A, 0xFF, 0x0D, 0xB4, 0xFF, 0xF6, 0xD5, 0xFF, 0x7D, 0xF7, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0x3C, 0xEF, 0xFF, 0x95, 0xD5, 0xFF, 0xCC, 0xB3, 0xFF, 0x44, 0xA2, 0xFF, 0x80, 0x99, 0xFF, 0xA0, 0xA1, 0xFF, 0x20, 0xB2, 0xFF, 0x21, 0xB2, 0xFF, 0x21, 0xB2, 0xFF, 0xA3, 0xB2, 0xFF, 0x63, 0xB2, 0xFF, 0x82, 0xC2, 0xFF, 0xA1, 0xCA, 0xFF, 0x61, 0xBA, 0xFF, 0xA0, 0xA1, 0xFF, 0x87, 0x8A, 0xFF, 0x15, 0x9D, 0xFF, 0xD4, 0x9C, 0xFF, 0xD4, 0x9C, 0xFF, 0xB3, 0x94, 0xFF, 0x72, 0x8C, 0xFF, 0x52, 0x8C, 0xFF, 0x52, 0x8C, 0xFF, 0x11, 0x84, 0xFF, 0xB7, 0xB5, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0x14, 0xA5, 0xFF, 0xF1, 0x7B, 0xFF, 0x72, 0x8C, 0xFF, 0x93, 0x94, 0xFF, 0x93, 0x94, 0xFF, 0xB3, 0x94, 0xFF, 0xB3, 0x94, 0xFF, 0x93, 0x94, 0xFF, 0x72, 0x8C, 0xFF, 0x05, 0x82, 0xFF, 0x60, 0x99, 0xFF, 0xE1, 0xA1, 0xFF, 0x63, 0xB2, 0xFF, 0x42, 0xB2, 0xFF, 0xE0, 0xA9, 0xFF, 0x60, 0x99, 0xFF, 0x20, 0x91, 0xFF, 0xA2, 0x91, 0xFF, 0xC8, 0xA2, 0xFF, 0xB1, 0xC4, 0xFF, 0x99, 0xE6, 0xFF, 0xDF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0x9E, 0xF7, 0x00, 0x38, 0xDE, 0xFF, 0x6F, 0xBC, 0xFF, 0xC6, 0xA2, 0xFF, 0xC1, 0x99, 0xFF, 0x80, 0xA1, 0xFF, 0xE0, 0xA9, 0xFF, 0x81, 0xBA, 0xFF, 0xE3, 0xC2, 0xFF, 0xE4, 0xC2, 0xFF, 0x62, 0xB2, 0xFF, 0xA0, 0xA1, 0xFF, 0x87, 0x8A, 0xFF, 0x15, 0x9D, 0xFF, 0xD4, 0x9C, 0xFF, 0xD4, 0x9C, 0xFF, 0x93, 0x94, 0xFF, 0x72, 0x8C, 0xFF, 0x52, 0x8C, 0xFF, 0x52, 0x8C, 0xFF, 0x11, 0x84, 0xFF, 0xB7, 0xB5, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0x14, 0xA5, 0xFF, 0xF1, 0x7B, 0xFF, 0x72, 0x8C, 0xFF, 0x72, 0x8C, 0xFF, 0x93, 0x94, 0xFF, 0xB3, 0x94, 0xFF, 0xB3, 0x94, 0xFF, 0x92, 0x94, 0xFF, 0x72, 0x8C, 0xFF, 0x05, 0x8A, 0xFF, 0x80, 0x99, 0xFF, 0x80, 0x99, 0xFF, 0x40, 0x91, 0xFF, 0x20, 0x91, 0xFF, 0xE3, 0x91, 0xFF, 0x6B, 0xAB, 0xFF, 0x74, 0xCD, 0xFF, 0x1B, 0xEF, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xDA, 0xE6, 0xFF, 0x12, 0xC5, 0xFF, 0x49, 0xAB, 0xFF, 0x02, 0x9A, 0xFF, 0x80, 0x99, 0xFF, 0xA0, 0xA1, 0xFF, 0x00, 0xAA, 0xFF, 0xC0, 0xA1, 0xFF, 0xA8, 0x92, 0xFF, 0x15, 0x9D, 0xFF, 0xD4, 0x9C, 0xFF, 0xB3, 0x94, 0xFF, 0x93, 0x94, 0xFF, 0x72, 0x8C, 0xFF, 0x52, 0x8C, 0xFF, 0x52, 0x8C, 0xFF, 0x11, 0x84, 0xFF, 0xB7, 0xB5, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xF4, 0xA4, 0xFF, 0xF1, 0x7B, 0xFF, 0x72, 0x8C, 0xFF, 0x72, 0x8C, 0xFF, 0x93, 0x94, 0xFF, 0x93, 0x94, 0xFF, 0xB3, 0x94, 0xFF, 0x92, 0x94, 0xFF, 0x72, 0x8C, 0xFF, 0xA3, 0x79, 0xFF, 0x40, 0x89, 0xFF, 0x86, 0x9A, 0xFF, 0x2E, 0xB4, 0xFF, 0x17, 0xD6, 0xFF, 0x9E, 0xF7, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0x5C, 0xEF, 0xFF, 0xD5, 0xD5, 0xFF, 0xEC, 0xB3, 0xFF, 0x85, 0xA2, 0xFF, 0x20, 0x91, 0xFF, 0x26, 0x82, 0xFF, 0x15, 0x9D, 0xFF, 0xD3, 0x9C, 0xFF, 0xB3, 0x94, 0xFF, 0x93, 0x94, 0xFF, 0x72, 0x8C, 0xFF, 0x31, 0x84, 0xFF, 0x52, 0x8C, 0xFF, 0x11, 0x84, 0xFF, 0xB6, 0xB5, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xF4, 0xA4, 0xFF, 0xF1, 0x7B, 0xFF, 0x52, 0x8C, 0xFF, 0x72, 0x8C, 0xFF, 0x93, 0x94, 0xFF, 0x93, 0x94, 0xFF, 0x93, 0x94, 0xFF, 0x92, 0x94, 0xFF, 0x31, 0x8C, 0xFF, 0x13, 0xB5, 0xFF, 0x9A, 0xE6, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xBE, 0xF7, 0x00, 0x58, 0xDE, 0xFF, 0x13, 0xB5, 0xFF, 0xD3, 0x9C, 0xFF, 0xD4, 0x9C, 0xFF, 0xB3, 0x94, 0xFF, 0x93, 0x94, 0xFF, 0x72, 0x8C, 0xFF, 0x31, 0x84, 0xFF, 0x52, 0x8C, 0xFF, 0x11, 0x84, 0xFF, 0xB7, 0xB5, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xF4, 0xA4, 0xFF, 0xF0, 0x7B, 0xFF, 0x52, 0x8C, 0xFF, 0x72, 0x8C, 0xFF, 0x93, 0x94, 0xFF, 0x93, 0x94, 0xFF, 0x93, 0x94, 0xFF, 0x92, 0x94, 0xFF, 0x10, 0x8C, 0xFF, 0x3D, 0xE7, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0x1C, 0xE7, 0xFF, 0x92, 0x94, 0xFF, 0xD4, 0x9C, 0xFF, 0xB3, 0x94, 0xFF, 0x93, 0x94, 0xFF, 0x52, 0x8C, 0xFF, 0x31, 0x84, 0xFF, 0x31, 0x84, 0xFF, 0x11, 0x84, 0xFF, 0xB7, 0xB5, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xD4, 0x9C, 0xFF, 0xD0, 0x7B, 0xFF, 0x52, 0x8C, 0xFF, 0x72, 0x8C, 0xFF, 0x73, 0x8C, 0xFF, 0x93, 0x94, 0xFF, 0x93, 0x94, 0xFF, 0x92, 0x94, 0xFF, 0x10, 0x84, 0xFF, 0xDB, 0xDE, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0x9A, 0xD6, 0xFF, 0x93, 0x94, 0xFF, 0xD4, 0x9C, 0xFF, 0xB3, 0x94, 0xFF, 0x93, 0x94, 0xFF, 0x52, 0x8C, 0xFF, 0x31, 0x84, 0xFF, 0x31, 0x84, 0xFF, 0x11, 0x84, 0xFF, 0xB6, 0xB5, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0x35, 0xAD, 0xFF, 0xAF, 0x73, 0xFF, 0x10, 0x84, 0xFF, 0x10, 0x84, 0xFF, 0x31, 0x84, 0xFF, 0x31, 0x8C, 0xFF, 0x31, 0x8C, 0xFF, 0x31, 0x8C, 0xFF, 0x10, 0x84, 0xFF, 0x3C, 0xE7, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFB, 0xDE, 0xFF, 0x31, 0x8C, 0xFF, 0x51, 0x8C, 0xFF, 0x31, 0x8C, 0xFF, 0x31, 0x84, 0xFF, 0x10, 0x84, 0xFF, 0x10, 0x84, 0xFF, 0x10, 0x84, 0xFF, 0xF0, 0x7B, 0xFF, 0xF7, 0xBD, 0xFF, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0x9E, 0xF7, 0x00, 0x9E, 0xF7, 0x00, 0x9E, 0xF7, 0x00, 0x9E, 0xF7, 0x00, 0x9E, 0xF7, 0x00, 0x9E, 0xF7, 0x00, 0x9E, 0xF7, 0x00, 0xBE, 0xF7, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xBE, 0xF7, 0x00, 0x9E, 0xF7, 0x00, 0x9E, 0xF7, 0x00, 0x9E, 0xF7, 0x00, 0x9E, 0xF7, 0x00, 0x9E, 0xF7, 0x00, 0xBE, 0xF7, 0x00, 0xBE, 0xF7, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-    0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 0xFF, 0xFF, 0x00, 
-};
+// Pixel data is embedded from gate_open.bin
+// Payload SHA-256: b13e7c726cd9a0228fa504f2a12975499c825bad96fe5f83c1933dccf6b44b06
+__asm__(
+    ".section .rodata\n"
+    ".balign 4\n"
+    ".global gate_open_data\n"
+    "gate_open_data:\n"
+    ".incbin \"src/gate_icons/gate_open.bin\"\n"
+    ".previous\n"
+);
+extern "C" const uint8_t gate_open_data[];
 
 extern const lv_img_dsc_t gate_open = {
     .header = {
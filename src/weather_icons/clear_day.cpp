@@ -2,104 +2,17 @@
 #include <Arduino.h>
 
 // Weather icon: clear_day (96x96 RGB565 with alpha)
-const uint8_t clear_day_data[] PROGMEM = {
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x04, 0x00, 0x00, 0x06, 0x00, 0x00, 0x06, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x04, 0x00, 0x00, 0x06, 0x00, 0x00, 0x06, 0x00, 0x00, 0x04, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x04, 0x60, 0x00, 0x13, 0x20, 0x00, 0x20, 0x41, 0x00, 0x1D, 0x00, 0x00, 0x0D, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x04, 0x60, 0x00, 0x13, 0x41, 0x08, 0x1F, 0x20, 0x00, 0x21, 0x61, 0x00, 0x14, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x40, 0x00, 0x2B, 0x20, 0x00, 0x8E, 0x21, 0x00, 0xD9, 0x20, 0x00, 0xCA, 0x20, 0x00, 0x68, 0x02, 0x00, 0x0D, 0x00, 0x00, 0x02, 0x00, 0x00, 0x03, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x03, 0x00, 0x00, 0x05, 0x00, 0x00, 0x04, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x41, 0x00, 0x2D, 0x20, 0x00, 0x8D, 0x21, 0x00, 0xD5, 0x21, 0x00, 0xDE, 0x20, 0x00, 0x93, 0x61, 0x00, 0x12, 0x00, 0x00, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x05, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x20, 0x00, 0x66, 0x21, 0x00, 0xEB, 0x41, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xBE, 0x41, 0x08, 0x1E, 0x00, 0x00, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x21, 0x00, 0x68, 0x21, 0x00, 0xE7, 0x41, 0x00, 0xFF, 0x41, 0x00, 0xFF, 0x21, 0x00, 0xDC, 0x21, 0x00, 0x28, 0x00, 0x00, 0x00, 0x00, 0x00, 0x05, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x06, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x20, 0x00, 0x81, 0x41, 0x00, 0xFF, 0x21, 0x00, 0xF9, 0x21, 0x00, 0xFB, 0x20, 0x00, 0xEB, 0x20, 0x00, 0x4F, 0x00, 0x00, 0x07, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x0B, 0x61, 0x00, 0x15, 0x82, 0x00, 0x0F, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x02, 0x00, 0x00, 0x01, 0x00, 0x08, 0x13, 0x21, 0x00, 0x9E, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFA, 0x41, 0x00, 0xFB, 0x20, 0x00, 0xE1, 0x21, 0x00, 0x2F, 0x00, 0x00, 0x00, 0x00, 0x00, 0x05, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x05, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x20, 0x00, 0x64, 0x21, 0x00, 0xE3, 0x21, 0x00, 0xFC, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xF7, 0x20, 0x00, 0xA5, 0x41, 0x00, 0x39, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x61, 0x08, 0x10, 0x21, 0x00, 0x5E, 0x20, 0x00, 0x9A, 0x41, 0x00, 0x79, 0x61, 0x00, 0x29, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x01, 0x00, 0x00, 0x0A, 0x20, 0x00, 0x53, 0x20, 0x00, 0xC5, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x20, 0x00, 0xCE, 0x20, 0x00, 0x20, 0x00, 0x00, 0x00, 0x00, 0x00, 0x06, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x21, 0x00, 0x38, 0x20, 0x00, 0xAD, 0x21, 0x00, 0xF7, 0x21, 0x00, 0xFD, 0x21, 0x00, 0xFB, 0x20, 0x00, 0xE8, 0x20, 0x00, 0x64, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x05, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0xA2, 0x00, 0x0C, 0x20, 0x00, 0x63, 0x20, 0x00, 0xC0, 0x20, 0x00, 0xEF, 0x41, 0x00, 0xDB, 0x21, 0x00, 0x6F, 0x02, 0x10, 0x0B, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x05, 0x00, 0x00, 0x00, 0x00, 0x00, 0x0D, 0x21, 0x00, 0x98, 0x20, 0x00, 0xEA, 0x21, 0x00, 0xFD, 0x21, 0x00, 0xFD, 0x20, 0x00, 0xE1, 0x20, 0x00, 0x86, 0x80, 0x00, 0x0E, 0x00, 0x00, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x41, 0x08, 0x16, 0x40, 0x00, 0x6A, 0x20, 0x00, 0xEA, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x41, 0x00, 0xFF, 0x20, 0x00, 0x89, 0x00, 0x00, 0x07, 0x00, 0x00, 0x01, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x05, 0x00, 0x00, 0x00, 0x41, 0x00, 0x18, 0x20, 0x00, 0xAB, 0x21, 0x00, 0xF6, 0x21, 0x00, 0xFF, 0x41, 0x00, 0xFF, 0x20, 0x00, 0xA3, 0x01, 0x08, 0x1D, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x05, 0x00, 0x00, 0x01, 0x20, 0x00, 0x23, 0x20, 0x00, 0xCA, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xAE, 0x40, 0x08, 0x35, 0x00, 0x00, 0x04, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x05, 0x00, 0x00, 0x02, 0x20, 0x00, 0x25, 0x20, 0x00, 0xCA, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xB8, 0x20, 0x00, 0x43, 0x00, 0x00, 0x08, 0x00, 0x00, 0x01, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x05, 0x00, 0x00, 0x00, 0x41, 0x00, 0x17, 0x20, 0x00, 0xA6, 0x21, 0x00, 0xF4, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x20, 0x00, 0xA7, 0x20, 0x00, 0x27, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x02, 0x10, 0x0F, 0x41, 0x08, 0x5D, 0x20, 0x00, 0xE8, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x41, 0x00, 0xFF, 0x20, 0x00, 0x88, 0x00, 0x00, 0x05, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x06, 0x00, 0x00, 0x00, 0x00, 0x00, 0x0C, 0x21, 0x00, 0x99, 0x20, 0x00, 0xEC, 0x21, 0x00, 0xFD, 0x21, 0x00, 0xFD, 0x20, 0x00, 0xE7, 0x21, 0x00, 0x90, 0x00, 0x00, 0x0D, 0x00, 0x00, 0x00, 0x00, 0x00, 0x06, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x05, 0x00, 0x00, 0x00, 0x61, 0x00, 0x15, 0x21, 0x00, 0x9E, 0x21, 0x00, 0xED, 0x21, 0x00, 0xFD, 0x21, 0x00, 0xFC, 0x20, 0x00, 0xA4, 0x20, 0x00, 0x29, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x20, 0x00, 0x2D, 0x41, 0x00, 0x9D, 0x21, 0x00, 0xF4, 0x21, 0x00, 0xFE, 0x21, 0x00, 0xFC, 0x20, 0x00, 0xE6, 0x20, 0x00, 0x65, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x05, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x01, 0x00, 0x00, 0x0B, 0x40, 0x00, 0x52, 0x20, 0x00, 0xC3, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x20, 0x00, 0xCB, 0x20, 0x00, 0x22, 0x00, 0x00, 0x00, 0x00, 0x00, 0x05, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x05, 0x00, 0x00, 0x00, 0x41, 0x00, 0x16, 0x20, 0x00, 0xA1, 0x21, 0x00, 0xF0, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x20, 0x00, 0xA5, 0x20, 0x00, 0x28, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x20, 0x00, 0x5B, 0x21, 0x00, 0xD3, 0x21, 0x00, 0xFA, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xF6, 0x21, 0x00, 0xA7, 0x41, 0x00, 0x39, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x01, 0x00, 0x00, 0x0A, 0x21, 0x00, 0x94, 0x41, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x20, 0x00, 0xE6, 0x41, 0x00, 0x50, 0x00, 0x00, 0x06, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x01, 0x00, 0x00, 0x05, 0x00, 0x00, 0x00, 0x41, 0x00, 0x16, 0x20, 0x00, 0xA1, 0x21, 0x00, 0xF0, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x20, 0x00, 0xA5, 0x20, 0x00, 0x28, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x01, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x30, 0x05, 0x21, 0x00, 0x89, 0x21, 0x00, 0xFA, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFD, 0x20, 0x00, 0xE9, 0x21, 0x00, 0x5D, 0x00, 0x00, 0x08, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x03, 0x00, 0x00, 0x03, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x05, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x21, 0x00, 0x68, 0x21, 0x00, 0xE6, 0x21, 0x00, 0xF9, 0x21, 0x00, 0xF7, 0x21, 0x00, 0xED, 0x20, 0x00, 0x88, 0x20, 0x00, 0x24, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x01, 0x00, 0x00, 0x05, 0x00, 0x00, 0x00, 0x41, 0x00, 0x16, 0x20, 0x00, 0xA1, 0x21, 0x00, 0xF0, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x20, 0x00, 0xA5, 0x20, 0x00, 0x28, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x41, 0x08, 0x1E, 0x20, 0x00, 0xA7, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFA, 0x21, 0x00, 0xFF, 0x20, 0x00, 0xD6, 0x21, 0x00, 0x2C, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x02, 0x00, 0x00, 0x03, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x41, 0x00, 0x39, 0x20, 0x00, 0xA7, 0x21, 0x00, 0xF9, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xF6, 0x41, 0x00, 0x99, 0x41, 0x00, 0x31, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x01, 0x00, 0x00, 0x05, 0x00, 0x00, 0x00, 0x41, 0x00, 0x16, 0x20, 0x00, 0xA1, 0x21, 0x00, 0xF0, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x20, 0x00, 0xA5, 0x20, 0x00, 0x28, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x20, 0x00, 0x25, 0x20, 0x00, 0xA0, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xF5, 0x20, 0x00, 0xA0, 0x61, 0x00, 0x15, 0x00, 0x00, 0x02, 0x00, 0x00, 0x05, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x03, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x09, 0x21, 0x00, 0x5D, 0x20, 0x00, 0xE9, 0x41, 0x00, 0xFF, 0x20, 0x00, 0xEB, 0x41, 0x00, 0x6D, 0x00, 0x00, 0x14, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x01, 0x00, 0x00, 0x05, 0x00, 0x00, 0x00, 0x41, 0x00, 0x16, 0x21, 0x00, 0x9E, 0x21, 0x00, 0xED, 0x21, 0x00, 0xFE, 0x21, 0x00, 0xFD, 0x20, 0x00, 0xA2, 0x20, 0x00, 0x27, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x01, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x07, 0x20, 0x00, 0x71, 0x21, 0x00, 0xEF, 0x41, 0x00, 0xFF, 0x20, 0x00, 0xC1, 0x20, 0x00, 0x4A, 0x00, 0x00, 0x05, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x0A, 0x41, 0x00, 0x2F, 0x60, 0x00, 0x27, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x41, 0x08, 0x1C, 0x20, 0x00, 0x66, 0x20, 0x00, 0x80, 0x20, 0x00, 0x68, 0x20, 0x00, 0x25, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0x00, 0x00, 0x05, 0x00, 0x00, 0x00, 0x41, 0x00, 0x18, 0x20, 0x00, 0xAD, 0x21, 0x00, 0xF8, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x20, 0x00, 0xAF, 0x20, 0x00, 0x2C, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x20, 0x00, 0x28, 0x20, 0x00, 0x68, 0x40, 0x00, 0x7C, 0x20, 0x00, 0x4C, 0x01, 0x00, 0x10, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x05, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x42, 0x08, 0x1F, 0x41, 0x00, 0x36, 0x41, 0x08, 0x1F, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x41, 0x00, 0x1D, 0x41, 0x00, 0x5E, 0x41, 0x00, 0x96, 0x40, 0x00, 0x8B, 0x41, 0x00, 0x4D, 0x00, 0x00, 0x10, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x05, 0x00, 0x00, 0x00, 0x61, 0x00, 0x14, 0x21, 0x00, 0x94, 0x21, 0x00, 0xE8, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFA, 0x41, 0x00, 0x9A, 0x20, 0x00, 0x23, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x08, 0x21, 0x00, 0x38, 0x41, 0x00, 0x7D, 0x21, 0x00, 0xA1, 0x41, 0x00, 0x79, 0x42, 0x00, 0x1F, 0x00, 0x00, 0x05, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x05, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x20, 0x00, 0x67, 0x20, 0x00, 0xE6, 0x21, 0x00, 0xF2, 0x20, 0x00, 0xF1, 0x20, 0x00, 0xD6, 0x20, 0x00, 0x62, 0x82, 0x10, 0x0F, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x06, 0x21, 0x00, 0x3F, 0x20, 0x00, 0xA0, 0x21, 0x00, 0xDE, 0x41, 0x00, 0xBE, 0x41, 0x00, 0x51, 0x00, 0x00, 0x05, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x06, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x20, 0x00, 0x53, 0x20, 0x00, 0xC9, 0x21, 0x00, 0xED, 0x21, 0x00, 0xF4, 0x41, 0x00, 0xDF, 0x21, 0x00, 0x7A, 0x21, 0x00, 0x23, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x06, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x20, 0x00, 0x88, 0x41, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x41, 0x00, 0xFF, 0x20, 0x00, 0xCB, 0x20, 0x00, 0x67, 0x00, 0x08, 0x11, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x05, 0x00, 0x00, 0x06, 0x00, 0x00, 0x05, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x09, 0x41, 0x00, 0x39, 0x21, 0x00, 0x5F, 0x20, 0x00, 0x4A, 0x61, 0x00, 0x15, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x05, 0x00, 0x00, 0x06, 0x00, 0x00, 0x04, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x06, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x21, 0x00, 0x51, 0x20, 0x00, 0xC0, 0x41, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x41, 0x00, 0xFF, 0x41, 0x00, 0x9D, 0x21, 0x00, 0x2B, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x21, 0x00, 0x5B, 0x21, 0x00, 0xDD, 0x21, 0x00, 0xFE, 0x21, 0x00, 0xF9, 0x21, 0x00, 0xFA, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xCF, 0x20, 0x00, 0x62, 0x00, 0x00, 0x11, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x08, 0x21, 0x00, 0x42, 0x20, 0x00, 0xCB, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFB, 0x21, 0x00, 0xFB, 0x21, 0x00, 0xFE, 0x20, 0x00, 0xE2, 0x20, 0x00, 0x6B, 0x41, 0x08, 0x18, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x10, 0x21, 0x00, 0x67, 0x20, 0x00, 0xEA, 0x41, 0x00, 0xFF, 0x21, 0x00, 0xF7, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFD, 0x20, 0x00, 0xDA, 0x20, 0x00, 0x62, 0x82, 0x10, 0x0F, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x02, 0x00, 0x00, 0x04, 0x00, 0x00, 0x05, 0x00, 0x00, 0x06, 0x00, 0x00, 0x06, 0x00, 0x00, 0x05, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x06, 0x00, 0x00, 0x06, 0x00, 0x00, 0x05, 0x00, 0x00, 0x04, 0x00, 0x00, 0x03, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x20, 0x00, 0x52, 0x20, 0x00, 0xCB, 0x21, 0x00, 0xFC, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFD, 0x21, 0x00, 0xFF, 0x20, 0x00, 0xEF, 0x21, 0x00, 0x9B, 0x41, 0x00, 0x1F, 0x00, 0x00, 0x03, 0x00, 0x00, 0x04, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x01, 0x08, 0x13, 0x20, 0x00, 0x77, 0x41, 0x00, 0xDA, 0x41, 0x00, 0xFF, 0x21, 0x00, 0xF9, 0x21, 0x00, 0xFC, 0x41, 0x00, 0xFF, 0x20, 0x00, 0xCB, 0x20, 0x00, 0x67, 0x61, 0x08, 0x15, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x03, 0x00, 0x00, 0x05, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x60, 0x00, 0x13, 0x00, 0x00, 0x0A, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x06, 0x00, 0x00, 0x04, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x03, 0x00, 0x08, 0x21, 0x00, 0x52, 0x20, 0x00, 0xC0, 0x41, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFA, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xEE, 0x21, 0x00, 0x97, 0x21, 0x00, 0x35, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x03, 0x00, 0x00, 0x03, 0x00, 0x00, 0x02, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x03, 0x18, 0x0A, 0x21, 0x00, 0x78, 0x20, 0x00, 0xEB, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFA, 0x21, 0x00, 0xFB, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xCF, 0x41, 0x00, 0x5D, 0x00, 0x00, 0x09, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x06, 0x00, 0x00, 0x10, 0x41, 0x00, 0x17, 0x20, 0x00, 0x20, 0x20, 0x00, 0x21, 0x20, 0x00, 0x21, 0x20, 0x00, 0x40, 0x20, 0x00, 0x62, 0x21, 0x00, 0x56, 0x21, 0x00, 0x35, 0x20, 0x00, 0x20, 0x41, 0x00, 0x1C, 0x41, 0x00, 0x19, 0x61, 0x00, 0x12, 0x00, 0x00, 0x09, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x06, 0x21, 0x00, 0x39, 0x20, 0x00, 0xC9, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFB, 0x21, 0x00, 0xFE, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xEE, 0x21, 0x00, 0x9D, 0x20, 0x00, 0x30, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x05, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x02, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x04, 0x00, 0x00, 0x04, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x12, 0x21, 0x00, 0x69, 0x20, 0x00, 0xEB, 0x41, 0x00, 0xFF, 0x21, 0x00, 0xF7, 0x21, 0x00, 0xFC, 0x21, 0x00, 0xF8, 0x21, 0x00, 0xB2, 0x41, 0x00, 0x18, 0x00, 0x00, 0x00, 0x00, 0x00, 0x06, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0x00, 0x00, 0x04, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x10, 0x0E, 0x00, 0x00, 0x46, 0x20, 0x00, 0x80, 0x20, 0x00, 0xA8, 0x20, 0x00, 0xCC, 0x21, 0x00, 0xDE, 0x21, 0x00, 0xDE, 0x20, 0x00, 0xE3, 0x21, 0x00, 0xEA, 0x20, 0x00, 0xE7, 0x20, 0x00, 0xE2, 0x21, 0x00, 0xDC, 0x20, 0x00, 0xC5, 0x20, 0x00, 0xAC, 0x20, 0x00, 0x8A, 0x20, 0x00, 0x56, 0x00, 0x08, 0x12, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x04, 0x00, 0x00, 0x02, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x21, 0x00, 0x25, 0x21, 0x00, 0x81, 0x21, 0x00, 0xEC, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFB, 0x21, 0x00, 0xFF, 0x20, 0x00, 0xF0, 0x21, 0x00, 0x9D, 0x21, 0x00, 0x25, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x02, 0x00, 0x00, 0x04, 0x00, 0x00, 0x06, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x08, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x05, 0x00, 0x00, 0x05, 0x00, 0x00, 0x03, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x02, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x01, 0x08, 0x12, 0x20, 0x00, 0x77, 0x41, 0x00, 0xD8, 0x41, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x20, 0x00, 0xCD, 0x41, 0x00, 0x1D, 0x00, 0x00, 0x00, 0x00, 0x00, 0x07, 0x00, 0x00, 0x06, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x41, 0x00, 0x32, 0x20, 0x00, 0x65, 0x21, 0x00, 0x94, 0x21, 0x00, 0xBA, 0x41, 0x00, 0xDE, 0x41, 0x08, 0xF9, 0x41, 0x08, 0xFF, 0x61, 0x08, 0xFF, 0x61, 0x08, 0xFF, 0x41, 0x08, 0xFF, 0x21, 0x00, 0xFF, 0x41, 0x08, 0xFF, 0x61, 0x08, 0xFF, 0x61, 0x08, 0xFF, 0x41, 0x08, 0xFF, 0x41, 0x08, 0xFB, 0x41, 0x00, 0xE5, 0x20, 0x00, 0xC3, 0x21, 0x00, 0x98, 0x40, 0x00, 0x6F, 0x20, 0x00, 0x40, 0x00, 0x00, 0x0B, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x08, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x41, 0x08, 0x1F, 0x21, 0x00, 0x88, 0x21, 0x00, 0xFF, 0x41, 0x00, 0xFF, 0x41, 0x00, 0xFF, 0x21, 0x00, 0xEE, 0x21, 0x00, 0x97, 0x21, 0x00, 0x34, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x06, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x03, 0x00, 0x00, 0x05, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x20, 0x00, 0x27, 0x41, 0x00, 0x35, 0x41, 0x08, 0x1F, 0x0A, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0x00, 0x00, 0x12, 0x21, 0x00, 0x44, 0x21, 0x00, 0x59, 0x21, 0x00, 0x46, 0x41, 0x00, 0x1E, 0x02, 0x00, 0x0F, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0x03, 0x18, 0x09, 0x21, 0x00, 0x78, 0x20, 0x00, 0xE5, 0x20, 0x00, 0xE9, 0x21, 0x00, 0xD7, 0x20, 0x00, 0x88, 0x61, 0x00, 0x12, 0x00, 0x00, 0x01, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x61, 0x00, 0x15, 0x40, 0x00, 0x4C, 0x41, 0x00, 0x9B, 0x21, 0x00, 0xE6, 0x41, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x20, 0x00, 0xFF, 0x00, 0x00, 0xFF, 0x00, 0x00, 0xFB, 0x00, 0x00, 0xF9, 0x00, 0x00, 0xF9, 0x00, 0x00, 0xFA, 0x20, 0x00, 0xFA, 0x00, 0x00, 0xFA, 0x00, 0x00, 0xF9, 0x00, 0x00, 0xF9, 0x00, 0x00, 0xFB, 0x00, 0x00, 0xFE, 0x20, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x41, 0x00, 0xFF, 0x41, 0x00, 0xFA, 0x41, 0x00, 0xAF, 0x41, 0x00, 0x5C, 0x42, 0x00, 0x1F, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x06, 0x20, 0x00, 0x4C, 0x20, 0x00, 0xCD, 0x21, 0x00, 0xEA, 0x21, 0x00, 0xDD, 0x21, 0x00, 0x9B, 0x20, 0x00, 0x30, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x06, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x05, 0x61, 0x00, 0x11, 0x41, 0x08, 0x1D, 0x20, 0x00, 0x49, 0x20, 0x00, 0x8A, 0x41, 0x00, 0x9F, 0x41, 0x00, 0x7A, 0x21, 0x00, 0x36, 0x00, 0x00, 0x06, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x10, 0x0F, 0x21, 0x08, 0x59, 0x20, 0x00, 0xD0, 0x21, 0x00, 0xE8, 0x21, 0x00, 0xDD, 0x20, 0x00, 0xAF, 0x21, 0x00, 0x77, 0x40, 0x08, 0x36, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x05, 0x00, 0x00, 0x04, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x19, 0x20, 0x00, 0x48, 0x41, 0x00, 0x5F, 0x21, 0x00, 0x49, 0x02, 0x00, 0x1C, 0x00, 0x00, 0x02, 0x00, 0x00, 0x06, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x20, 0x00, 0x24, 0x20, 0x00, 0x8D, 0x21, 0x00, 0xDD, 0x21, 0x00, 0xF4, 0x41, 0x00, 0xFE, 0x41, 0x08, 0xFF, 0x41, 0x08, 0xFF, 0x21, 0x00, 0xFF, 0x00, 0x00, 0xFF, 0x00, 0x00, 0xFF, 0x00, 0x00, 0xFE, 0x00, 0x00, 0xFE, 0x41, 0x08, 0xFE, 0xC1, 0x18, 0xFE, 0x41, 0x00, 0xFE, 0x00, 0x00, 0xFE, 0x00, 0x00, 0xFE, 0x00, 0x00, 0xFF, 0x00, 0x00, 0xFF, 0x20, 0x00, 0xFF, 0x41, 0x08, 0xFF, 0x41, 0x08, 0xFF, 0x41, 0x08, 0xFF, 0x21, 0x00, 0xF5, 0x20, 0x00, 0xE9, 0x20, 0x00, 0xAB, 0x21, 0x00, 0x31, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x01, 0x00, 0x00, 0x0E, 0x21, 0x00, 0x42, 0x20, 0x00, 0x62, 0x41, 0x00, 0x54, 0x41, 0x00, 0x1D, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x05, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x20, 0x08, 0x39, 0x20, 0x00, 0x87, 0x20, 0x00, 0xC6, 0x20, 0x00, 0xE4, 0x20, 0x00, 0xF0, 0x21, 0x00, 0xF2, 0x20, 0x00, 0xE1, 0x21, 0x00, 0x90, 0x61, 0x00, 0x13, 0x00, 0x00, 0x00, 0x00, 0x00, 0x05, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x21, 0x00, 0x2B, 0x41, 0x00, 0x9C, 0x21, 0x00, 0xFF, 0x41, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xF8, 0x21, 0x00, 0xD8, 0x20, 0x00, 0xAF, 0x20, 0x00, 0x80, 0x41, 0x00, 0x5F, 0x20, 0x00, 0x30, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x02, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x0B, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x20, 0x00, 0x51, 0x20, 0x00, 0xA2, 0x20, 0x00, 0xE6, 0x41, 0x00, 0xFF, 0x41, 0x08, 0xFF, 0x20, 0x00, 0xFD, 0x00, 0x00, 0xFA, 0x00, 0x00, 0xFB, 0xA1, 0x10, 0xFD, 0x83, 0x39, 0xFE, 0x44, 0x5A, 0xFF, 0xA5, 0x6A, 0xFF, 0xE5, 0x7A, 0xFF, 0x66, 0x8B, 0xFF, 0xA6, 0x9B, 0xFF, 0x46, 0x8B, 0xFF, 0x25, 0x83, 0xFF, 0xE5, 0x7A, 0xFF, 0x44, 0x62, 0xFE, 0xA3, 0x41, 0xFE, 0xC2, 0x20, 0xFD, 0x00, 0x00, 0xFC, 0x00, 0x00, 0xF9, 0x00, 0x00, 0xFC, 0x41, 0x08, 0xFF, 0x41, 0x08, 0xFF, 0x20, 0x00, 0xF9, 0x21, 0x00, 0xAD, 0x21, 0x00, 0x58, 0x00, 0x08, 0x12, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x0D, 0x00, 0x00, 0x07, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x40, 0x00, 0x2C, 0x21, 0x00, 0x5A, 0x21, 0x00, 0x89, 0x20, 0x00, 0xB0, 0x20, 0x00, 0xE0, 0x41, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x41, 0x00, 0xFF, 0x20, 0x00, 0xB6, 0x41, 0x00, 0x19, 0x00, 0x00, 0x00, 0x00, 0x00, 0x05, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x41, 0x00, 0x2D, 0x41, 0x00, 0x8E, 0x21, 0x00, 0xEC, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x41, 0x00, 0xFF, 0x41, 0x00, 0xDF, 0x20, 0x00, 0x96, 0x20, 0x00, 0x4C, 0x20, 0x00, 0x24, 0x01, 0x00, 0x12, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x02, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x09, 0x21, 0x00, 0x42, 0x20, 0x00, 0xCB, 0x41, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x20, 0x00, 0xFB, 0x20, 0x00, 0xFB, 0x20, 0x00, 0xFE, 0x81, 0x10, 0xFF, 0x43, 0x31, 0xFF, 0x85, 0x6A, 0xFF, 0xE7, 0xAB, 0xFF, 0x09, 0xD5, 0xFF, 0xCA, 0xF5, 0xFF, 0x4B, 0xFE, 0xFF, 0x2B, 0xFE, 0xFF, 0x2B, 0xFE, 0xFF, 0x2A, 0xFE, 0xFF, 0x6B, 0xFE, 0xFF, 0x2A, 0xFE, 0xFF, 0x29, 0xDD, 0xFF, 0x27, 0xAC, 0xFF, 0xE5, 0x7A, 0xFF, 0x63, 0x39, 0xFF, 0xA1, 0x18, 0xFF, 0x61, 0x08, 0xFE, 0x00, 0x00, 0xFD, 0x00, 0x00, 0xF6, 0x41, 0x00, 0xFE, 0x41, 0x00, 0xFF, 0x21, 0x00, 0xD1, 0x20, 0x00, 0x61, 0x00, 0x00, 0x11, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x0A, 0x20, 0x00, 0x20, 0x41, 0x00, 0x4F, 0x40, 0x00, 0x91, 0x21, 0x00, 0xD8, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xF7, 0x20, 0x00, 0xD3, 0x20, 0x00, 0x7C, 0x61, 0x00, 0x10, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x07, 0x41, 0x00, 0x39, 0x21, 0x00, 0xBB, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFB, 0x20, 0x00, 0xF2, 0x20, 0x00, 0xE6, 0x21, 0x00, 0xD3, 0x20, 0x00, 0x88, 0x41, 0x00, 0x16, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x20, 0x00, 0x55, 0x20, 0x00, 0xCB, 0x21, 0x00, 0xFC, 0x41, 0x00, 0xFF, 0x41, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x20, 0x00, 0xFE, 0x22, 0x29, 0xFF, 0x46, 0x8B, 0xFF, 0xC8, 0xCC, 0xFF, 0x69, 0xE5, 0xFF, 0xAA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xEA, 0xFD, 0xFF, 0x0A, 0xFE, 0xFF, 0x0A, 0xFE, 0xFF, 0xEA, 0xFD, 0xFF, 0x0A, 0xFE, 0xFF, 0x0A, 0xFE, 0xFF, 0x0A, 0xFE, 0xFF, 0xCA, 0xF5, 0xFF, 0xAA, 0xED, 0xFF, 0x69, 0xED, 0xFF, 0x09, 0xD5, 0xFF, 0xE7, 0xA3, 0xFF, 0xE3, 0x49, 0xFF, 0x00, 0x00, 0xFF, 0x00, 0x00, 0xFE, 0x61, 0x08, 0xFF, 0x41, 0x00, 0xFF, 0x21, 0x00, 0xFE, 0x20, 0x00, 0xDA, 0x20, 0x00, 0x63, 0x61, 0x08, 0x13, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x05, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x20, 0x00, 0x4E, 0x20, 0x00, 0xC6, 0x20, 0x00, 0xE6, 0x20, 0x00, 0xF2, 0x21, 0x00, 0xFB, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x41, 0x00, 0xFB, 0x41, 0x00, 0xBD, 0x20, 0x00, 0x61, 0x41, 0x00, 0x17, 0x00, 0x00, 0x02, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x07, 0x00, 0x04, 0x20, 0x00, 0x49, 0x41, 0x00, 0x7B, 0x21, 0x00, 0x9B, 0x20, 0x00, 0xC9, 0x21, 0x00, 0xF7, 0x41, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xDB, 0x21, 0x00, 0x67, 0x41, 0x00, 0x1C, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x04, 0x00, 0x00, 0x03, 0x00, 0x00, 0x02, 0x21, 0x00, 0x36, 0x20, 0x00, 0xAF, 0x41, 0x00, 0xFF, 0x41, 0x08, 0xFF, 0x20, 0x00, 0xF9, 0x00, 0x00, 0xFC, 0x81, 0x10, 0xFF, 0x24, 0x5A, 0xFF, 0x07, 0xAC, 0xFF, 0x69, 0xE5, 0xFF, 0x0A, 0xFE, 0xFF, 0x2B, 0xFE, 0xFF, 0x0A, 0xFE, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xAA, 0xF5, 0xFF, 0xAA, 0xF5, 0xFF, 0xAA, 0xF5, 0xFF, 0xAA, 0xF5, 0xFF, 0xAA, 0xF5, 0xFF, 0xAA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xEA, 0xFD, 0xFF, 0x2B, 0xFE, 0xFF, 0x2B, 0xFE, 0xFF, 0xAA, 0xED, 0xFF, 0x68, 0xBC, 0xFF, 0xC5, 0x72, 0xFF, 0xE2, 0x20, 0xFF, 0x00, 0x00, 0xFD, 0x20, 0x00, 0xF8, 0x41, 0x08, 0xFF, 0x41, 0x00, 0xFF, 0x20, 0x00, 0xCB, 0x21, 0x00, 0x50, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x04, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x02, 0x00, 0x00, 0x01, 0x41, 0x08, 0x18, 0x40, 0x00, 0x96, 0x41, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x41, 0x00, 0xFF, 0x21, 0x00, 0xF4, 0x20, 0x00, 0xC5, 0x21, 0x00, 0x96, 0x40, 0x00, 0x70, 0x20, 0x00, 0x48, 0x00, 0x00, 0x13, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x08, 0x16, 0x20, 0x00, 0x61, 0x20, 0x00, 0xAB, 0x20, 0x00, 0xD7, 0x20, 0x00, 0xEB, 0x21, 0x00, 0xF5, 0x21, 0x00, 0xFC, 0x21, 0x00, 0xFE, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFC, 0x20, 0x00, 0xA2, 0x41, 0x00, 0x33, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0x01, 0x00, 0x19, 0x21, 0x00, 0x9A, 0x21, 0x00, 0xEC, 0x21, 0x00, 0xFC, 0x41, 0x00, 0xFD, 0x00, 0x00, 0xFD, 0x81, 0x10, 0xFF, 0x44, 0x62, 0xFF, 0xC8, 0xCC, 0xFF, 0x4B, 0xFE, 0xFF, 0x0A, 0xFE, 0xFF, 0xAA, 0xED, 0xFF, 0xAA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xAA, 0xF5, 0xFF, 0xAA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0x0A, 0xFE, 0xFF, 0xAA, 0xF5, 0xFF, 0x26, 0x83, 0xFF, 0xA1, 0x18, 0xFF, 0x00, 0x00, 0xFF, 0x20, 0x00, 0xFA, 0x41, 0x00, 0xFC, 0x20, 0x00, 0xFF, 0x21, 0x00, 0xA9, 0x21, 0x00, 0x2E, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x20, 0x00, 0x26, 0x20, 0x00, 0xA3, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFA, 0x21, 0x00, 0xF4, 0x20, 0x00, 0xEB, 0x20, 0x00, 0xD5, 0x20, 0x00, 0xA3, 0x41, 0x00, 0x5A, 0x00, 0x10, 0x0F, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x0D, 0x41, 0x00, 0x18, 0x20, 0x00, 0x28, 0x40, 0x00, 0x6B, 0x21, 0x00, 0xAC, 0x20, 0x00, 0xE2, 0x21, 0x00, 0xFF, 0x41, 0x00, 0xFF, 0x21, 0x00, 0xFC, 0x41, 0x00, 0x7F, 0x01, 0x08, 0x1C, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x02, 0x10, 0x0D, 0x21, 0x00, 0x57, 0x20, 0x00, 0xE2, 0x41, 0x00, 0xFF, 0x20, 0x00, 0xFC, 0x20, 0x00, 0xFE, 0x81, 0x10, 0xFF, 0x44, 0x62, 0xFF, 0xE9, 0xD4, 0xFF, 0x0A, 0xFE, 0xFF, 0xEA, 0xFD, 0xFF, 0xEA, 0xFD, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xEA, 0xFD, 0xFF, 0xEA, 0xFD, 0xFF, 0x69, 0xE5, 0xFF, 0x86, 0x93, 0xFF, 0xA1, 0x18, 0xFF, 0x00, 0x00, 0xFD, 0x41, 0x08, 0xFF, 0x41, 0x00, 0xFF, 0x20, 0x00, 0xF5, 0x20, 0x00, 0x9A, 0x61, 0x00, 0x11, 0x00, 0x00, 0x00, 0x00, 0x00, 0x05, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x05, 0x00, 0x00, 0x00, 0x00, 0x00, 0x07, 0x21, 0x00, 0x6A, 0x21, 0x00, 0xF0, 0x41, 0x00, 0xFF, 0x21, 0x00, 0xEF, 0x20, 0x00, 0xA6, 0x20, 0x00, 0x6A, 0x41, 0x00, 0x35, 0x41, 0x00, 0x16, 0x00, 0x00, 0x0A, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x04, 0x00, 0x00, 0x05, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x60, 0x08, 0x14, 0x41, 0x00, 0x3E, 0x20, 0x00, 0x62, 0x21, 0x00, 0x8A, 0x41, 0x00, 0x9D, 0x21, 0x00, 0x8C, 0x21, 0x00, 0x33, 0x00, 0x00, 0x06, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x21, 0x00, 0x3B, 0x21, 0x00, 0xBA, 0x21, 0x00, 0xFE, 0x41, 0x00, 0xFF, 0x20, 0x00, 0xFB, 0x41, 0x00, 0xFE, 0x44, 0x5A, 0xFF, 0xC8, 0xCC, 0xFF, 0x0A, 0xFE, 0xFF, 0x0A, 0xFE, 0xFF, 0xAA, 0xED, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xAA, 0xF5, 0xFF, 0x2A, 0xFE, 0xFF, 0x69, 0xE5, 0xFF, 0x05, 0x7B, 0xFF, 0xC2, 0x20, 0xFF, 0x00, 0x00, 0xFE, 0x20, 0x00, 0xF9, 0x41, 0x08, 0xFF, 0x20, 0x00, 0xDE, 0x20, 0x00, 0x40, 0x00, 0x00, 0x08, 0x00, 0x00, 0x04, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x20, 0x00, 0x20, 0x20, 0x00, 0x68, 0x20, 0x00, 0x80, 0x20, 0x00, 0x6A, 0x41, 0x00, 0x39, 0x00, 0x00, 0x13, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x06, 0x00, 0x00, 0x04, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x03, 0x00, 0x00, 0x05, 0x00, 0x00, 0x05, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x38, 0x04, 0x01, 0x08, 0x1A, 0x01, 0x08, 0x15, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x05, 0x00, 0x00, 0x00, 0x00, 0x00, 0x07, 0x40, 0x00, 0x7B, 0x21, 0x00, 0xFF, 0x41, 0x08, 0xFE, 0x00, 0x00, 0xFC, 0x41, 0x08, 0xFE, 0x83, 0x41, 0xFF, 0x47, 0xB4, 0xFF, 0x4B, 0xFE, 0xFF, 0xEA, 0xFD, 0xFF, 0xAA, 0xED, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0x69, 0xE5, 0xFF, 0x85, 0x6A, 0xFF, 0x20, 0x00, 0xFE, 0x00, 0x00, 0xFB, 0x41, 0x08, 0xFC, 0x20, 0x00, 0xF1, 0x41, 0x00, 0x92, 0x20, 0x00, 0x29, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x05, 0x00, 0x00, 0x03, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x01, 0x00, 0x00, 0x05, 0x41, 0x08, 0x3A, 0x41, 0x00, 0xB0, 0x21, 0x00, 0xFF, 0x41, 0x08, 0xFF, 0x00, 0x00, 0xFB, 0xE2, 0x20, 0xFF, 0x07, 0xAC, 0xFF, 0xCA, 0xF5, 0xFF, 0xEA, 0xFD, 0xFF, 0xCA, 0xFD, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xEA, 0xFD, 0xFF, 0x0A, 0xFE, 0xFF, 0x27, 0xAC, 0xFF, 0xA3, 0x41, 0xFF, 0x61, 0x08, 0xFD, 0x00, 0x00, 0xFD, 0x41, 0x00, 0xFF, 0x20, 0x00, 0xE8, 0x20, 0x00, 0x60, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x05, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x04, 0x00, 0x00, 0x05, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0xA0, 0x00, 0x0B, 0x20, 0x00, 0x6C, 0x41, 0x00, 0xD6, 0x21, 0x00, 0xFD, 0x21, 0x00, 0xFF, 0x61, 0x08, 0xFC, 0x04, 0x52, 0xFF, 0x49, 0xE5, 0xFF, 0x2B, 0xFE, 0xFF, 0x8A, 0xED, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xEA, 0xFD, 0xFF, 0x8A, 0xED, 0xFF, 0xA6, 0x93, 0xFF, 0x81, 0x10, 0xFF, 0x00, 0x00, 0xFB, 0x41, 0x08, 0xFF, 0x41, 0x00, 0xFF, 0x20, 0x00, 0x88, 0x00, 0x00, 0x06, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x05, 0x00, 0x00, 0x06, 0x00, 0x00, 0x05, 0x00, 0x00, 0x03, 0x00, 0x00, 0x02, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0x41, 0x00, 0x16, 0x20, 0x00, 0xA0, 0x41, 0x08, 0xEF, 0x00, 0x00, 0xFE, 0x00, 0x00, 0xFF, 0x43, 0x31, 0xFD, 0xA6, 0x9B, 0xFF, 0x89, 0xED, 0xFF, 0x0A, 0xFE, 0xFF, 0xAA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xAA, 0xF5, 0xFF, 0x4B, 0xFE, 0xFF, 0x09, 0xD5, 0xFF, 0x22, 0x29, 0xFF, 0x00, 0x00, 0xFA, 0x41, 0x08, 0xFF, 0x41, 0x00, 0xFD, 0x20, 0x00, 0xA4, 0x00, 0x00, 0x23, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0x00, 0x00, 0x02, 0x00, 0x00, 0x02, 0x00, 0x00, 0x02, 0x00, 0x00, 0x02, 0x00, 0x00, 0x02, 0x00, 0x00, 0x02, 0x00, 0x00, 0x02, 0x00, 0x00, 0x02, 0x00, 0x00, 0x02, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x05, 0x00, 0x00, 0x00, 0x21, 0x00, 0x2A, 0x21, 0x00, 0xD9, 0x61, 0x08, 0xFE, 0x00, 0x00, 0xFA, 0x00, 0x00, 0xFE, 0x64, 0x62, 0xFF, 0x49, 0xE5, 0xFF, 0xEA, 0xFD, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xAA, 0xF5, 0xFF, 0x4B, 0xFE, 0xFF, 0x69, 0xE5, 0xFF, 0x85, 0x6A, 0xFF, 0xA1, 0x18, 0xFC, 0x21, 0x00, 0xFF, 0x20, 0x00, 0xFF, 0x41, 0x00, 0xC7, 0x41, 0x00, 0x58, 0x00, 0x00, 0x09, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0x00, 0x00, 0x02, 0x00, 0x00, 0x02, 0x00, 0x00, 0x02, 0x00, 0x00, 0x02, 0x00, 0x00, 0x02, 0x00, 0x00, 0x02, 0x00, 0x00, 0x02, 0x00, 0x00, 0x02, 0x00, 0x00, 0x02, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x03, 0x20, 0x00, 0x45, 0x21, 0x00, 0xEB, 0x41, 0x08, 0xFF, 0x00, 0x00, 0xF9, 0x20, 0x00, 0xFE, 0x05, 0x83, 0xFF, 0x2A, 0xFE, 0xFF, 0xEA, 0xFD, 0xFF, 0xAA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0x0A, 0xFE, 0xFF, 0x89, 0xED, 0xFF, 0xC6, 0x9B, 0xFF, 0x43, 0x31, 0xFD, 0x00, 0x00, 0xFF, 0x20, 0x00, 0xFF, 0x41, 0x08, 0xE4, 0x20, 0x00, 0x88, 0x61, 0x00, 0x11, 0x00, 0x00, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x0F, 0x20, 0x00, 0x66, 0x21, 0x00, 0xE9, 0x41, 0x00, 0xFE, 0x20, 0x00, 0xFA, 0x81, 0x10, 0xFE, 0x86, 0x93, 0xFF, 0x2B, 0xFE, 0xFF, 0x0A, 0xFE, 0xFF, 0xAA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xEA, 0xFD, 0xFF, 0xAA, 0xF5, 0xFF, 0x68, 0xBC, 0xFF, 0xC3, 0x49, 0xFD, 0x00, 0x00, 0xFF, 0x00, 0x00, 0xFF, 0x41, 0x08, 0xF7, 0x20, 0x00, 0xA7, 0x41, 0x00, 0x17, 0x00, 0x00, 0x00, 0x00, 0x00, 0x05, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x18, 0x08, 0x41, 0x00, 0x1D, 0x20, 0x00, 0x2B, 0x20, 0x00, 0x29, 0x20, 0x00, 0x27, 0x20, 0x00, 0x28, 0x20, 0x00, 0x28, 0x20, 0x00, 0x28, 0x20, 0x00, 0x29, 0x20, 0x00, 0x29, 0x20, 0x00, 0x26, 0x01, 0x08, 0x14, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x21, 0x00, 0x24, 0x21, 0x00, 0x86, 0x41, 0x00, 0xF0, 0x20, 0x00, 0xFF, 0x41, 0x00, 0xFB, 0x42, 0x31, 0xFF, 0x07, 0xA4, 0xFF, 0x0B, 0xFE, 0xFF, 0xEA, 0xFD, 0xFF, 0xAA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0x09, 0xDD, 0xFF, 0x44, 0x5A, 0xFE, 0x00, 0x00, 0xFF, 0x00, 0x00, 0xFD, 0x41, 0x08, 0xFF, 0x21, 0x00, 0xBC, 0x41, 0x00, 0x1A, 0x00, 0x00, 0x00, 0x00, 0x00, 0x05, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x05, 0x20, 0x00, 0x23, 0x20, 0x00, 0x2D, 0x20, 0x00, 0x28, 0x20, 0x00, 0x28, 0x20, 0x00, 0x28, 0x20, 0x00, 0x28, 0x20, 0x00, 0x28, 0x20, 0x00, 0x27, 0x20, 0x00, 0x2B, 0x20, 0x00, 0x2D, 0x80, 0x10, 0x0F, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0x00, 0x00, 0x10, 0x40, 0x00, 0x71, 0x41, 0x00, 0x9D, 0x20, 0x00, 0xA4, 0x20, 0x00, 0xA6, 0x20, 0x00, 0xA4, 0x20, 0x00, 0xA5, 0x20, 0x00, 0xA5, 0x20, 0x00, 0xA5, 0x20, 0x00, 0xA5, 0x20, 0x00, 0xA3, 0x21, 0x00, 0xA3, 0x21, 0x00, 0x8A, 0x20, 0x00, 0x2D, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x41, 0x00, 0x30, 0x41, 0x00, 0x96, 0x41, 0x08, 0xF3, 0x00, 0x00, 0xFF, 0x61, 0x08, 0xFC, 0x04, 0x52, 0xFF, 0x68, 0xBC, 0xFF, 0x0A, 0xFE, 0xFF, 0xEA, 0xFD, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xEA, 0xFD, 0xFF, 0xCA, 0xF5, 0xFF, 0xC5, 0x72, 0xFF, 0x00, 0x00, 0xFF, 0x00, 0x00, 0xFA, 0x61, 0x08, 0xFF, 0x21, 0x00, 0xD1, 0x41, 0x08, 0x1E, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x20, 0x00, 0x29, 0x21, 0x00, 0x72, 0x20, 0x00, 0xA0, 0x20, 0x00, 0xA9, 0x20, 0x00, 0xA3, 0x20, 0x00, 0xA5, 0x20, 0x00, 0xA5, 0x20, 0x00, 0xA5, 0x20, 0x00, 0xA5, 0x20, 0x00, 0xA2, 0x20, 0x00, 0xA7, 0x20, 0x00, 0xA8, 0x21, 0x00, 0x72, 0x20, 0x00, 0x27, 0x00, 0x00, 0x04, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x07, 0x00, 0x00, 0x00, 0x20, 0x00, 0x22, 0x20, 0x00, 0xE5, 0x41, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x41, 0x00, 0xFF, 0x20, 0x00, 0xFD, 0x41, 0x00, 0x6D, 0x60, 0x00, 0x13, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x41, 0x00, 0x34, 0x41, 0x00, 0x9C, 0x41, 0x08, 0xF4, 0x00, 0x00, 0xFF, 0x61, 0x10, 0xFC, 0x84, 0x6A, 0xFF, 0xC8, 0xCC, 0xFF, 0xEA, 0xFD, 0xFF, 0xEA, 0xFD, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xAA, 0xED, 0xFF, 0x0A, 0xFE, 0xFF, 0x4B, 0xFE, 0xFF, 0x05, 0x83, 0xFF, 0x00, 0x00, 0xFE, 0x00, 0x00, 0xF9, 0x61, 0x08, 0xFF, 0x20, 0x00, 0xE0, 0x20, 0x00, 0x21, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x20, 0x00, 0x65, 0x21, 0x00, 0xF0, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x20, 0x00, 0xD6, 0x20, 0x00, 0x63, 0x00, 0x00, 0x0A, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x06, 0x00, 0x00, 0x00, 0x20, 0x00, 0x24, 0x20, 0x00, 0xEF, 0x41, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x20, 0x00, 0xFD, 0x20, 0x00, 0x84, 0x20, 0x00, 0x22, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x41, 0x00, 0x34, 0x41, 0x00, 0x9C, 0x41, 0x08, 0xF4, 0x00, 0x00, 0xFF, 0x61, 0x10, 0xFC, 0x84, 0x6A, 0xFF, 0xC8, 0xCC, 0xFF, 0xEA, 0xFD, 0xFF, 0xEA, 0xFD, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xAA, 0xED, 0xFF, 0x0A, 0xFE, 0xFF, 0x4B, 0xFE, 0xFF, 0x05, 0x83, 0xFF, 0x00, 0x00, 0xFE, 0x00, 0x00, 0xF9, 0x61, 0x08, 0xFF, 0x21, 0x00, 0xDF, 0x20, 0x00, 0x21, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x20, 0x00, 0x74, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x20, 0x00, 0xDB, 0x20, 0x00, 0x6E, 0x00, 0x00, 0x0C, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0x00, 0x00, 0x14, 0x21, 0x00, 0x92, 0x21, 0x00, 0xD3, 0x21, 0x00, 0xF1, 0x21, 0x00, 0xF1, 0x21, 0x00, 0xEE, 0x21, 0x00, 0xF0, 0x21, 0x00, 0xF0, 0x21, 0x00, 0xEE, 0x21, 0x00, 0xF0, 0x21, 0x00, 0xEF, 0x20, 0x00, 0xE5, 0x20, 0x00, 0xB4, 0x20, 0x00, 0x48, 0x01, 0x08, 0x12, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x41, 0x00, 0x31, 0x41, 0x00, 0x96, 0x41, 0x08, 0xF3, 0x00, 0x00, 0xFF, 0x61, 0x08, 0xFC, 0x24, 0x5A, 0xFF, 0x88, 0xBC, 0xFF, 0xEA, 0xFD, 0xFF, 0xEA, 0xFD, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xEA, 0xFD, 0xFF, 0xCA, 0xF5, 0xFF, 0xA5, 0x72, 0xFF, 0x00, 0x00, 0xFF, 0x00, 0x00, 0xF9, 0x61, 0x08, 0xFF, 0x21, 0x00, 0xDA, 0x20, 0x00, 0x20, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x41, 0x00, 0x3C, 0x21, 0x00, 0xA3, 0x21, 0x00, 0xDC, 0x21, 0x00, 0xF2, 0x21, 0x00, 0xEE, 0x21, 0x00, 0xF0, 0x21, 0x00, 0xF0, 0x21, 0x00, 0xF0, 0x21, 0x00, 0xEF, 0x21, 0x00, 0xEE, 0x21, 0x00, 0xF0, 0x20, 0x00, 0xE5, 0x21, 0x00, 0x99, 0x41, 0x00, 0x34, 0x00, 0x00, 0x06, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x20, 0x08, 0x28, 0x21, 0x00, 0x75, 0x20, 0x00, 0xA8, 0x20, 0x00, 0xA5, 0x21, 0x00, 0x9E, 0x20, 0x00, 0xA1, 0x20, 0x00, 0xA1, 0x21, 0x00, 0x9F, 0x20, 0x00, 0xA3, 0x20, 0x00, 0xA3, 0x20, 0x00, 0x91, 0x20, 0x00, 0x52, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x21, 0x00, 0x24, 0x21, 0x00, 0x86, 0x41, 0x00, 0xF0, 0x20, 0x00, 0xFF, 0x41, 0x08, 0xFB, 0x83, 0x41, 0xFF, 0x27, 0xB4, 0xFF, 0x0A, 0xFE, 0xFF, 0xEA, 0xFD, 0xFF, 0xAA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0x29, 0xDD, 0xFF, 0x44, 0x5A, 0xFF, 0x00, 0x00, 0xFF, 0x00, 0x00, 0xFB, 0x41, 0x08, 0xFF, 0x20, 0x00, 0xC9, 0x41, 0x08, 0x1D, 0x00, 0x00, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x21, 0x00, 0x2C, 0x20, 0x00, 0x83, 0x20, 0x00, 0xA6, 0x21, 0x00, 0x9F, 0x20, 0x00, 0xA1, 0x20, 0x00, 0xA1, 0x20, 0x00, 0xA1, 0x20, 0x00, 0xA0, 0x20, 0x00, 0xA2, 0x20, 0x00, 0xA2, 0x20, 0x00, 0x91, 0x00, 0x00, 0x41, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x0E, 0x41, 0x00, 0x17, 0x41, 0x00, 0x17, 0x41, 0x00, 0x16, 0x41, 0x00, 0x16, 0x41, 0x00, 0x16, 0x41, 0x00, 0x16, 0x41, 0x00, 0x16, 0x41, 0x00, 0x17, 0x61, 0x00, 0x13, 0x00, 0x00, 0x08, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x0F, 0x20, 0x00, 0x66, 0x21, 0x00, 0xE9, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFA, 0xE2, 0x20, 0xFE, 0xC7, 0x9B, 0xFF, 0x2B, 0xFE, 0xFF, 0x0A, 0xFE, 0xFF, 0xAA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xEA, 0xFD, 0xFF, 0xCA, 0xF5, 0xFF, 0xA8, 0xCC, 0xFF, 0x04, 0x52, 0xFD, 0x00, 0x00, 0xFF, 0x00, 0x00, 0xFE, 0x41, 0x08, 0xF7, 0x20, 0x00, 0xA8, 0x41, 0x00, 0x17, 0x00, 0x00, 0x00, 0x00, 0x00, 0x05, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x61, 0x00, 0x11, 0x41, 0x00, 0x17, 0x41, 0x00, 0x16, 0x41, 0x00, 0x16, 0x41, 0x00, 0x16, 0x41, 0x00, 0x16, 0x41, 0x00, 0x16, 0x41, 0x00, 0x16, 0x41, 0x00, 0x16, 0x01, 0x00, 0x13, 0x00, 0x00, 0x06, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x03, 0x20, 0x00, 0x45, 0x21, 0x00, 0xE7, 0x41, 0x08, 0xFE, 0x00, 0x00, 0xF9, 0x40, 0x08, 0xFE, 0x26, 0x83, 0xFF, 0x0A, 0xFE, 0xFF, 0xEA, 0xFD, 0xFF, 0xAA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0x0A, 0xFE, 0xFF, 0x8A, 0xED, 0xFF, 0xE7, 0xA3, 0xFF, 0x63, 0x39, 0xFC, 0x00, 0x00, 0xFF, 0x00, 0x00, 0xFF, 0x41, 0x08, 0xE7, 0x20, 0x00, 0x8B, 0x61, 0x00, 0x12, 0x00, 0x00, 0x00, 0x00, 0x00, 0x05, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x04, 0x00, 0x00, 0x05, 0x00, 0x00, 0x05, 0x00, 0x00, 0x05, 0x00, 0x00, 0x05, 0x00, 0x00, 0x05, 0x00, 0x00, 0x05, 0x00, 0x00, 0x05, 0x00, 0x00, 0x05, 0x00, 0x00, 0x04, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x05, 0x00, 0x00, 0x00, 0x21, 0x00, 0x2B, 0x21, 0x00, 0xDE, 0x61, 0x08, 0xFF, 0x00, 0x00, 0xFA, 0x00, 0x00, 0xFE, 0x64, 0x62, 0xFF, 0x69, 0xE5, 0xFF, 0xEA, 0xFD, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xAA, 0xF5, 0xFF, 0x2B, 0xFE, 0xFF, 0x69, 0xE5, 0xFF, 0xA5, 0x6A, 0xFF, 0xA1, 0x18, 0xFC, 0x20, 0x00, 0xFF, 0x20, 0x00, 0xFF, 0x41, 0x08, 0xD2, 0x20, 0x00, 0x6C, 0x00, 0x00, 0x0C, 0x00, 0x00, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x04, 0x00, 0x00, 0x05, 0x00, 0x00, 0x05, 0x00, 0x00, 0x05, 0x00, 0x00, 0x05, 0x00, 0x00, 0x05, 0x00, 0x00, 0x05, 0x00, 0x00, 0x05, 0x00, 0x00, 0x05, 0x00, 0x00, 0x04, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x05, 0x00, 0x00, 0x00, 0x41, 0x00, 0x1B, 0x20, 0x00, 0xBC, 0x41, 0x08, 0xFF, 0x00, 0x00, 0xFD, 0x00, 0x00, 0xFF, 0x83, 0x39, 0xFE, 0x07, 0xAC, 0xFF, 0x8A, 0xED, 0xFF, 0xEA, 0xFD, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xAA, 0xF5, 0xFF, 0x4B, 0xFE, 0xFF, 0x09, 0xD5, 0xFF, 0x63, 0x39, 0xFF, 0x00, 0x00, 0xFB, 0x41, 0x08, 0xFF, 0x21, 0x00, 0xFC, 0x21, 0x00, 0xB7, 0x00, 0x00, 0x43, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x03, 0x00, 0x00, 0x04, 0x00, 0x00, 0x03, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0x60, 0x00, 0x11, 0x20, 0x00, 0x88, 0x21, 0x00, 0xE6, 0x21, 0x00, 0xFC, 0x21, 0x00, 0xFF, 0x81, 0x10, 0xFD, 0x44, 0x5A, 0xFF, 0x69, 0xE5, 0xFF, 0x4B, 0xFE, 0xFF, 0xAA, 0xED, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xFD, 0xFF, 0xAA, 0xED, 0xFF, 0xC7, 0xA3, 0xFF, 0xC1, 0x18, 0xFF, 0x00, 0x00, 0xFA, 0x41, 0x08, 0xFF, 0x41, 0x00, 0xFF, 0x21, 0x00, 0x96, 0x01, 0x08, 0x17, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x04, 0x00, 0x00, 0x06, 0x00, 0x00, 0x06, 0x00, 0x00, 0x03, 0x00, 0x00, 0x02, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x01, 0x00, 0x00, 0x07, 0x21, 0x00, 0x45, 0x41, 0x00, 0xBA, 0x21, 0x00, 0xFF, 0x41, 0x08, 0xFF, 0x00, 0x00, 0xFC, 0xE2, 0x20, 0xFF, 0x68, 0xBC, 0xFF, 0x0A, 0xFE, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xEA, 0xFD, 0xFF, 0x0A, 0xFE, 0xFF, 0x68, 0xBC, 0xFF, 0xE4, 0x51, 0xFF, 0x61, 0x08, 0xFF, 0x00, 0x00, 0xFB, 0x41, 0x00, 0xFF, 0x41, 0x00, 0xF6, 0x40, 0x00, 0x6C, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x06, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x02, 0x00, 0x00, 0x04, 0x00, 0x00, 0x05, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x01, 0x00, 0x00, 0x08, 0x20, 0x00, 0x8D, 0x41, 0x00, 0xFF, 0x41, 0x08, 0xFE, 0x00, 0x00, 0xFA, 0x61, 0x08, 0xFF, 0x44, 0x5A, 0xFF, 0xA8, 0xC4, 0xFF, 0x0A, 0xFE, 0xFF, 0xEA, 0xFD, 0xFF, 0xAA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0x89, 0xED, 0xFF, 0xE5, 0x7A, 0xFF, 0x61, 0x08, 0xFF, 0x20, 0x00, 0xFC, 0x41, 0x00, 0xFC, 0x21, 0x00, 0xF6, 0x41, 0x00, 0xB0, 0x41, 0x00, 0x3D, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x05, 0x00, 0x00, 0x03, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x03, 0x00, 0x00, 0x05, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x40, 0x00, 0x30, 0x20, 0x00, 0x50, 0x21, 0x00, 0x3A, 0x1F, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x21, 0x00, 0x52, 0x21, 0x00, 0xD1, 0x41, 0x00, 0xFD, 0x21, 0x00, 0xFB, 0x20, 0x00, 0xFC, 0x81, 0x10, 0xFF, 0x05, 0x7B, 0xFF, 0x8A, 0xED, 0xFF, 0x0A, 0xFE, 0xFF, 0xCA, 0xF5, 0xFF, 0xAA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xAA, 0xF5, 0xFF, 0x2B, 0xFE, 0xFF, 0xCA, 0xF5, 0xFF, 0xA6, 0x9B, 0xFF, 0x22, 0x31, 0xFF, 0x00, 0x00, 0xFF, 0x20, 0x00, 0xF8, 0x41, 0x08, 0xFF, 0x20, 0x00, 0xEA, 0x41, 0x00, 0x5D, 0x61, 0x00, 0x13, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x60, 0x00, 0x14, 0x20, 0x00, 0x4C, 0x41, 0x00, 0x7E, 0x20, 0x00, 0x6E, 0x41, 0x00, 0x39, 0x00, 0x00, 0x13, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x05, 0x00, 0x00, 0x04, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x06, 0x61, 0x00, 0x13, 0x20, 0x00, 0x21, 0x20, 0x00, 0x4E, 0x40, 0x00, 0x98, 0x20, 0x00, 0xCA, 0x21, 0x00, 0xA5, 0x41, 0x00, 0x3B, 0x00, 0x00, 0x09, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x42, 0x08, 0x1D, 0x21, 0x00, 0x74, 0x21, 0x00, 0xEC, 0x41, 0x08, 0xFF, 0x20, 0x00, 0xFB, 0x00, 0x00, 0xFF, 0x42, 0x31, 0xFF, 0xA6, 0x9B, 0xFF, 0x69, 0xE5, 0xFF, 0x0A, 0xFE, 0xFF, 0xEA, 0xFD, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xEA, 0xFD, 0xFF, 0xEA, 0xFD, 0xFF, 0xEA, 0xF5, 0xFF, 0x67, 0xB4, 0xFF, 0x63, 0x39, 0xFF, 0x20, 0x00, 0xFD, 0x41, 0x08, 0xFF, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xF9, 0x20, 0x00, 0xAC, 0x42, 0x00, 0x1F, 0x00, 0x00, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x20, 0x00, 0x48, 0x20, 0x00, 0xC5, 0x41, 0x00, 0xFF, 0x21, 0x00, 0xF5, 0x20, 0x00, 0xA5, 0x20, 0x00, 0x6A, 0x41, 0x00, 0x37, 0x41, 0x00, 0x19, 0x02, 0x00, 0x0C, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x04, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x18, 0x08, 0x01, 0x00, 0x49, 0x21, 0x00, 0x92, 0x20, 0x00, 0xCA, 0x20, 0x00, 0xE6, 0x20, 0x00, 0xF2, 0x21, 0x00, 0xF9, 0x21, 0x00, 0xED, 0x21, 0x00, 0xA5, 0x41, 0x00, 0x3C, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x05, 0x00, 0x00, 0x02, 0x20, 0x00, 0x22, 0x21, 0x00, 0xB8, 0x41, 0x00, 0xFD, 0x21, 0x00, 0xFB, 0x21, 0x00, 0xFD, 0x20, 0x00, 0xFD, 0x02, 0x29, 0xFF, 0xA6, 0x9B, 0xFF, 0xAA, 0xED, 0xFF, 0x0A, 0xFE, 0xFF, 0xCA, 0xF5, 0xFF, 0xAA, 0xED, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xAA, 0xF5, 0xFF, 0xAA, 0xF5, 0xFF, 0x0A, 0xFE, 0xFF, 0xEA, 0xFD, 0xFF, 0xE7, 0xA3, 0xFF, 0x62, 0x31, 0xFF, 0x41, 0x08, 0xFF, 0x20, 0x00, 0xF8, 0x41, 0x00, 0xFC, 0x21, 0x00, 0xFF, 0x41, 0x00, 0xBD, 0x41, 0x00, 0x3D, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x06, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x41, 0x00, 0x7A, 0x41, 0x00, 0xF9, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFA, 0x21, 0x00, 0xF4, 0x20, 0x00, 0xEB, 0x21, 0x00, 0xDD, 0x21, 0x00, 0xB3, 0x21, 0x00, 0x69, 0x01, 0x08, 0x1F, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x06, 0x41, 0x00, 0x35, 0x20, 0x00, 0x64, 0x21, 0x00, 0x8D, 0x21, 0x00, 0xBB, 0x21, 0x00, 0xE9, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x41, 0x00, 0xFF, 0x20, 0x00, 0xC9, 0x20, 0x00, 0x49, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x20, 0x00, 0x48, 0x20, 0x00, 0xC0, 0x41, 0x00, 0xFF, 0x41, 0x08, 0xFF, 0x00, 0x00, 0xFA, 0x00, 0x00, 0xFD, 0x42, 0x31, 0xFF, 0xE5, 0x7A, 0xFF, 0x88, 0xBC, 0xFF, 0x0A, 0xFE, 0xFF, 0x6B, 0xFE, 0xFF, 0x0A, 0xFE, 0xFF, 0xEA, 0xFD, 0xFF, 0xAA, 0xF5, 0xFF, 0xAA, 0xF5, 0xFF, 0xAA, 0xF5, 0xFF, 0xAA, 0xF5, 0xFF, 0xAA, 0xF5, 0xFF, 0xAA, 0xF5, 0xFF, 0xAA, 0xF5, 0xFF, 0xAA, 0xF5, 0xFF, 0xAA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0x0A, 0xFE, 0xFF, 0x4B, 0xFE, 0xFF, 0xEA, 0xFD, 0xFF, 0xC8, 0xCC, 0xFF, 0x46, 0x8B, 0xFF, 0x43, 0x31, 0xFF, 0x20, 0x00, 0xFE, 0x00, 0x00, 0xF9, 0x41, 0x00, 0xFF, 0x41, 0x00, 0xFF, 0x20, 0x00, 0xCB, 0x41, 0x00, 0x5C, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x06, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x21, 0x00, 0x7C, 0x41, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x41, 0x00, 0xFF, 0x21, 0x00, 0xFE, 0x21, 0x00, 0xCE, 0x20, 0x00, 0xA0, 0x21, 0x00, 0x81, 0x21, 0x00, 0x53, 0x01, 0x08, 0x1A, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x04, 0x21, 0x00, 0x22, 0x21, 0x00, 0x54, 0x41, 0x00, 0x9E, 0x21, 0x00, 0xE8, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFA, 0x21, 0x00, 0xF5, 0x41, 0x00, 0xDF, 0x20, 0x00, 0x83, 0x61, 0x00, 0x28, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x05, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x21, 0x00, 0x5E, 0x21, 0x00, 0xDE, 0x21, 0x00, 0xFD, 0x41, 0x08, 0xFF, 0x21, 0x00, 0xFF, 0x00, 0x00, 0xFE, 0x41, 0x08, 0xFF, 0xE3, 0x51, 0xFF, 0x67, 0xBC, 0xFF, 0x69, 0xE5, 0xFF, 0x69, 0xE5, 0xFF, 0xCA, 0xF5, 0xFF, 0x0A, 0xFE, 0xFF, 0x0A, 0xFE, 0xFF, 0x0A, 0xFE, 0xFF, 0xEA, 0xFD, 0xFF, 0xEA, 0xFD, 0xFF, 0xEA, 0xFD, 0xFF, 0xEA, 0xFD, 0xFF, 0x0A, 0xFE, 0xFF, 0x0A, 0xFE, 0xFF, 0xCA, 0xF5, 0xFF, 0xAA, 0xF5, 0xFF, 0x69, 0xE5, 0xFF, 0x68, 0xBC, 0xFF, 0x85, 0x6A, 0xFF, 0x61, 0x08, 0xFF, 0x00, 0x00, 0xFE, 0x41, 0x08, 0xFF, 0x41, 0x00, 0xFF, 0x41, 0x00, 0xFD, 0x20, 0x00, 0xDA, 0x20, 0x00, 0x62, 0x61, 0x08, 0x11, 0x00, 0x00, 0x01, 0x00, 0x00, 0x02, 0x00, 0x00, 0x03, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x20, 0x00, 0x48, 0x21, 0x00, 0xB7, 0x20, 0x00, 0xE6, 0x20, 0x00, 0xF0, 0x21, 0x00, 0xF7, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x41, 0x00, 0xFF, 0x21, 0x00, 0xCC, 0x21, 0x00, 0x74, 0x41, 0x00, 0x2D, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x40, 0x08, 0x2C, 0x20, 0x00, 0xB6, 0x20, 0x00, 0xE6, 0x21, 0x00, 0xF0, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x20, 0x00, 0xE2, 0x21, 0x00, 0xAC, 0x40, 0x00, 0x69, 0x41, 0x00, 0x1B, 0x00, 0x00, 0x05, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x05, 0x00, 0x00, 0x06, 0x00, 0x00, 0x07, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x01, 0x00, 0x11, 0x21, 0x00, 0x61, 0x20, 0x00, 0xD1, 0x41, 0x00, 0xFF, 0x21, 0x00, 0xFD, 0x00, 0x00, 0xFB, 0x20, 0x00, 0xFC, 0x41, 0x08, 0xFF, 0x02, 0x29, 0xFF, 0xE3, 0x49, 0xFF, 0x46, 0x8B, 0xFF, 0xE9, 0xD4, 0xFF, 0xEA, 0xFD, 0xFF, 0x4B, 0xFE, 0xFF, 0x2A, 0xFE, 0xFF, 0x0A, 0xFE, 0xFF, 0x2A, 0xFE, 0xFF, 0x2A, 0xFE, 0xFF, 0x2A, 0xFE, 0xFF, 0x4B, 0xFE, 0xFF, 0x0A, 0xFE, 0xFF, 0x49, 0xE5, 0xFF, 0xE7, 0xA3, 0xFF, 0x44, 0x5A, 0xFF, 0x22, 0x29, 0xFF, 0x61, 0x10, 0xFF, 0x00, 0x00, 0xFD, 0x20, 0x00, 0xF7, 0x21, 0x00, 0xFD, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xD0, 0x20, 0x00, 0x62, 0x00, 0x00, 0x11, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x05, 0x00, 0x00, 0x07, 0x00, 0x00, 0x05, 0x00, 0x00, 0x03, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x0A, 0x41, 0x00, 0x1F, 0x41, 0x00, 0x51, 0x20, 0x00, 0x88, 0x21, 0x00, 0xC9, 0x41, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xF5, 0x20, 0x00, 0xE9, 0x20, 0x00, 0xB3, 0x41, 0x08, 0x19, 0x00, 0x00, 0x00, 0x00, 0x00, 0x05, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x41, 0x08, 0x18, 0x41, 0x00, 0x75, 0x21, 0x00, 0xFF, 0x41, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x41, 0x00, 0xFF, 0x21, 0x00, 0xEA, 0x21, 0x00, 0xBB, 0x21, 0x00, 0x92, 0x20, 0x00, 0x62, 0x41, 0x00, 0x3D, 0x60, 0x08, 0x15, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x01, 0x00, 0x10, 0x21, 0x00, 0x55, 0x20, 0x00, 0xB7, 0x41, 0x00, 0xFF, 0x41, 0x08, 0xFF, 0x41, 0x08, 0xFF, 0x00, 0x00, 0xFA, 0x00, 0x00, 0xFB, 0x21, 0x00, 0xFC, 0x22, 0x29, 0xFD, 0x24, 0x5A, 0xFE, 0xA5, 0x72, 0xFF, 0x25, 0x83, 0xFF, 0xC7, 0x9B, 0xFF, 0xE7, 0xA3, 0xFF, 0xE7, 0xA3, 0xFF, 0xE7, 0xA3, 0xFF, 0xA6, 0x9B, 0xFF, 0x66, 0x8B, 0xFF, 0xE5, 0x7A, 0xFF, 0x64, 0x62, 0xFF, 0x83, 0x39, 0xFE, 0x61, 0x08, 0xFD, 0x00, 0x00, 0xFB, 0x00, 0x00, 0xFA, 0x41, 0x00, 0xFF, 0x61, 0x08, 0xFF, 0x21, 0x00, 0xFF, 0x20, 0x00, 0xC1, 0x20, 0x00, 0x63, 0x00, 0x08, 0x11, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x20, 0x00, 0x26, 0x21, 0x00, 0x50, 0x41, 0x00, 0x7E, 0x20, 0x00, 0xA6, 0x41, 0x00, 0xD8, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x41, 0x00, 0xFF, 0x20, 0x00, 0xF6, 0x20, 0x00, 0x24, 0x00, 0x00, 0x00, 0x00, 0x00, 0x07, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x21, 0x00, 0x26, 0x21, 0x00, 0x84, 0x21, 0x00, 0xE8, 0x21, 0x00, 0xFE, 0x21, 0x00, 0xF9, 0x21, 0x00, 0xF0, 0x20, 0x00, 0xE7, 0x21, 0x00, 0xD8, 0x21, 0x00, 0x96, 0x00, 0x00, 0x49, 0x02, 0x10, 0x0D, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x06, 0x41, 0x08, 0x1B, 0x20, 0x00, 0x21, 0x41, 0x00, 0x1A, 0x00, 0x00, 0x0A, 0x00, 0x00, 0x01, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x4A, 0x21, 0x00, 0xB7, 0x20, 0x00, 0xEA, 0x21, 0x00, 0xFA, 0x41, 0x08, 0xFF, 0x41, 0x08, 0xFF, 0x41, 0x00, 0xFF, 0x00, 0x00, 0xFF, 0x00, 0x00, 0xFF, 0x00, 0x00, 0xFE, 0x00, 0x00, 0xFE, 0xE2, 0x20, 0xFE, 0x22, 0x31, 0xFE, 0x02, 0x29, 0xFE, 0x22, 0x29, 0xFE, 0xC2, 0x18, 0xFE, 0x41, 0x08, 0xFE, 0x00, 0x00, 0xFE, 0x00, 0x00, 0xFF, 0x00, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x41, 0x08, 0xFF, 0x41, 0x08, 0xFF, 0x41, 0x00, 0xFA, 0x20, 0x00, 0xED, 0x20, 0x00, 0xC0, 0x21, 0x00, 0x50, 0x03, 0x18, 0x09, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x01, 0x00, 0x00, 0x04, 0x41, 0x00, 0x1A, 0x20, 0x00, 0x21, 0x41, 0x08, 0x1B, 0x00, 0x00, 0x0A, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x05, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x20, 0x00, 0x29, 0x41, 0x00, 0x79, 0x21, 0x00, 0xB6, 0x21, 0x00, 0xDB, 0x20, 0x00, 0xEE, 0x21, 0x00, 0xEF, 0x20, 0x00, 0xEA, 0x20, 0x00, 0xB5, 0x41, 0x08, 0x1A, 0x00, 0x00, 0x00, 0x00, 0x00, 0x05, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x07, 0x41, 0x00, 0x37, 0x20, 0x00, 0xAE, 0x20, 0x00, 0xEF, 0x41, 0x00, 0xDB, 0x41, 0x00, 0x9E, 0x21, 0x00, 0x54, 0x21, 0x00, 0x28, 0x61, 0x00, 0x14, 0x00, 0x00, 0x07, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x05, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x46, 0x21, 0x00, 0xBA, 0x21, 0x00, 0xDF, 0x21, 0x00, 0xBA, 0x20, 0x00, 0x58, 0x00, 0x00, 0x0A, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x07, 0x20, 0x00, 0x20, 0x20, 0x00, 0x67, 0x20, 0x00, 0xC0, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x20, 0x00, 0xFF, 0x00, 0x00, 0xFB, 0x00, 0x00, 0xF9, 0x00, 0x00, 0xFA, 0x21, 0x00, 0xFA, 0x41, 0x00, 0xFA, 0x21, 0x00, 0xFA, 0x41, 0x00, 0xFA, 0x20, 0x00, 0xFB, 0x00, 0x00, 0xFA, 0x00, 0x00, 0xF9, 0x00, 0x00, 0xFB, 0x00, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x41, 0x00, 0xFF, 0x21, 0x00, 0xCD, 0x21, 0x00, 0x75, 0x41, 0x08, 0x2E, 0x00, 0x00, 0x08, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x20, 0x08, 0x2B, 0x20, 0x00, 0xB3, 0x41, 0x00, 0xDE, 0x20, 0x00, 0xBC, 0x41, 0x00, 0x5F, 0x61, 0x08, 0x11, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x82, 0x00, 0x0F, 0x41, 0x00, 0x1A, 0x41, 0x08, 0x3F, 0x41, 0x00, 0x7C, 0x41, 0x00, 0x9C, 0x41, 0x00, 0x7D, 0x41, 0x00, 0x3A, 0x00, 0x00, 0x07, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x06, 0x00, 0x05, 0x20, 0x00, 0x40, 0x20, 0x00, 0x68, 0x41, 0x00, 0x5C, 0x41, 0x00, 0x35, 0x00, 0x00, 0x05, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x05, 0x00, 0x00, 0x04, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x06, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x21, 0x00, 0x52, 0x21, 0x00, 0xB8, 0x21, 0x00, 0xFF, 0x41, 0x00, 0xFF, 0x41, 0x00, 0xFF, 0x21, 0x00, 0xBE, 0x41, 0x08, 0x1B, 0x00, 0x00, 0x00, 0x00, 0x00, 0x07, 0x00, 0x00, 0x07, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x08, 0x12, 0x20, 0x00, 0x4A, 0x20, 0x00, 0x79, 0x41, 0x00, 0xB0, 0x41, 0x00, 0xD4, 0x41, 0x00, 0xF1, 0x41, 0x08, 0xFF, 0x61, 0x08, 0xFF, 0x41, 0x08, 0xFF, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x41, 0x08, 0xFF, 0x61, 0x08, 0xFF, 0x61, 0x08, 0xFF, 0x41, 0x08, 0xF9, 0x41, 0x00, 0xDE, 0x20, 0x00, 0xB3, 0x21, 0x00, 0x88, 0x21, 0x00, 0x53, 0x01, 0x08, 0x19, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x02, 0x00, 0x00, 0x02, 0x41, 0x08, 0x1E, 0x41, 0x00, 0x7C, 0x21, 0x00, 0xF9, 0x41, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x20, 0x00, 0xCA, 0x20, 0x00, 0x69, 0x00, 0x08, 0x11, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x03, 0x00, 0x00, 0x04, 0x00, 0x00, 0x05, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x41, 0x08, 0x1E, 0x41, 0x00, 0x33, 0x41, 0x08, 0x1F, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x05, 0x00, 0x00, 0x04, 0x00, 0x00, 0x02, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x08, 0x21, 0x00, 0x42, 0x20, 0x00, 0xCB, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFB, 0x21, 0x00, 0xF6, 0x41, 0x00, 0xFD, 0x21, 0x00, 0xDB, 0x20, 0x00, 0x20, 0x00, 0x00, 0x00, 0x00, 0x00, 0x06, 0x00, 0x00, 0x01, 0x00, 0x00, 0x02, 0x00, 0x00, 0x05, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x41, 0x08, 0x37, 0x20, 0x00, 0x70, 0x20, 0x00, 0x9E, 0x20, 0x00, 0xC8, 0x21, 0x00, 0xDD, 0x20, 0x00, 0xE5, 0x21, 0x00, 0xE8, 0x41, 0x00, 0xE9, 0x41, 0x00, 0xE9, 0x41, 0x00, 0xE9, 0x21, 0x00, 0xE9, 0x20, 0x00, 0xE8, 0x20, 0x00, 0xE0, 0x20, 0x00, 0xCB, 0x20, 0x00, 0xA9, 0x20, 0x00, 0x81, 0x20, 0x08, 0x3C, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x03, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x41, 0x00, 0x30, 0x41, 0x00, 0x97, 0x21, 0x00, 0xF5, 0x21, 0x00, 0xFC, 0x21, 0x00, 0xFB, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xCF, 0x20, 0x00, 0x62, 0x00, 0x00, 0x11, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x04, 0x00, 0x00, 0x05, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x05, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x20, 0x00, 0x53, 0x20, 0x00, 0xCB, 0x21, 0x00, 0xFC, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFD, 0x21, 0x00, 0xFF, 0x20, 0x00, 0xE7, 0x20, 0x00, 0x8F, 0x00, 0x00, 0x12, 0x00, 0x00, 0x00, 0x00, 0x00, 0x05, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x0E, 0x61, 0x00, 0x15, 0x41, 0x08, 0x1D, 0x20, 0x08, 0x2C, 0x20, 0x00, 0x46, 0x41, 0x00, 0x5B, 0x20, 0x00, 0x61, 0x41, 0x00, 0x5D, 0x41, 0x00, 0x5C, 0x20, 0x00, 0x64, 0x41, 0x00, 0x56, 0x20, 0x00, 0x28, 0x41, 0x08, 0x1D, 0x41, 0x00, 0x19, 0x00, 0x00, 0x10, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x08, 0x41, 0x00, 0x51, 0x20, 0x00, 0xE7, 0x41, 0x00, 0xFF, 0x21, 0x00, 0xF7, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFD, 0x20, 0x00, 0xDA, 0x20, 0x00, 0x62, 0x82, 0x10, 0x0F, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x04, 0x00, 0x00, 0x05, 0x00, 0x00, 0x05, 0x00, 0x00, 0x03, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x21, 0x00, 0x51, 0x20, 0x00, 0xC0, 0x41, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFA, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xEE, 0x20, 0x00, 0x90, 0x20, 0x00, 0x2B, 0x00, 0x00, 0x04, 0x00, 0x00, 0x02, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x04, 0x00, 0x00, 0x05, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x09, 0x00, 0x00, 0x0E, 0x80, 0x00, 0x0D, 0xA0, 0x00, 0x0C, 0x00, 0x00, 0x10, 0x00, 0x00, 0x06, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x04, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x61, 0x08, 0x12, 0x20, 0x00, 0x76, 0x41, 0x00, 0xD9, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xF9, 0x21, 0x00, 0xFC, 0x41, 0x00, 0xFF, 0x20, 0x00, 0xCB, 0x20, 0x00, 0x68, 0x60, 0x08, 0x11, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x02, 0x00, 0x00, 0x03, 0x00, 0x00, 0x02, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x09, 0x21, 0x00, 0x40, 0x20, 0x00, 0xCB, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFB, 0x21, 0x00, 0xFE, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xEE, 0x21, 0x00, 0x9D, 0x20, 0x00, 0x31, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x03, 0x00, 0x00, 0x05, 0x00, 0x00, 0x06, 0x00, 0x00, 0x05, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x05, 0x00, 0x00, 0x06, 0x00, 0x00, 0x05, 0x00, 0x00, 0x04, 0x00, 0x00, 0x02, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x03, 0x18, 0x0A, 0x21, 0x00, 0x78, 0x20, 0x00, 0xEB, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFA, 0x21, 0x00, 0xFB, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xCF, 0x20, 0x00, 0x61, 0x00, 0x00, 0x0F, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x20, 0x00, 0x48, 0x21, 0x00, 0xBC, 0x21, 0x00, 0xFA, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFD, 0x21, 0x00, 0xFF, 0x20, 0x00, 0xF0, 0x21, 0x00, 0x9D, 0x21, 0x00, 0x25, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x12, 0x21, 0x00, 0x69, 0x20, 0x00, 0xEB, 0x41, 0x00, 0xFF, 0x21, 0x00, 0xF7, 0x21, 0x00, 0xFD, 0x41, 0x00, 0xFB, 0x20, 0x00, 0xD4, 0x20, 0x00, 0x4B, 0x00, 0x00, 0x05, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x06, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x21, 0x00, 0x7D, 0x41, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xEE, 0x21, 0x00, 0x97, 0x21, 0x00, 0x34, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x05, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x04, 0x00, 0x00, 0x04, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x41, 0x08, 0x17, 0x41, 0x00, 0x37, 0x20, 0x00, 0x20, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x03, 0x00, 0x00, 0x05, 0x00, 0x00, 0x04, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x02, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x01, 0x08, 0x12, 0x20, 0x00, 0x77, 0x41, 0x00, 0xD9, 0x41, 0x00, 0xFF, 0x21, 0x00, 0xFE, 0x41, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x41, 0x00, 0x90, 0x20, 0x00, 0x25, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x06, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x41, 0x00, 0x7A, 0x41, 0x00, 0xF6, 0x21, 0x00, 0xFC, 0x21, 0x00, 0xFE, 0x20, 0x00, 0xEC, 0x21, 0x00, 0x9D, 0x20, 0x00, 0x30, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x06, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x02, 0x41, 0x00, 0x16, 0x21, 0x00, 0x66, 0x20, 0x00, 0xA0, 0x41, 0x00, 0x7D, 0x21, 0x00, 0x32, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0x03, 0x18, 0x09, 0x21, 0x00, 0x79, 0x20, 0x00, 0xEA, 0x21, 0x00, 0xFC, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xEA, 0x41, 0x00, 0x93, 0x41, 0x00, 0x2E, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x20, 0x00, 0x47, 0x21, 0x00, 0xAF, 0x21, 0x00, 0xD3, 0x21, 0x00, 0xD3, 0x20, 0x00, 0x91, 0x20, 0x00, 0x24, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x61, 0x00, 0x10, 0x21, 0x00, 0x7F, 0x21, 0x00, 0xD4, 0x21, 0x00, 0xF5, 0x41, 0x00, 0xEE, 0x21, 0x00, 0x8C, 0x01, 0x08, 0x15, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x16, 0x21, 0x00, 0x64, 0x21, 0x00, 0xC5, 0x20, 0x00, 0xEB, 0x20, 0x00, 0xB1, 0x41, 0x00, 0x48, 0x00, 0x00, 0x08, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x61, 0x00, 0x13, 0x41, 0x00, 0x3D, 0x21, 0x00, 0x57, 0x21, 0x00, 0x56, 0x20, 0x00, 0x2D, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x06, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x60, 0x08, 0x15, 0x41, 0x00, 0x3F, 0x41, 0x00, 0x3F, 0x01, 0x00, 0x11, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x05, 0x00, 0x00, 0x00, 0x41, 0x00, 0x17, 0x20, 0x00, 0xA9, 0x21, 0x00, 0xFA, 0x21, 0x00, 0xFF, 0x41, 0x00, 0xFF, 0x20, 0x00, 0xAD, 0x20, 0x00, 0x23, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x0D, 0x41, 0x00, 0x36, 0x21, 0x00, 0x59, 0x41, 0x00, 0x3F, 0x02, 0x10, 0x0D, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x02, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x02, 0x00, 0x0E, 0x21, 0x00, 0x4D, 0x20, 0x00, 0x66, 0x20, 0x00, 0x42, 0x82, 0x00, 0x0D, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x10, 0x20, 0x00, 0x65, 0x21, 0x00, 0xAF, 0x21, 0x00, 0xAE, 0x21, 0x00, 0x5D, 0x01, 0x00, 0x15, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x01, 0x00, 0x00, 0x05, 0x00, 0x00, 0x00, 0x41, 0x00, 0x16, 0x21, 0x00, 0x9F, 0x21, 0x00, 0xED, 0x21, 0x00, 0xFC, 0x21, 0x00, 0xFB, 0x20, 0x00, 0xA3, 0x20, 0x00, 0x29, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x21, 0x00, 0x3A, 0x21, 0x00, 0xA1, 0x21, 0x00, 0xD7, 0x21, 0x00, 0xB0, 0x21, 0x00, 0x52, 0x00, 0x00, 0x09, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x41, 0x08, 0x3F, 0x20, 0x00, 0xD3, 0x41, 0x00, 0xF7, 0x21, 0x00, 0xF2, 0x21, 0x00, 0xC5, 0x21, 0x00, 0x4E, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x05, 0x00, 0x00, 0x01, 0x00, 0x00, 0x05, 0x00, 0x00, 0x00, 0x41, 0x00, 0x16, 0x20, 0x00, 0xA1, 0x21, 0x00, 0xF0, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFE, 0x20, 0x00, 0xA5, 0x20, 0x00, 0x29, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x06, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x41, 0x00, 0x75, 0x41, 0x00, 0xF2, 0x21, 0x00, 0xFE, 0x41, 0x00, 0xF7, 0x21, 0x00, 0xBF, 0x21, 0x00, 0x25, 0x00, 0x00, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x04, 0x00, 0x00, 0x05, 0x00, 0x00, 0x05, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x41, 0x00, 0x1E, 0x21, 0x00, 0x82, 0x21, 0x00, 0xFC, 0x41, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x20, 0x00, 0xE5, 0x20, 0x00, 0x62, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x05, 0x00, 0x00, 0x01, 0x00, 0x00, 0x05, 0x00, 0x00, 0x00, 0x41, 0x00, 0x16, 0x20, 0x00, 0xA1, 0x21, 0x00, 0xF0, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x20, 0x00, 0xA5, 0x20, 0x00, 0x28, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x07, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x20, 0x00, 0x89, 0x41, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x41, 0x00, 0xFF, 0x20, 0x00, 0xED, 0x21, 0x00, 0x4B, 0x00, 0x00, 0x08, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x04, 0x00, 0x00, 0x05, 0x00, 0x00, 0x04, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x20, 0x00, 0x50, 0x20, 0x00, 0xC8, 0x21, 0x00, 0xF6, 0x21, 0x00, 0xFC, 0x21, 0x00, 0xF6, 0x41, 0x00, 0xBA, 0x20, 0x00, 0x46, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x01, 0x00, 0x00, 0x05, 0x00, 0x00, 0x00, 0x41, 0x00, 0x16, 0x20, 0x00, 0xA1, 0x21, 0x00, 0xF0, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x20, 0x00, 0xA5, 0x20, 0x00, 0x28, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x06, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x40, 0x00, 0x6C, 0x41, 0x00, 0xF3, 0x21, 0x00, 0xFC, 0x21, 0x00, 0xFC, 0x20, 0x00, 0xEF, 0x41, 0x00, 0x91, 0x20, 0x00, 0x28, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x41, 0x00, 0x78, 0x41, 0x00, 0xFA, 0x21, 0x00, 0xFE, 0x21, 0x00, 0xFD, 0x20, 0x00, 0xEE, 0x41, 0x00, 0x7E, 0x01, 0x08, 0x1E, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x01, 0x00, 0x00, 0x05, 0x00, 0x00, 0x00, 0x41, 0x00, 0x16, 0x20, 0x00, 0xA1, 0x21, 0x00, 0xF0, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x20, 0x00, 0xA5, 0x20, 0x00, 0x28, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x41, 0x00, 0x3E, 0x41, 0x00, 0xAE, 0x21, 0x00, 0xF3, 0x21, 0x00, 0xFE, 0x21, 0x00, 0xFD, 0x21, 0x00, 0xE8, 0x20, 0x00, 0x60, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x05, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x02, 0x41, 0x08, 0x17, 0x21, 0x00, 0x9A, 0x41, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xDC, 0x41, 0x08, 0x3C, 0x00, 0x38, 0x04, 0x00, 0x00, 0x03, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0x00, 0x00, 0x05, 0x00, 0x00, 0x00, 0x41, 0x00, 0x16, 0x21, 0x00, 0x9F, 0x21, 0x00, 0xEF, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFE, 0x20, 0x00, 0xA4, 0x20, 0x00, 0x27, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x61, 0x00, 0x12, 0x20, 0x00, 0x67, 0x21, 0x00, 0xF3, 0x41, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x20, 0x00, 0x8C, 0x00, 0x00, 0x0C, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x07, 0x41, 0x00, 0x5B, 0x20, 0x00, 0xC5, 0x21, 0x00, 0xFD, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFB, 0x21, 0x00, 0xB5, 0x61, 0x00, 0x15, 0x00, 0x00, 0x00, 0x00, 0x00, 0x06, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x05, 0x00, 0x00, 0x00, 0x41, 0x00, 0x17, 0x20, 0x00, 0xA4, 0x21, 0x00, 0xF1, 0x21, 0x00, 0xFE, 0x21, 0x00, 0xFF, 0x20, 0x00, 0xA7, 0x20, 0x00, 0x2A, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x41, 0x08, 0x35, 0x21, 0x00, 0xDA, 0x41, 0x00, 0xFD, 0x21, 0x00, 0xFE, 0x21, 0x00, 0xFD, 0x20, 0x00, 0xB0, 0x20, 0x00, 0x33, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x06, 0x00, 0x00, 0x00, 0x61, 0x00, 0x15, 0x21, 0x00, 0xB0, 0x21, 0x00, 0xF8, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFE, 0x20, 0x00, 0xD6, 0x21, 0x00, 0x76, 0x00, 0x00, 0x0B, 0x00, 0x00, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x05, 0x00, 0x00, 0x00, 0x41, 0x00, 0x17, 0x20, 0x00, 0xA7, 0x21, 0x00, 0xF0, 0x21, 0x00, 0xF9, 0x21, 0x00, 0xFB, 0x20, 0x00, 0xA7, 0x20, 0x00, 0x2B, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0x01, 0x00, 0x15, 0x21, 0x00, 0x95, 0x20, 0x00, 0xE5, 0x21, 0x00, 0xFE, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xD6, 0x20, 0x00, 0x71, 0x02, 0x00, 0x0D, 0x00, 0x00, 0x01, 0x00, 0x00, 0x04, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x41, 0x00, 0x34, 0x21, 0x00, 0xDE, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xB0, 0x20, 0x08, 0x30, 0x00, 0x00, 0x06, 0x00, 0x00, 0x01, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0x82, 0x00, 0x0F, 0x21, 0x00, 0x7B, 0x21, 0x00, 0xEA, 0x41, 0x00, 0xFF, 0x41, 0x00, 0xFF, 0x20, 0x00, 0x92, 0x61, 0x08, 0x14, 0x00, 0x00, 0x01, 0x00, 0x00, 0x02, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x03, 0x00, 0x00, 0x01, 0x00, 0x00, 0x06, 0x20, 0x00, 0x50, 0x20, 0x00, 0xC5, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFE, 0x21, 0x00, 0xF3, 0x21, 0x00, 0xBB, 0x20, 0x00, 0x20, 0x00, 0x00, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x14, 0x21, 0x00, 0x6F, 0x20, 0x00, 0xEB, 0x21, 0x00, 0xFD, 0x21, 0x00, 0xFE, 0x21, 0x00, 0xFC, 0x21, 0x00, 0x89, 0x00, 0x38, 0x04, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x04, 0x41, 0x00, 0x36, 0x21, 0x00, 0x9F, 0x21, 0x00, 0xDE, 0x20, 0x00, 0xCA, 0x20, 0x00, 0x56, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0x41, 0x08, 0x1E, 0x41, 0x00, 0x9D, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x41, 0x00, 0xFF, 0x20, 0x00, 0xEB, 0x21, 0x00, 0x4E, 0x00, 0x00, 0x06, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x41, 0x00, 0x3E, 0x21, 0x00, 0xAE, 0x21, 0x00, 0xF3, 0x21, 0x00, 0xFB, 0x21, 0x00, 0xF7, 0x21, 0x00, 0xD5, 0x21, 0x00, 0x5B, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x05, 0x41, 0x00, 0x16, 0x20, 0x00, 0x21, 0x41, 0x08, 0x1D, 0x00, 0x00, 0x0B, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x05, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x20, 0x00, 0x6E, 0x20, 0x00, 0xF0, 0x21, 0x00, 0xFA, 0x21, 0x00, 0xFB, 0x21, 0x00, 0xEE, 0x21, 0x00, 0x85, 0x21, 0x00, 0x25, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x20, 0x00, 0x47, 0x20, 0x00, 0xC1, 0x21, 0x00, 0xFF, 0x41, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x40, 0x00, 0x95, 0x20, 0x00, 0x28, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x21, 0x08, 0x37, 0x21, 0x00, 0xB1, 0x21, 0x00, 0xFF, 0x41, 0x00, 0xFF, 0x21, 0x00, 0xFD, 0x21, 0x00, 0x85, 0x41, 0x08, 0x1F, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x61, 0x00, 0x29, 0x20, 0x00, 0x84, 0x40, 0x00, 0xDE, 0x41, 0x00, 0xEF, 0x20, 0x00, 0xD0, 0x20, 0x00, 0x4B, 0x00, 0x00, 0x06, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x05, 0x00, 0x00, 0x06, 0x00, 0x00, 0x06, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x02, 0x10, 0x0E, 0x21, 0x08, 0x56, 0x20, 0x00, 0xCE, 0x21, 0x00, 0xE8, 0x20, 0x00, 0xCD, 0x20, 0x00, 0x4C, 0x00, 0x00, 0x06, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x05, 0x41, 0x00, 0x1F, 0x41, 0x00, 0x6F, 0x41, 0x00, 0x7E, 0x41, 0x00, 0x4D, 0x00, 0x00, 0x0F, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x0F, 0x21, 0x00, 0x44, 0x21, 0x00, 0x59, 0x21, 0x00, 0x44, 0x00, 0x00, 0x10, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x41, 0x08, 0x1A, 0x20, 0x00, 0x20, 0x40, 0x01, 0x06, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x08, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x02, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x02, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-};
+// Pixel data is embedded from clear_day.bin
+// Payload SHA-256: 1652f95fc05adb4083aca2e60c2a3cb45aaae9816e39d9bfec407e70892f8391
+__asm__(
+    ".section .rodata\n"
+    ".balign 4\n"
+    ".global clear_day_data\n"
+    "clear_day_data:\n"
+    ".incbin \"src/weather_icons/clear_day.bin\"\n"
+    ".previous\n"
+);
+extern "C" const uint8_t clear_day_data[];
 
 extern const lv_img_dsc_t clear_day = {
     .header = {
@@ -2,104 +2,17 @@
 #include <Arduino.h>
 
 // Weather icon: cloudy (96x96 RGB565 with alpha)
-const uint8_t cloudy_data[] PROGMEM = {
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x03, 0x00, 0x00, 0x04, 0x00, 0x00, 0x04, 0x00, 0x00, 0x05, 0x00, 0x00, 0x05, 0x00, 0x00, 0x05, 0x00, 0x00, 0x05, 0x00, 0x00, 0x03, 0x00, 0x00, 0x02, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x04, 0x00, 0x00, 0x05, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x06, 0x00, 0x00, 0x04, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x0A, 0x00, 0x03, 0x61, 0x08, 0x26, 0x82, 0x08, 0x40, 0x82, 0x10, 0x52, 0xA2, 0x10, 0x59, 0xA2, 0x10, 0x58, 0x82, 0x10, 0x5B, 0x82, 0x10, 0x55, 0x82, 0x10, 0x3A, 0xA2, 0x10, 0x18, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x82, 0x10, 0x0F, 0x21, 0x00, 0x25, 0x21, 0x00, 0x52, 0x00, 0x00, 0x88, 0x00, 0x00, 0xB0, 0x00, 0x00, 0xCC, 0x00, 0x00, 0xD8, 0x00, 0x00, 0xD6, 0x00, 0x00, 0xDA, 0x00, 0x00, 0xD2, 0x00, 0x00, 0xA7, 0x20, 0x00, 0x73, 0x21, 0x00, 0x44, 0x20, 0x00, 0x21, 0x61, 0x00, 0x10, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x02, 0x00, 0x00, 0x02, 0x00, 0x00, 0x02, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x20, 0x00, 0x26, 0x61, 0x08, 0x7B, 0x61, 0x08, 0xC6, 0x41, 0x08, 0xE7, 0x20, 0x00, 0xF0, 0x00, 0x00, 0xF8, 0x00, 0x00, 0xFC, 0x00, 0x00, 0xFE, 0x00, 0x00, 0xFE, 0x00, 0x00, 0xFF, 0x00, 0x00, 0xFD, 0x00, 0x00, 0xF5, 0x41, 0x00, 0xED, 0x61, 0x08, 0xE4, 0x41, 0x08, 0xCE, 0x21, 0x00, 0x81, 0x00, 0x00, 0x25, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x06, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x02, 0x00, 0x00, 0x02, 0x00, 0x00, 0x02, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x03, 0x00, 0x00, 0x05, 0x00, 0x00, 0x05, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x05, 0x00, 0x00, 0x06, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x21, 0x08, 0x24, 0x41, 0x08, 0x6F, 0x61, 0x08, 0xA6, 0x00, 0x00, 0xD9, 0x00, 0x00, 0xFF, 0x00, 0x00, 0xFF, 0x82, 0x08, 0xFF, 0xA7, 0x31, 0xFF, 0x8A, 0x4A, 0xFF, 0xCB, 0x52, 0xFF, 0xCB, 0x52, 0xFF, 0xCB, 0x52, 0xFF, 0x49, 0x42, 0xFF, 0x65, 0x29, 0xFF, 0x41, 0x00, 0xFF, 0x00, 0x00, 0xFF, 0x00, 0x00, 0xFF, 0x20, 0x00, 0xE0, 0x62, 0x08, 0x9F, 0x41, 0x08, 0x56, 0x00, 0x00, 0x14, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x06, 0x00, 0x00, 0x05, 0x00, 0x00, 0x05, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x05, 0x00, 0x00, 0x04, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x21, 0x08, 0x2B, 0x21, 0x00, 0x86, 0x20, 0x00, 0xF1, 0x20, 0x00, 0xFF, 0x20, 0x00, 0xFF, 0xA3, 0x10, 0xFC, 0x66, 0x29, 0xFA, 0xEC, 0x5A, 0xFB, 0xD3, 0x94, 0xFC, 0x19, 0xBE, 0xFD, 0x9B, 0xC6, 0xFD, 0x9A, 0xC6, 0xFD, 0x7A, 0xC6, 0xFE, 0xD8, 0xB5, 0xFD, 0x51, 0x84, 0xFC, 0x8A, 0x4A, 0xFB, 0x45, 0x21, 0xFA, 0xA2, 0x10, 0xF9, 0x20, 0x00, 0xFF, 0x00, 0x00, 0xFF, 0x20, 0x00, 0xCD, 0x41, 0x00, 0x6C, 0x01, 0x00, 0x19, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x04, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x61, 0x08, 0x13, 0x61, 0x00, 0x26, 0x82, 0x08, 0x29, 0x82, 0x08, 0x2A, 0x82, 0x08, 0x1C, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x20, 0x00, 0x31, 0x41, 0x08, 0xA0, 0x41, 0x00, 0xF0, 0x20, 0x00, 0xFF, 0x20, 0x00, 0xFF, 0x66, 0x29, 0xFF, 0x51, 0x84, 0xFF, 0x5A, 0xBE, 0xFE, 0xFD, 0xD6, 0xFF, 0x5E, 0xDF, 0xFF, 0x7F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x7E, 0xE7, 0xFF, 0x3D, 0xDF, 0xFF, 0xFC, 0xD6, 0xFE, 0xF8, 0xB5, 0xFE, 0xCF, 0x73, 0xFF, 0x04, 0x21, 0xFF, 0x00, 0x00, 0xFF, 0x20, 0x00, 0xFC, 0x61, 0x08, 0xEB, 0x20, 0x00, 0x96, 0x00, 0x00, 0x09, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x63, 0x08, 0x14, 0x82, 0x08, 0x2B, 0x82, 0x08, 0x29, 0x82, 0x08, 0x2C, 0x61, 0x00, 0x23, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x04, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x41, 0x08, 0x39, 0x61, 0x08, 0x65, 0x82, 0x08, 0x7C, 0x62, 0x08, 0x99, 0x41, 0x00, 0xA5, 0x00, 0x00, 0xA7, 0x00, 0x00, 0xA7, 0x41, 0x08, 0x9F, 0x82, 0x10, 0x8F, 0x82, 0x08, 0x76, 0x61, 0x08, 0x50, 0x61, 0x08, 0x4E, 0x61, 0x08, 0xA2, 0x20, 0x00, 0xEE, 0x00, 0x00, 0xFF, 0xA3, 0x10, 0xFE, 0xCC, 0x52, 0xF8, 0x55, 0xA5, 0xFD, 0x1C, 0xD7, 0xFE, 0xFF, 0xF7, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xF7, 0xFF, 0xBF, 0xEF, 0xFF, 0xBF, 0xEF, 0xFF, 0xBF, 0xEF, 0xFF, 0xBF, 0xEF, 0xFF, 0xDF, 0xEF, 0xFF, 0xFF, 0xF7, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xF7, 0xFF, 0xBB, 0xCE, 0xFF, 0x93, 0x8C, 0xFC, 0x29, 0x42, 0xFB, 0x20, 0x00, 0xFF, 0x00, 0x00, 0xFF, 0x61, 0x08, 0xE6, 0x82, 0x08, 0x6D, 0x61, 0x08, 0x56, 0x82, 0x08, 0x6B, 0x82, 0x08, 0x83, 0x41, 0x08, 0x99, 0x20, 0x00, 0xA8, 0x00, 0x00, 0xA7, 0x20, 0x00, 0xA8, 0x21, 0x00, 0xA3, 0x62, 0x08, 0x8E, 0x82, 0x08, 0x76, 0x61, 0x08, 0x4D, 0x41, 0x00, 0x16, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x06, 0x41, 0x08, 0x1B, 0x21, 0x00, 0x4F, 0x20, 0x00, 0xA4, 0x00, 0x00, 0xE9, 0x00, 0x00, 0xFF, 0x00, 0x00, 0xFF, 0x20, 0x00, 0xFF, 0x41, 0x00, 0xFF, 0x41, 0x00, 0xFF, 0x00, 0x00, 0xFF, 0x00, 0x00, 0xFF, 0x00, 0x00, 0xFF, 0x00, 0x00, 0xC9, 0x20, 0x00, 0xBF, 0x21, 0x00, 0xFE, 0x00, 0x00, 0xFF, 0xA3, 0x10, 0xF9, 0x0C, 0x5B, 0xFE, 0x5A, 0xC6, 0xFF, 0xFF, 0xFF, 0xFF, 0xDF, 0xEF, 0xFF, 0x5E, 0xE7, 0xFF, 0x7E, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x7E, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0xDF, 0xEF, 0xFF, 0xBF, 0xEF, 0xFF, 0xB7, 0xAD, 0xFF, 0xE8, 0x39, 0xFB, 0x20, 0x00, 0xFB, 0x00, 0x00, 0xF8, 0x00, 0x00, 0xDC, 0x00, 0x00, 0xD3, 0x00, 0x00, 0xEE, 0x00, 0x00, 0xFF, 0x00, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x41, 0x00, 0xFF, 0x41, 0x00, 0xFF, 0x20, 0x00, 0xFF, 0x00, 0x00, 0xFF, 0x00, 0x00, 0xFF, 0x00, 0x00, 0xC4, 0x21, 0x00, 0x70, 0x41, 0x00, 0x2F, 0x00, 0x00, 0x0F, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x21, 0x00, 0x3E, 0x41, 0x00, 0xA7, 0x41, 0x08, 0xE7, 0x41, 0x00, 0xF5, 0x00, 0x00, 0xFF, 0x00, 0x00, 0xFF, 0x00, 0x00, 0xFF, 0xA3, 0x10, 0xFF, 0x86, 0x29, 0xFF, 0x86, 0x29, 0xFF, 0x62, 0x08, 0xFF, 0x00, 0x00, 0xFF, 0x00, 0x00, 0xFF, 0x20, 0x00, 0xFC, 0x20, 0x00, 0xFA, 0x20, 0x00, 0xFF, 0xA2, 0x10, 0xFF, 0x0C, 0x5B, 0xFE, 0x9B, 0xC6, 0xFF, 0xFF, 0xF7, 0xFF, 0xBF, 0xEF, 0xFF, 0xBF, 0xEF, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0xBF, 0xEF, 0xFF, 0xBF, 0xEF, 0xFF, 0xFF, 0xF7, 0xFF, 0x5E, 0xE7, 0xFF, 0x56, 0xA5, 0xFE, 0xC7, 0x31, 0xFE, 0x00, 0x00, 0xFF, 0x00, 0x00, 0xFF, 0x20, 0x00, 0xFE, 0x00, 0x00, 0xFF, 0x00, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x24, 0x21, 0xFF, 0x65, 0x29, 0xFF, 0x45, 0x21, 0xFF, 0xC3, 0x10, 0xFF, 0x00, 0x00, 0xFF, 0x00, 0x00, 0xFF, 0x20, 0x00, 0xFB, 0x41, 0x08, 0xEC, 0x41, 0x00, 0xCB, 0x20, 0x00, 0x79, 0x00, 0x00, 0x10, 0x00, 0x00, 0x00, 0x00, 0x00, 0x06, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x12, 0x41, 0x08, 0x50, 0x41, 0x08, 0xAE, 0x00, 0x00, 0xF7, 0x00, 0x00, 0xFF, 0x41, 0x00, 0xFF, 0xC7, 0x31, 0xFD, 0x6E, 0x63, 0xFA, 0x31, 0x7C, 0xFA, 0xB3, 0x8C, 0xFA, 0x35, 0x9D, 0xFA, 0x35, 0x9D, 0xFB, 0xB2, 0x8C, 0xFA, 0xCF, 0x73, 0xFA, 0xCB, 0x52, 0xFC, 0x66, 0x29, 0xFF, 0x41, 0x00, 0xFF, 0x61, 0x08, 0xFD, 0x0C, 0x5B, 0xFD, 0x59, 0xC6, 0xFF, 0xFF, 0xF7, 0xFF, 0xDF, 0xF7, 0xFF, 0x5E, 0xDF, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x7F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0xDF, 0xEF, 0xFF, 0x5E, 0xDF, 0xFF, 0xF4, 0x94, 0xFF, 0x69, 0x4A, 0xFE, 0xA6, 0x31, 0xFF, 0xC7, 0x31, 0xFF, 0x6A, 0x4A, 0xFE, 0x6E, 0x6B, 0xFA, 0x52, 0x84, 0xFA, 0xF4, 0x94, 0xFB, 0x35, 0x9D, 0xFA, 0x15, 0x9D, 0xFB, 0xB3, 0x8C, 0xFA, 0xAF, 0x6B, 0xF9, 0xAA, 0x4A, 0xFA, 0x45, 0x21, 0xFF, 0x00, 0x00, 0xFF, 0x00, 0x00, 0xFF, 0x61, 0x08, 0xDB, 0x41, 0x00, 0x84, 0x20, 0x00, 0x28, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x41, 0x00, 0x4C, 0x20, 0x00, 0xC1, 0x20, 0x00, 0xFF, 0x20, 0x00, 0xFE, 0xC3, 0x10, 0xF7, 0x69, 0x42, 0xFC, 0x14, 0x9D, 0xFE, 0x5E, 0xDF, 0xFF, 0xFF, 0xF7, 0xFF, 0xFF, 0xF7, 0xFF, 0xFF, 0xF7, 0xFF, 0xFF, 0xF7, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xF7, 0xFF, 0x9B, 0xC6, 0xFF, 0x51, 0x84, 0xFD, 0x8A, 0x4A, 0xFD, 0xCB, 0x52, 0xFF, 0xD8, 0xB5, 0xFF, 0xFF, 0xFF, 0xFF, 0xBF, 0xEF, 0xFF, 0x7E, 0xE7, 0xFF, 0xBF, 0xEF, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0xBF, 0xEF, 0xFF, 0x5E, 0xDF, 0xFF, 0x19, 0xBE, 0xFF, 0xD4, 0x94, 0xFE, 0xD3, 0x8C, 0xFD, 0xF8, 0xB5, 0xFE, 0x7F, 0xE7, 0xFF, 0xFF, 0xF7, 0xFF, 0xFF, 0xF7, 0xFF, 0xFF, 0xF7, 0xFF, 0xFF, 0xF7, 0xFF, 0xFF, 0xF7, 0xFF, 0x9F, 0xE7, 0xFF, 0x5A, 0xC6, 0xFF, 0x10, 0x7C, 0xFD, 0x65, 0x29, 0xFA, 0x41, 0x08, 0xFB, 0x20, 0x00, 0xFF, 0x20, 0x00, 0xF6, 0x21, 0x00, 0x84, 0x02, 0x00, 0x0F, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x04, 0x00, 0x00, 0x04, 0x00, 0x00, 0x03, 0x00, 0x00, 0x25, 0x61, 0x08, 0x9D, 0x00, 0x00, 0xFB, 0x00, 0x00, 0xFF, 0x65, 0x29, 0xFD, 0x51, 0x84, 0xFE, 0x9B, 0xCE, 0xFF, 0x9E, 0xE7, 0xFF, 0xBF, 0xEF, 0xFF, 0xFF, 0xEF, 0xFF, 0xDF, 0xEF, 0xFF, 0xDF, 0xEF, 0xFF, 0xDF, 0xEF, 0xFF, 0xFF, 0xF7, 0xFF, 0xFF, 0xEF, 0xFF, 0x9F, 0xE7, 0xFF, 0x3D, 0xDF, 0xFF, 0xFC, 0xD6, 0xFF, 0xFC, 0xD6, 0xFF, 0x7E, 0xE7, 0xFF, 0xDF, 0xEF, 0xFF, 0xBF, 0xEF, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0xBF, 0xEF, 0xFF, 0xBF, 0xEF, 0xFF, 0x9F, 0xE7, 0xFF, 0x5E, 0xDF, 0xFF, 0x5E, 0xDF, 0xFF, 0x9F, 0xE7, 0xFF, 0xDF, 0xEF, 0xFF, 0xDF, 0xEF, 0xFF, 0xDF, 0xEF, 0xFF, 0xDF, 0xEF, 0xFF, 0xDF, 0xEF, 0xFF, 0xDF, 0xEF, 0xFF, 0xDF, 0xEF, 0xFF, 0x9F, 0xE7, 0xFF, 0x3D, 0xDF, 0xFF, 0xF8, 0xB5, 0xFE, 0x8A, 0x4A, 0xFD, 0x00, 0x00, 0xFF, 0x00, 0x00, 0xFF, 0x41, 0x08, 0xDC, 0x40, 0x00, 0x79, 0x82, 0x00, 0x0E, 0x00, 0x00, 0x04, 0x00, 0x00, 0x07, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x03, 0x00, 0x00, 0x04, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x08, 0x41, 0x00, 0x87, 0x20, 0x00, 0xE3, 0x20, 0x00, 0xFF, 0xE3, 0x18, 0xFC, 0xF0, 0x73, 0xFB, 0x1C, 0xD7, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xF7, 0xFF, 0x7F, 0xE7, 0xFF, 0x7E, 0xE7, 0xFF, 0x7E, 0xE7, 0xFF, 0x7F, 0xE7, 0xFF, 0x7F, 0xE7, 0xFF, 0x7E, 0xE7, 0xFF, 0x7E, 0xE7, 0xFF, 0xBF, 0xEF, 0xFF, 0xFF, 0xF7, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xDF, 0xEF, 0xFF, 0x7F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0xBF, 0xEF, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0xBF, 0xEF, 0xFF, 0xFF, 0xF7, 0xFF, 0xFF, 0xF7, 0xFF, 0xBF, 0xEF, 0xFF, 0x9F, 0xE7, 0xFF, 0x7E, 0xE7, 0xFF, 0x7E, 0xE7, 0xFF, 0x7F, 0xE7, 0xFF, 0x7E, 0xE7, 0xFF, 0x7E, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0xBF, 0xEF, 0xFF, 0xFF, 0xF7, 0xFF, 0xFF, 0xF7, 0xFF, 0xD8, 0xB5, 0xFD, 0x8A, 0x4A, 0xFC, 0x41, 0x00, 0xFA, 0x00, 0x00, 0xFF, 0x41, 0x08, 0xCC, 0x42, 0x00, 0x2C, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x06, 0x00, 0x00, 0x04, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x0A, 0x61, 0x08, 0x10, 0x21, 0x00, 0x43, 0x61, 0x08, 0xE2, 0x00, 0x00, 0xFF, 0x82, 0x10, 0xF9, 0x6E, 0x63, 0xFF, 0x7A, 0xC6, 0xFF, 0xFF, 0xF7, 0xFF, 0xBF, 0xEF, 0xFF, 0x7E, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x7E, 0xE7, 0xFF, 0x7E, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x7E, 0xE7, 0xFF, 0xFF, 0xF7, 0xFF, 0xF8, 0xB5, 0xFE, 0x45, 0x21, 0xF9, 0x00, 0x00, 0xFE, 0x41, 0x08, 0xEF, 0x41, 0x00, 0x74, 0x41, 0x08, 0x1F, 0xE0, 0x18, 0x08, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x60, 0x08, 0x13, 0x41, 0x08, 0x49, 0x61, 0x08, 0x7D, 0x61, 0x08, 0xB5, 0x82, 0x08, 0xFA, 0x00, 0x00, 0xFF, 0x86, 0x29, 0xFC, 0x5A, 0xC6, 0xFF, 0xFF, 0xFF, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x7F, 0xE7, 0xFF, 0xFF, 0xFF, 0xFF, 0x1D, 0xD7, 0xFF, 0x2D, 0x63, 0xFD, 0xC3, 0x18, 0xFF, 0x41, 0x08, 0xFE, 0x41, 0x00, 0xD7, 0x62, 0x08, 0x9B, 0x61, 0x08, 0x54, 0x61, 0x08, 0x14, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x05, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x05, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x20, 0x00, 0x2C, 0x61, 0x08, 0x6B, 0x61, 0x08, 0x99, 0x21, 0x00, 0xBB, 0x00, 0x00, 0xDB, 0x00, 0x00, 0xF6, 0x00, 0x00, 0xFD, 0xC3, 0x10, 0xFD, 0x10, 0x7C, 0xFE, 0x9F, 0xE7, 0xFF, 0xFF, 0xFF, 0xFF, 0x7E, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0xBF, 0xEF, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x7F, 0xE7, 0xFF, 0xBF, 0xEF, 0xFF, 0x9F, 0xE7, 0xFF, 0xD8, 0xB5, 0xFF, 0x08, 0x3A, 0xFE, 0x00, 0x00, 0xFF, 0x00, 0x00, 0xFF, 0x00, 0x00, 0xEC, 0x00, 0x00, 0xC3, 0x61, 0x08, 0x9A, 0x61, 0x08, 0x76, 0x41, 0x00, 0x3F, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x08, 0x21, 0x00, 0x38, 0x40, 0x00, 0x91, 0x00, 0x00, 0xEB, 0x00, 0x00, 0xFF, 0x20, 0x00, 0xFF, 0x82, 0x08, 0xFF, 0x82, 0x08, 0xFF, 0xA2, 0x10, 0xFE, 0x4D, 0x63, 0xFF, 0x9A, 0xC6, 0xFF, 0x7F, 0xE7, 0xFF, 0xBF, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0xBF, 0xEF, 0xFF, 0x9F, 0xE7, 0xFF, 0x51, 0x84, 0xFF, 0xE4, 0x18, 0xFF, 0x82, 0x10, 0xFD, 0xA2, 0x10, 0xFF, 0x41, 0x08, 0xFF, 0x00, 0x00, 0xFF, 0x00, 0x00, 0xFC, 0x20, 0x00, 0xAF, 0x20, 0x00, 0x42, 0x02, 0x00, 0x0F, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x20, 0x00, 0x53, 0x41, 0x00, 0xC9, 0x61, 0x08, 0xF2, 0x00, 0x00, 0xFF, 0x00, 0x00, 0xFF, 0x04, 0x19, 0xFF, 0x8A, 0x4A, 0xFF, 0xD0, 0x73, 0xFF, 0x14, 0x9D, 0xFF, 0x9B, 0xC6, 0xFF, 0x9F, 0xE7, 0xFF, 0xBF, 0xEF, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0xBF, 0xEF, 0xFF, 0xBF, 0xEF, 0xFF, 0xFC, 0xD6, 0xFF, 0x97, 0xA5, 0xFF, 0x51, 0x84, 0xFF, 0x4D, 0x63, 0xFF, 0xC7, 0x31, 0xFF, 0x00, 0x00, 0xFF, 0x00, 0x00, 0xFF, 0x41, 0x08, 0xF7, 0x41, 0x00, 0xE4, 0x21, 0x00, 0x77, 0x00, 0x10, 0x0C, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x20, 0x00, 0x48, 0x41, 0x08, 0xBB, 0x20, 0x00, 0xFF, 0x00, 0x00, 0xFF, 0xE3, 0x18, 0xFD, 0x0C, 0x5B, 0xF9, 0xD3, 0x94, 0xFB, 0xF8, 0xB5, 0xFD, 0xBB, 0xCE, 0xFE, 0x7E, 0xE7, 0xFF, 0xDF, 0xEF, 0xFF, 0xBF, 0xEF, 0xFF, 0xBF, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0xDF, 0xEF, 0xFF, 0xBF, 0xEF, 0xFF, 0xFC, 0xD6, 0xFE, 0x5A, 0xBE, 0xFD, 0x76, 0xA5, 0xFB, 0xAF, 0x6B, 0xFA, 0x66, 0x29, 0xFA, 0x20, 0x00, 0xFF, 0x20, 0x00, 0xFF, 0x41, 0x08, 0xD9, 0x21, 0x00, 0x6B, 0x03, 0x00, 0x08, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x05, 0x00, 0x00, 0x01, 0x60, 0x00, 0x20, 0x41, 0x00, 0xB7, 0x20, 0x00, 0xFE, 0x00, 0x00, 0xFC, 0xE3, 0x18, 0xFB, 0xAF, 0x6B, 0xFC, 0x9B, 0xCE, 0xFF, 0xFF, 0xF7, 0xFF, 0xFF, 0xF7, 0xFF, 0xBF, 0xEF, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0xBF, 0xEF, 0xFF, 0xDF, 0xEF, 0xFF, 0xFF, 0xF7, 0xFF, 0x5E, 0xDF, 0xFF, 0xD3, 0x94, 0xFE, 0xC7, 0x31, 0xFC, 0x41, 0x00, 0xF6, 0x00, 0x00, 0xFF, 0x41, 0x00, 0xD6, 0x41, 0x00, 0x3E, 0x00, 0x00, 0x06, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x60, 0x08, 0x15, 0x41, 0x00, 0x66, 0x41, 0x08, 0xE9, 0x00, 0x00, 0xFF, 0xE4, 0x18, 0xFC, 0x93, 0x8C, 0xFE, 0xFD, 0xD6, 0xFF, 0x9F, 0xE7, 0xFF, 0xDF, 0xEF, 0xFF, 0xDF, 0xEF, 0xFF, 0xBF, 0xEF, 0xFF, 0xBF, 0xEF, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0xBF, 0xEF, 0xFF, 0xBF, 0xEF, 0xFF, 0xBF, 0xEF, 0xFF, 0xDF, 0xEF, 0xFF, 0x9F, 0xEF, 0xFF, 0xBE, 0xEF, 0xFF, 0x97, 0xAD, 0xFF, 0x65, 0x29, 0xFC, 0x00, 0x00, 0xFF, 0x41, 0x08, 0xF8, 0x20, 0x00, 0xA2, 0x21, 0x00, 0x37, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x41, 0x08, 0x43, 0x20, 0x00, 0xC2, 0x21, 0x00, 0xFB, 0xA3, 0x10, 0xFC, 0x0D, 0x5B, 0xFB, 0xFC, 0xD6, 0xFE, 0xFF, 0xFF, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x7E, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x7F, 0xE7, 0xFF, 0x7E, 0xE7, 0xFF, 0xFF, 0xFF, 0xFF, 0x9F, 0xE7, 0xFF, 0x92, 0x8C, 0xFE, 0x45, 0x21, 0xFA, 0x00, 0x00, 0xFE, 0x00, 0x00, 0xEA, 0x82, 0x08, 0x6E, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x05, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x62, 0x08, 0x78, 0x00, 0x00, 0xFD, 0x00, 0x00, 0xFE, 0x49, 0x42, 0xFC, 0xD7, 0xB5, 0xFE, 0x7E, 0xE7, 0xFF, 0xBF, 0xEF, 0xFF, 0x7F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x7F, 0xE7, 0xFF, 0xBF, 0xEF, 0xFF, 0x7E, 0xE7, 0xFF, 0xAF, 0x6B, 0xFA, 0x20, 0x00, 0xFE, 0x00, 0x00, 0xFF, 0x61, 0x08, 0x9E, 0x60, 0x18, 0x14, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x82, 0x08, 0x1E, 0x62, 0x08, 0x9F, 0x00, 0x00, 0xFF, 0x00, 0x00, 0xFF, 0xF0, 0x73, 0xFA, 0xDF, 0xF7, 0xFF, 0xFF, 0xEF, 0xFF, 0x9E, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x7F, 0xE7, 0xFF, 0xDF, 0xEF, 0xFF, 0xFF, 0xF7, 0xFF, 0x56, 0xA5, 0xFB, 0xC7, 0x31, 0xFF, 0x41, 0x08, 0xFF, 0x00, 0x00, 0xC6, 0x61, 0x08, 0x55, 0xE3, 0x18, 0x09, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x45, 0x29, 0x06, 0x61, 0x08, 0x4B, 0x20, 0x00, 0xBF, 0x20, 0x00, 0xFD, 0x24, 0x19, 0xFF, 0x15, 0x9D, 0xFB, 0xFF, 0xFF, 0xFF, 0xDF, 0xEF, 0xFF, 0x7E, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0xBF, 0xEF, 0xFF, 0xDF, 0xEF, 0xFF, 0x9B, 0xC6, 0xFD, 0x8E, 0x6B, 0xFF, 0xA2, 0x10, 0xFD, 0x00, 0x00, 0xE6, 0x61, 0x08, 0x8D, 0x61, 0x08, 0x12, 0x00, 0x00, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0xA2, 0x10, 0x0C, 0x61, 0x08, 0x69, 0x00, 0x00, 0xD0, 0x62, 0x08, 0xFF, 0x8A, 0x4A, 0xFF, 0xD8, 0xB5, 0xFC, 0xDF, 0xEF, 0xFF, 0xBF, 0xEF, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0xBF, 0xEF, 0xFF, 0x9F, 0xE7, 0xFF, 0x3D, 0xDF, 0xFD, 0xB3, 0x8C, 0xFF, 0xC3, 0x10, 0xFF, 0x00, 0x00, 0xF6, 0x61, 0x08, 0xA4, 0x41, 0x08, 0x17, 0x00, 0x00, 0x00, 0x00, 0x00, 0x05, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0xA2, 0x10, 0x0B, 0x61, 0x08, 0x67, 0x00, 0x00, 0xCF, 0x82, 0x08, 0xFF, 0x0D, 0x5B, 0xFF, 0x39, 0xBE, 0xFC, 0xDF, 0xEF, 0xFF, 0xBF, 0xEF, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0xBF, 0xEF, 0xFF, 0x9F, 0xE7, 0xFF, 0x5E, 0xDF, 0xFD, 0xF4, 0x94, 0xFF, 0xC3, 0x18, 0xFF, 0x00, 0x00, 0xF5, 0x61, 0x08, 0xA3, 0x41, 0x08, 0x16, 0x00, 0x00, 0x00, 0x00, 0x00, 0x05, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0xA2, 0x10, 0x0B, 0x61, 0x08, 0x62, 0x00, 0x00, 0xCC, 0x82, 0x08, 0xFF, 0x2D, 0x5B, 0xFF, 0x59, 0xBE, 0xFC, 0xDF, 0xEF, 0xFF, 0xBF, 0xEF, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0xBF, 0xEF, 0xFF, 0x9F, 0xE7, 0xFF, 0x5E, 0xE7, 0xFD, 0xF4, 0x94, 0xFF, 0xC3, 0x18, 0xFF, 0x00, 0x00, 0xF2, 0x62, 0x08, 0x9E, 0x61, 0x08, 0x15, 0x00, 0x00, 0x00, 0x00, 0x00, 0x05, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0xA2, 0x10, 0x0B, 0x61, 0x08, 0x67, 0x00, 0x00, 0xCF, 0x82, 0x08, 0xFF, 0x2D, 0x5B, 0xFF, 0x39, 0xBE, 0xFC, 0xDF, 0xEF, 0xFF, 0xBF, 0xEF, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0xBF, 0xEF, 0xFF, 0x9F, 0xE7, 0xFF, 0x5E, 0xDF, 0xFD, 0xF4, 0x94, 0xFF, 0xC3, 0x18, 0xFF, 0x00, 0x00, 0xF5, 0x61, 0x08, 0xA3, 0x41, 0x08, 0x16, 0x00, 0x00, 0x00, 0x00, 0x00, 0x05, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0xA2, 0x10, 0x0C, 0x61, 0x08, 0x69, 0x00, 0x00, 0xD0, 0x82, 0x08, 0xFF, 0xEC, 0x5A, 0xFF, 0x19, 0xB6, 0xFC, 0xDF, 0xEF, 0xFF, 0xBF, 0xEF, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0xBF, 0xEF, 0xFF, 0xBF, 0xEF, 0xFF, 0xFC, 0xD6, 0xFD, 0x51, 0x84, 0xFF, 0xC3, 0x10, 0xFF, 0x00, 0x00, 0xF6, 0x61, 0x08, 0xA4, 0x41, 0x08, 0x17, 0x00, 0x00, 0x00, 0x00, 0x00, 0x05, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x45, 0x29, 0x06, 0x61, 0x08, 0x4B, 0x20, 0x00, 0xBF, 0x41, 0x00, 0xFE, 0xA6, 0x31, 0xFF, 0x76, 0xA5, 0xFB, 0xFF, 0xFF, 0xFF, 0xDF, 0xEF, 0xFF, 0x7E, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0xBF, 0xEF, 0xFF, 0xDF, 0xEF, 0xFF, 0x39, 0xBE, 0xFD, 0x0C, 0x5B, 0xFF, 0x82, 0x08, 0xFD, 0x00, 0x00, 0xE6, 0x61, 0x08, 0x8D, 0x61, 0x08, 0x12, 0x00, 0x00, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x41, 0x08, 0x1E, 0x41, 0x08, 0x9F, 0x00, 0x00, 0xFF, 0x41, 0x00, 0xFF, 0x31, 0x7C, 0xFA, 0xDF, 0xEF, 0xFF, 0xDF, 0xEF, 0xFF, 0x7F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x7F, 0xE7, 0xFF, 0xDF, 0xEF, 0xFF, 0xFF, 0xF7, 0xFF, 0x15, 0x9D, 0xFB, 0x66, 0x29, 0xFF, 0x41, 0x00, 0xFF, 0x00, 0x00, 0xC6, 0x61, 0x08, 0x55, 0xE3, 0x18, 0x09, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x62, 0x08, 0x77, 0x00, 0x00, 0xFC, 0x00, 0x00, 0xFE, 0x69, 0x42, 0xFC, 0xD7, 0xAD, 0xFE, 0x7E, 0xE7, 0xFF, 0xBF, 0xEF, 0xFF, 0x7E, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x7F, 0xE7, 0xFF, 0xBF, 0xEF, 0xFF, 0x7E, 0xE7, 0xFF, 0x8F, 0x6B, 0xFA, 0x20, 0x00, 0xFE, 0x00, 0x00, 0xFF, 0x61, 0x08, 0x9E, 0x60, 0x08, 0x14, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x05, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x42, 0x08, 0x49, 0x00, 0x00, 0xCB, 0x20, 0x00, 0xFD, 0xA2, 0x10, 0xFC, 0x0D, 0x5B, 0xFB, 0xFC, 0xD6, 0xFF, 0xFF, 0xFF, 0xFF, 0xBF, 0xEF, 0xFF, 0x9F, 0xE7, 0xFF, 0x7E, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x7F, 0xE7, 0xFF, 0x7F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0xFF, 0xFF, 0xFF, 0x9F, 0xEF, 0xFF, 0x92, 0x8C, 0xFE, 0x45, 0x21, 0xF9, 0x00, 0x00, 0xFE, 0x00, 0x00, 0xEA, 0x62, 0x08, 0x6E, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x01, 0x08, 0x1F, 0x41, 0x00, 0x75, 0x41, 0x08, 0xEC, 0x00, 0x00, 0xFF, 0x04, 0x19, 0xFC, 0xB3, 0x8C, 0xFF, 0xFC, 0xD6, 0xFE, 0x7E, 0xE7, 0xFF, 0xDF, 0xEF, 0xFF, 0xDF, 0xEF, 0xFF, 0xBF, 0xEF, 0xFF, 0xBF, 0xEF, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0xBF, 0xEF, 0xFF, 0xBF, 0xEF, 0xFF, 0xDF, 0xEF, 0xFF, 0xDF, 0xEF, 0xFF, 0x9F, 0xE7, 0xFF, 0x9E, 0xE7, 0xFF, 0x97, 0xAD, 0xFF, 0x65, 0x29, 0xFC, 0x00, 0x00, 0xFF, 0x41, 0x08, 0xF8, 0x20, 0x00, 0xA2, 0x21, 0x00, 0x37, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x05, 0x00, 0x00, 0x02, 0x61, 0x00, 0x23, 0x41, 0x00, 0xB8, 0x20, 0x00, 0xFF, 0x20, 0x00, 0xFD, 0xE4, 0x18, 0xFB, 0x0C, 0x5B, 0xFC, 0xD7, 0xAD, 0xFF, 0xDF, 0xF7, 0xFF, 0xFF, 0xFF, 0xFF, 0xBF, 0xEF, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0xBF, 0xEF, 0xFF, 0xFF, 0xF7, 0xFF, 0xFF, 0xF7, 0xFF, 0xFC, 0xD6, 0xFF, 0x51, 0x84, 0xFD, 0x66, 0x29, 0xFC, 0x20, 0x00, 0xF8, 0x00, 0x00, 0xFF, 0x41, 0x00, 0xD5, 0x41, 0x00, 0x3E, 0x00, 0x00, 0x06, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x20, 0x00, 0x48, 0x41, 0x08, 0xB5, 0x20, 0x00, 0xFF, 0x00, 0x00, 0xFF, 0xA2, 0x10, 0xFF, 0x6A, 0x42, 0xF9, 0x31, 0x7C, 0xFB, 0x76, 0xA5, 0xFC, 0x7A, 0xC6, 0xFD, 0x7E, 0xE7, 0xFF, 0xDF, 0xEF, 0xFF, 0xBF, 0xEF, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0xBF, 0xE7, 0xFF, 0xBF, 0xEF, 0xFF, 0xDF, 0xEF, 0xFF, 0x7E, 0xE7, 0xFF, 0xBB, 0xCE, 0xFE, 0xD8, 0xB5, 0xFD, 0xD4, 0x94, 0xFB, 0x4D, 0x63, 0xF9, 0x25, 0x21, 0xFC, 0x00, 0x00, 0xFF, 0x20, 0x00, 0xFF, 0x41, 0x08, 0xD3, 0x21, 0x00, 0x6C, 0x03, 0x00, 0x08, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x4A, 0x41, 0x00, 0xB8, 0x41, 0x08, 0xEE, 0x20, 0x00, 0xFF, 0x00, 0x00, 0xFF, 0x41, 0x00, 0xFF, 0xA7, 0x31, 0xFF, 0x8E, 0x6B, 0xFF, 0x14, 0x9D, 0xFF, 0x9B, 0xCE, 0xFF, 0x9F, 0xE7, 0xFF, 0xBF, 0xEF, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0xBF, 0xEF, 0xFF, 0xBF, 0xEF, 0xFF, 0x9B, 0xC6, 0xFF, 0x14, 0x9D, 0xFF, 0xD0, 0x73, 0xFF, 0x8A, 0x4A, 0xFF, 0x04, 0x19, 0xFF, 0x00, 0x00, 0xFF, 0x00, 0x00, 0xFF, 0x61, 0x08, 0xF5, 0x41, 0x00, 0xD6, 0x21, 0x00, 0x6E, 0x00, 0x10, 0x0E, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x07, 0x20, 0x00, 0x25, 0x20, 0x00, 0x83, 0x20, 0x00, 0xDB, 0x00, 0x00, 0xFF, 0x00, 0x00, 0xFF, 0x61, 0x08, 0xFF, 0x62, 0x08, 0xFF, 0xA2, 0x10, 0xFF, 0x4D, 0x63, 0xFF, 0x9A, 0xC6, 0xFF, 0x7F, 0xE7, 0xFF, 0xBF, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0xDC, 0xCE, 0xFF, 0x6E, 0x6B, 0xFF, 0xA2, 0x10, 0xFF, 0x62, 0x08, 0xFE, 0x82, 0x08, 0xFF, 0x20, 0x00, 0xFF, 0x00, 0x00, 0xFF, 0x00, 0x00, 0xF4, 0x20, 0x00, 0xA0, 0x21, 0x00, 0x3D, 0x02, 0x00, 0x0D, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x06, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x20, 0x00, 0x23, 0x61, 0x08, 0x5C, 0x61, 0x08, 0x8A, 0x41, 0x08, 0xB1, 0x20, 0x00, 0xD1, 0x00, 0x00, 0xEE, 0x00, 0x00, 0xFD, 0xC3, 0x10, 0xFE, 0x10, 0x7C, 0xFE, 0x7F, 0xE7, 0xFF, 0xFF, 0xFF, 0xFF, 0x7E, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0xBF, 0xEF, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x7E, 0xE7, 0xFF, 0xDF, 0xF7, 0xFF, 0x7F, 0xE7, 0xFF, 0x15, 0x9D, 0xFF, 0x66, 0x29, 0xFE, 0x00, 0x00, 0xFD, 0x00, 0x00, 0xFD, 0x00, 0x00, 0xE1, 0x21, 0x00, 0xBA, 0x61, 0x08, 0x99, 0x61, 0x08, 0x71, 0x21, 0x00, 0x36, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x04, 0x61, 0x08, 0x3A, 0x61, 0x08, 0x6C, 0x61, 0x08, 0xA8, 0x82, 0x08, 0xF7, 0x00, 0x00, 0xFF, 0x86, 0x29, 0xFC, 0x7A, 0xC6, 0xFF, 0xFF, 0xFF, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0xFF, 0xFF, 0xFF, 0xDC, 0xD6, 0xFF, 0xCB, 0x52, 0xFD, 0xA2, 0x10, 0xFF, 0x41, 0x08, 0xFD, 0x41, 0x00, 0xC6, 0x61, 0x08, 0x86, 0x41, 0x08, 0x48, 0x60, 0x08, 0x13, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x04, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x07, 0x82, 0x00, 0x0D, 0x21, 0x00, 0x40, 0x61, 0x08, 0xDE, 0x00, 0x00, 0xFF, 0xA2, 0x10, 0xF9, 0xD0, 0x73, 0xFF, 0xBB, 0xCE, 0xFF, 0xDF, 0xEF, 0xFF, 0x9F, 0xE7, 0xFF, 0x7E, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x7E, 0xE7, 0xFF, 0x7F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x7F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x7E, 0xE7, 0xFF, 0x15, 0x9D, 0xFE, 0x04, 0x19, 0xF9, 0x00, 0x00, 0xFF, 0x41, 0x08, 0xED, 0x41, 0x08, 0x55, 0x61, 0x08, 0x11, 0x03, 0x00, 0x09, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x05, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x0D, 0x41, 0x08, 0x9A, 0x21, 0x00, 0xEE, 0x21, 0x00, 0xFF, 0x24, 0x21, 0xFC, 0x51, 0x7C, 0xFC, 0x5E, 0xDF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xF7, 0xFF, 0x9F, 0xE7, 0xFF, 0x7E, 0xE7, 0xFF, 0x7E, 0xE7, 0xFF, 0x7F, 0xE7, 0xFF, 0x7F, 0xE7, 0xFF, 0x7E, 0xE7, 0xFF, 0x7E, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0xDF, 0xEF, 0xFF, 0xFF, 0xF7, 0xFF, 0xFF, 0xF7, 0xFF, 0xBF, 0xEF, 0xFF, 0x7F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0xBF, 0xEF, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0xBF, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0xBF, 0xEF, 0xFF, 0xFF, 0xF7, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xF7, 0xFF, 0xBF, 0xEF, 0xFF, 0x7E, 0xE7, 0xFF, 0x7E, 0xE7, 0xFF, 0x7F, 0xE7, 0xFF, 0x7F, 0xE7, 0xFF, 0x7E, 0xE7, 0xFF, 0x7E, 0xE7, 0xFF, 0x7F, 0xE7, 0xFF, 0xDF, 0xEF, 0xFF, 0xFF, 0xF7, 0xFF, 0xBF, 0xEF, 0xFF, 0x56, 0xA5, 0xFC, 0x08, 0x3A, 0xFB, 0x20, 0x00, 0xF9, 0x00, 0x00, 0xF6, 0x41, 0x08, 0xB6, 0x41, 0x08, 0x18, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x05, 0x00, 0x00, 0x03, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x04, 0x00, 0x00, 0x04, 0x00, 0x00, 0x09, 0x00, 0x00, 0x42, 0x61, 0x08, 0xB2, 0x00, 0x00, 0xFD, 0x00, 0x00, 0xFF, 0xA6, 0x31, 0xFD, 0xB3, 0x8C, 0xFE, 0xDC, 0xCE, 0xFF, 0x9E, 0xE7, 0xFF, 0xBF, 0xEF, 0xFF, 0xDF, 0xEF, 0xFF, 0xDF, 0xEF, 0xFF, 0xDF, 0xEF, 0xFF, 0xDF, 0xEF, 0xFF, 0xDF, 0xEF, 0xFF, 0xDF, 0xEF, 0xFF, 0xBF, 0xEF, 0xFF, 0x7E, 0xE7, 0xFF, 0x5E, 0xDF, 0xFF, 0x5E, 0xDF, 0xFF, 0x9F, 0xE7, 0xFF, 0xDF, 0xEF, 0xFF, 0xBF, 0xEF, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0xBF, 0xEF, 0xFF, 0xBF, 0xEF, 0xFF, 0x9F, 0xE7, 0xFF, 0x5E, 0xDF, 0xFF, 0xFC, 0xD6, 0xFF, 0x1D, 0xDF, 0xFF, 0x9F, 0xE7, 0xFF, 0xDF, 0xEF, 0xFF, 0xFF, 0xEF, 0xFF, 0xDF, 0xEF, 0xFF, 0xDF, 0xEF, 0xFF, 0xDF, 0xEF, 0xFF, 0xDF, 0xEF, 0xFF, 0xDF, 0xEF, 0xFF, 0x9F, 0xE7, 0xFF, 0x1D, 0xD7, 0xFF, 0x97, 0xAD, 0xFE, 0x69, 0x42, 0xFD, 0x00, 0x00, 0xFF, 0x20, 0x00, 0xFF, 0x41, 0x08, 0xC9, 0x41, 0x00, 0x5D, 0x00, 0x00, 0x0C, 0x00, 0x00, 0x05, 0x00, 0x00, 0x06, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0x00, 0x00, 0x06, 0x41, 0x00, 0x59, 0x20, 0x00, 0xCF, 0x20, 0x00, 0xFF, 0x20, 0x00, 0xFD, 0xE4, 0x18, 0xF8, 0xCB, 0x52, 0xFC, 0x55, 0xA5, 0xFE, 0x5E, 0xDF, 0xFF, 0xFF, 0xF7, 0xFF, 0xFF, 0xF7, 0xFF, 0xFF, 0xF7, 0xFF, 0xFF, 0xF7, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xF7, 0xFF, 0xDC, 0xCE, 0xFF, 0x76, 0xA5, 0xFD, 0x92, 0x8C, 0xFD, 0xD3, 0x94, 0xFF, 0xBB, 0xCE, 0xFF, 0xFF, 0xF7, 0xFF, 0xBF, 0xEF, 0xFF, 0x7F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x7F, 0xE7, 0xFF, 0xBF, 0xEF, 0xFF, 0xDF, 0xEF, 0xFF, 0xDC, 0xCE, 0xFF, 0x92, 0x8C, 0xFF, 0xEC, 0x5A, 0xFE, 0xCF, 0x73, 0xFE, 0x39, 0xBE, 0xFE, 0xFF, 0xF7, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xF7, 0xFF, 0xFF, 0xF7, 0xFF, 0xFF, 0xF7, 0xFF, 0xFF, 0xF7, 0xFF, 0x9F, 0xE7, 0xFF, 0x19, 0xB6, 0xFE, 0x8F, 0x6B, 0xFD, 0x25, 0x21, 0xFA, 0x20, 0x00, 0xFC, 0x20, 0x00, 0xFF, 0x20, 0x00, 0xF9, 0x41, 0x00, 0x77, 0x00, 0x00, 0x0A, 0x00, 0x00, 0x00, 0x00, 0x00, 0x05, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x16, 0x41, 0x08, 0x5B, 0x61, 0x08, 0xB9, 0x00, 0x00, 0xFD, 0x00, 0x00, 0xFF, 0x82, 0x08, 0xFF, 0xE8, 0x39, 0xFC, 0x6E, 0x6B, 0xF9, 0x72, 0x84, 0xFA, 0xF4, 0x94, 0xFB, 0x35, 0x9D, 0xFA, 0x35, 0x9D, 0xFA, 0xD3, 0x94, 0xFA, 0x10, 0x7C, 0xFA, 0x0C, 0x5B, 0xFA, 0x29, 0x42, 0xFF, 0x86, 0x29, 0xFF, 0x86, 0x29, 0xFE, 0xAF, 0x6B, 0xFE, 0x7A, 0xC6, 0xFF, 0xDF, 0xEF, 0xFF, 0xDF, 0xEF, 0xFF, 0x7E, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x7F, 0xE7, 0xFF, 0xBF, 0xEF, 0xFF, 0xDF, 0xF7, 0xFF, 0x3D, 0xDF, 0xFF, 0x72, 0x84, 0xFE, 0x65, 0x29, 0xFD, 0x61, 0x08, 0xFF, 0x24, 0x21, 0xFF, 0x8B, 0x4A, 0xFC, 0x10, 0x7C, 0xFA, 0xF3, 0x94, 0xFA, 0x35, 0x9D, 0xFB, 0x35, 0x9D, 0xFA, 0x14, 0x9D, 0xFB, 0xB3, 0x8C, 0xFA, 0xAF, 0x6B, 0xF9, 0x6A, 0x4A, 0xFC, 0x04, 0x19, 0xFF, 0x00, 0x00, 0xFF, 0x00, 0x00, 0xFF, 0x61, 0x08, 0xD1, 0x21, 0x00, 0x84, 0x20, 0x00, 0x25, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x05, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x20, 0x00, 0x4C, 0x41, 0x00, 0xB0, 0x41, 0x08, 0xE6, 0x21, 0x00, 0xF5, 0x00, 0x00, 0xFF, 0x00, 0x00, 0xFF, 0x41, 0x08, 0xFF, 0x04, 0x19, 0xFF, 0x66, 0x29, 0xFF, 0x86, 0x29, 0xFF, 0xC3, 0x10, 0xFF, 0x00, 0x00, 0xFF, 0x00, 0x00, 0xFF, 0x00, 0x00, 0xFE, 0x00, 0x00, 0xF9, 0x00, 0x00, 0xFF, 0xC3, 0x18, 0xFF, 0x6E, 0x6B, 0xFE, 0xDC, 0xCE, 0xFF, 0xFF, 0xF7, 0xFF, 0xBF, 0xEF, 0xFF, 0xBF, 0xEF, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0xBF, 0xEF, 0xFF, 0xBF, 0xEF, 0xFF, 0xFF, 0xF7, 0xFF, 0x1D, 0xDF, 0xFF, 0xD3, 0x94, 0xFE, 0xA6, 0x31, 0xFF, 0x00, 0x00, 0xFF, 0x00, 0x00, 0xFF, 0x20, 0x00, 0xFF, 0x00, 0x00, 0xFF, 0x00, 0x00, 0xFF, 0xC3, 0x10, 0xFF, 0x86, 0x29, 0xFF, 0x66, 0x29, 0xFF, 0x45, 0x21, 0xFF, 0xA3, 0x10, 0xFF, 0x00, 0x00, 0xFF, 0x00, 0x00, 0xFF, 0x20, 0x00, 0xF9, 0x41, 0x08, 0xEC, 0x41, 0x00, 0xC3, 0x20, 0x00, 0x6B, 0x00, 0x00, 0x0D, 0x00, 0x00, 0x00, 0x00, 0x00, 0x05, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x08, 0x41, 0x08, 0x1C, 0x20, 0x00, 0x4E, 0x00, 0x00, 0xA2, 0x00, 0x00, 0xF2, 0x00, 0x00, 0xFF, 0x00, 0x00, 0xFF, 0x20, 0x00, 0xFF, 0x41, 0x00, 0xFF, 0x41, 0x00, 0xFF, 0x20, 0x00, 0xFF, 0x00, 0x00, 0xFF, 0x00, 0x00, 0xFF, 0x00, 0x00, 0xD3, 0x00, 0x00, 0xBC, 0x20, 0x00, 0xF9, 0x00, 0x00, 0xFE, 0xE4, 0x18, 0xFA, 0x51, 0x84, 0xFF, 0x1D, 0xDF, 0xFF, 0xFF, 0xF7, 0xFF, 0xBF, 0xEF, 0xFF, 0x5E, 0xE7, 0xFF, 0x7E, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x7F, 0xE7, 0xFF, 0x7E, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0xDF, 0xEF, 0xFF, 0x5E, 0xDF, 0xFF, 0xD3, 0x94, 0xFF, 0x45, 0x21, 0xFB, 0x00, 0x00, 0xFD, 0x20, 0x00, 0xFD, 0x20, 0x00, 0xDA, 0x00, 0x00, 0xDB, 0x00, 0x00, 0xFC, 0x00, 0x00, 0xFF, 0x20, 0x00, 0xFF, 0x41, 0x00, 0xFF, 0x41, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x20, 0x00, 0xFF, 0x00, 0x00, 0xFF, 0x00, 0x00, 0xF7, 0x20, 0x00, 0xB6, 0x20, 0x00, 0x6D, 0x41, 0x00, 0x30, 0x00, 0x00, 0x0C, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x41, 0x08, 0x38, 0x82, 0x08, 0x6B, 0x62, 0x08, 0x84, 0x41, 0x08, 0xA2, 0x20, 0x00, 0xAA, 0x00, 0x00, 0xA6, 0x00, 0x00, 0xA7, 0x21, 0x00, 0xA5, 0x62, 0x08, 0x99, 0x61, 0x08, 0x82, 0x62, 0x08, 0x56, 0x62, 0x08, 0x52, 0x61, 0x08, 0xBD, 0x00, 0x00, 0xFF, 0x00, 0x00, 0xFF, 0x86, 0x29, 0xFC, 0x6E, 0x6B, 0xF9, 0x97, 0xAD, 0xFE, 0x9F, 0xE7, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xF7, 0xFF, 0xDF, 0xEF, 0xFF, 0xBF, 0xEF, 0xFF, 0xBF, 0xEF, 0xFF, 0xDF, 0xEF, 0xFF, 0xFF, 0xF7, 0xFF, 0xFF, 0xF7, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xF7, 0xFF, 0x7A, 0xC6, 0xFE, 0x31, 0x7C, 0xFB, 0xA7, 0x31, 0xFB, 0x00, 0x00, 0xFF, 0x00, 0x00, 0xFF, 0x62, 0x08, 0xCA, 0x61, 0x08, 0x66, 0x41, 0x08, 0x5B, 0x62, 0x08, 0x75, 0x62, 0x08, 0x8E, 0x41, 0x00, 0x9F, 0x00, 0x00, 0xA7, 0x00, 0x00, 0xA7, 0x20, 0x00, 0xA8, 0x21, 0x00, 0xA3, 0x62, 0x08, 0x8E, 0x82, 0x08, 0x70, 0x61, 0x08, 0x44, 0x61, 0x00, 0x14, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x05, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x61, 0x00, 0x21, 0x81, 0x08, 0x2F, 0x82, 0x08, 0x27, 0x82, 0x08, 0x28, 0x61, 0x00, 0x26, 0x61, 0x08, 0x13, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x20, 0x00, 0x5B, 0x41, 0x08, 0xBD, 0x21, 0x00, 0xF3, 0x00, 0x00, 0xFF, 0x20, 0x00, 0xFF, 0x08, 0x3A, 0xFF, 0x35, 0x9D, 0xFE, 0xDC, 0xCE, 0xFE, 0xFC, 0xD6, 0xFF, 0x3E, 0xDF, 0xFF, 0x7E, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x7E, 0xE7, 0xFF, 0x3E, 0xDF, 0xFF, 0x1D, 0xD7, 0xFF, 0xFC, 0xD6, 0xFE, 0xD8, 0xB5, 0xFE, 0x4E, 0x63, 0xFF, 0xE3, 0x18, 0xFF, 0x00, 0x00, 0xFF, 0x20, 0x00, 0xFB, 0x61, 0x08, 0xCC, 0x20, 0x00, 0x69, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x86, 0x31, 0x05, 0x82, 0x08, 0x1D, 0x82, 0x08, 0x2A, 0x82, 0x08, 0x28, 0x82, 0x08, 0x2C, 0x61, 0x00, 0x23, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x03, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x0A, 0x41, 0x08, 0x37, 0x20, 0x00, 0x97, 0x00, 0x00, 0xFF, 0x00, 0x00, 0xFF, 0x41, 0x08, 0xFD, 0xC3, 0x18, 0xF9, 0xA7, 0x29, 0xFA, 0xCB, 0x52, 0xFB, 0x52, 0x84, 0xFC, 0xD7, 0xAD, 0xFD, 0x9B, 0xCE, 0xFE, 0xBB, 0xCE, 0xFD, 0xB7, 0xAD, 0xFD, 0x92, 0x8C, 0xFC, 0xAF, 0x6B, 0xFC, 0x29, 0x42, 0xFA, 0xE3, 0x18, 0xFA, 0x82, 0x08, 0xFB, 0x41, 0x00, 0xFF, 0x00, 0x00, 0xFF, 0x20, 0x00, 0xC1, 0x41, 0x00, 0x54, 0x00, 0x00, 0x0C, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x03, 0x00, 0x00, 0x05, 0x00, 0x00, 0x05, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x05, 0x00, 0x00, 0x06, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x41, 0x08, 0x2F, 0x61, 0x08, 0x81, 0x41, 0x08, 0xB6, 0x00, 0x00, 0xEB, 0x00, 0x00, 0xFF, 0x00, 0x00, 0xFF, 0x62, 0x08, 0xFF, 0x66, 0x29, 0xFF, 0x49, 0x42, 0xFF, 0xEC, 0x52, 0xFF, 0xEC, 0x52, 0xFF, 0x49, 0x42, 0xFF, 0x86, 0x29, 0xFF, 0x04, 0x19, 0xFF, 0x00, 0x00, 0xFF, 0x00, 0x00, 0xFF, 0x00, 0x00, 0xFD, 0x41, 0x00, 0xCE, 0x61, 0x08, 0x97, 0x41, 0x00, 0x4D, 0x00, 0x00, 0x0C, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x07, 0x00, 0x00, 0x05, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x05, 0x00, 0x00, 0x04, 0x00, 0x00, 0x02, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x02, 0x00, 0x00, 0x02, 0x00, 0x00, 0x02, 0x00, 0x00, 0x02, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0xF8, 0x01, 0x41, 0x08, 0x3F, 0x41, 0x08, 0x99, 0x61, 0x08, 0xDC, 0x61, 0x08, 0xE9, 0x21, 0x00, 0xEE, 0x00, 0x00, 0xF5, 0x00, 0x00, 0xFB, 0x00, 0x00, 0xFF, 0x00, 0x00, 0xFF, 0x00, 0x00, 0xFC, 0x00, 0x00, 0xF8, 0x20, 0x00, 0xF1, 0x41, 0x00, 0xEA, 0x61, 0x08, 0xDF, 0x41, 0x08, 0xB2, 0x41, 0x00, 0x65, 0x40, 0x00, 0x19, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x05, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0x00, 0x00, 0x02, 0x00, 0x00, 0x02, 0x00, 0x00, 0x02, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x05, 0x41, 0x08, 0x16, 0x61, 0x08, 0x37, 0x41, 0x08, 0x5E, 0x00, 0x00, 0x84, 0x00, 0x00, 0xA2, 0x00, 0x00, 0xC3, 0x00, 0x00, 0xDA, 0x00, 0x00, 0xD9, 0x00, 0x00, 0xC9, 0x00, 0x00, 0xB2, 0x00, 0x00, 0x95, 0x20, 0x00, 0x64, 0x61, 0x08, 0x36, 0x41, 0x08, 0x1A, 0x00, 0x00, 0x0B, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x03, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0xA2, 0x10, 0x0B, 0x61, 0x08, 0x24, 0x82, 0x10, 0x37, 0xA2, 0x10, 0x4C, 0x82, 0x10, 0x5B, 0x82, 0x10, 0x5A, 0x82, 0x08, 0x50, 0x62, 0x08, 0x41, 0x82, 0x10, 0x2E, 0x84, 0x10, 0x0F, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x04, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x05, 0x00, 0x00, 0x03, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x02, 0x00, 0x00, 0x03, 0x00, 0x00, 0x03, 0x00, 0x00, 0x04, 0x00, 0x00, 0x05, 0x00, 0x00, 0x05, 0x00, 0x00, 0x04, 0x00, 0x00, 0x04, 0x00, 0x00, 0x03, 0x00, 0x00, 0x02, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-};
+// Pixel data is embedded from cloudy.bin
+// Payload SHA-256: f42c03fdb5ee317306a880d21d7bac2a59929ab8d2cd99dd605ec24cc073f269
+__asm__(
+    ".section .rodata\n"
+    ".balign 4\n"
+    ".global cloudy_data\n"
+    "cloudy_data:\n"
+    ".incbin \"src/weather_icons/cloudy.bin\"\n"
+    ".previous\n"
+);
+extern "C" const uint8_t cloudy_data[];
 
 extern const lv_img_dsc_t cloudy = {
     .header = {
@@ -2,104 +2,17 @@
 #include <Arduino.h>
 
 // Weather icon: fog (96x96 RGB565 with alpha)
-const uint8_t fog_data[] PROGMEM = {
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x03, 0x00, 0x38, 0x04, 0x86, 0x31, 0x05, 0x45, 0x29, 0x06, 0x86, 0x31, 0x05, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x86, 0x31, 0x05, 0x45, 0x29, 0x06, 0x45, 0x29, 0x06, 0xE7, 0x39, 0x04, 0x00, 0x00, 0x03, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x86, 0x31, 0x05, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x78, 0x02, 0xE3, 0x18, 0x08, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x07, 0x38, 0x04, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0xE3, 0x18, 0x09, 0xE3, 0x28, 0x11, 0x24, 0x21, 0x1B, 0x24, 0x21, 0x21, 0x24, 0x21, 0x28, 0x04, 0x21, 0x4F, 0xE3, 0x20, 0x59, 0x24, 0x21, 0x2A, 0x24, 0x21, 0x21, 0x04, 0x21, 0x1F, 0x45, 0x29, 0x13, 0xE3, 0x18, 0x08, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x05, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0xC3, 0x28, 0x13, 0x04, 0x21, 0x55, 0x24, 0x21, 0x86, 0x24, 0x21, 0xBE, 0x24, 0x29, 0xDE, 0x24, 0x29, 0xE0, 0x04, 0x29, 0xE5, 0x04, 0x21, 0xE8, 0x24, 0x29, 0xDF, 0x24, 0x29, 0xDD, 0x04, 0x21, 0xC8, 0x04, 0x21, 0x92, 0x04, 0x21, 0x54, 0xE3, 0x20, 0x1B, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x30, 0x05, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x03, 0x00, 0x00, 0x03, 0x00, 0x00, 0x04, 0x00, 0x00, 0x03, 0x00, 0x00, 0x03, 0x00, 0x00, 0x03, 0x00, 0x00, 0x03, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x24, 0x21, 0x23, 0x24, 0x21, 0x61, 0x24, 0x29, 0x98, 0x04, 0x21, 0xC3, 0xA2, 0x18, 0xE3, 0x82, 0x10, 0xFF, 0x61, 0x10, 0xFF, 0x41, 0x10, 0xFF, 0x62, 0x10, 0xFF, 0x82, 0x10, 0xFF, 0x61, 0x10, 0xFF, 0x41, 0x10, 0xFF, 0x82, 0x10, 0xFF, 0xA2, 0x18, 0xE9, 0xE4, 0x20, 0xC3, 0x24, 0x29, 0x9D, 0x04, 0x21, 0x68, 0xC4, 0x18, 0x26, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0x00, 0x00, 0x02, 0x00, 0x00, 0x03, 0x00, 0x00, 0x03, 0x00, 0x00, 0x03, 0x00, 0x00, 0x03, 0x00, 0x00, 0x03, 0x00, 0x00, 0x03, 0x00, 0x00, 0x02, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0xA2, 0x28, 0x0C, 0x04, 0x21, 0x33, 0xE4, 0x20, 0x84, 0xC3, 0x20, 0xE4, 0xC3, 0x18, 0xFF, 0xE3, 0x20, 0xFF, 0x24, 0x29, 0xFF, 0x86, 0x31, 0xFB, 0xA7, 0x39, 0xF9, 0xC7, 0x39, 0xF9, 0x08, 0x42, 0xFA, 0x29, 0x42, 0xFA, 0xE7, 0x39, 0xF9, 0xA7, 0x39, 0xF9, 0x86, 0x31, 0xFB, 0x25, 0x29, 0xFF, 0xE3, 0x20, 0xFF, 0xC3, 0x18, 0xFF, 0xC3, 0x20, 0xE9, 0xE4, 0x20, 0x88, 0xE3, 0x20, 0x2A, 0x00, 0x50, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x86, 0x31, 0x05, 0x86, 0x31, 0x05, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0xC3, 0x30, 0x0A, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0xE3, 0x20, 0x69, 0x04, 0x21, 0xC6, 0x04, 0x21, 0xF0, 0xE3, 0x20, 0xFF, 0x82, 0x10, 0xFF, 0x24, 0x29, 0xFF, 0x0C, 0x63, 0xFF, 0x14, 0x9D, 0xFF, 0x39, 0xBE, 0xFE, 0xBB, 0xCE, 0xFE, 0xDC, 0xCE, 0xFE, 0xDC, 0xD6, 0xFE, 0xDC, 0xCE, 0xFE, 0x7A, 0xC6, 0xFE, 0x35, 0xA5, 0xFF, 0x4D, 0x6B, 0xFF, 0x65, 0x29, 0xFF, 0x82, 0x10, 0xFF, 0xC3, 0x18, 0xFF, 0x24, 0x29, 0xF1, 0xE4, 0x20, 0xBB, 0xE3, 0x20, 0x34, 0x00, 0x00, 0x00, 0x06, 0x00, 0x05, 0x00, 0x38, 0x04, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x86, 0x31, 0x05, 0x00, 0x38, 0x04, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x07, 0x38, 0x04, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x45, 0x29, 0x0C, 0x65, 0x29, 0x28, 0x65, 0x31, 0x34, 0x45, 0x29, 0x3C, 0x45, 0x29, 0x36, 0x65, 0x31, 0x32, 0x65, 0x29, 0x34, 0x45, 0x31, 0x25, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x18, 0x0A, 0x04, 0x21, 0x60, 0x24, 0x29, 0xCC, 0xA3, 0x18, 0xFF, 0xA3, 0x18, 0xFF, 0xE7, 0x39, 0xFF, 0x4D, 0x6B, 0xF9, 0xB3, 0x8C, 0xFC, 0x19, 0xBE, 0xFD, 0x3D, 0xDF, 0xFE, 0xFF, 0xF7, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xF7, 0xFF, 0x5E, 0xDF, 0xFE, 0x39, 0xBE, 0xFD, 0xF4, 0x9C, 0xFB, 0x6E, 0x6B, 0xFA, 0x45, 0x29, 0xFD, 0xC3, 0x18, 0xFF, 0xE4, 0x20, 0xFF, 0x04, 0x21, 0xAE, 0x24, 0x29, 0x3E, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x65, 0x19, 0x11, 0x65, 0x29, 0x2E, 0x65, 0x29, 0x32, 0x65, 0x31, 0x31, 0x65, 0x31, 0x32, 0x65, 0x31, 0x31, 0x65, 0x29, 0x32, 0x65, 0x29, 0x22, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x07, 0x38, 0x04, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x24, 0x21, 0x07, 0x24, 0x21, 0x15, 0x04, 0x21, 0x27, 0xE3, 0x20, 0x60, 0xC3, 0x18, 0x8A, 0xC3, 0x18, 0x9E, 0xC3, 0x18, 0xAA, 0xA3, 0x18, 0xA0, 0xC3, 0x18, 0x9C, 0xC3, 0x18, 0x9D, 0xC3, 0x20, 0x87, 0x04, 0x21, 0x4C, 0xE3, 0x20, 0x20, 0x04, 0x21, 0x5D, 0xE3, 0x20, 0xD0, 0xE3, 0x20, 0xFF, 0xC3, 0x18, 0xFC, 0xC7, 0x39, 0xF9, 0x51, 0x84, 0xFE, 0xBB, 0xCE, 0xFF, 0xFF, 0xEF, 0xFF, 0xFF, 0xF7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x7E, 0xE7, 0xFF, 0x7E, 0xE7, 0xFF, 0x7E, 0xE7, 0xFF, 0x7E, 0xE7, 0xFF, 0x7E, 0xE7, 0xFF, 0xBF, 0xE7, 0xFF, 0xDF, 0xEF, 0xFF, 0xFF, 0xF7, 0xFF, 0xDC, 0xD6, 0xFF, 0xAF, 0x73, 0xFE, 0x86, 0x31, 0xF8, 0xE4, 0x20, 0xFD, 0xE3, 0x20, 0xFF, 0x04, 0x21, 0xAA, 0x24, 0x21, 0x3B, 0x24, 0x21, 0x35, 0xE3, 0x20, 0x66, 0xC3, 0x18, 0x94, 0xC3, 0x18, 0x9C, 0xC3, 0x18, 0x9A, 0xC3, 0x18, 0x9B, 0xC3, 0x18, 0x9A, 0xC3, 0x18, 0x9A, 0xE3, 0x18, 0x82, 0x04, 0x21, 0x4B, 0x24, 0x29, 0x23, 0x04, 0x21, 0x0F, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x04, 0x20, 0x07, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0xE3, 0x20, 0x40, 0x04, 0x21, 0x9C, 0x04, 0x21, 0xD9, 0x04, 0x21, 0xE9, 0xE3, 0x20, 0xF0, 0xC3, 0x18, 0xF4, 0xC3, 0x18, 0xF6, 0xC3, 0x18, 0xF5, 0xC3, 0x18, 0xF4, 0xC3, 0x18, 0xF4, 0xE3, 0x20, 0xF0, 0x04, 0x21, 0xE6, 0x04, 0x21, 0xDE, 0x24, 0x29, 0xE9, 0xE3, 0x20, 0xFD, 0x82, 0x10, 0xFF, 0x29, 0x42, 0xFF, 0x15, 0x9D, 0xFE, 0x1D, 0xD7, 0xFF, 0xDF, 0xEF, 0xFF, 0xBF, 0xEF, 0xFF, 0xDF, 0xEF, 0xFF, 0xBF, 0xEF, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0xBF, 0xEF, 0xFF, 0xBF, 0xEF, 0xFF, 0xDF, 0xEF, 0xFF, 0xDF, 0xEF, 0xFF, 0x1D, 0xD7, 0xFF, 0x51, 0x84, 0xFE, 0x86, 0x31, 0xFF, 0xE4, 0x20, 0xFF, 0x04, 0x21, 0xF6, 0x24, 0x29, 0xE3, 0x24, 0x29, 0xE2, 0x04, 0x21, 0xEA, 0xE3, 0x20, 0xF3, 0xC3, 0x18, 0xF4, 0xC3, 0x18, 0xF4, 0xC3, 0x18, 0xF4, 0xC3, 0x18, 0xF4, 0xC3, 0x18, 0xF2, 0xE4, 0x20, 0xEF, 0x04, 0x21, 0xE6, 0x04, 0x21, 0xC8, 0xE4, 0x20, 0x7B, 0xE3, 0x18, 0x1B, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x02, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0xE3, 0x18, 0x21, 0x04, 0x21, 0x6B, 0x04, 0x21, 0xB4, 0xC3, 0x18, 0xF1, 0xA2, 0x18, 0xFF, 0xA2, 0x18, 0xFF, 0x66, 0x31, 0xFF, 0x29, 0x42, 0xFF, 0x49, 0x4A, 0xFF, 0x49, 0x4A, 0xFF, 0x49, 0x4A, 0xFF, 0x29, 0x42, 0xFF, 0x66, 0x31, 0xFF, 0xA3, 0x18, 0xFF, 0xC3, 0x18, 0xFF, 0x82, 0x18, 0xFF, 0xC3, 0x18, 0xFF, 0x29, 0x42, 0xFD, 0xF4, 0x94, 0xFE, 0x5E, 0xDF, 0xFF, 0xFF, 0xF7, 0xFF, 0xBF, 0xEF, 0xFF, 0x7E, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x7E, 0xE7, 0xFF, 0xBF, 0xEF, 0xFF, 0xFF, 0xF7, 0xFF, 0xFC, 0xD6, 0xFF, 0x51, 0x84, 0xFE, 0x65, 0x31, 0xFB, 0x61, 0x10, 0xFF, 0x61, 0x10, 0xFF, 0x41, 0x08, 0xFF, 0xC3, 0x20, 0xFF, 0xA7, 0x39, 0xFF, 0x49, 0x4A, 0xFF, 0x49, 0x4A, 0xFF, 0x49, 0x4A, 0xFF, 0x49, 0x4A, 0xFF, 0x08, 0x42, 0xFF, 0x45, 0x29, 0xFF, 0x82, 0x10, 0xFF, 0x82, 0x18, 0xFF, 0x04, 0x21, 0xDC, 0x04, 0x21, 0x9D, 0xE3, 0x20, 0x4B, 0xC3, 0x18, 0x0A, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0xE3, 0x18, 0x12, 0x04, 0x21, 0x7C, 0xE3, 0x20, 0xEB, 0xE3, 0x20, 0xFF, 0x04, 0x21, 0xFF, 0x66, 0x31, 0xF8, 0x49, 0x4A, 0xFA, 0xAF, 0x73, 0xFC, 0xD3, 0x94, 0xFC, 0x14, 0x9D, 0xFC, 0x14, 0x9D, 0xFC, 0x14, 0x9D, 0xFC, 0xD3, 0x94, 0xFC, 0xCF, 0x73, 0xFB, 0x49, 0x4A, 0xFA, 0x86, 0x31, 0xF9, 0xC3, 0x18, 0xFA, 0xE7, 0x39, 0xFD, 0x15, 0x9D, 0xFF, 0x5D, 0xDF, 0xFF, 0xBF, 0xEF, 0xFF, 0x9F, 0xE7, 0xFF, 0x7F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x7E, 0xE7, 0xFF, 0xFF, 0xF7, 0xFF, 0x1D, 0xD7, 0xFF, 0xAF, 0x73, 0xFF, 0xC7, 0x39, 0xFC, 0x86, 0x31, 0xF9, 0xA6, 0x31, 0xF9, 0xCB, 0x52, 0xFA, 0x11, 0x84, 0xFC, 0xF4, 0x9C, 0xFC, 0x14, 0x9D, 0xFC, 0x14, 0x9D, 0xFC, 0x14, 0x9D, 0xFC, 0x93, 0x8C, 0xFC, 0x6E, 0x6B, 0xFB, 0xE8, 0x41, 0xFA, 0x04, 0x21, 0xFA, 0xE3, 0x20, 0xFF, 0xE3, 0x20, 0xFF, 0xE3, 0x20, 0xC0, 0xE4, 0x20, 0x53, 0x49, 0x4A, 0x07, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x86, 0x31, 0x05, 0x00, 0x00, 0x00, 0x65, 0x11, 0x0B, 0xE4, 0x20, 0x86, 0x04, 0x21, 0xE4, 0xE3, 0x20, 0xFF, 0xC3, 0x18, 0xFF, 0x29, 0x42, 0xFF, 0x93, 0x8C, 0xFE, 0x9B, 0xCE, 0xFE, 0x5D, 0xDF, 0xFF, 0x3D, 0xDF, 0xFF, 0x5E, 0xDF, 0xFF, 0x5E, 0xDF, 0xFF, 0x5E, 0xDF, 0xFF, 0x3D, 0xDF, 0xFF, 0x7D, 0xE7, 0xFF, 0x7B, 0xC6, 0xFE, 0x72, 0x8C, 0xFE, 0x4D, 0x63, 0xFE, 0x72, 0x8C, 0xFF, 0xFD, 0xD6, 0xFF, 0xFF, 0xF7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0xBF, 0xEF, 0xFF, 0xBF, 0xEF, 0xFF, 0x3D, 0xDF, 0xFF, 0x19, 0xBE, 0xFF, 0x97, 0xAD, 0xFE, 0x9B, 0xC6, 0xFE, 0x1D, 0xD7, 0xFE, 0x1D, 0xDF, 0xFF, 0x5E, 0xDF, 0xFF, 0x5E, 0xDF, 0xFF, 0x5E, 0xDF, 0xFF, 0x5E, 0xDF, 0xFF, 0x3D, 0xDF, 0xFF, 0x1D, 0xDF, 0xFE, 0x7A, 0xC6, 0xFE, 0xCF, 0x73, 0xFF, 0x25, 0x29, 0xFF, 0xC3, 0x18, 0xFF, 0x04, 0x21, 0xFA, 0x04, 0x21, 0xD0, 0x23, 0x21, 0x38, 0x00, 0x00, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x05, 0x45, 0x29, 0x06, 0xE3, 0x18, 0x09, 0xC3, 0x18, 0x13, 0x04, 0x21, 0x50, 0x24, 0x21, 0xDB, 0xA3, 0x18, 0xFF, 0x04, 0x21, 0xFD, 0x2D, 0x63, 0xFB, 0x56, 0xA5, 0xFC, 0xFC, 0xD6, 0xFF, 0xFF, 0xF7, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xEF, 0xFF, 0xFF, 0xF7, 0xFF, 0xFF, 0xF7, 0xFF, 0xFF, 0xF7, 0xFF, 0xFF, 0xEF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xF7, 0xFF, 0xDC, 0xD6, 0xFF, 0x39, 0xBE, 0xFF, 0xDC, 0xCE, 0xFF, 0xBF, 0xEF, 0xFF, 0xDF, 0xEF, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x7F, 0xE7, 0xFF, 0xBF, 0xEF, 0xFF, 0xFF, 0xF7, 0xFF, 0xDF, 0xEF, 0xFF, 0xBF, 0xEF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xF7, 0xFF, 0xFF, 0xF7, 0xFF, 0xFF, 0xEF, 0xFF, 0xFF, 0xF7, 0xFF, 0xDF, 0xEF, 0xFF, 0xFF, 0xF7, 0xFF, 0xFF, 0xF7, 0xFF, 0xFF, 0xF7, 0xFF, 0xDB, 0xCE, 0xFF, 0x72, 0x8C, 0xFC, 0xE8, 0x41, 0xF7, 0x04, 0x21, 0xFF, 0x04, 0x21, 0xFF, 0xE3, 0x20, 0xA7, 0x04, 0x21, 0x33, 0x00, 0x00, 0x00, 0x00, 0x38, 0x04, 0x24, 0x21, 0x07, 0x00, 0x00, 0x03, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x24, 0x21, 0x3B, 0xE3, 0x20, 0xB2, 0x04, 0x21, 0xF8, 0xC3, 0x18, 0xFC, 0x8A, 0x52, 0xFB, 0x39, 0xBE, 0xFF, 0xFF, 0xF7, 0xFF, 0xBF, 0xEF, 0xFF, 0x9F, 0xE7, 0xFF, 0x7E, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x7F, 0xE7, 0xFF, 0x7F, 0xE7, 0xFF, 0xBF, 0xEF, 0xFF, 0xDF, 0xEF, 0xFF, 0xBF, 0xEF, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x7F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x7E, 0xE7, 0xFF, 0x7E, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x7F, 0xE7, 0xFF, 0x5E, 0xE7, 0xFF, 0xFF, 0xFF, 0xFF, 0x9F, 0xE7, 0xFF, 0x92, 0x8C, 0xFE, 0xC7, 0x39, 0xFB, 0xC3, 0x20, 0xFD, 0xE3, 0x20, 0xFF, 0x04, 0x21, 0x89, 0x24, 0x21, 0x07, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x03, 0x86, 0x31, 0x05, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x24, 0x29, 0x6E, 0xC3, 0x20, 0xF7, 0xC3, 0x18, 0xFF, 0x69, 0x4A, 0xFB, 0x35, 0x9D, 0xFE, 0x5E, 0xDF, 0xFF, 0xFF, 0xF7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0xBF, 0xEF, 0xFF, 0xBF, 0xEF, 0xFF, 0xBF, 0xEF, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0xBF, 0xEF, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0xBF, 0xEF, 0xFF, 0xFF, 0xF7, 0xFF, 0x5E, 0xDF, 0xFF, 0x10, 0x7C, 0xFC, 0x04, 0x21, 0xFF, 0xE4, 0x20, 0xFF, 0x04, 0x29, 0xC3, 0xE3, 0x20, 0x4C, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x38, 0x04, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x45, 0x29, 0x13, 0x04, 0x21, 0x40, 0x25, 0x29, 0x60, 0x45, 0x29, 0x7D, 0x25, 0x29, 0xC7, 0xC3, 0x18, 0xFF, 0xA2, 0x18, 0xFE, 0xF0, 0x7B, 0xFC, 0x5D, 0xDF, 0xFF, 0xDF, 0xEF, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x7E, 0xE7, 0xFF, 0xBF, 0xEF, 0xFF, 0xFF, 0xF7, 0xFF, 0xF8, 0xB5, 0xFD, 0x8A, 0x52, 0xFE, 0xE3, 0x20, 0xFC, 0xA3, 0x18, 0xED, 0x45, 0x29, 0xBD, 0x45, 0x29, 0x78, 0x24, 0x29, 0x58, 0x24, 0x21, 0x31, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0xA2, 0x28, 0x0B, 0x04, 0x21, 0x24, 0x04, 0x21, 0x6B, 0xE3, 0x20, 0xAC, 0xC3, 0x18, 0xE3, 0xC3, 0x20, 0xFF, 0xA3, 0x18, 0xFF, 0xE3, 0x20, 0xFB, 0x28, 0x42, 0xFF, 0x76, 0xAD, 0xFF, 0xFF, 0xF7, 0xFF, 0xDF, 0xEF, 0xFF, 0x7F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0xBF, 0xEF, 0xFF, 0x9F, 0xE7, 0xFF, 0x1D, 0xDF, 0xFF, 0x14, 0x9D, 0xFF, 0xC7, 0x39, 0xFE, 0x82, 0x10, 0xFF, 0xC3, 0x18, 0xFF, 0xC3, 0x18, 0xFB, 0xC3, 0x20, 0xD6, 0xE3, 0x20, 0x96, 0x04, 0x21, 0x4C, 0x45, 0x19, 0x19, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x24, 0x21, 0x0D, 0x03, 0x21, 0x65, 0x04, 0x21, 0xC3, 0x04, 0x21, 0xEB, 0x04, 0x21, 0xF7, 0xA2, 0x18, 0xFF, 0xA2, 0x18, 0xFF, 0x61, 0x10, 0xFF, 0xC7, 0x39, 0xFE, 0x15, 0x9D, 0xFF, 0x3E, 0xDF, 0xFF, 0xBF, 0xEF, 0xFF, 0xBF, 0xEF, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0xFF, 0xF7, 0xFF, 0xFC, 0xD6, 0xFF, 0xF0, 0x7B, 0xFF, 0x45, 0x29, 0xFF, 0x41, 0x10, 0xFF, 0x82, 0x10, 0xFF, 0xE3, 0x20, 0xFC, 0xE4, 0x20, 0xF3, 0x04, 0x21, 0xE1, 0x04, 0x21, 0x94, 0xE3, 0x20, 0x32, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0xC4, 0x20, 0x15, 0xE3, 0x20, 0x79, 0x04, 0x21, 0xCE, 0xC3, 0x18, 0xFF, 0x82, 0x10, 0xFF, 0x45, 0x29, 0xFF, 0x8A, 0x52, 0xFF, 0xAF, 0x73, 0xF9, 0x31, 0x84, 0xFC, 0x35, 0x9D, 0xFF, 0x1D, 0xDF, 0xFF, 0xBF, 0xEF, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0xDF, 0xEF, 0xFF, 0xBF, 0xEF, 0xFF, 0x7A, 0xC6, 0xFF, 0x14, 0x9D, 0xFE, 0x31, 0x84, 0xFB, 0x4D, 0x63, 0xFC, 0x28, 0x42, 0xFF, 0x04, 0x21, 0xFF, 0xA2, 0x18, 0xFF, 0xC3, 0x18, 0xEB, 0x24, 0x21, 0xA7, 0x04, 0x21, 0x4F, 0xE3, 0x18, 0x12, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0xA2, 0x28, 0x0B, 0xE4, 0x20, 0x65, 0xE4, 0x20, 0xEA, 0xE3, 0x20, 0xFF, 0xE4, 0x20, 0xF9, 0xC7, 0x39, 0xFB, 0x6E, 0x6B, 0xFC, 0x76, 0xA5, 0xFE, 0x1D, 0xDF, 0xFF, 0xFF, 0xF7, 0xFF, 0xFF, 0xF7, 0xFF, 0xBF, 0xEF, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0xBF, 0xEF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xF7, 0xFF, 0x9B, 0xCE, 0xFE, 0xD3, 0x94, 0xFE, 0x0C, 0x5B, 0xFC, 0x86, 0x31, 0xF7, 0xE4, 0x20, 0xFF, 0xE3, 0x20, 0xFF, 0xE3, 0x20, 0xC1, 0x04, 0x21, 0x4C, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x86, 0x31, 0x05, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x04, 0x21, 0x4E, 0xE4, 0x20, 0xD3, 0x04, 0x21, 0xFF, 0xE3, 0x20, 0xFF, 0x49, 0x4A, 0xFE, 0xD7, 0xB5, 0xFE, 0x5D, 0xDF, 0xFF, 0x5E, 0xDF, 0xFF, 0xBF, 0xEF, 0xFF, 0xDF, 0xEF, 0xFF, 0xDF, 0xEF, 0xFF, 0xBF, 0xEF, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0xBF, 0xEF, 0xFF, 0xDF, 0xEF, 0xFF, 0xDF, 0xEF, 0xFF, 0x9F, 0xE7, 0xFF, 0x7E, 0xE7, 0xFF, 0xBC, 0xCE, 0xFF, 0xB3, 0x8C, 0xFE, 0x08, 0x42, 0xFE, 0xA2, 0x18, 0xFF, 0xE3, 0x20, 0xFB, 0x24, 0x29, 0x9D, 0xC3, 0x20, 0x25, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0xAA, 0x52, 0x03, 0x80, 0x31, 0x05, 0xE3, 0x20, 0x29, 0x24, 0x29, 0x9D, 0xC3, 0x18, 0xFF, 0x82, 0x18, 0xFF, 0x6A, 0x4A, 0xFA, 0x96, 0xAD, 0xFE, 0xDF, 0xEF, 0xFF, 0xFF, 0xFF, 0xFF, 0xDF, 0xEF, 0xFF, 0x9F, 0xE7, 0xFF, 0x7F, 0xE7, 0xFF, 0x7F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x7E, 0xE7, 0xFF, 0x7E, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0xFF, 0xF7, 0xFF, 0xFF, 0xF7, 0xFF, 0x3D, 0xDF, 0xFF, 0x52, 0x84, 0xFB, 0x86, 0x31, 0xFC, 0xE3, 0x20, 0xFF, 0x04, 0x21, 0xE3, 0x04, 0x21, 0x89, 0xE3, 0x18, 0x11, 0x00, 0x00, 0x00, 0xE7, 0x39, 0x04, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0x42, 0x29, 0x0C, 0x04, 0x21, 0x77, 0x04, 0x21, 0xDB, 0xC3, 0x20, 0xFD, 0x25, 0x29, 0xFE, 0xD4, 0x94, 0xFC, 0xFF, 0xF7, 0xFF, 0xDF, 0xEF, 0xFF, 0x5E, 0xDF, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x7E, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0xDF, 0xEF, 0xFF, 0x9B, 0xCE, 0xFF, 0xD0, 0x7B, 0xFF, 0x45, 0x29, 0xF8, 0xC3, 0x18, 0xFF, 0x04, 0x21, 0xE0, 0xE3, 0x20, 0x38, 0x00, 0x00, 0x02, 0xE7, 0x39, 0x04, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x45, 0x29, 0x06, 0x00, 0x00, 0x00, 0x04, 0x21, 0x16, 0x04, 0x21, 0xB5, 0xA2, 0x18, 0xFD, 0x45, 0x29, 0xFD, 0xCF, 0x73, 0xFF, 0x9B, 0xC6, 0xFE, 0xFF, 0xF7, 0xFF, 0xDF, 0xEF, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0xFF, 0xF7, 0xFF, 0x7A, 0xC6, 0xFE, 0x49, 0x4A, 0xFA, 0xA2, 0x18, 0xFF, 0x04, 0x21, 0xEF, 0x04, 0x21, 0x6F, 0x64, 0x29, 0x17, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0xAA, 0x52, 0x03, 0x00, 0x00, 0x01, 0x04, 0x21, 0x36, 0x04, 0x21, 0xD9, 0x82, 0x18, 0xFF, 0xE7, 0x39, 0xF8, 0x18, 0xB6, 0xFD, 0x9E, 0xEF, 0xFD, 0x7E, 0xE7, 0xFD, 0x9F, 0xE7, 0xFD, 0x9F, 0xE7, 0xFD, 0x9F, 0xE7, 0xFD, 0x9F, 0xE7, 0xFD, 0x9F, 0xE7, 0xFD, 0x9F, 0xE7, 0xFD, 0x9F, 0xE7, 0xFD, 0x9F, 0xE7, 0xFD, 0x9F, 0xE7, 0xFD, 0x9F, 0xE7, 0xFD, 0x9F, 0xE7, 0xFD, 0x9F, 0xE7, 0xFD, 0x9F, 0xE7, 0xFD, 0x9F, 0xE7, 0xFD, 0x9F, 0xE7, 0xFD, 0x9F, 0xE7, 0xFD, 0x9F, 0xE7, 0xFD, 0x9F, 0xE7, 0xFD, 0x9F, 0xE7, 0xFD, 0x9F, 0xE7, 0xFD, 0x9F, 0xE7, 0xFD, 0x9F, 0xE7, 0xFD, 0x9F, 0xE7, 0xFD, 0x9F, 0xE7, 0xFD, 0x9F, 0xE7, 0xFD, 0x9F, 0xE7, 0xFD, 0x9F, 0xE7, 0xFD, 0x9F, 0xE7, 0xFD, 0x9F, 0xE7, 0xFD, 0x9F, 0xE7, 0xFD, 0x9F, 0xE7, 0xFD, 0x9F, 0xE7, 0xFD, 0x9F, 0xE7, 0xFD, 0x9F, 0xE7, 0xFD, 0x9F, 0xE7, 0xFD, 0x9F, 0xE7, 0xFD, 0x9F, 0xE7, 0xFD, 0x9F, 0xE7, 0xFD, 0x9F, 0xE7, 0xFD, 0x9F, 0xE7, 0xFD, 0x9F, 0xE7, 0xFD, 0x9F, 0xE7, 0xFD, 0x9F, 0xE7, 0xFD, 0x9F, 0xE7, 0xFD, 0x9F, 0xE7, 0xFD, 0x9F, 0xE7, 0xFD, 0x9F, 0xE7, 0xFD, 0x9F, 0xE7, 0xFD, 0x9F, 0xE7, 0xFD, 0x9F, 0xE7, 0xFD, 0x9F, 0xE7, 0xFD, 0x9F, 0xE7, 0xFD, 0x9F, 0xE7, 0xFD, 0x9F, 0xE7, 0xFD, 0x9F, 0xE7, 0xFD, 0x9F, 0xE7, 0xFD, 0x9F, 0xE7, 0xFD, 0x9F, 0xE7, 0xFD, 0x9F, 0xE7, 0xFD, 0x9F, 0xE7, 0xFD, 0x9F, 0xE7, 0xFD, 0x9F, 0xE7, 0xFD, 0x9F, 0xE7, 0xFD, 0x9F, 0xE7, 0xFD, 0x9F, 0xE7, 0xFD, 0x9F, 0xE7, 0xFD, 0x9F, 0xE7, 0xFD, 0x9F, 0xE7, 0xFD, 0x9F, 0xE7, 0xFD, 0x7E, 0xE7, 0xFD, 0xFF, 0xFF, 0xFD, 0x7E, 0xE7, 0xFD, 0xF0, 0x7B, 0xFA, 0x86, 0x31, 0xFC, 0xE3, 0x20, 0xF3, 0xE3, 0x18, 0xA3, 0x24, 0x29, 0x36, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0xAA, 0x52, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x65, 0x29, 0x11, 0xE3, 0x20, 0x6C, 0x04, 0x21, 0xED, 0xE4, 0x20, 0xFF, 0xEC, 0x5A, 0xFC, 0x1D, 0xDF, 0xFF, 0xFF, 0xFF, 0xFF, 0x7F, 0xE7, 0xFF, 0xBF, 0xEF, 0xFF, 0xBF, 0xEF, 0xFF, 0xBF, 0xEF, 0xFF, 0xBF, 0xEF, 0xFF, 0xBF, 0xEF, 0xFF, 0xBF, 0xEF, 0xFF, 0xBF, 0xEF, 0xFF, 0xBF, 0xEF, 0xFF, 0xBF, 0xEF, 0xFF, 0xBF, 0xEF, 0xFF, 0xBF, 0xEF, 0xFF, 0xBF, 0xEF, 0xFF, 0xBF, 0xEF, 0xFF, 0xBF, 0xEF, 0xFF, 0xBF, 0xEF, 0xFF, 0xBF, 0xEF, 0xFF, 0xBF, 0xEF, 0xFF, 0xBF, 0xEF, 0xFF, 0xBF, 0xEF, 0xFF, 0xBF, 0xEF, 0xFF, 0xBF, 0xEF, 0xFF, 0xBF, 0xEF, 0xFF, 0xBF, 0xEF, 0xFF, 0xBF, 0xEF, 0xFF, 0xBF, 0xEF, 0xFF, 0xBF, 0xEF, 0xFF, 0xBF, 0xEF, 0xFF, 0xBF, 0xEF, 0xFF, 0xBF, 0xEF, 0xFF, 0xBF, 0xEF, 0xFF, 0xBF, 0xEF, 0xFF, 0xBF, 0xEF, 0xFF, 0xBF, 0xEF, 0xFF, 0xBF, 0xEF, 0xFF, 0xBF, 0xEF, 0xFF, 0xBF, 0xEF, 0xFF, 0xBF, 0xEF, 0xFF, 0xBF, 0xEF, 0xFF, 0xBF, 0xEF, 0xFF, 0xBF, 0xEF, 0xFF, 0xBF, 0xEF, 0xFF, 0xBF, 0xEF, 0xFF, 0xBF, 0xEF, 0xFF, 0xBF, 0xEF, 0xFF, 0xBF, 0xEF, 0xFF, 0xBF, 0xEF, 0xFF, 0xBF, 0xEF, 0xFF, 0xBF, 0xEF, 0xFF, 0xBF, 0xEF, 0xFF, 0xBF, 0xEF, 0xFF, 0xBF, 0xEF, 0xFF, 0xBF, 0xEF, 0xFF, 0xBF, 0xEF, 0xFF, 0xBF, 0xEF, 0xFF, 0xBF, 0xEF, 0xFF, 0xBF, 0xEF, 0xFF, 0xBF, 0xEF, 0xFF, 0xBF, 0xEF, 0xFF, 0xBF, 0xEF, 0xFF, 0xBF, 0xEF, 0xFF, 0xBF, 0xEF, 0xFF, 0xBF, 0xEF, 0xFF, 0xBF, 0xEF, 0xFF, 0xBF, 0xEF, 0xFF, 0xBF, 0xEF, 0xFF, 0xBF, 0xEF, 0xFF, 0xBF, 0xEF, 0xFF, 0xBF, 0xEF, 0xFF, 0xBF, 0xEF, 0xFF, 0x9F, 0xE7, 0xFF, 0xDF, 0xEF, 0xFF, 0x7E, 0xE7, 0xFF, 0xD8, 0xB5, 0xFF, 0xCB, 0x5A, 0xFF, 0xA2, 0x18, 0xFE, 0xC3, 0x18, 0xD2, 0x25, 0x29, 0x56, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0xE7, 0x39, 0x04, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x24, 0x29, 0x2E, 0xE3, 0x20, 0x96, 0xE3, 0x20, 0xF4, 0xA6, 0x31, 0xFE, 0x10, 0x7C, 0xFC, 0x3E, 0xDF, 0xFF, 0xFF, 0xF7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0xBF, 0xEF, 0xFF, 0xBF, 0xE7, 0xFF, 0xDC, 0xCE, 0xFE, 0x6E, 0x6B, 0xFE, 0xA2, 0x18, 0xFF, 0xC3, 0x18, 0xF0, 0x25, 0x29, 0x69, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x86, 0x31, 0x05, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x65, 0x31, 0x34, 0xC3, 0x18, 0x9A, 0xC3, 0x18, 0xEA, 0x08, 0x42, 0xF9, 0xD3, 0x94, 0xF2, 0x3D, 0xDF, 0xF4, 0xDF, 0xEF, 0xF5, 0x7E, 0xE7, 0xF7, 0x7F, 0xE7, 0xF8, 0x7E, 0xE7, 0xFA, 0x7E, 0xE7, 0xFA, 0x7E, 0xE7, 0xFA, 0x7E, 0xE7, 0xF9, 0x7F, 0xE7, 0xF8, 0x9F, 0xE7, 0xF6, 0x9F, 0xE7, 0xF5, 0x9F, 0xE7, 0xF4, 0x9F, 0xE7, 0xF4, 0x9F, 0xE7, 0xF4, 0x9F, 0xE7, 0xF4, 0x9F, 0xE7, 0xF4, 0x9F, 0xE7, 0xF4, 0x9F, 0xE7, 0xF4, 0x9F, 0xE7, 0xF4, 0x9F, 0xE7, 0xF4, 0x9F, 0xE7, 0xF4, 0x9F, 0xE7, 0xF4, 0x9F, 0xE7, 0xF4, 0x9F, 0xE7, 0xF4, 0x9F, 0xE7, 0xF4, 0x9F, 0xE7, 0xF6, 0x7F, 0xE7, 0xF8, 0x7E, 0xE7, 0xF9, 0x7E, 0xE7, 0xF9, 0x7E, 0xE7, 0xF9, 0x7E, 0xE7, 0xF9, 0x7F, 0xE7, 0xF8, 0x9F, 0xE7, 0xF6, 0x9F, 0xE7, 0xF4, 0x9F, 0xE7, 0xF4, 0x9F, 0xE7, 0xF4, 0x9F, 0xE7, 0xF4, 0x9F, 0xE7, 0xF4, 0x9F, 0xE7, 0xF4, 0x9F, 0xE7, 0xF4, 0x9F, 0xE7, 0xF4, 0x9F, 0xE7, 0xF4, 0x9F, 0xE7, 0xF4, 0x9F, 0xE7, 0xF4, 0x9F, 0xE7, 0xF4, 0x9F, 0xE7, 0xF4, 0x9F, 0xE7, 0xF4, 0x9F, 0xE7, 0xF4, 0x9F, 0xE7, 0xF6, 0x9F, 0xE7, 0xF6, 0x9F, 0xE7, 0xF6, 0x9F, 0xE7, 0xF6, 0x9F, 0xE7, 0xF5, 0x9F, 0xE7, 0xF5, 0x9F, 0xE7, 0xF4, 0x9F, 0xE7, 0xF4, 0x9F, 0xE7, 0xF4, 0x9F, 0xE7, 0xF4, 0x9F, 0xE7, 0xF4, 0x9F, 0xE7, 0xF4, 0x9F, 0xE7, 0xF4, 0x9F, 0xE7, 0xF4, 0x9F, 0xE7, 0xF4, 0x9F, 0xE7, 0xF4, 0x9F, 0xE7, 0xF4, 0x9F, 0xE7, 0xF4, 0x9F, 0xE7, 0xF4, 0x9F, 0xE7, 0xF5, 0x9F, 0xE7, 0xF7, 0x9F, 0xE7, 0xF7, 0x9F, 0xE7, 0xF7, 0x9F, 0xE7, 0xF7, 0x9F, 0xE7, 0xF7, 0x7E, 0xE7, 0xF6, 0xBF, 0xEF, 0xF5, 0xBF, 0xEF, 0xF4, 0xF0, 0x7B, 0xF0, 0x82, 0x10, 0xF9, 0xA3, 0x18, 0xFC, 0x25, 0x29, 0x73, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x45, 0x29, 0x06, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x86, 0x31, 0x1E, 0xA3, 0x18, 0x60, 0xC3, 0x18, 0x9A, 0x29, 0x4A, 0xA9, 0x14, 0x9D, 0xA0, 0x5E, 0xDF, 0xA2, 0xDF, 0xEF, 0xA1, 0xBF, 0xEF, 0x9E, 0xDF, 0xEF, 0x9B, 0xFF, 0xF7, 0x99, 0xFF, 0xF7, 0x98, 0xFF, 0xF7, 0x98, 0xFF, 0xF7, 0x9A, 0xDF, 0xEF, 0x9C, 0xBF, 0xEF, 0x9F, 0x9F, 0xE7, 0xA1, 0x9F, 0xE7, 0xA2, 0x9F, 0xE7, 0xA1, 0x9F, 0xE7, 0xA1, 0x9F, 0xE7, 0xA1, 0x9F, 0xE7, 0xA1, 0x9F, 0xE7, 0xA1, 0x9F, 0xE7, 0xA1, 0x9F, 0xE7, 0xA1, 0x9F, 0xE7, 0xA1, 0x9F, 0xE7, 0xA1, 0x9F, 0xE7, 0xA1, 0x9F, 0xE7, 0xA1, 0x9F, 0xE7, 0xA2, 0x9F, 0xE7, 0xA2, 0xBF, 0xEF, 0x9F, 0xDF, 0xEF, 0x9B, 0xFF, 0xF7, 0x9A, 0xFF, 0xF7, 0x9A, 0xFF, 0xF7, 0x99, 0xFF, 0xF7, 0x9A, 0xDF, 0xEF, 0x9C, 0xBF, 0xEF, 0x9F, 0x9F, 0xE7, 0xA2, 0x9F, 0xE7, 0xA2, 0x9F, 0xE7, 0xA1, 0x9F, 0xE7, 0xA1, 0x9F, 0xE7, 0xA1, 0x9F, 0xE7, 0xA1, 0x9F, 0xE7, 0xA1, 0x9F, 0xE7, 0xA1, 0x9F, 0xE7, 0xA1, 0x9F, 0xE7, 0xA1, 0x9F, 0xE7, 0xA1, 0x9F, 0xE7, 0xA1, 0x9F, 0xE7, 0xA1, 0x9F, 0xE7, 0xA2, 0x9F, 0xE7, 0xA2, 0x9F, 0xEF, 0xA0, 0xBF, 0xEF, 0x9F, 0xBF, 0xEF, 0x9F, 0xBF, 0xEF, 0x9F, 0xBF, 0xEF, 0xA0, 0x9F, 0xE7, 0xA2, 0x9F, 0xE7, 0xA2, 0x9F, 0xE7, 0xA1, 0x9F, 0xE7, 0xA1, 0x9F, 0xE7, 0xA1, 0x9F, 0xE7, 0xA1, 0x9F, 0xE7, 0xA1, 0x9F, 0xE7, 0xA1, 0x9F, 0xE7, 0xA1, 0x9F, 0xE7, 0xA1, 0x9F, 0xE7, 0xA1, 0x9F, 0xE7, 0xA1, 0x9F, 0xE7, 0xA1, 0x9F, 0xE7, 0xA2, 0x9F, 0xE7, 0xA1, 0xBF, 0xEF, 0x9E, 0xDF, 0xEF, 0x9D, 0xDF, 0xEF, 0x9D, 0xDF, 0xEF, 0x9D, 0xDF, 0xEF, 0x9D, 0x9F, 0xE7, 0x9F, 0xDF, 0xF7, 0xA1, 0xFF, 0xFF, 0xA2, 0x72, 0x8C, 0x9D, 0x61, 0x10, 0xA8, 0xA2, 0x18, 0xAF, 0x45, 0x29, 0x52, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0xE7, 0x39, 0x04, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0xE7, 0x39, 0x04, 0x82, 0x10, 0x0D, 0xC3, 0x18, 0x15, 0x69, 0x4A, 0x17, 0x75, 0xA5, 0x16, 0xBC, 0xCE, 0x19, 0x5E, 0xDF, 0x18, 0xFF, 0xFF, 0x12, 0xFF, 0xFF, 0x0C, 0xFF, 0xFF, 0x06, 0xFF, 0xFF, 0x03, 0xFF, 0xFF, 0x04, 0xFF, 0xFF, 0x07, 0xFF, 0xFF, 0x0D, 0x9F, 0xE7, 0x16, 0xBC, 0xCE, 0x19, 0xFD, 0xD6, 0x18, 0x9F, 0xE7, 0x16, 0x9F, 0xE7, 0x16, 0x9F, 0xE7, 0x16, 0x9F, 0xE7, 0x16, 0x9F, 0xE7, 0x16, 0x9F, 0xE7, 0x16, 0x9F, 0xE7, 0x16, 0x9F, 0xE7, 0x16, 0x9F, 0xE7, 0x16, 0x9F, 0xE7, 0x16, 0x9F, 0xE7, 0x16, 0xFD, 0xD6, 0x18, 0x79, 0xC6, 0x1B, 0xFF, 0xFF, 0x14, 0xFF, 0xFF, 0x0C, 0xFF, 0xFF, 0x09, 0xFF, 0xFF, 0x07, 0xFF, 0xFF, 0x07, 0xFF, 0xFF, 0x07, 0xFF, 0xFF, 0x0C, 0xFF, 0xFF, 0x14, 0x79, 0xC6, 0x1B, 0xBC, 0xCE, 0x19, 0x9F, 0xE7, 0x16, 0x9F, 0xE7, 0x16, 0x9F, 0xE7, 0x16, 0x9F, 0xE7, 0x16, 0x9F, 0xE7, 0x16, 0x9F, 0xE7, 0x16, 0x9F, 0xE7, 0x16, 0x9F, 0xE7, 0x16, 0x9F, 0xE7, 0x16, 0x9F, 0xE7, 0x16, 0x5E, 0xDF, 0x17, 0xBA, 0xCE, 0x1A, 0x7B, 0xC6, 0x1B, 0x5E, 0xDF, 0x17, 0xFF, 0xF7, 0x15, 0x9F, 0xE7, 0x16, 0xFF, 0xF7, 0x15, 0xFD, 0xD6, 0x18, 0x79, 0xC6, 0x1B, 0xBC, 0xCE, 0x19, 0x5E, 0xDF, 0x17, 0x9F, 0xE7, 0x16, 0x9F, 0xE7, 0x16, 0x9F, 0xE7, 0x16, 0x9F, 0xE7, 0x16, 0x9F, 0xE7, 0x16, 0x9F, 0xE7, 0x16, 0x9F, 0xE7, 0x16, 0x9F, 0xE7, 0x16, 0x9F, 0xE7, 0x16, 0x5E, 0xDF, 0x17, 0x79, 0xC6, 0x1B, 0xBC, 0xCE, 0x19, 0xFF, 0xFF, 0x13, 0xFF, 0xFF, 0x0F, 0xFF, 0xFF, 0x0F, 0xFF, 0xFF, 0x0F, 0xFF, 0xFF, 0x10, 0x9F, 0xE7, 0x15, 0xBC, 0xCE, 0x1A, 0xBF, 0xEF, 0x19, 0xB2, 0x8C, 0x16, 0x41, 0x10, 0x17, 0xA2, 0x18, 0x19, 0x45, 0x29, 0x0C, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x0A, 0x00, 0x00, 0x2F, 0x00, 0x00, 0x50, 0x00, 0x00, 0x5F, 0x00, 0x00, 0x57, 0x00, 0x00, 0x46, 0x00, 0x00, 0x25, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x2F, 0x00, 0x00, 0x3F, 0x00, 0x00, 0x46, 0x00, 0x00, 0x4A, 0x00, 0x00, 0x45, 0x00, 0x00, 0x2B, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x08, 0x00, 0x00, 0x1A, 0x00, 0x00, 0x1D, 0x00, 0x00, 0x1B, 0x00, 0x00, 0x18, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x03, 0x00, 0x30, 0x05, 0x45, 0x29, 0x06, 0xFF, 0xFF, 0x03, 0xAA, 0x52, 0x12, 0x86, 0x31, 0x3E, 0x24, 0x29, 0x81, 0x04, 0x21, 0xC1, 0x04, 0x21, 0xF9, 0x24, 0x29, 0xFF, 0x24, 0x29, 0xFF, 0x04, 0x21, 0xE8, 0x24, 0x29, 0xAE, 0x45, 0x29, 0x63, 0xE7, 0x39, 0x26, 0xF3, 0x9C, 0x08, 0xFF, 0xFF, 0x04, 0xBA, 0xAE, 0x06, 0xFF, 0xCF, 0x05, 0xFF, 0xCF, 0x05, 0xFF, 0xCF, 0x05, 0xFF, 0xCF, 0x05, 0xFF, 0xCF, 0x05, 0x7F, 0xCE, 0x05, 0xFF, 0xCF, 0x05, 0xFF, 0xCF, 0x05, 0xFF, 0xFF, 0x02, 0xF3, 0x9C, 0x08, 0xE7, 0x39, 0x24, 0x25, 0x29, 0x6E, 0x24, 0x29, 0xBD, 0x04, 0x21, 0xDE, 0x04, 0x21, 0xEC, 0x04, 0x21, 0xF3, 0x04, 0x21, 0xE9, 0x24, 0x21, 0xB9, 0x45, 0x29, 0x6D, 0xA6, 0x31, 0x29, 0x2C, 0x63, 0x0F, 0xFF, 0xFF, 0x02, 0xFF, 0xFF, 0x04, 0xFF, 0xCF, 0x05, 0xFF, 0xCF, 0x05, 0xFF, 0xCF, 0x05, 0xFF, 0xCF, 0x05, 0xFF, 0xCF, 0x05, 0xFF, 0xCF, 0x05, 0xFF, 0xFF, 0x04, 0xFF, 0xFF, 0x02, 0xB6, 0x95, 0x07, 0x69, 0x4A, 0x17, 0x87, 0x39, 0x2D, 0x45, 0x29, 0x5B, 0x45, 0x29, 0x69, 0x45, 0x29, 0x64, 0x45, 0x29, 0x66, 0x45, 0x31, 0x4E, 0xA6, 0x31, 0x29, 0x2C, 0x63, 0x0F, 0xFF, 0xFF, 0x03, 0xFF, 0xFF, 0x02, 0xFF, 0xCF, 0x05, 0xFF, 0xCF, 0x05, 0xFF, 0xCF, 0x05, 0xFF, 0xCF, 0x05, 0x7F, 0xCE, 0x05, 0xFF, 0xCF, 0x05, 0xBA, 0xAE, 0x06, 0xFF, 0xFF, 0x03, 0xFF, 0xFF, 0x03, 0x28, 0x42, 0x19, 0x45, 0x29, 0x46, 0x45, 0x29, 0x7E, 0x24, 0x21, 0xA0, 0x24, 0x29, 0xA7, 0x24, 0x29, 0xA3, 0x24, 0x21, 0x9A, 0x25, 0x29, 0x6D, 0x86, 0x31, 0x37, 0xEB, 0x5A, 0x10, 0x55, 0xAD, 0x03, 0x00, 0x00, 0x04, 0x00, 0x30, 0x05, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x30, 0x05, 0x00, 0x00, 0x02, 0x86, 0x19, 0x0A, 0x04, 0x21, 0x6B, 0xE4, 0x20, 0xC6, 0xE4, 0x20, 0xED, 0xE4, 0x20, 0xFF, 0x04, 0x21, 0xFF, 0x04, 0x21, 0xFF, 0x04, 0x21, 0xFF, 0x04, 0x21, 0xFF, 0x04, 0x21, 0xF7, 0x04, 0x21, 0xE8, 0x04, 0x21, 0x9F, 0x04, 0x29, 0x33, 0xE7, 0x39, 0x04, 0xEF, 0x7B, 0x02, 0xEF, 0x7B, 0x02, 0xFF, 0xFF, 0x01, 0xFF, 0xFF, 0x01, 0xFF, 0xFF, 0x01, 0xFF, 0xFF, 0x01, 0x1F, 0x00, 0x01, 0xFF, 0xFF, 0x01, 0xE7, 0x39, 0x04, 0x00, 0x00, 0x00, 0x04, 0x21, 0x35, 0xE4, 0x20, 0xBA, 0x04, 0x21, 0xEA, 0x04, 0x21, 0xF7, 0x04, 0x21, 0xFF, 0x04, 0x21, 0xFF, 0x04, 0x21, 0xFF, 0x04, 0x21, 0xFF, 0xE4, 0x20, 0xFC, 0xE4, 0x20, 0xE8, 0x04, 0x21, 0xC6, 0x04, 0x21, 0x57, 0x00, 0x00, 0x00, 0xFF, 0xFF, 0x01, 0xAA, 0x52, 0x03, 0x00, 0x00, 0x00, 0xFF, 0xFF, 0x01, 0xFF, 0xFF, 0x01, 0xFF, 0xFF, 0x01, 0xAA, 0x52, 0x03, 0xFF, 0xFF, 0x01, 0x00, 0x00, 0x00, 0x04, 0x29, 0x25, 0xE4, 0x20, 0x8A, 0xE4, 0x20, 0xDB, 0xE4, 0x20, 0xE5, 0xE4, 0x20, 0xE8, 0xE4, 0x20, 0xEA, 0x04, 0x21, 0xE6, 0x04, 0x21, 0xE2, 0xE3, 0x20, 0xC0, 0x04, 0x21, 0x5F, 0x45, 0x29, 0x12, 0x00, 0x00, 0x00, 0xEF, 0x7B, 0x02, 0xAA, 0x52, 0x03, 0x00, 0x00, 0x00, 0xFF, 0xFF, 0x01, 0x00, 0x00, 0x00, 0xFF, 0xFF, 0x01, 0x45, 0x29, 0x06, 0x00, 0x00, 0x00, 0x24, 0x21, 0x15, 0x04, 0x21, 0x97, 0x04, 0x21, 0xDF, 0xE4, 0x20, 0xEB, 0xE4, 0x20, 0xF8, 0xE4, 0x20, 0xFC, 0xE4, 0x20, 0xFA, 0xE4, 0x20, 0xF1, 0x04, 0x21, 0xEA, 0xE4, 0x20, 0xD1, 0xE4, 0x20, 0x62, 0x65, 0x29, 0x11, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x02, 0x00, 0x38, 0x04, 0xE7, 0x39, 0x04, 0xE3, 0x18, 0x3A, 0xE3, 0x20, 0xC2, 0x04, 0x21, 0xFF, 0x04, 0x21, 0xFF, 0xE3, 0x20, 0xE1, 0x04, 0x21, 0xAD, 0xE4, 0x20, 0x93, 0xE4, 0x20, 0x93, 0x04, 0x21, 0xBF, 0xE4, 0x20, 0xFD, 0x04, 0x21, 0xFF, 0x04, 0x21, 0xEE, 0xE3, 0x20, 0x9A, 0x04, 0x21, 0x17, 0x00, 0x00, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0xE7, 0x39, 0x04, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0xC3, 0x20, 0x2E, 0xE3, 0x20, 0xA8, 0xE4, 0x20, 0xFF, 0x04, 0x21, 0xFF, 0xE4, 0x20, 0xF7, 0xE4, 0x20, 0xBD, 0xE3, 0x20, 0xA4, 0xE4, 0x20, 0xA7, 0xE3, 0x20, 0xB2, 0xE4, 0x20, 0xEC, 0x04, 0x29, 0xFF, 0x04, 0x21, 0xFF, 0xE3, 0x20, 0xA8, 0x04, 0x21, 0x2E, 0x45, 0x29, 0x06, 0x00, 0x00, 0x05, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0x06, 0x30, 0x05, 0xAA, 0x02, 0x03, 0xE4, 0x20, 0x2A, 0xE3, 0x20, 0x96, 0x04, 0x21, 0xE6, 0x04, 0x29, 0xFF, 0x04, 0x29, 0xFF, 0x04, 0x21, 0xFF, 0x04, 0x21, 0xFF, 0x04, 0x21, 0xFF, 0x24, 0x29, 0xFF, 0x04, 0x21, 0xFF, 0xE4, 0x20, 0xC9, 0xE3, 0x18, 0x68, 0x24, 0x21, 0x15, 0x00, 0x00, 0x00, 0x45, 0x29, 0x06, 0x00, 0x00, 0x04, 0x00, 0x00, 0x02, 0x45, 0x29, 0x06, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0xE3, 0x18, 0x28, 0xE3, 0x20, 0x88, 0xE4, 0x20, 0xEA, 0x04, 0x21, 0xFF, 0x04, 0x21, 0xFF, 0xE4, 0x20, 0xEB, 0xE4, 0x20, 0xD3, 0xE4, 0x20, 0xDC, 0xE4, 0x20, 0xF5, 0x04, 0x21, 0xFF, 0x04, 0x21, 0xFF, 0x04, 0x21, 0xCB, 0xE3, 0x20, 0x61, 0x24, 0x21, 0x0E, 0x00, 0x00, 0x01, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x04, 0x21, 0x2C, 0xE4, 0x20, 0x95, 0xE4, 0x20, 0xF4, 0x04, 0x21, 0xF9, 0xE3, 0x20, 0xD9, 0xE3, 0x20, 0x79, 0x04, 0x21, 0x34, 0xE3, 0x28, 0x12, 0x04, 0x31, 0x0F, 0x04, 0x21, 0x4E, 0xE3, 0x20, 0xA6, 0xE3, 0x20, 0xE8, 0x04, 0x21, 0xFF, 0xE3, 0x20, 0xEF, 0xE3, 0x18, 0x51, 0x45, 0x29, 0x06, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x86, 0x31, 0x05, 0x00, 0x00, 0x00, 0xE3, 0x18, 0x08, 0xE3, 0x20, 0x7D, 0x04, 0x21, 0xFF, 0x04, 0x21, 0xFF, 0xE3, 0x20, 0xE2, 0xE3, 0x20, 0x9B, 0x04, 0x21, 0x45, 0xE3, 0x20, 0x23, 0x04, 0x21, 0x27, 0x04, 0x21, 0x37, 0xE3, 0x20, 0x8A, 0xE3, 0x20, 0xE8, 0xE4, 0x20, 0xFA, 0xE4, 0x20, 0xE0, 0xE4, 0x20, 0x89, 0x04, 0x21, 0x0F, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x01, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x04, 0x21, 0x1E, 0xE4, 0x20, 0x87, 0xE3, 0x20, 0xFA, 0x04, 0x21, 0xFF, 0xE3, 0x20, 0xE8, 0xE4, 0x20, 0xC4, 0xE4, 0x20, 0xA6, 0xE4, 0x20, 0x9D, 0xE3, 0x20, 0xB3, 0xE3, 0x20, 0xD2, 0x04, 0x21, 0xF5, 0x04, 0x21, 0xFF, 0x04, 0x21, 0xCD, 0x04, 0x21, 0x5D, 0xE3, 0x18, 0x09, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0xFF, 0x07, 0x01, 0x00, 0x00, 0x00, 0x86, 0x31, 0x05, 0xE3, 0x20, 0x74, 0xE4, 0x20, 0xF8, 0x04, 0x21, 0xFF, 0xE3, 0x20, 0xF0, 0xE3, 0x20, 0xC2, 0xE4, 0x20, 0x7E, 0xE3, 0x20, 0x5B, 0xE3, 0x20, 0x69, 0xE3, 0x20, 0x91, 0xE3, 0x20, 0xCA, 0x04, 0x21, 0xF7, 0x04, 0x21, 0xFF, 0xE4, 0x20, 0xC4, 0xE4, 0x20, 0x4C, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x45, 0x29, 0x06, 0xE3, 0x20, 0x82, 0x04, 0x21, 0xF1, 0x04, 0x21, 0xFF, 0x04, 0x21, 0xCF, 0x04, 0x21, 0x6F, 0x04, 0x21, 0x17, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0xFF, 0xFF, 0x01, 0xE3, 0x18, 0x08, 0xE4, 0x20, 0x2B, 0xE3, 0x20, 0xB1, 0x04, 0x21, 0xFF, 0xE3, 0x20, 0xFA, 0xE3, 0x20, 0xA7, 0xE3, 0x20, 0x36, 0x00, 0x00, 0x03, 0x00, 0x00, 0x03, 0x00, 0x28, 0x06, 0x00, 0x00, 0x02, 0x00, 0x00, 0x05, 0x86, 0x31, 0x05, 0xE3, 0x38, 0x09, 0x04, 0x21, 0x4F, 0xE3, 0x20, 0xBD, 0x04, 0x21, 0xFF, 0x04, 0x21, 0xFF, 0xE4, 0x20, 0x92, 0x24, 0x21, 0x15, 0x45, 0x29, 0x06, 0xE7, 0x39, 0x04, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0xC3, 0x20, 0x1C, 0x04, 0x21, 0x76, 0xE4, 0x20, 0xE8, 0x04, 0x29, 0xFB, 0xE4, 0x20, 0xD3, 0x04, 0x21, 0x2D, 0x00, 0x00, 0x00, 0x00, 0x00, 0x05, 0x45, 0x29, 0x06, 0xC6, 0x30, 0x0A, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x04, 0x21, 0x5E, 0xE3, 0x20, 0xE8, 0x04, 0x21, 0xFF, 0xE4, 0x20, 0xED, 0xE3, 0x20, 0x9B, 0xE3, 0x20, 0x2C, 0x04, 0x21, 0x17, 0x24, 0x21, 0x15, 0xE3, 0x18, 0x19, 0xE3, 0x20, 0x4C, 0xE3, 0x20, 0xB3, 0xE3, 0x20, 0xF9, 0x04, 0x21, 0xF9, 0xE4, 0x20, 0xC1, 0xE3, 0x20, 0x35, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x04, 0x21, 0x3F, 0xE3, 0x20, 0xB3, 0x04, 0x21, 0xFF, 0x04, 0x21, 0xFF, 0x04, 0x21, 0xA5, 0xE3, 0x20, 0x35, 0xE3, 0x18, 0x10, 0xA2, 0x10, 0x0C, 0x45, 0x29, 0x0C, 0xC3, 0x28, 0x13, 0xE4, 0x20, 0x5C, 0xE4, 0x20, 0xCC, 0xE4, 0x20, 0xFC, 0x04, 0x21, 0xF9, 0xE4, 0x20, 0xAA, 0xE3, 0x18, 0x11, 0x00, 0x00, 0x00, 0x45, 0x29, 0x06, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0xAA, 0x52, 0x03, 0x00, 0x00, 0x00, 0x04, 0x21, 0x16, 0xE4, 0x20, 0x76, 0x04, 0x21, 0xD4, 0x04, 0x21, 0xFF, 0x04, 0x21, 0xF3, 0xE4, 0x20, 0x87, 0x23, 0x19, 0x1A, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x86, 0x31, 0x05, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0xE4, 0x20, 0x5F, 0xE3, 0x20, 0xD4, 0x04, 0x21, 0xFD, 0x04, 0x21, 0xE8, 0xE3, 0x20, 0x69, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0xE3, 0x20, 0x1B, 0xE3, 0x20, 0xAB, 0x04, 0x21, 0xEC, 0x04, 0x21, 0xF5, 0x04, 0x21, 0xBE, 0x04, 0x21, 0x3E, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x24, 0x21, 0x2A, 0xE3, 0x20, 0xD0, 0x04, 0x29, 0xFF, 0xE3, 0x20, 0xF3, 0xE4, 0x20, 0x8F, 0x04, 0x21, 0x37, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0xE7, 0x01, 0x04, 0xE3, 0x20, 0x48, 0xE3, 0x20, 0xB5, 0x04, 0x21, 0xFF, 0x04, 0x21, 0xFF, 0xE3, 0x20, 0xAA, 0xE3, 0x20, 0x34, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0xA0, 0x52, 0x03, 0x04, 0x21, 0x4F, 0xE3, 0x20, 0xD6, 0x04, 0x21, 0xFF, 0xE4, 0x20, 0xF5, 0xE3, 0x20, 0xA5, 0xE3, 0x20, 0x5B, 0xC4, 0x20, 0x2E, 0xC3, 0x20, 0x14, 0xE3, 0x18, 0x21, 0xE3, 0x20, 0x54, 0xE3, 0x20, 0xA8, 0x04, 0x21, 0xE8, 0x04, 0x21, 0xFF, 0xE4, 0x20, 0xD1, 0x03, 0x21, 0x54, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0xE5, 0x18, 0x11, 0xE4, 0x20, 0x6E, 0xE3, 0x20, 0xE8, 0x04, 0x29, 0xFF, 0xE4, 0x20, 0xDC, 0xE3, 0x20, 0x49, 0x24, 0x21, 0x0D, 0xAA, 0x52, 0x03, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0xE7, 0x39, 0x04, 0x00, 0x00, 0x00, 0x04, 0x21, 0x32, 0xE3, 0x20, 0xE1, 0x04, 0x29, 0xFF, 0xE3, 0x20, 0xF0, 0xE4, 0x20, 0xAF, 0xE4, 0x20, 0x3C, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x45, 0x29, 0x06, 0x00, 0x00, 0x01, 0x00, 0x00, 0x02, 0xAA, 0x52, 0x03, 0x00, 0x00, 0x03, 0x23, 0x21, 0x1B, 0xE3, 0x20, 0x93, 0x04, 0x21, 0xFE, 0x04, 0x21, 0xFF, 0xE3, 0x20, 0xAA, 0xE3, 0x28, 0x33, 0xA5, 0x28, 0x0C, 0x00, 0x00, 0x02, 0x00, 0x00, 0x01, 0xE3, 0x18, 0x09, 0x04, 0x21, 0x16, 0xE3, 0x20, 0x69, 0xE4, 0x20, 0xEE, 0x24, 0x29, 0xFF, 0xE4, 0x20, 0xDF, 0xE4, 0x20, 0x56, 0x24, 0x21, 0x0D, 0x86, 0x31, 0x05, 0x00, 0x00, 0x03, 0x00, 0x00, 0x03, 0x00, 0x00, 0x03, 0x24, 0x21, 0x07, 0x00, 0x38, 0x04, 0xE3, 0x18, 0x11, 0xE4, 0x20, 0x87, 0xE3, 0x20, 0xEA, 0x04, 0x21, 0xFF, 0xE4, 0x20, 0xF5, 0xE3, 0x20, 0xA3, 0x04, 0x21, 0x4B, 0x04, 0x21, 0x24, 0xE3, 0x18, 0x20, 0x04, 0x21, 0x54, 0xE3, 0x20, 0xC0, 0xE4, 0x20, 0xFD, 0x04, 0x21, 0xFE, 0xE3, 0x20, 0xE3, 0xE3, 0x20, 0x54, 0x00, 0x00, 0x00, 0x07, 0x38, 0x04, 0x86, 0x31, 0x0A, 0x45, 0x29, 0x06, 0x86, 0x31, 0x0A, 0x00, 0x00, 0x01, 0x65, 0x11, 0x0B, 0xE4, 0x20, 0x86, 0xE4, 0x20, 0xE4, 0x04, 0x21, 0xFF, 0x04, 0x21, 0xFF, 0xE3, 0x20, 0xE0, 0xE4, 0x20, 0x9A, 0x04, 0x21, 0x6F, 0x04, 0x21, 0x86, 0xE4, 0x20, 0xCF, 0xE4, 0x20, 0xFF, 0x04, 0x21, 0xFF, 0xE3, 0x20, 0xE2, 0xE3, 0x20, 0x72, 0x04, 0x21, 0x1D, 0x00, 0x00, 0x03, 0x00, 0x38, 0x04, 0x00, 0x00, 0x06, 0x00, 0x00, 0x03, 0xE3, 0x38, 0x09, 0x00, 0x00, 0x00, 0xA3, 0x18, 0x20, 0xE3, 0x20, 0xC1, 0x04, 0x29, 0xFE, 0xE3, 0x20, 0xF3, 0xE4, 0x20, 0x8B, 0x24, 0x21, 0x23, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x04, 0x21, 0x2F, 0xE3, 0x20, 0xCB, 0x04, 0x21, 0xFF, 0xE3, 0x20, 0xC5, 0xE4, 0x20, 0x3E, 0x45, 0x29, 0x06, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x02, 0x00, 0x00, 0x02, 0x86, 0x31, 0x05, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0xE4, 0x20, 0x5C, 0xE4, 0x20, 0xDB, 0xE4, 0x20, 0xFE, 0xE4, 0x20, 0xF0, 0xE4, 0x20, 0xBF, 0xE3, 0x20, 0x68, 0x04, 0x19, 0x2D, 0xE3, 0x20, 0x2A, 0x04, 0x21, 0x53, 0xE4, 0x20, 0x9C, 0xE4, 0x20, 0xE3, 0x04, 0x21, 0xFD, 0xE4, 0x20, 0xF6, 0xE3, 0x20, 0xA8, 0xE3, 0x20, 0x1A, 0x00, 0x00, 0x00, 0xE7, 0x39, 0x04, 0x00, 0x00, 0x02, 0x00, 0x00, 0x02, 0x00, 0x00, 0x02, 0x00, 0x00, 0x02, 0x00, 0x38, 0x04, 0x00, 0x00, 0x01, 0xE3, 0x18, 0x12, 0xE3, 0x20, 0x99, 0x04, 0x21, 0xFF, 0x04, 0x21, 0xFF, 0x04, 0x21, 0xEF, 0xE3, 0x20, 0xE0, 0xE3, 0x20, 0xD9, 0xE3, 0x20, 0xD8, 0xE3, 0x20, 0xE2, 0xE4, 0x20, 0xF7, 0x04, 0x21, 0xFF, 0xE4, 0x20, 0xEA, 0xE3, 0x20, 0x68, 0xA2, 0x28, 0x0C, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x01, 0x00, 0x00, 0x02, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0xE3, 0x18, 0x11, 0xE4, 0x20, 0x86, 0xE4, 0x20, 0xFA, 0x04, 0x21, 0xFF, 0x04, 0x21, 0xFF, 0xE4, 0x20, 0xF5, 0xE4, 0x20, 0xEC, 0xE4, 0x20, 0xEF, 0xE4, 0x20, 0xFF, 0x04, 0x21, 0xFF, 0xE4, 0x20, 0xED, 0xE4, 0x20, 0x8C, 0xE3, 0x20, 0x1B, 0x00, 0x00, 0x01, 0x00, 0x00, 0x03, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0xA2, 0x28, 0x0C, 0x03, 0x21, 0x76, 0x04, 0x21, 0xE5, 0xE3, 0x20, 0xFC, 0x04, 0x21, 0x9A, 0xE3, 0x18, 0x2A, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0xC3, 0x18, 0x13, 0xE3, 0x20, 0x51, 0xE3, 0x20, 0x86, 0x04, 0x21, 0x64, 0x24, 0x21, 0x07, 0x00, 0x00, 0x00, 0xE3, 0x18, 0x09, 0x45, 0x29, 0x06, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x45, 0x29, 0x06, 0x45, 0x29, 0x06, 0x00, 0x00, 0x04, 0xE3, 0x20, 0x21, 0xE3, 0x20, 0x76, 0xE3, 0x20, 0xE8, 0x04, 0x21, 0xFF, 0x04, 0x21, 0xFF, 0xE4, 0x20, 0xD7, 0xE4, 0x20, 0xAC, 0xE3, 0x20, 0xAB, 0x04, 0x21, 0xC6, 0xE4, 0x20, 0xFB, 0x04, 0x29, 0xFF, 0x04, 0x21, 0xFF, 0xE3, 0x20, 0xB3, 0xC3, 0x20, 0x40, 0x00, 0x38, 0x04, 0x00, 0x28, 0x06, 0xE3, 0x18, 0x08, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0xE3, 0x18, 0x08, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x03, 0x21, 0x33, 0xE3, 0x20, 0x93, 0xE4, 0x20, 0xD1, 0x04, 0x21, 0xFF, 0x24, 0x29, 0xFF, 0x24, 0x29, 0xFF, 0x25, 0x29, 0xFF, 0x24, 0x29, 0xFF, 0xE3, 0x20, 0xFA, 0xE4, 0x20, 0xC0, 0xE3, 0x20, 0x7C, 0xC3, 0x20, 0x14, 0x00, 0x00, 0x00, 0x45, 0x29, 0x06, 0x00, 0x00, 0x04, 0x00, 0x00, 0x04, 0x86, 0x31, 0x05, 0x00, 0x00, 0x03, 0x00, 0x28, 0x06, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x04, 0x21, 0x27, 0xE4, 0x20, 0x74, 0xE4, 0x20, 0xAC, 0xE4, 0x20, 0xD3, 0xE3, 0x20, 0xF0, 0x04, 0x21, 0xFF, 0xE3, 0x20, 0xF8, 0xE3, 0x20, 0xD4, 0x04, 0x21, 0xAC, 0xE3, 0x20, 0x74, 0xE4, 0x20, 0x2D, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x24, 0x21, 0x07, 0x86, 0x31, 0x05, 0x86, 0x31, 0x05, 0x86, 0x31, 0x05, 0x00, 0x28, 0x06, 0x86, 0x31, 0x05, 0xE3, 0x18, 0x09, 0x24, 0x21, 0x2F, 0xE3, 0x18, 0x70, 0xE4, 0x20, 0x7C, 0x04, 0x21, 0x47, 0x24, 0x21, 0x14, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0xE3, 0x18, 0x10, 0x45, 0x29, 0x06, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0xE3, 0x18, 0x18, 0x04, 0x21, 0x96, 0xE4, 0x20, 0xDF, 0xE4, 0x20, 0xEE, 0xE4, 0x20, 0xFF, 0x04, 0x21, 0xFF, 0x04, 0x21, 0xFF, 0x04, 0x21, 0xFF, 0xE4, 0x20, 0xF7, 0xE4, 0x20, 0xE7, 0xE4, 0x20, 0xC5, 0xE4, 0x20, 0x55, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x05, 0x00, 0x00, 0x00, 0xA2, 0x10, 0x0B, 0xE3, 0x20, 0x6B, 0xE4, 0x20, 0xB4, 0xE4, 0x20, 0xCF, 0xE4, 0x20, 0xD7, 0xE4, 0x20, 0xD8, 0xE3, 0x20, 0xD3, 0xE3, 0x20, 0xA2, 0xE3, 0x20, 0x52, 0xE3, 0x28, 0x10, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x45, 0x29, 0x06, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x04, 0x21, 0x37, 0xE3, 0x20, 0x69, 0xE4, 0x20, 0x87, 0xE4, 0x20, 0x9D, 0xE3, 0x20, 0x90, 0xE3, 0x20, 0x66, 0x04, 0x21, 0x34, 0x24, 0x21, 0x07, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0xE3, 0x18, 0x08, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x07, 0x38, 0x04, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0xA2, 0x28, 0x0B, 0x04, 0x21, 0x2D, 0xE3, 0x20, 0x20, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x02, 0x24, 0x21, 0x15, 0x04, 0x21, 0x46, 0xE4, 0x20, 0x8D, 0xE4, 0x20, 0xC4, 0xE4, 0x20, 0xDC, 0xE4, 0x20, 0xDE, 0xE4, 0x20, 0xD2, 0xE3, 0x20, 0xAC, 0xE4, 0x20, 0x6B, 0xC4, 0x20, 0x25, 0xC3, 0x18, 0x0A, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0xE3, 0x20, 0x21, 0x24, 0x21, 0x23, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x84, 0x20, 0x0D, 0xE3, 0x18, 0x19, 0x04, 0x21, 0x1E, 0xE3, 0x18, 0x20, 0xE3, 0x20, 0x20, 0x04, 0x21, 0x1F, 0x04, 0x21, 0x16, 0xE3, 0x18, 0x08, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x86, 0x31, 0x05, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0xA5, 0x28, 0x0C, 0xE3, 0x18, 0x12, 0x24, 0x21, 0x15, 0xC3, 0x28, 0x13, 0xA2, 0x28, 0x0C, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x50, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0xE7, 0x39, 0x04, 0x45, 0x29, 0x06, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0xA4, 0x20, 0x16, 0xE3, 0x20, 0x52, 0xE4, 0x20, 0x77, 0xE4, 0x20, 0x90, 0x04, 0x21, 0xA7, 0x04, 0x21, 0x9F, 0xE3, 0x20, 0x8A, 0xE4, 0x20, 0x6C, 0xE3, 0x20, 0x40, 0x42, 0x11, 0x0C, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x04, 0x21, 0x27, 0xE4, 0x20, 0x47, 0xE4, 0x20, 0x53, 0xE4, 0x20, 0x54, 0x04, 0x21, 0x4F, 0xE3, 0x20, 0x3A, 0x45, 0x19, 0x13, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0xA2, 0x10, 0x0B, 0xE3, 0x20, 0x42, 0xE3, 0x20, 0x74, 0xE3, 0x20, 0x89, 0x04, 0x21, 0x9F, 0xE4, 0x20, 0xA4, 0xE3, 0x20, 0x8A, 0xE4, 0x20, 0x6E, 0xE4, 0x20, 0x3F, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x45, 0x29, 0x12, 0xE3, 0x20, 0x31, 0xE3, 0x20, 0x4D, 0xE4, 0x20, 0x54, 0xE3, 0x20, 0x40, 0xE3, 0x20, 0x22, 0x00, 0x50, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0xE3, 0x18, 0x08, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x86, 0x31, 0x05, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x21, 0x1E, 0xE4, 0x20, 0x4B, 0xE4, 0x20, 0x53, 0xE4, 0x20, 0x5E, 0xE3, 0x20, 0x68, 0xE3, 0x20, 0x5C, 0xE4, 0x20, 0x3E, 0x24, 0x19, 0x14, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x24, 0x21, 0x07, 0x00, 0x50, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x45, 0x19, 0x19, 0xE4, 0x20, 0x6B, 0xE4, 0x20, 0xCF, 0x04, 0x21, 0xFF, 0x04, 0x21, 0xFF, 0x04, 0x21, 0xFF, 0x04, 0x21, 0xFF, 0x04, 0x21, 0xFF, 0xE4, 0x20, 0xFE, 0xE3, 0x20, 0xB2, 0x03, 0x21, 0x4D, 0x24, 0x21, 0x0E, 0x00, 0x00, 0x04, 0x00, 0x00, 0x05, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x24, 0x21, 0x07, 0x00, 0x00, 0x03, 0x04, 0x21, 0x0F, 0xE3, 0x20, 0x56, 0x04, 0x21, 0xB7, 0x04, 0x21, 0xFF, 0x04, 0x21, 0xFF, 0x04, 0x21, 0xFF, 0x04, 0x21, 0xFF, 0x04, 0x21, 0xFF, 0xE4, 0x20, 0xFF, 0xE3, 0x20, 0xB1, 0xE3, 0x18, 0x50, 0xE3, 0x18, 0x11, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x45, 0x29, 0x06, 0x45, 0x29, 0x06, 0x45, 0x29, 0x06, 0x45, 0x29, 0x06, 0x45, 0x29, 0x06, 0x45, 0x29, 0x06, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x42, 0x29, 0x0C, 0xE3, 0x20, 0x32, 0x04, 0x21, 0x6A, 0x04, 0x21, 0x9F, 0xE4, 0x20, 0xCF, 0xE4, 0x20, 0xDC, 0xE4, 0x20, 0xBA, 0x04, 0x21, 0x85, 0xE3, 0x20, 0x50, 0x24, 0x21, 0x1C, 0x24, 0x21, 0x07, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x04, 0x07, 0x38, 0x04, 0x86, 0x31, 0x05, 0xE7, 0x39, 0x04, 0x00, 0x00, 0x03, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0xE3, 0x20, 0x2B, 0x04, 0x21, 0x7C, 0xE4, 0x20, 0xC5, 0xE4, 0x20, 0xDA, 0xE4, 0x20, 0xEF, 0xE4, 0x20, 0xFD, 0xE4, 0x20, 0xE6, 0xE4, 0x20, 0xB1, 0xE3, 0x20, 0x69, 0xC4, 0x20, 0x1E, 0x07, 0x38, 0x04, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x05, 0x00, 0x00, 0x00, 0xE3, 0x18, 0x19, 0xE4, 0x20, 0x98, 0xE4, 0x20, 0xE5, 0xE4, 0x20, 0xFC, 0x04, 0x21, 0xFF, 0x04, 0x21, 0xFF, 0xE4, 0x20, 0xF8, 0xE4, 0x20, 0xF9, 0x04, 0x21, 0xFF, 0x04, 0x21, 0xFF, 0x04, 0x21, 0xF6, 0xE3, 0x20, 0xC8, 0xE3, 0x20, 0x6B, 0xA2, 0x10, 0x0C, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x50, 0x03, 0x24, 0x21, 0x15, 0xE4, 0x20, 0x62, 0xE4, 0x20, 0xD7, 0x04, 0x21, 0xF8, 0x04, 0x21, 0xFF, 0x04, 0x29, 0xFF, 0xE4, 0x20, 0xFF, 0xE4, 0x20, 0xEF, 0x04, 0x21, 0xFF, 0x04, 0x21, 0xFF, 0xE4, 0x20, 0xF6, 0xE4, 0x20, 0xE6, 0xE3, 0x20, 0x79, 0x02, 0x21, 0x0F, 0x00, 0x00, 0x01, 0x00, 0x00, 0x02, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0x00, 0x00, 0x02, 0x00, 0x30, 0x05, 0x00, 0x00, 0x00, 0x86, 0x01, 0x05, 0xE3, 0x20, 0x69, 0xE3, 0x20, 0xC4, 0xE3, 0x20, 0xE8, 0xE4, 0x20, 0xF6, 0x04, 0x21, 0xFF, 0x04, 0x21, 0xFF, 0xE4, 0x20, 0xFE, 0x04, 0x21, 0xEF, 0xE3, 0x20, 0xDF, 0xE3, 0x20, 0xA8, 0x04, 0x21, 0x44, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0x00, 0x00, 0x05, 0x00, 0x00, 0x00, 0xE3, 0x20, 0x34, 0xE3, 0x20, 0xBB, 0x04, 0x21, 0xEC, 0xE4, 0x20, 0xF9, 0x04, 0x21, 0xFF, 0x04, 0x21, 0xFF, 0x04, 0x21, 0xFF, 0x04, 0x21, 0xFF, 0xE4, 0x20, 0xF8, 0xE3, 0x20, 0xE3, 0xE3, 0x20, 0x9C, 0xE4, 0x28, 0x33, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x38, 0x04, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x78, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x04, 0x29, 0x16, 0xE3, 0x20, 0x6C, 0xE4, 0x20, 0xE4, 0x04, 0x21, 0xFF, 0xE4, 0x20, 0xFF, 0xE3, 0x20, 0xB2, 0xE3, 0x20, 0x7A, 0x04, 0x21, 0x65, 0xE4, 0x20, 0x64, 0xE3, 0x20, 0x89, 0xE3, 0x20, 0xD0, 0x04, 0x21, 0xFF, 0x04, 0x21, 0xFF, 0xE3, 0x20, 0xC0, 0x04, 0x21, 0x2C, 0x00, 0x00, 0x00, 0x24, 0x21, 0x07, 0x86, 0x31, 0x05, 0x00, 0x00, 0x05, 0x86, 0x31, 0x05, 0x00, 0x00, 0x04, 0x45, 0x29, 0x06, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0xE4, 0x20, 0x4A, 0xE4, 0x20, 0xCA, 0x04, 0x21, 0xFF, 0x04, 0x21, 0xFF, 0xE4, 0x20, 0xCC, 0x04, 0x21, 0x8E, 0xE3, 0x20, 0x69, 0xE4, 0x20, 0x5F, 0xE4, 0x20, 0x7E, 0xE4, 0x20, 0xC4, 0x04, 0x21, 0xFF, 0x04, 0x21, 0xFF, 0xE3, 0x20, 0xD2, 0xE3, 0x20, 0x59, 0xAA, 0x02, 0x03, 0x00, 0x00, 0x01, 0x24, 0x21, 0x07, 0x00, 0x00, 0x02, 0x00, 0x00, 0x03, 0x00, 0x00, 0x04, 0x00, 0x38, 0x04, 0xC4, 0x20, 0x15, 0xE3, 0x20, 0x55, 0xE3, 0x20, 0xC8, 0x04, 0x21, 0xFF, 0x04, 0x21, 0xFF, 0xE4, 0x20, 0xF6, 0xE3, 0x20, 0xC8, 0xE4, 0x20, 0xBC, 0xE4, 0x20, 0xD3, 0x04, 0x21, 0xFF, 0x24, 0x29, 0xFF, 0xE4, 0x20, 0xF8, 0xE3, 0x20, 0x9A, 0x04, 0x21, 0x2F, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x24, 0x21, 0x07, 0x00, 0x38, 0x04, 0xE3, 0x18, 0x08, 0x00, 0x50, 0x03, 0x00, 0x00, 0x00, 0xC4, 0x20, 0x37, 0xE4, 0x20, 0xAD, 0xE4, 0x20, 0xFE, 0x04, 0x21, 0xFF, 0xE4, 0x20, 0xF5, 0xE4, 0x20, 0xBE, 0xE3, 0x20, 0xA0, 0xE3, 0x20, 0xA8, 0xE4, 0x20, 0xC2, 0xE4, 0x20, 0xFA, 0x04, 0x29, 0xFF, 0xE4, 0x20, 0xF0, 0xE3, 0x20, 0x8A, 0x04, 0x21, 0x27, 0x00, 0x38, 0x04, 0x00, 0x38, 0x04, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x38, 0x04, 0x00, 0x00, 0x00, 0x86, 0x31, 0x05, 0xE4, 0x20, 0x57, 0xE4, 0x20, 0xCC, 0xE4, 0x20, 0xFC, 0x04, 0x21, 0xF4, 0xE4, 0x20, 0xBD, 0xE3, 0x20, 0x42, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0xC3, 0x18, 0x15, 0xE3, 0x20, 0x71, 0xE4, 0x20, 0xDA, 0x04, 0x21, 0xFA, 0xE4, 0x20, 0xED, 0xE4, 0x20, 0x71, 0xE3, 0x28, 0x12, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x01, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x19, 0x1D, 0xE3, 0x20, 0x9D, 0x04, 0x21, 0xFF, 0x04, 0x21, 0xFD, 0xE3, 0x20, 0xC8, 0xE4, 0x20, 0x6A, 0xA2, 0x10, 0x0B, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0xE4, 0x18, 0x5A, 0xE4, 0x20, 0xCC, 0xE3, 0x20, 0xFA, 0x04, 0x21, 0xFC, 0xE3, 0x20, 0xB2, 0xE3, 0x18, 0x20, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0xE3, 0x20, 0x48, 0xE3, 0x20, 0xC0, 0xE4, 0x20, 0xFC, 0x04, 0x21, 0xF6, 0xE3, 0x20, 0xD9, 0xE3, 0x20, 0x92, 0x03, 0x21, 0x56, 0x04, 0x21, 0x44, 0xE3, 0x20, 0x61, 0xE4, 0x20, 0xAB, 0xE4, 0x20, 0xE9, 0x04, 0x21, 0xFF, 0xE4, 0x20, 0xE2, 0xE4, 0x20, 0x8B, 0xE3, 0x18, 0x18, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0xA2, 0x28, 0x0C, 0xE4, 0x20, 0x93, 0x04, 0x21, 0xFF, 0x04, 0x21, 0xFF, 0xE3, 0x20, 0xE0, 0xE4, 0x20, 0x9C, 0x04, 0x21, 0x46, 0xE3, 0x20, 0x20, 0x04, 0x29, 0x2C, 0x04, 0x21, 0x52, 0xE4, 0x20, 0xAA, 0x04, 0x21, 0xF1, 0x04, 0x21, 0xFF, 0xE3, 0x20, 0xDA, 0xE4, 0x20, 0x79, 0xA2, 0x28, 0x0C, 0x00, 0x00, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x01, 0x00, 0x00, 0x02, 0x04, 0x21, 0x3D, 0xE3, 0x20, 0xAB, 0x04, 0x21, 0xFB, 0x04, 0x21, 0xFF, 0x04, 0x21, 0xB7, 0xE3, 0x20, 0x40, 0x45, 0x29, 0x06, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0xE2, 0x28, 0x18, 0x03, 0x21, 0x7C, 0x04, 0x21, 0xDC, 0x04, 0x21, 0xFD, 0xE4, 0x20, 0xCB, 0xE4, 0x20, 0x46, 0x00, 0x00, 0x00, 0xE7, 0x39, 0x04, 0xE3, 0x18, 0x09, 0x00, 0x00, 0x04, 0xE3, 0x38, 0x09, 0x00, 0x00, 0x02, 0x24, 0x21, 0x0D, 0xE3, 0x20, 0x88, 0xE3, 0x20, 0xEB, 0x04, 0x21, 0xFF, 0xE3, 0x20, 0xE8, 0xE4, 0x20, 0x6D, 0xA5, 0x28, 0x0C, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0xC3, 0x18, 0x0A, 0x04, 0x21, 0x57, 0xE3, 0x20, 0xEB, 0x24, 0x29, 0xFF, 0xE3, 0x20, 0xE1, 0xE3, 0x20, 0x64, 0x24, 0x21, 0x0D, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x24, 0x21, 0x07, 0x04, 0x21, 0x87, 0x04, 0x21, 0xF8, 0x04, 0x21, 0xFF, 0xE4, 0x20, 0xC4, 0xE3, 0x20, 0x62, 0xE3, 0x28, 0x19, 0xE3, 0x18, 0x08, 0x24, 0x21, 0x07, 0xC3, 0x30, 0x0A, 0xE3, 0x20, 0x22, 0x04, 0x21, 0x77, 0xE4, 0x20, 0xF0, 0x04, 0x21, 0xFD, 0xE3, 0x20, 0xDB, 0xE3, 0x20, 0x64, 0x83, 0x19, 0x0A, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0xE3, 0x20, 0x68, 0xE3, 0x20, 0xD3, 0x04, 0x21, 0xFF, 0x04, 0x21, 0xFF, 0xE3, 0x20, 0x8A, 0x24, 0x21, 0x15, 0x45, 0x29, 0x06, 0x86, 0x31, 0x05, 0x00, 0x00, 0x01, 0xE3, 0x18, 0x08, 0xE4, 0x20, 0x3D, 0xE3, 0x20, 0xA2, 0xE4, 0x20, 0xF2, 0x04, 0x21, 0xFB, 0xE3, 0x20, 0xC0, 0xC4, 0x20, 0x1F, 0x00, 0x00, 0x00, 0xE7, 0x39, 0x04, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0xE3, 0x18, 0x2A, 0xE4, 0x20, 0xAF, 0x04, 0x21, 0xF0, 0x04, 0x21, 0xFF, 0x04, 0x21, 0xD1, 0xE3, 0x20, 0x60, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x28, 0x06, 0x24, 0x21, 0x07, 0x24, 0x21, 0x07, 0x00, 0x78, 0x02, 0x00, 0x00, 0x00, 0x23, 0x21, 0x23, 0xE4, 0x20, 0xA7, 0x04, 0x21, 0xFF, 0x04, 0x21, 0xF7, 0xE4, 0x20, 0x85, 0xE3, 0x18, 0x10, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x04, 0x21, 0x46, 0xE3, 0x20, 0xD1, 0x04, 0x21, 0xFF, 0xE3, 0x20, 0xF8, 0xE4, 0x20, 0x8C, 0xC4, 0x20, 0x1E, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0xE3, 0x18, 0x09, 0x86, 0x31, 0x05, 0x00, 0x18, 0x08, 0x00, 0x00, 0x00, 0xC3, 0x20, 0x15, 0xE4, 0x20, 0xAA, 0x04, 0x21, 0xF1, 0xE4, 0x20, 0xFC, 0xE4, 0x20, 0xC3, 0xE3, 0x20, 0x70, 0xE3, 0x20, 0x2C, 0xA5, 0x28, 0x0C, 0x22, 0x11, 0x0D, 0x04, 0x21, 0x33, 0xE4, 0x20, 0x77, 0xE4, 0x20, 0xD0, 0x04, 0x21, 0xFF, 0x04, 0x21, 0xFC, 0xE4, 0x20, 0x87, 0xE3, 0x18, 0x10, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x04, 0x21, 0x25, 0xE4, 0x20, 0xB5, 0x04, 0x21, 0xFC, 0x04, 0x21, 0xFF, 0xE4, 0x20, 0xC5, 0xE3, 0x20, 0x81, 0xE4, 0x20, 0x57, 0xE3, 0x20, 0x42, 0xE3, 0x20, 0x50, 0xE4, 0x20, 0x77, 0xE3, 0x20, 0xC6, 0x04, 0x21, 0xFD, 0x04, 0x21, 0xFF, 0xE3, 0x20, 0xB3, 0xE3, 0x20, 0x33, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0xE0, 0x01, 0x04, 0xE3, 0x20, 0x48, 0xE4, 0x20, 0xDC, 0x24, 0x29, 0xFF, 0xE3, 0x20, 0xEB, 0xE4, 0x20, 0x6D, 0xC3, 0x20, 0x1C, 0xEF, 0x7B, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x04, 0x21, 0x3E, 0xE4, 0x20, 0xDE, 0x04, 0x29, 0xFE, 0xE3, 0x20, 0xE1, 0xE3, 0x20, 0x73, 0xE4, 0x18, 0x1B, 0x00, 0x00, 0x02, 0x00, 0x00, 0x02, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x30, 0x05, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0xE4, 0x20, 0x6F, 0x04, 0x21, 0xF7, 0x04, 0x21, 0xFF, 0xE3, 0x20, 0xC8, 0xE3, 0x20, 0x61, 0x04, 0x21, 0x1E, 0x24, 0x21, 0x0E, 0xA2, 0x28, 0x0B, 0xC3, 0x18, 0x13, 0xE3, 0x18, 0x42, 0xE3, 0x20, 0xA2, 0xE4, 0x20, 0xF3, 0x04, 0x21, 0xFC, 0xE3, 0x20, 0xD2, 0x04, 0x21, 0x2D, 0x00, 0x00, 0x00, 0x00, 0x00, 0x07, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x38, 0x04, 0xC3, 0x30, 0x0A, 0x04, 0x21, 0x4F, 0xE3, 0x20, 0xB8, 0x04, 0x21, 0xFD, 0x04, 0x21, 0xFF, 0xE4, 0x20, 0xE7, 0x04, 0x21, 0x97, 0xE4, 0x20, 0x64, 0x03, 0x21, 0x63, 0x04, 0x21, 0xA2, 0xE4, 0x20, 0xF6, 0x04, 0x21, 0xFF, 0xE4, 0x20, 0xF7, 0xE4, 0x20, 0xBF, 0x04, 0x21, 0x47, 0x00, 0x00, 0x00, 0x00, 0x38, 0x04, 0xE3, 0x18, 0x08, 0x00, 0x00, 0x02, 0x00, 0x00, 0x07, 0x07, 0x00, 0x04, 0xC3, 0x18, 0x0A, 0xE4, 0x20, 0x5D, 0xE3, 0x20, 0xC0, 0xE4, 0x20, 0xF9, 0x04, 0x21, 0xFF, 0x04, 0x21, 0xFF, 0xE3, 0x20, 0xE0, 0xE4, 0x20, 0xBC, 0xE4, 0x20, 0xD4, 0xE4, 0x20, 0xFF, 0x04, 0x21, 0xFF, 0x04, 0x21, 0xFA, 0xE3, 0x20, 0xD2, 0x04, 0x21, 0x46, 0x00, 0x38, 0x04, 0x86, 0x31, 0x05, 0x00, 0x00, 0x02, 0x00, 0x00, 0x03, 0x00, 0x00, 0x03, 0xE3, 0x18, 0x09, 0x00, 0x00, 0x01, 0xC3, 0x28, 0x13, 0xE4, 0x20, 0xAE, 0x04, 0x21, 0xF9, 0xE3, 0x20, 0xF1, 0xE3, 0x20, 0x9E, 0xE3, 0x20, 0x31, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0xE3, 0x18, 0x18, 0xE4, 0x20, 0x86, 0xE4, 0x20, 0xC9, 0xE3, 0x20, 0xA1, 0xE3, 0x20, 0x21, 0x00, 0x00, 0x01, 0x00, 0x50, 0x03, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0xE3, 0x20, 0x3C, 0xE3, 0x20, 0xB2, 0xE4, 0x20, 0xFD, 0x04, 0x21, 0xF8, 0xE4, 0x20, 0xDC, 0xE4, 0x20, 0xAC, 0xE3, 0x20, 0x74, 0xE3, 0x20, 0x64, 0xE4, 0x20, 0x8F, 0xE4, 0x20, 0xC7, 0xE4, 0x20, 0xF0, 0x04, 0x21, 0xFF, 0x04, 0x21, 0xDE, 0x04, 0x21, 0x7C, 0x82, 0x20, 0x0D, 0x00, 0x00, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x38, 0x04, 0x00, 0x00, 0x00, 0xE3, 0x18, 0x08, 0xE3, 0x20, 0x5A, 0xE3, 0x20, 0xD0, 0x04, 0x21, 0xFF, 0x04, 0x21, 0xFF, 0xE4, 0x20, 0xF3, 0xE3, 0x20, 0xEA, 0xE3, 0x20, 0xE9, 0xE4, 0x20, 0xF7, 0x04, 0x21, 0xFF, 0x04, 0x21, 0xFF, 0xE4, 0x20, 0xCA, 0xE3, 0x18, 0x40, 0xE3, 0x18, 0x08, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0xC3, 0x18, 0x0A, 0xE3, 0x20, 0x52, 0xE3, 0x20, 0xC2, 0x04, 0x21, 0xFF, 0x04, 0x21, 0xFF, 0x04, 0x21, 0xFF, 0xE4, 0x20, 0xFF, 0x04, 0x21, 0xFF, 0x04, 0x21, 0xFF, 0x04, 0x21, 0xFF, 0xE4, 0x20, 0xC1, 0xE3, 0x20, 0x53, 0x86, 0x31, 0x0A, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x24, 0x21, 0x07, 0xE3, 0x20, 0x5C, 0xE3, 0x20, 0xC0, 0xE4, 0x20, 0xCD, 0xE3, 0x20, 0x6D, 0x04, 0x21, 0x17, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x03, 0x21, 0x24, 0xE3, 0x20, 0x4D, 0xE3, 0x20, 0x3B, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x50, 0x03, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x04, 0xC3, 0x28, 0x13, 0xE3, 0x20, 0x48, 0xE3, 0x20, 0xB4, 0x04, 0x21, 0xFF, 0x24, 0x29, 0xFF, 0x04, 0x21, 0xFF, 0xE3, 0x20, 0xE3, 0xE3, 0x20, 0xDA, 0xE4, 0x20, 0xF5, 0x04, 0x21, 0xFF, 0x04, 0x29, 0xFF, 0x04, 0x21, 0xDF, 0xE3, 0x20, 0x7F, 0x04, 0x21, 0x25, 0x00, 0x50, 0x03, 0x00, 0x00, 0x04, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x78, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0xC4, 0x20, 0x15, 0xE4, 0x20, 0x57, 0xE4, 0x20, 0x97, 0x04, 0x21, 0xC7, 0xE3, 0x20, 0xF2, 0x04, 0x21, 0xFF, 0x04, 0x21, 0xFF, 0xE3, 0x20, 0xF0, 0xE3, 0x20, 0xC3, 0xE4, 0x20, 0x94, 0xE4, 0x20, 0x51, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x22, 0x21, 0x0D, 0xE3, 0x20, 0x4C, 0xE4, 0x20, 0x86, 0x04, 0x21, 0x9D, 0xE3, 0x20, 0xB8, 0xE4, 0x20, 0xD3, 0xE3, 0x20, 0xC3, 0xE3, 0x20, 0x9B, 0x04, 0x21, 0x7F, 0xC3, 0x20, 0x49, 0xA2, 0x10, 0x0B, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x86, 0x31, 0x05, 0xE3, 0x18, 0x19, 0xE3, 0x20, 0x4A, 0xE4, 0x20, 0x54, 0xE3, 0x18, 0x22, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0xF8, 0x01, 0x04, 0x21, 0x4D, 0xE4, 0x20, 0xAF, 0x04, 0x21, 0xE2, 0x04, 0x21, 0xEE, 0xE4, 0x20, 0xF6, 0xE3, 0x20, 0xFA, 0xE4, 0x20, 0xF2, 0xE4, 0x20, 0xE8, 0xE4, 0x20, 0xD5, 0xE3, 0x20, 0x7F, 0xE3, 0x20, 0x20, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0xE3, 0x20, 0x1B, 0xE3, 0x20, 0x58, 0xE3, 0x20, 0x8A, 0xE4, 0x20, 0x9C, 0xE4, 0x20, 0x9D, 0xE4, 0x20, 0x87, 0x04, 0x21, 0x56, 0xE3, 0x18, 0x12, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x04, 0x04, 0x21, 0x1D, 0xE3, 0x20, 0x42, 0xE3, 0x20, 0x62, 0xE3, 0x20, 0x50, 0xE3, 0x20, 0x1A, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0xE3, 0x18, 0x08, 0x04, 0x21, 0x1F, 0x04, 0x21, 0x4A, 0x04, 0x21, 0x82, 0x04, 0x21, 0x9E, 0x04, 0x21, 0x9F, 0x04, 0x21, 0x95, 0x04, 0x21, 0x67, 0x04, 0x21, 0x34, 0xE3, 0x18, 0x11, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0xE3, 0x18, 0x09, 0xE3, 0x18, 0x12, 0x24, 0x21, 0x15, 0x24, 0x21, 0x15, 0xE3, 0x18, 0x12, 0xE3, 0x18, 0x09, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x86, 0x31, 0x05, 0xA2, 0x28, 0x0B, 0xE3, 0x18, 0x08, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0xE7, 0x39, 0x04, 0x00, 0x00, 0x03, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0xE3, 0x18, 0x20, 0xE3, 0x20, 0x30, 0x04, 0x21, 0x2F, 0xE3, 0x20, 0x2B, 0xE3, 0x18, 0x10, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0xE7, 0x39, 0x04, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x07, 0x38, 0x04, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x86, 0x31, 0x05, 0x07, 0x38, 0x04, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x07, 0x38, 0x04, 0xE7, 0x39, 0x04, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0xE7, 0x39, 0x04, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x38, 0x04, 0x00, 0x38, 0x04, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x03, 0x07, 0x38, 0x04, 0x86, 0x31, 0x05, 0x86, 0x31, 0x05, 0x07, 0x38, 0x04, 0x00, 0x00, 0x03, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0x00, 0x00, 0x02, 0x00, 0x00, 0x03, 0x00, 0x00, 0x03, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x02, 0x00, 0x00, 0x03, 0x00, 0x00, 0x03, 0x00, 0x00, 0x03, 0x00, 0x00, 0x02, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-};
+// Pixel data is embedded from fog.bin
+// Payload SHA-256: 6b64dcf3866d836a5eaf63f2762b95a9a750585938a18f9cb24a4b2e9ce66f50
+__asm__(
+    ".section .rodata\n"
+    ".balign 4\n"
+    ".global fog_data\n"
+    "fog_data:\n"
+    ".incbin \"src/weather_icons/fog.bin\"\n"
+    ".previous\n"
+);
+extern "C" const uint8_t fog_data[];
 
 extern const lv_img_dsc_t fog = {
     .header = {
@@ -2,104 +2,17 @@
 #include <Arduino.h>
 
 // Weather icon: partly_cloudy_day (96x96 RGB565 with alpha)
-const uint8_t partly_cloudy_day_data[] PROGMEM = {
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x02, 0x00, 0x00, 0x03, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x03, 0x00, 0x00, 0x03, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x06, 0x01, 0x08, 0x1C, 0x20, 0x00, 0x2D, 0x61, 0x00, 0x15, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x02, 0x00, 0x00, 0x03, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x61, 0x00, 0x15, 0x40, 0x00, 0x3B, 0x21, 0x00, 0x39, 0x41, 0x00, 0x18, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x21, 0x00, 0x32, 0x21, 0x00, 0x7E, 0x21, 0x00, 0x93, 0x20, 0x00, 0x48, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x40, 0x00, 0x4C, 0x20, 0x00, 0xA9, 0x20, 0x00, 0xAB, 0x20, 0x00, 0x4A, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x06, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x21, 0x00, 0x73, 0x21, 0x00, 0xF1, 0x41, 0x00, 0xF2, 0x21, 0x00, 0x87, 0x02, 0x10, 0x0F, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x41, 0x08, 0x1E, 0x41, 0x00, 0x93, 0x41, 0x00, 0xF6, 0x41, 0x00, 0xF9, 0x20, 0x00, 0x6F, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x06, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x06, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x21, 0x00, 0x6D, 0x21, 0x00, 0xF5, 0x41, 0x00, 0xFF, 0x20, 0x00, 0xC6, 0x00, 0x00, 0x48, 0x00, 0x00, 0x07, 0x00, 0x00, 0x01, 0x00, 0x00, 0x03, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x05, 0x41, 0x00, 0x18, 0x21, 0x00, 0x2B, 0x61, 0x00, 0x13, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x03, 0x00, 0x00, 0x01, 0x00, 0x00, 0x07, 0x20, 0x00, 0x4F, 0x20, 0x00, 0xCD, 0x41, 0x00, 0xFF, 0x21, 0x00, 0xF1, 0x20, 0x00, 0x65, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x06, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x41, 0x00, 0x35, 0x20, 0x00, 0xA8, 0x21, 0x00, 0xF8, 0x20, 0x00, 0xEF, 0x20, 0x00, 0x90, 0x01, 0x00, 0x12, 0x00, 0x00, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x20, 0x00, 0x21, 0x21, 0x00, 0x69, 0x21, 0x00, 0x90, 0x21, 0x00, 0x4D, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0x01, 0x00, 0x12, 0x21, 0x00, 0x91, 0x20, 0x00, 0xEE, 0x21, 0x00, 0xF8, 0x20, 0x00, 0xA7, 0x41, 0x00, 0x35, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x10, 0x20, 0x00, 0x6C, 0x20, 0x00, 0xEA, 0x41, 0x00, 0xFD, 0x20, 0x00, 0xC5, 0x21, 0x00, 0x25, 0x00, 0x00, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x05, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x21, 0x00, 0x4C, 0x21, 0x00, 0xD0, 0x21, 0x00, 0xF2, 0x21, 0x00, 0x94, 0x01, 0x08, 0x14, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x05, 0x00, 0x00, 0x00, 0x21, 0x00, 0x27, 0x21, 0x00, 0xD2, 0x41, 0x00, 0xFD, 0x20, 0x00, 0xE5, 0x21, 0x00, 0x5D, 0x00, 0x00, 0x07, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x41, 0x00, 0x34, 0x20, 0x00, 0xD0, 0x41, 0x00, 0xFF, 0x20, 0x00, 0xE3, 0x21, 0x00, 0x54, 0x02, 0x00, 0x0E, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x05, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x21, 0x00, 0x59, 0x20, 0x00, 0xEC, 0x21, 0x00, 0xFF, 0x20, 0x00, 0xAE, 0x20, 0x00, 0x22, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x02, 0x00, 0x0D, 0x21, 0x00, 0x55, 0x21, 0x00, 0xEC, 0x41, 0x00, 0xFF, 0x20, 0x00, 0xCD, 0x21, 0x00, 0x2A, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x05, 0x00, 0x00, 0x00, 0x61, 0x00, 0x13, 0x41, 0x00, 0x9F, 0x41, 0x00, 0xF8, 0x21, 0x00, 0xF2, 0x21, 0x00, 0xA2, 0x21, 0x00, 0x30, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x05, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x21, 0x00, 0x53, 0x21, 0x00, 0xDA, 0x21, 0x00, 0xFC, 0x20, 0x00, 0xA7, 0x20, 0x00, 0x28, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x21, 0x00, 0x30, 0x21, 0x00, 0xA2, 0x21, 0x00, 0xF1, 0x41, 0x00, 0xF7, 0x41, 0x00, 0x9F, 0x61, 0x00, 0x14, 0x00, 0x00, 0x01, 0x00, 0x00, 0x05, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x06, 0x40, 0x00, 0x57, 0x20, 0x00, 0xC5, 0x21, 0x00, 0xFB, 0x21, 0x00, 0xF0, 0x41, 0x00, 0x5C, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x05, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x05, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x21, 0x00, 0x54, 0x21, 0x00, 0xDD, 0x21, 0x00, 0xFF, 0x20, 0x00, 0xA9, 0x20, 0x00, 0x28, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x05, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x41, 0x00, 0x5C, 0x21, 0x00, 0xEF, 0x21, 0x00, 0xFA, 0x20, 0x00, 0xC4, 0x40, 0x00, 0x57, 0x00, 0x00, 0x07, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x04, 0x00, 0x00, 0x03, 0x41, 0x00, 0x19, 0x20, 0x00, 0x94, 0x41, 0x00, 0xFF, 0x41, 0x00, 0xFF, 0x20, 0x00, 0x8B, 0x41, 0x00, 0x17, 0x00, 0x00, 0x01, 0x00, 0x00, 0x03, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x05, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x21, 0x00, 0x54, 0x21, 0x00, 0xDE, 0x21, 0x00, 0xFF, 0x20, 0x00, 0xA9, 0x20, 0x00, 0x26, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x02, 0x00, 0x0E, 0x20, 0x00, 0x87, 0x41, 0x00, 0xFF, 0x41, 0x00, 0xFF, 0x21, 0x00, 0x9A, 0x41, 0x00, 0x19, 0x00, 0x00, 0x02, 0x00, 0x00, 0x02, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x06, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x20, 0x00, 0x65, 0x41, 0x00, 0xF6, 0x41, 0x00, 0xFF, 0x20, 0x00, 0xA9, 0x20, 0x00, 0x28, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x05, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x21, 0x00, 0x54, 0x21, 0x00, 0xDD, 0x21, 0x00, 0xFF, 0x20, 0x00, 0xA9, 0x20, 0x00, 0x28, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x08, 0x1A, 0x21, 0x00, 0x9C, 0x41, 0x00, 0xFD, 0x41, 0x00, 0xF2, 0x21, 0x00, 0x6D, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x06, 0x00, 0x00, 0x06, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x21, 0x00, 0x31, 0x21, 0x00, 0xA9, 0x21, 0x00, 0xFA, 0x41, 0x00, 0x9D, 0x00, 0x08, 0x10, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x05, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x21, 0x00, 0x53, 0x21, 0x00, 0xDA, 0x21, 0x00, 0xFC, 0x20, 0x00, 0xA7, 0x20, 0x00, 0x28, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x60, 0x08, 0x11, 0x21, 0x00, 0x8A, 0x21, 0x00, 0xDA, 0x41, 0x00, 0x95, 0x20, 0x00, 0x2E, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x05, 0x00, 0x00, 0x06, 0x00, 0x00, 0x04, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x02, 0x00, 0x0D, 0x41, 0x00, 0x3B, 0x20, 0x00, 0x6F, 0x20, 0x00, 0x43, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x05, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x21, 0x00, 0x59, 0x20, 0x00, 0xEC, 0x21, 0x00, 0xFF, 0x20, 0x00, 0xAE, 0x20, 0x00, 0x22, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x80, 0x01, 0x05, 0x21, 0x00, 0x39, 0x21, 0x00, 0x5B, 0x41, 0x00, 0x2E, 0x00, 0x00, 0x09, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x0A, 0x41, 0x08, 0x1E, 0x41, 0x08, 0x1F, 0x00, 0x00, 0x0C, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x05, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x21, 0x00, 0x4C, 0x21, 0x00, 0xD0, 0x21, 0x00, 0xF2, 0x21, 0x00, 0x94, 0x01, 0x08, 0x14, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x41, 0x00, 0x17, 0x20, 0x00, 0x21, 0x41, 0x08, 0x17, 0x00, 0x00, 0x07, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x21, 0x00, 0x46, 0x20, 0x00, 0xC8, 0x21, 0x00, 0xD5, 0x20, 0x00, 0x65, 0x0F, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x07, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x20, 0x00, 0x21, 0x21, 0x00, 0x69, 0x21, 0x00, 0x90, 0x21, 0x00, 0x4D, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x20, 0x00, 0x2E, 0x20, 0x00, 0xA4, 0x21, 0x00, 0xDD, 0x20, 0x00, 0x97, 0x40, 0x00, 0x2F, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0x21, 0x00, 0x61, 0x21, 0x00, 0xFF, 0x41, 0x00, 0xFF, 0x20, 0x00, 0xC3, 0x21, 0x00, 0x5D, 0x60, 0x00, 0x12, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x03, 0x00, 0x00, 0x06, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x05, 0x41, 0x00, 0x18, 0x21, 0x00, 0x2B, 0x61, 0x00, 0x13, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x05, 0x00, 0x00, 0x03, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x41, 0x00, 0x33, 0x41, 0x00, 0x9B, 0x41, 0x00, 0xF7, 0x41, 0x00, 0xFF, 0x20, 0x00, 0xC7, 0x20, 0x00, 0x40, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0x21, 0x00, 0x43, 0x20, 0x00, 0xCC, 0x41, 0x00, 0xF6, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xCD, 0x41, 0x00, 0x5D, 0x00, 0x00, 0x0C, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x21, 0x00, 0x31, 0x41, 0x00, 0x96, 0x21, 0x00, 0xFC, 0x41, 0x00, 0xFF, 0x20, 0x00, 0xE0, 0x20, 0x00, 0x83, 0x61, 0x00, 0x2A, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x0F, 0x20, 0x00, 0x60, 0x21, 0x00, 0xCC, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFA, 0x20, 0x00, 0xC8, 0x20, 0x00, 0x69, 0x0A, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x03, 0x00, 0x00, 0x04, 0x00, 0x00, 0x05, 0x00, 0x00, 0x06, 0x00, 0x00, 0x06, 0x00, 0x00, 0x04, 0x00, 0x00, 0x02, 0x00, 0x00, 0x04, 0x00, 0x00, 0x06, 0x00, 0x00, 0x05, 0x00, 0x00, 0x04, 0x00, 0x00, 0x04, 0x00, 0x00, 0x02, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x20, 0x08, 0x31, 0x21, 0x00, 0x9F, 0x21, 0x00, 0xF1, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xEE, 0x21, 0x00, 0x9A, 0x21, 0x00, 0x23, 0x00, 0x00, 0x06, 0x00, 0x00, 0x04, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0x00, 0x00, 0x02, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x60, 0x08, 0x12, 0x20, 0x00, 0x66, 0x20, 0x00, 0xC9, 0x41, 0x00, 0xFF, 0x41, 0x00, 0xFF, 0x20, 0x00, 0xC5, 0x21, 0x00, 0x5B, 0x41, 0x00, 0x16, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x04, 0x00, 0x00, 0x05, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x05, 0x00, 0x00, 0x03, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x07, 0x41, 0x00, 0x34, 0x40, 0x00, 0x9C, 0x21, 0x00, 0xEB, 0x41, 0x00, 0xFF, 0x21, 0x00, 0xEC, 0x20, 0x00, 0x93, 0x21, 0x00, 0x35, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x04, 0x00, 0x00, 0x04, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x82, 0x10, 0x0F, 0x20, 0x00, 0x62, 0x20, 0x00, 0xD6, 0x41, 0x00, 0xFA, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xD4, 0x21, 0x00, 0x59, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0xE0, 0x18, 0x09, 0x61, 0x08, 0x11, 0x41, 0x08, 0x18, 0x20, 0x00, 0x20, 0x20, 0x00, 0x21, 0x20, 0x00, 0x20, 0x20, 0x00, 0x21, 0x20, 0x00, 0x21, 0x20, 0x00, 0x20, 0x41, 0x08, 0x1A, 0x61, 0x08, 0x15, 0x82, 0x10, 0x0F, 0x00, 0x00, 0x06, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x20, 0x00, 0x2A, 0x41, 0x00, 0x97, 0x21, 0x00, 0xFF, 0x41, 0x00, 0xFF, 0x21, 0x00, 0xE7, 0x21, 0x00, 0x9D, 0x20, 0x00, 0x31, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x05, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x05, 0x00, 0x00, 0x04, 0x00, 0x00, 0x02, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x10, 0x20, 0x00, 0x61, 0x21, 0x00, 0xCB, 0x21, 0x00, 0xFF, 0x41, 0x00, 0xFF, 0x21, 0x00, 0x98, 0x01, 0x08, 0x18, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x02, 0x00, 0x00, 0x06, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x40, 0x08, 0x16, 0x41, 0x08, 0x57, 0x41, 0x08, 0x86, 0x41, 0x08, 0xAC, 0x41, 0x08, 0xD8, 0x41, 0x08, 0xDE, 0x61, 0x08, 0xDC, 0x61, 0x08, 0xDD, 0x61, 0x08, 0xDE, 0x41, 0x08, 0xD9, 0x61, 0x08, 0xB8, 0x41, 0x08, 0x9B, 0x41, 0x08, 0x79, 0x20, 0x00, 0x46, 0x00, 0x18, 0x0A, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x04, 0x00, 0x00, 0x01, 0x00, 0x00, 0x05, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x21, 0x00, 0x54, 0x21, 0x00, 0xDC, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xF6, 0x21, 0x00, 0x99, 0x21, 0x00, 0x24, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x03, 0x00, 0x00, 0x05, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x0D, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x05, 0x00, 0x00, 0x03, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x08, 0x12, 0x20, 0x00, 0x61, 0x21, 0x00, 0xAD, 0x21, 0x00, 0xC2, 0x21, 0x00, 0x73, 0x02, 0x10, 0x0F, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0xE0, 0x01, 0x04, 0x20, 0x08, 0x4A, 0x61, 0x08, 0x7B, 0x61, 0x08, 0x9B, 0x20, 0x00, 0xC5, 0x00, 0x00, 0xE1, 0x00, 0x00, 0xFB, 0x00, 0x00, 0xFF, 0x00, 0x00, 0xFF, 0x00, 0x00, 0xFF, 0x00, 0x00, 0xFF, 0x00, 0x00, 0xFF, 0x00, 0x00, 0xFF, 0x00, 0x00, 0xFF, 0x00, 0x00, 0xEF, 0x00, 0x00, 0xDB, 0x41, 0x08, 0xB9, 0x61, 0x08, 0x91, 0x61, 0x08, 0x63, 0x41, 0x00, 0x2C, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x08, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x20, 0x00, 0x40, 0x20, 0x00, 0xA4, 0x21, 0x00, 0xBC, 0x20, 0x00, 0x8B, 0x21, 0x00, 0x34, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x06, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x04, 0x00, 0x00, 0x05, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x40, 0x08, 0x17, 0x20, 0x00, 0x43, 0x00, 0x00, 0x4A, 0x41, 0x00, 0x1F, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x26, 0x21, 0x00, 0x5A, 0x20, 0x00, 0x63, 0x41, 0x00, 0x3D, 0x41, 0x00, 0x19, 0x02, 0x00, 0x0E, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0xA2, 0x00, 0x0C, 0x20, 0x00, 0x35, 0x20, 0x00, 0x4B, 0x60, 0x00, 0x21, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x06, 0x41, 0x08, 0x17, 0x41, 0x00, 0x53, 0x20, 0x00, 0xC0, 0x00, 0x00, 0xFF, 0x00, 0x00, 0xFF, 0x41, 0x00, 0xFF, 0x61, 0x08, 0xFF, 0xA1, 0x10, 0xFE, 0xC2, 0x18, 0xF9, 0xE2, 0x20, 0xF9, 0xE2, 0x20, 0xF9, 0xE2, 0x20, 0xF9, 0xE2, 0x20, 0xF9, 0xE2, 0x20, 0xF9, 0xC1, 0x18, 0xFD, 0x81, 0x10, 0xFF, 0x41, 0x08, 0xFF, 0x20, 0x00, 0xFF, 0x00, 0x00, 0xFF, 0x20, 0x00, 0xE7, 0x41, 0x00, 0x92, 0x41, 0x08, 0x3E, 0x00, 0x00, 0x0F, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x61, 0x00, 0x10, 0x20, 0x00, 0x35, 0x20, 0x00, 0x4C, 0x41, 0x08, 0x1E, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x0A, 0x41, 0x00, 0x16, 0x41, 0x08, 0x31, 0x40, 0x00, 0x72, 0x21, 0x00, 0xBB, 0x20, 0x00, 0xCD, 0x20, 0x00, 0x60, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x05, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x05, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x20, 0x00, 0x6E, 0x20, 0x00, 0xEE, 0x20, 0x00, 0xE6, 0x21, 0x00, 0xD3, 0x21, 0x00, 0xB1, 0x21, 0x00, 0x75, 0x20, 0x08, 0x32, 0x00, 0x78, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x03, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x07, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x05, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x21, 0x00, 0x3E, 0x41, 0x00, 0xA6, 0x41, 0x08, 0xE7, 0x41, 0x00, 0xFA, 0x00, 0x00, 0xFF, 0x00, 0x00, 0xFF, 0x02, 0x29, 0xFF, 0x44, 0x5A, 0xFF, 0x46, 0x8B, 0xFF, 0x47, 0xB4, 0xFE, 0xE8, 0xCC, 0xFE, 0x09, 0xDD, 0xFE, 0x09, 0xD5, 0xFE, 0x29, 0xDD, 0xFE, 0xE8, 0xD4, 0xFE, 0x07, 0xAC, 0xFF, 0x05, 0x7B, 0xFF, 0xA3, 0x41, 0xFF, 0x41, 0x08, 0xFF, 0x00, 0x00, 0xFF, 0x20, 0x00, 0xFF, 0x41, 0x08, 0xF2, 0x41, 0x08, 0xCE, 0x20, 0x00, 0x79, 0x00, 0x00, 0x10, 0x00, 0x00, 0x00, 0x00, 0x00, 0x07, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x07, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x41, 0x08, 0x1A, 0x40, 0x00, 0x5B, 0x20, 0x00, 0xA0, 0x21, 0x00, 0xD6, 0x20, 0x00, 0xE8, 0x21, 0x00, 0xFB, 0x41, 0x00, 0xFF, 0x20, 0x00, 0x85, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x06, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x21, 0x00, 0x5E, 0x21, 0x00, 0xE8, 0x41, 0x00, 0xFF, 0x41, 0x00, 0xFF, 0x41, 0x00, 0xFF, 0x21, 0x00, 0xDC, 0x20, 0x00, 0xAA, 0x20, 0x00, 0x85, 0x21, 0x00, 0x57, 0x60, 0x00, 0x2A, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x14, 0x41, 0x08, 0x59, 0x41, 0x08, 0xB0, 0x00, 0x00, 0xF8, 0x00, 0x00, 0xFF, 0x61, 0x08, 0xFF, 0x83, 0x41, 0xF9, 0xE5, 0x7A, 0xFA, 0xE7, 0xA3, 0xFC, 0xA8, 0xC4, 0xFD, 0x49, 0xE5, 0xFE, 0xEA, 0xFD, 0xFF, 0x4B, 0xFE, 0xFF, 0x6B, 0xFE, 0xFF, 0x6B, 0xFE, 0xFF, 0x8B, 0xFE, 0xFF, 0x4B, 0xFE, 0xFF, 0xCA, 0xF5, 0xFE, 0x09, 0xD5, 0xFD, 0x47, 0xB4, 0xFC, 0x46, 0x8B, 0xFB, 0x44, 0x5A, 0xF9, 0x02, 0x21, 0xFF, 0x00, 0x00, 0xFF, 0x00, 0x00, 0xFF, 0x41, 0x08, 0xDB, 0x40, 0x00, 0x84, 0x20, 0x00, 0x26, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x08, 0x1B, 0x21, 0x00, 0x4C, 0x20, 0x00, 0x71, 0x41, 0x00, 0x99, 0x20, 0x00, 0xC8, 0x21, 0x00, 0xFF, 0x41, 0x00, 0xFF, 0x41, 0x00, 0xFF, 0x20, 0x00, 0xEF, 0x41, 0x00, 0xB7, 0x41, 0x00, 0x4F, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x42, 0x08, 0x1D, 0x21, 0x00, 0x69, 0x41, 0x00, 0xBE, 0x20, 0x00, 0xE0, 0x21, 0x00, 0xEE, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x41, 0x00, 0xFF, 0x21, 0x00, 0xDD, 0x40, 0x00, 0x93, 0x41, 0x00, 0x4F, 0x41, 0x00, 0x17, 0x00, 0x00, 0x06, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x02, 0x00, 0x00, 0x03, 0x00, 0x00, 0x05, 0x00, 0x00, 0x00, 0x00, 0x00, 0x08, 0x41, 0x00, 0x5A, 0x20, 0x00, 0xCF, 0x20, 0x00, 0xFF, 0x20, 0x00, 0xFE, 0xA1, 0x18, 0xF8, 0x24, 0x52, 0xFD, 0x47, 0xB4, 0xFF, 0xEA, 0xFD, 0xFF, 0x2A, 0xFE, 0xFF, 0xEA, 0xFD, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xAA, 0xF5, 0xFF, 0xAA, 0xF5, 0xFF, 0xAA, 0xF5, 0xFF, 0xAA, 0xF5, 0xFF, 0xAA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xEA, 0xFD, 0xFF, 0x0A, 0xFE, 0xFF, 0x0A, 0xFE, 0xFF, 0x09, 0xD5, 0xFF, 0x05, 0x83, 0xFE, 0x02, 0x29, 0xFB, 0x21, 0x08, 0xFC, 0x20, 0x00, 0xFF, 0x20, 0x00, 0xF6, 0x40, 0x00, 0x87, 0x01, 0x00, 0x14, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x02, 0x00, 0x00, 0x03, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x02, 0x00, 0x00, 0x18, 0x21, 0x00, 0x77, 0x21, 0x00, 0xCD, 0x21, 0x00, 0xFF, 0x41, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x20, 0x00, 0xF3, 0x20, 0x00, 0xE1, 0x20, 0x00, 0xC9, 0x20, 0x00, 0x8D, 0x21, 0x00, 0x39, 0x24, 0x01, 0x07, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x04, 0x02, 0x00, 0x0C, 0x41, 0x08, 0x1B, 0x20, 0x00, 0x46, 0x21, 0x00, 0x8D, 0x21, 0x00, 0xCD, 0x21, 0x00, 0xFF, 0x41, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x20, 0x00, 0xF3, 0x21, 0x00, 0xDA, 0x21, 0x00, 0x7A, 0x21, 0x00, 0x23, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x02, 0x00, 0x00, 0x06, 0x20, 0x00, 0x4E, 0x41, 0x08, 0xBB, 0x20, 0x00, 0xFD, 0x00, 0x00, 0xFF, 0x02, 0x29, 0xFE, 0x46, 0x8B, 0xFE, 0x29, 0xDD, 0xFF, 0xEA, 0xFD, 0xFF, 0xEA, 0xFD, 0xFF, 0xEA, 0xFD, 0xFF, 0xEA, 0xFD, 0xFF, 0xEA, 0xFD, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xEA, 0xFD, 0xFF, 0xEA, 0xFD, 0xFF, 0xEA, 0xFD, 0xFF, 0xCA, 0xF5, 0xFF, 0x89, 0xED, 0xFF, 0x88, 0xC4, 0xFE, 0xE4, 0x51, 0xFE, 0x00, 0x00, 0xFF, 0x20, 0x00, 0xFF, 0x41, 0x08, 0xED, 0x20, 0x00, 0x97, 0x02, 0x08, 0x1B, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x0A, 0x41, 0x00, 0x58, 0x20, 0x00, 0xE0, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x41, 0x00, 0xFF, 0x20, 0x00, 0xE5, 0x20, 0x00, 0x98, 0x20, 0x00, 0x4B, 0x20, 0x00, 0x23, 0x61, 0x00, 0x13, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x21, 0x00, 0x28, 0x21, 0x00, 0x4D, 0x20, 0x00, 0x6F, 0x20, 0x00, 0x97, 0x20, 0x00, 0xCC, 0x21, 0x00, 0xFF, 0x21, 0x00, 0xFB, 0x21, 0x00, 0x93, 0x21, 0x00, 0x28, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x20, 0x00, 0x27, 0x41, 0x08, 0xB0, 0x20, 0x00, 0xF4, 0x21, 0x00, 0xFF, 0x42, 0x31, 0xFB, 0x66, 0x8B, 0xFC, 0x49, 0xE5, 0xFF, 0x2B, 0xFE, 0xFF, 0x0A, 0xFE, 0xFF, 0xAA, 0xF5, 0xFF, 0xAA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xAA, 0xF5, 0xFF, 0xAA, 0xF5, 0xFF, 0xCA, 0xFD, 0xFF, 0x2A, 0xFE, 0xFF, 0x0A, 0xFE, 0xFF, 0x68, 0xBC, 0xFE, 0xE4, 0x51, 0xFC, 0x21, 0x00, 0xFB, 0x00, 0x00, 0xFF, 0x41, 0x08, 0xE8, 0x41, 0x00, 0x63, 0x01, 0x00, 0x15, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x07, 0x20, 0x00, 0x4C, 0x20, 0x00, 0xC9, 0x21, 0x00, 0xD5, 0x21, 0x00, 0xAC, 0x20, 0x00, 0x84, 0x41, 0x00, 0x5B, 0x20, 0x00, 0x2E, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x03, 0x00, 0x00, 0x06, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x08, 0x18, 0x20, 0x00, 0x5F, 0x21, 0x00, 0x9C, 0x21, 0x00, 0x94, 0x21, 0x00, 0x53, 0x61, 0x08, 0x15, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x14, 0x41, 0x00, 0x75, 0x41, 0x08, 0xF4, 0x00, 0x00, 0xFF, 0xC1, 0x18, 0xF8, 0xA6, 0x93, 0xFE, 0x8A, 0xED, 0xFF, 0xEA, 0xFD, 0xFF, 0xCA, 0xF5, 0xFF, 0xAA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xAA, 0xF5, 0xFF, 0xEA, 0xFD, 0xFF, 0xA8, 0xC4, 0xFF, 0xA3, 0x41, 0xFC, 0x20, 0x00, 0xFB, 0x21, 0x00, 0xF8, 0x20, 0x00, 0xBD, 0x41, 0x08, 0x48, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x41, 0x00, 0x16, 0x21, 0x00, 0x57, 0x20, 0x00, 0x68, 0x21, 0x00, 0x38, 0x00, 0x00, 0x05, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x05, 0x00, 0x00, 0x04, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x0A, 0x61, 0x00, 0x15, 0x61, 0x00, 0x14, 0x00, 0x00, 0x0B, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x05, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x40, 0x08, 0x52, 0x20, 0x00, 0xD6, 0x41, 0x00, 0xFF, 0x61, 0x08, 0xFF, 0x04, 0x52, 0xFD, 0x29, 0xDD, 0xFF, 0x2B, 0xFE, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0x0A, 0xFE, 0xFF, 0xAA, 0xF5, 0xFF, 0x68, 0xBC, 0xFE, 0xC3, 0x49, 0xFA, 0x00, 0x00, 0xFF, 0x00, 0x00, 0xF9, 0x61, 0x08, 0x84, 0x00, 0xF8, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x0A, 0x00, 0x00, 0x0C, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x03, 0x00, 0x00, 0x04, 0x00, 0x00, 0x05, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x61, 0x08, 0x14, 0x61, 0x08, 0x8C, 0x00, 0x00, 0xFF, 0x00, 0x00, 0xFE, 0xC3, 0x41, 0xFC, 0x68, 0xBC, 0xFF, 0xCA, 0xFD, 0xFF, 0xEA, 0xFD, 0xFF, 0xAA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xAA, 0xF5, 0xFF, 0xEA, 0xFD, 0xFF, 0xCA, 0xF5, 0xFF, 0x46, 0x8B, 0xFB, 0x81, 0x10, 0xFE, 0x20, 0x00, 0xFF, 0x21, 0x00, 0xBF, 0x41, 0x08, 0x3E, 0x20, 0x21, 0x07, 0x00, 0x00, 0x02, 0x00, 0x00, 0x02, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x05, 0x00, 0x00, 0x03, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x03, 0x00, 0x00, 0x05, 0x00, 0x00, 0x04, 0x00, 0x00, 0x03, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x05, 0x40, 0x00, 0x46, 0x41, 0x08, 0xBB, 0x20, 0x00, 0xFE, 0x41, 0x08, 0xFE, 0x46, 0x8B, 0xFB, 0x2A, 0xFE, 0xFF, 0xEA, 0xFD, 0xFF, 0xAA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0x0A, 0xFE, 0xFF, 0x0A, 0xFE, 0xFF, 0xA8, 0xC4, 0xFE, 0x44, 0x5A, 0xFF, 0x61, 0x08, 0xFC, 0x00, 0x00, 0xE9, 0x41, 0x08, 0x98, 0x61, 0x08, 0x14, 0x00, 0x00, 0x00, 0x00, 0x00, 0x05, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x03, 0x00, 0x00, 0x03, 0x00, 0x00, 0x02, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0x61, 0x08, 0x11, 0x40, 0x00, 0x84, 0x00, 0x00, 0xE4, 0x41, 0x08, 0xFF, 0xA3, 0x41, 0xFF, 0x47, 0xB4, 0xFC, 0x2B, 0xFE, 0xFF, 0xEA, 0xFD, 0xFF, 0xAA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xAA, 0xF5, 0xFF, 0xAA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0x0A, 0xFE, 0xFF, 0x0A, 0xFE, 0xFF, 0xEA, 0xFD, 0xFF, 0x07, 0xAC, 0xFE, 0xC1, 0x18, 0xF9, 0x00, 0x00, 0xFE, 0x41, 0x08, 0xD9, 0x21, 0x00, 0x2A, 0x00, 0x00, 0x03, 0x00, 0x00, 0x0A, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x02, 0x00, 0x00, 0x03, 0x00, 0x00, 0x03, 0x00, 0x00, 0x03, 0x00, 0x00, 0x03, 0x00, 0x00, 0x03, 0x00, 0x00, 0x03, 0x00, 0x00, 0x03, 0x00, 0x00, 0x03, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x05, 0x00, 0x00, 0x00, 0x41, 0x08, 0x17, 0x41, 0x08, 0xB7, 0x00, 0x00, 0xF9, 0x81, 0x10, 0xFC, 0x26, 0x83, 0xFF, 0x29, 0xDD, 0xFE, 0xCA, 0xF5, 0xFF, 0xEA, 0xFD, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xAA, 0xF5, 0xFF, 0xEA, 0xFD, 0xFF, 0x2B, 0xFE, 0xFF, 0x4B, 0xFE, 0xFF, 0xAA, 0xED, 0xFF, 0xC8, 0xCC, 0xFF, 0x88, 0xBC, 0xFF, 0x88, 0xBC, 0xFF, 0x26, 0x83, 0xFE, 0xA2, 0x18, 0xF9, 0x20, 0x00, 0xFF, 0x41, 0x08, 0xED, 0x41, 0x00, 0x4A, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x06, 0x00, 0x00, 0x00, 0x20, 0x00, 0x22, 0x61, 0x08, 0xD4, 0x00, 0x00, 0xFF, 0xC2, 0x18, 0xF9, 0x47, 0xB4, 0xFF, 0xEA, 0xFD, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xEA, 0xFD, 0xFF, 0xEA, 0xFD, 0xFF, 0xCA, 0xF5, 0xFF, 0x69, 0xE5, 0xFF, 0x09, 0xD5, 0xFF, 0xC6, 0x9B, 0xFF, 0x84, 0x6A, 0xFF, 0x03, 0x52, 0xFF, 0x82, 0x39, 0xFF, 0xC1, 0x18, 0xFE, 0x00, 0x00, 0xFC, 0x00, 0x00, 0xFE, 0x20, 0x00, 0xEF, 0x20, 0x00, 0x92, 0x41, 0x08, 0x3A, 0x61, 0x08, 0x12, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0x41, 0x08, 0x39, 0x41, 0x08, 0xE3, 0x00, 0x00, 0xFF, 0x22, 0x29, 0xF9, 0x09, 0xD5, 0xFE, 0x4B, 0xFE, 0xFF, 0xAA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xAA, 0xF5, 0xFF, 0xAA, 0xF5, 0xFF, 0xAA, 0xF5, 0xFF, 0xAA, 0xF5, 0xFF, 0xAA, 0xF5, 0xFF, 0xAA, 0xF5, 0xFF, 0xAA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xAA, 0xF5, 0xFF, 0xEA, 0xFD, 0xFF, 0x0A, 0xFE, 0xFF, 0xC8, 0xCC, 0xFF, 0xC5, 0x72, 0xFF, 0x43, 0x29, 0xFF, 0xA2, 0x18, 0xFF, 0x81, 0x10, 0xFF, 0x40, 0x08, 0xFF, 0x00, 0x00, 0xFF, 0x00, 0x00, 0xFF, 0x00, 0x00, 0xFF, 0x00, 0x00, 0xFD, 0x20, 0x00, 0xFD, 0x41, 0x08, 0xF1, 0x41, 0x08, 0xD2, 0x41, 0x08, 0x8F, 0x21, 0x00, 0x3A, 0x00, 0x00, 0x05, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x05, 0x00, 0x00, 0x04, 0x00, 0x00, 0x05, 0x00, 0x00, 0x05, 0x00, 0x00, 0x05, 0x00, 0x00, 0x05, 0x00, 0x00, 0x05, 0x00, 0x00, 0x04, 0x00, 0x00, 0x02, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x0A, 0x01, 0x08, 0x1D, 0x40, 0x00, 0x2D, 0x40, 0x00, 0x31, 0x40, 0x00, 0x2E, 0x40, 0x00, 0x2F, 0x40, 0x00, 0x2F, 0x40, 0x00, 0x2F, 0x40, 0x00, 0x2F, 0x20, 0x00, 0x31, 0x41, 0x08, 0x1D, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0x86, 0x31, 0x05, 0x20, 0x00, 0x52, 0x40, 0x00, 0xE7, 0x41, 0x08, 0xFE, 0xC3, 0x49, 0xFA, 0x49, 0xE5, 0xFE, 0x4B, 0xFE, 0xFF, 0xAA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xAA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xEA, 0xFD, 0xFF, 0x2A, 0xFE, 0xFF, 0x2B, 0xFE, 0xFF, 0x4B, 0xFE, 0xFF, 0x6B, 0xFE, 0xFF, 0x4B, 0xFE, 0xFF, 0x2B, 0xFE, 0xFF, 0x2B, 0xFE, 0xFF, 0x0A, 0xFE, 0xFF, 0x0A, 0xFE, 0xFF, 0x69, 0xE5, 0xFF, 0xA6, 0x9B, 0xFF, 0x24, 0x5A, 0xFF, 0xA1, 0x18, 0xFF, 0x00, 0x00, 0xFF, 0x00, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x25, 0x21, 0xFF, 0x49, 0x42, 0xFF, 0xCB, 0x52, 0xFF, 0x6A, 0x42, 0xFF, 0xC7, 0x31, 0xFE, 0xC3, 0x18, 0xFF, 0x00, 0x00, 0xFF, 0x00, 0x00, 0xFF, 0x20, 0x00, 0xE9, 0x41, 0x08, 0xB3, 0x61, 0x08, 0x61, 0x00, 0x00, 0x12, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x04, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x20, 0x00, 0x2F, 0x21, 0x00, 0x7A, 0x41, 0x00, 0x9C, 0x20, 0x00, 0xA2, 0x41, 0x00, 0x9E, 0x41, 0x00, 0x9F, 0x41, 0x00, 0x9F, 0x41, 0x00, 0x9F, 0x41, 0x00, 0x9D, 0x20, 0x00, 0xA3, 0x41, 0x00, 0x7F, 0x41, 0x00, 0x1D, 0x00, 0x00, 0x02, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x42, 0x29, 0x0C, 0x00, 0x00, 0x60, 0x20, 0x00, 0xE9, 0x81, 0x10, 0xFF, 0x64, 0x62, 0xFA, 0x49, 0xE5, 0xFE, 0x2B, 0xFE, 0xFF, 0xAA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xFD, 0xFF, 0xEA, 0xFD, 0xFF, 0xEA, 0xFD, 0xFF, 0xAA, 0xF5, 0xFF, 0x69, 0xE5, 0xFF, 0x69, 0xE5, 0xFF, 0x29, 0xDD, 0xFF, 0x29, 0xDD, 0xFF, 0x49, 0xE5, 0xFF, 0x49, 0xE5, 0xFF, 0x69, 0xE5, 0xFE, 0xAA, 0xED, 0xFC, 0x49, 0xE5, 0xFD, 0x86, 0x93, 0xFF, 0xE2, 0x20, 0xFF, 0x00, 0x00, 0xFF, 0x20, 0x00, 0xFF, 0xC3, 0x18, 0xFF, 0xA6, 0x31, 0xFF, 0xEB, 0x52, 0xFF, 0x71, 0x84, 0xFF, 0xD8, 0xB5, 0xFF, 0x9A, 0xC6, 0xFF, 0xD8, 0xB5, 0xFF, 0xD3, 0x94, 0xFF, 0x6E, 0x6B, 0xFF, 0xC7, 0x31, 0xFC, 0xC3, 0x10, 0xF8, 0x41, 0x08, 0xFF, 0x00, 0x00, 0xFF, 0x20, 0x00, 0xD0, 0x41, 0x00, 0x61, 0x61, 0x08, 0x11, 0x00, 0x00, 0x08, 0x61, 0x08, 0x12, 0x61, 0x08, 0x15, 0x41, 0x08, 0x17, 0x41, 0x08, 0x16, 0x41, 0x08, 0x16, 0x61, 0x08, 0x15, 0x82, 0x10, 0x0F, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x05, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x21, 0x00, 0x58, 0x21, 0x00, 0xD6, 0x21, 0x00, 0xFA, 0x21, 0x00, 0xFA, 0x21, 0x00, 0xF9, 0x21, 0x00, 0xFB, 0x21, 0x00, 0xFB, 0x21, 0x00, 0xFA, 0x21, 0x00, 0xF6, 0x41, 0x00, 0xFC, 0x20, 0x00, 0xE5, 0x41, 0x00, 0x5B, 0x00, 0x00, 0x0B, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x42, 0x29, 0x0C, 0x00, 0x00, 0x5E, 0x20, 0x00, 0xE9, 0x61, 0x08, 0xFF, 0x44, 0x5A, 0xFA, 0x49, 0xE5, 0xFE, 0x4B, 0xFE, 0xFF, 0xAA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xAA, 0xF5, 0xFF, 0xCA, 0xFD, 0xFF, 0x0A, 0xFE, 0xFF, 0xCA, 0xF5, 0xFF, 0x88, 0xBC, 0xFF, 0x05, 0x7B, 0xFF, 0x85, 0x62, 0xFF, 0xC4, 0x41, 0xFF, 0x63, 0x39, 0xFF, 0x44, 0x5A, 0xFF, 0x85, 0x62, 0xFF, 0xE5, 0x7A, 0xFC, 0xE7, 0xA3, 0xF1, 0xA5, 0x6A, 0xF5, 0xC2, 0x18, 0xFF, 0x41, 0x00, 0xFF, 0x00, 0x00, 0xFF, 0x04, 0x19, 0xFF, 0x31, 0x7C, 0xFF, 0x5A, 0xC6, 0xFF, 0xFC, 0xD6, 0xFF, 0x5E, 0xDF, 0xFF, 0x7E, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x7F, 0xE7, 0xFF, 0x3E, 0xDF, 0xFF, 0x3D, 0xDF, 0xFF, 0xBB, 0xCE, 0xFF, 0x72, 0x84, 0xFE, 0xA7, 0x31, 0xFF, 0x20, 0x00, 0xFF, 0x00, 0x00, 0xFD, 0x61, 0x08, 0xD8, 0x61, 0x08, 0x67, 0x61, 0x08, 0x50, 0x61, 0x08, 0x7F, 0x61, 0x08, 0x9D, 0x61, 0x08, 0xA5, 0x61, 0x08, 0xA1, 0x61, 0x08, 0xA1, 0x61, 0x08, 0x9B, 0x41, 0x08, 0x77, 0x41, 0x00, 0x38, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x05, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x21, 0x00, 0x3A, 0x21, 0x00, 0x9D, 0x21, 0x00, 0xD4, 0x21, 0x00, 0xDD, 0x21, 0x00, 0xD6, 0x21, 0x00, 0xD9, 0x21, 0x00, 0xD8, 0x21, 0x00, 0xD9, 0x21, 0x00, 0xD6, 0x41, 0x00, 0xD5, 0x21, 0x00, 0xB3, 0x41, 0x00, 0x3E, 0x00, 0x00, 0x07, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x22, 0x21, 0x0D, 0x00, 0x00, 0x62, 0x20, 0x00, 0xE9, 0x81, 0x10, 0xFF, 0x64, 0x62, 0xFA, 0x49, 0xE5, 0xFE, 0x2B, 0xFE, 0xFF, 0xAA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xAA, 0xF5, 0xFF, 0xEA, 0xFD, 0xFF, 0x2B, 0xFE, 0xFF, 0x89, 0xED, 0xFF, 0x27, 0xB4, 0xFF, 0xE5, 0x7A, 0xFF, 0xC3, 0x49, 0xFF, 0xC1, 0x18, 0xFF, 0x00, 0x00, 0xFF, 0x00, 0x00, 0xFF, 0x00, 0x00, 0xFF, 0x00, 0x00, 0xFF, 0x00, 0x00, 0xFF, 0x60, 0x10, 0xFD, 0x62, 0x39, 0xF6, 0xC2, 0x18, 0xF9, 0x00, 0x00, 0xFF, 0x00, 0x00, 0xFF, 0x08, 0x3A, 0xFF, 0xF4, 0x94, 0xFF, 0xFC, 0xD6, 0xFF, 0xFF, 0xF7, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xF7, 0xFF, 0xBF, 0xEF, 0xFF, 0xBF, 0xEF, 0xFF, 0xDF, 0xEF, 0xFF, 0xDF, 0xEF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0x3D, 0xDF, 0xFF, 0xF4, 0x94, 0xFD, 0x29, 0x42, 0xF8, 0x61, 0x08, 0xFF, 0x00, 0x00, 0xFF, 0x00, 0x00, 0xCE, 0x20, 0x00, 0xC0, 0x00, 0x00, 0xDE, 0x00, 0x00, 0xF2, 0x00, 0x00, 0xF7, 0x00, 0x00, 0xF4, 0x00, 0x00, 0xF4, 0x00, 0x00, 0xEF, 0x00, 0x00, 0xD9, 0x41, 0x00, 0xB1, 0x61, 0x08, 0x85, 0x21, 0x00, 0x48, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x06, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x05, 0x00, 0x06, 0x00, 0x00, 0x27, 0x41, 0x00, 0x5B, 0x20, 0x00, 0x6A, 0x20, 0x00, 0x60, 0x20, 0x00, 0x62, 0x20, 0x00, 0x61, 0x20, 0x00, 0x63, 0x20, 0x00, 0x63, 0x41, 0x00, 0x5E, 0x41, 0x00, 0x37, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0xC3, 0x39, 0x09, 0x00, 0x00, 0x59, 0x20, 0x00, 0xE9, 0x61, 0x08, 0xFF, 0x24, 0x52, 0xFA, 0x69, 0xE5, 0xFE, 0x4B, 0xFE, 0xFF, 0xAA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xCA, 0xF5, 0xFF, 0xEA, 0xFD, 0xFF, 0xAA, 0xF5, 0xFF, 0xE7, 0xA3, 0xFF, 0x83, 0x39, 0xFF, 0x00, 0x00, 0xFF, 0x00, 0x00, 0xFF, 0x61, 0x08, 0xFF, 0xA3, 0x10, 0xFF, 0xE4, 0x18, 0xFF, 0x04, 0x19, 0xFF, 0xE3, 0x18, 0xFF, 0xC3, 0x10, 0xFF, 0x62, 0x08, 0xFF, 0x00, 0x00, 0xFF, 0x00, 0x00, 0xFF, 0x41, 0x08, 0xFF, 0xC7, 0x31, 0xFF, 0x55, 0xA5, 0xFF, 0xFF, 0xF7, 0xFF, 0xDF, 0xEF, 0xFF, 0x7E, 0xE7, 0xFF, 0x7E, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x7F, 0xE7, 0xFF, 0x5E, 0xDF, 0xFF, 0xFF, 0xF7, 0xFF, 0xBF, 0xEF, 0xFF, 0x76, 0xA5, 0xFF, 0x29, 0x42, 0xFD, 0x20, 0x00, 0xFC, 0x20, 0x00, 0xFF, 0x61, 0x08, 0xFF, 0x62, 0x08, 0xFF, 0xA3, 0x10, 0xFF, 0xC3, 0x18, 0xFF, 0xE3, 0x18, 0xFF, 0xE3, 0x18, 0xFF, 0xA3, 0x10, 0xFE, 0x61, 0x08, 0xFF, 0x00, 0x00, 0xFF, 0x00, 0x00, 0xFF, 0x20, 0x00, 0xBD, 0x41, 0x00, 0x3F, 0x00, 0x00, 0x08, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x0A, 0x00, 0x00, 0x0C, 0x00, 0x00, 0x0B, 0x00, 0x00, 0x0B, 0x00, 0x00, 0x0B, 0x00, 0x00, 0x0B, 0x00, 0x00, 0x0B, 0x00, 0x00, 0x0A, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x01, 0x21, 0x00, 0x37, 0x61, 0x08, 0xE3, 0x00, 0x00, 0xFE, 0x22, 0x29, 0xF9, 0x29, 0xDD, 0xFE, 0x6B, 0xFE, 0xFF, 0xAA, 0xED, 0xFF, 0xAA, 0xED, 0xFF, 0x2B, 0xFE, 0xFF, 0xAA, 0xED, 0xFF, 0x86, 0x93, 0xFF, 0x63, 0x39, 0xFF, 0x21, 0x00, 0xFF, 0x00, 0x00, 0xFF, 0x62, 0x08, 0xFF, 0x29, 0x42, 0xFF, 0x11, 0x7C, 0xFF, 0x35, 0x9D, 0xFF, 0x56, 0xA5, 0xFF, 0xF4, 0x94, 0xFF, 0x72, 0x84, 0xFF, 0x0C, 0x5B, 0xFF, 0xE3, 0x10, 0xFF, 0x00, 0x00, 0xFF, 0xA7, 0x31, 0xFF, 0xB7, 0xAD, 0xFF, 0xBE, 0xEF, 0xFF, 0xBF, 0xEF, 0xFF, 0xBF, 0xEF, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0xBF, 0xEF, 0xFF, 0xFF, 0xF7, 0xFF, 0xBF, 0xEF, 0xFF, 0x15, 0x9D, 0xFF, 0x29, 0x42, 0xFF, 0x65, 0x29, 0xFF, 0x86, 0x29, 0xFF, 0xAB, 0x4A, 0xFF, 0x31, 0x7C, 0xFF, 0xD4, 0x94, 0xFF, 0xF4, 0x94, 0xFF, 0x14, 0x9D, 0xFF, 0x11, 0x7C, 0xFF, 0x29, 0x42, 0xFF, 0x61, 0x08, 0xFF, 0x00, 0x00, 0xFF, 0x41, 0x00, 0xFA, 0x20, 0x00, 0xCB, 0x21, 0x00, 0x53, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x06, 0x00, 0x00, 0x00, 0x20, 0x00, 0x21, 0x61, 0x08, 0xD4, 0x00, 0x00, 0xFF, 0xA1, 0x18, 0xFA, 0x67, 0xBC, 0xFF, 0xEA, 0xF5, 0xFE, 0xAA, 0xF5, 0xFF, 0xEA, 0xFD, 0xFF, 0xCA, 0xF5, 0xFF, 0x47, 0xB4, 0xFF, 0x83, 0x39, 0xFF, 0x00, 0x00, 0xFF, 0x00, 0x00, 0xFF, 0xC7, 0x31, 0xFF, 0x10, 0x7C, 0xFF, 0xD7, 0xAD, 0xFF, 0xFC, 0xD6, 0xFF, 0x7E, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x7E, 0xE7, 0xFF, 0x1D, 0xDF, 0xFF, 0x39, 0xBE, 0xFF, 0xD3, 0x94, 0xFF, 0x11, 0x7C, 0xFF, 0x55, 0x9D, 0xFF, 0x9F, 0xE7, 0xFF, 0xFF, 0xF7, 0xFF, 0x7E, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x7F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0xFF, 0xF7, 0xFF, 0x1D, 0xD7, 0xFF, 0x97, 0xAD, 0xFF, 0x15, 0x9D, 0xFC, 0x35, 0x9D, 0xFB, 0xF8, 0xB5, 0xFD, 0xDC, 0xD6, 0xFD, 0x5E, 0xDF, 0xFE, 0x5E, 0xE7, 0xFD, 0x7E, 0xE7, 0xFD, 0xDC, 0xCE, 0xFE, 0x97, 0xAD, 0xFC, 0xF0, 0x73, 0xFA, 0xA7, 0x31, 0xFA, 0x41, 0x00, 0xFF, 0x20, 0x00, 0xFF, 0x41, 0x00, 0xBB, 0x21, 0x00, 0x48, 0x00, 0x00, 0x03, 0x00, 0x00, 0x04, 0x00, 0x00, 0x09, 0x00, 0x00, 0x04, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x03, 0x00, 0x00, 0x03, 0x00, 0x00, 0x03, 0x00, 0x00, 0x03, 0x00, 0x00, 0x03, 0x00, 0x00, 0x03, 0x00, 0x00, 0x03, 0x00, 0x00, 0x03, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x06, 0x00, 0x00, 0x00, 0x41, 0x08, 0x1A, 0x41, 0x08, 0xBA, 0x00, 0x00, 0xFE, 0xA1, 0x10, 0xFD, 0x25, 0x83, 0xFF, 0x49, 0xDD, 0xFF, 0x2A, 0xFE, 0xFF, 0x0A, 0xFE, 0xFD, 0x88, 0xBC, 0xFD, 0x44, 0x5A, 0xFF, 0x61, 0x08, 0xFF, 0x20, 0x00, 0xFF, 0x45, 0x29, 0xFF, 0xD3, 0x94, 0xFF, 0x5E, 0xDF, 0xFF, 0xFF, 0xF7, 0xFF, 0xDF, 0xEF, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0xBF, 0xEF, 0xFF, 0xDF, 0xEF, 0xFF, 0xFF, 0xF7, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xF7, 0xFF, 0x9F, 0xE7, 0xFF, 0x7F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0xBF, 0xEF, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0xBF, 0xEF, 0xFF, 0xFF, 0xF7, 0xFF, 0xFF, 0xF7, 0xFF, 0xFF, 0xF7, 0xFF, 0xDF, 0xEF, 0xFF, 0xBF, 0xEF, 0xFF, 0xBF, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0xBF, 0xEF, 0xFF, 0xFF, 0xF7, 0xFF, 0x5E, 0xDF, 0xFF, 0xB3, 0x8C, 0xFD, 0xA6, 0x31, 0xFD, 0x20, 0x00, 0xFC, 0x00, 0x00, 0xFE, 0x41, 0x08, 0xB7, 0x61, 0x08, 0x20, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0x61, 0x08, 0x13, 0x41, 0x08, 0x91, 0x00, 0x00, 0xEA, 0x61, 0x08, 0xFF, 0x04, 0x52, 0xFF, 0xA8, 0xC4, 0xFF, 0x0A, 0xFE, 0xFE, 0x29, 0xDD, 0xF1, 0xA5, 0x6A, 0xF5, 0x81, 0x10, 0xFF, 0x00, 0x00, 0xFF, 0x86, 0x29, 0xFF, 0x72, 0x84, 0xFF, 0x1D, 0xD7, 0xFF, 0xFF, 0xF7, 0xFF, 0xBF, 0xEF, 0xFF, 0xBF, 0xEF, 0xFF, 0xBF, 0xEF, 0xFF, 0xBF, 0xEF, 0xFF, 0xBF, 0xEF, 0xFF, 0xBF, 0xEF, 0xFF, 0xBF, 0xEF, 0xFF, 0xDF, 0xEF, 0xFF, 0xFF, 0xF7, 0xFF, 0xDF, 0xEF, 0xFF, 0xBF, 0xEF, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0xBF, 0xEF, 0xFF, 0xDF, 0xEF, 0xFF, 0xDF, 0xEF, 0xFF, 0xDF, 0xEF, 0xFF, 0xDF, 0xEF, 0xFF, 0xBF, 0xEF, 0xFF, 0xBF, 0xEF, 0xFF, 0xBF, 0xEF, 0xFF, 0xBF, 0xEF, 0xFF, 0xBF, 0xEF, 0xFF, 0xDF, 0xEF, 0xFF, 0xBF, 0xEF, 0xFF, 0x3E, 0xDF, 0xFF, 0xB3, 0x8C, 0xFE, 0xA2, 0x10, 0xFC, 0x00, 0x00, 0xFF, 0x61, 0x08, 0xE9, 0x61, 0x08, 0x65, 0x00, 0x18, 0x08, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x04, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x02, 0x00, 0x00, 0x04, 0x00, 0x00, 0x05, 0x00, 0x00, 0x03, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0xE3, 0x18, 0x08, 0x21, 0x08, 0x4E, 0x00, 0x00, 0xC1, 0x41, 0x00, 0xFF, 0xC2, 0x20, 0xFF, 0x44, 0x5A, 0xF6, 0x06, 0x7B, 0xF4, 0x24, 0x5A, 0xF4, 0xA1, 0x18, 0xF9, 0x00, 0x00, 0xFF, 0x00, 0x00, 0xFF, 0x4D, 0x63, 0xFF, 0x1C, 0xDF, 0xFF, 0xFF, 0xF7, 0xFF, 0xBF, 0xEF, 0xFF, 0x7E, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x7E, 0xE7, 0xFF, 0x7E, 0xE7, 0xFF, 0x7F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x7F, 0xE7, 0xFF, 0x7F, 0xE7, 0xFF, 0x7F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x7F, 0xE7, 0xFF, 0xFF, 0xFF, 0xFF, 0xBB, 0xCE, 0xFE, 0x49, 0x42, 0xFC, 0x41, 0x08, 0xFD, 0x00, 0x00, 0xFB, 0x20, 0x00, 0xC8, 0x82, 0x08, 0x92, 0x82, 0x08, 0x6E, 0x61, 0x08, 0x3F, 0x00, 0x00, 0x0B, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x18, 0x0A, 0x21, 0x00, 0x90, 0x21, 0x00, 0xFF, 0x20, 0x00, 0xFF, 0x00, 0x00, 0xF0, 0x00, 0x00, 0xF1, 0x00, 0x00, 0xFE, 0x41, 0x00, 0xFF, 0xA2, 0x10, 0xFF, 0xC7, 0x31, 0xFF, 0x56, 0xA5, 0xFF, 0xFF, 0xF7, 0xFF, 0xDF, 0xEF, 0xFF, 0x7E, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0xDF, 0xEF, 0xFF, 0x5E, 0xDF, 0xFF, 0xF4, 0x94, 0xFF, 0xE7, 0x39, 0xFF, 0x20, 0x00, 0xFE, 0x00, 0x00, 0xFF, 0x20, 0x00, 0xFF, 0x00, 0x00, 0xFA, 0x20, 0x00, 0xAF, 0x41, 0x00, 0x5B, 0x01, 0x00, 0x1C, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x03, 0x00, 0x00, 0x05, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x40, 0x00, 0x7A, 0x41, 0x00, 0xFF, 0x41, 0x00, 0xFF, 0x00, 0x00, 0xF9, 0x00, 0x00, 0xFD, 0x82, 0x08, 0xFF, 0xC7, 0x31, 0xFF, 0xAF, 0x6B, 0xFF, 0xF8, 0xB5, 0xFF, 0x7E, 0xE7, 0xFF, 0xBF, 0xEF, 0xFF, 0xBF, 0xEF, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0xBF, 0xEF, 0xFF, 0x3D, 0xDF, 0xFF, 0x93, 0x8C, 0xFF, 0xA7, 0x31, 0xFF, 0xA2, 0x10, 0xFF, 0x00, 0x00, 0xFF, 0x00, 0x00, 0xFF, 0x41, 0x00, 0xF7, 0x61, 0x08, 0xE6, 0x20, 0x00, 0x97, 0x01, 0x00, 0x14, 0x00, 0x00, 0x00, 0x00, 0x00, 0x05, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x04, 0x00, 0x00, 0x05, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x08, 0x12, 0x20, 0x00, 0x44, 0x21, 0x00, 0x52, 0x21, 0x00, 0x2B, 0x00, 0x00, 0x09, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0x00, 0x00, 0x02, 0x00, 0x00, 0x03, 0x00, 0x00, 0x03, 0x20, 0x00, 0x36, 0x41, 0x08, 0xAC, 0x20, 0x00, 0xFF, 0x00, 0x00, 0xFF, 0x04, 0x19, 0xFD, 0x0C, 0x5B, 0xFF, 0x92, 0x8C, 0xFF, 0x76, 0xA5, 0xFF, 0x7A, 0xC6, 0xFF, 0xDF, 0xEF, 0xFF, 0xFF, 0xF7, 0xFF, 0x7F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0xBF, 0xEF, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0xBF, 0xEF, 0xFF, 0xDF, 0xEF, 0xFF, 0xDC, 0xCE, 0xFF, 0x56, 0xA5, 0xFF, 0xB3, 0x8C, 0xFC, 0xCF, 0x73, 0xF9, 0x08, 0x3A, 0xFC, 0x00, 0x00, 0xFF, 0x00, 0x00, 0xFF, 0x41, 0x08, 0xEC, 0x41, 0x00, 0x89, 0x20, 0x00, 0x27, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x0B, 0x41, 0x00, 0x18, 0x21, 0x00, 0x35, 0x20, 0x00, 0x69, 0x41, 0x00, 0xBE, 0x21, 0x00, 0xD6, 0x41, 0x00, 0x7C, 0x20, 0x00, 0x20, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x01, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0x01, 0x00, 0x19, 0x41, 0x00, 0x9B, 0x20, 0x00, 0xED, 0x00, 0x00, 0xFE, 0xC3, 0x18, 0xFF, 0x8E, 0x6B, 0xFD, 0x9B, 0xCE, 0xFF, 0xFF, 0xF7, 0xFF, 0xFF, 0xF7, 0xFF, 0xBF, 0xEF, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0xBF, 0xEF, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0xBF, 0xEF, 0xFF, 0xFF, 0xF7, 0xFF, 0xFF, 0xF7, 0xFF, 0x9F, 0xE7, 0xFF, 0x56, 0xA5, 0xFE, 0x08, 0x3A, 0xFC, 0x41, 0x08, 0xFA, 0x20, 0x00, 0xFF, 0x20, 0x00, 0xF8, 0x41, 0x00, 0x74, 0x00, 0x00, 0x07, 0x00, 0x00, 0x01, 0x00, 0x00, 0x05, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x08, 0x16, 0x20, 0x00, 0x5F, 0x20, 0x00, 0xA8, 0x20, 0x00, 0xD4, 0x20, 0x00, 0xE5, 0x21, 0x00, 0xFD, 0x21, 0x00, 0xFE, 0x20, 0x00, 0xA3, 0x41, 0x00, 0x34, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x05, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x06, 0x41, 0x00, 0x4F, 0x61, 0x08, 0xE0, 0x00, 0x00, 0xFF, 0x82, 0x10, 0xFA, 0x31, 0x7C, 0xFE, 0xDC, 0xCE, 0xFF, 0xBF, 0xEF, 0xFF, 0xFF, 0xF7, 0xFF, 0xDF, 0xEF, 0xFF, 0xBF, 0xEF, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0xBF, 0xEF, 0xFF, 0xDF, 0xEF, 0xFF, 0xDF, 0xEF, 0xFF, 0xDF, 0xEF, 0xFF, 0x7E, 0xE7, 0xFF, 0x19, 0xBE, 0xFF, 0xAB, 0x52, 0xFC, 0x00, 0x00, 0xFF, 0x00, 0x00, 0xFF, 0x41, 0x08, 0xB7, 0x21, 0x00, 0x43, 0x00, 0x00, 0x07, 0x00, 0x00, 0x01, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x0F, 0x20, 0x00, 0x48, 0x20, 0x00, 0x75, 0x20, 0x00, 0x96, 0x20, 0x00, 0xCD, 0x21, 0x00, 0xFF, 0x41, 0x00, 0xFF, 0x41, 0x00, 0xFF, 0x20, 0x00, 0xEA, 0x20, 0x00, 0xAA, 0x41, 0x00, 0x5F, 0x41, 0x00, 0x1C, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x05, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x61, 0x00, 0x24, 0x20, 0x00, 0x8B, 0x41, 0x00, 0xF8, 0x41, 0x08, 0xFF, 0x28, 0x42, 0xFB, 0x7A, 0xC6, 0xFE, 0xFF, 0xFF, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x7E, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x7F, 0xE7, 0xFF, 0x7E, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0xFF, 0xF7, 0xFF, 0xFF, 0xF7, 0xFF, 0x56, 0x9D, 0xFC, 0xC7, 0x31, 0xFD, 0x61, 0x08, 0xFC, 0x20, 0x00, 0xEA, 0x41, 0x00, 0x91, 0x00, 0x00, 0x10, 0x00, 0x00, 0x00, 0x00, 0x00, 0x05, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x17, 0x21, 0x00, 0x61, 0x20, 0x00, 0xC6, 0x21, 0x00, 0xFF, 0x41, 0x00, 0xFF, 0x21, 0x00, 0xFF, 0x20, 0x00, 0xF0, 0x20, 0x00, 0xE2, 0x20, 0x00, 0xC8, 0x20, 0x00, 0x85, 0x20, 0x00, 0x35, 0x03, 0x00, 0x08, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x82, 0x08, 0x4F, 0x00, 0x00, 0xC6, 0x00, 0x00, 0xF9, 0x65, 0x29, 0xFE, 0x72, 0x84, 0xFE, 0x5E, 0xDF, 0xFF, 0xFF, 0xF7, 0xFF, 0x7E, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x1D, 0xDF, 0xFE, 0xB3, 0x8C, 0xFF, 0xC3, 0x10, 0xFB, 0x00, 0x00, 0xFF, 0x61, 0x08, 0xCB, 0x20, 0x00, 0x20, 0x00, 0x00, 0x00, 0x00, 0x00, 0x06, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x21, 0x00, 0x52, 0x21, 0x00, 0xCD, 0x21, 0x00, 0xFE, 0x21, 0x00, 0xFF, 0x41, 0x00, 0xFF, 0x21, 0x00, 0xDC, 0x40, 0x00, 0x92, 0x41, 0x00, 0x4F, 0x20, 0x00, 0x21, 0x61, 0x00, 0x11, 0x00, 0x00, 0x05, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x06, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x81, 0x08, 0x71, 0x00, 0x00, 0xF9, 0x00, 0x00, 0xFF, 0xCB, 0x52, 0xFC, 0x9B, 0xC6, 0xFF, 0xBF, 0xEF, 0xFF, 0xBF, 0xEF, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x7F, 0xE7, 0xFF, 0xFF, 0xFF, 0xFF, 0x7A, 0xC6, 0xFE, 0x04, 0x19, 0xF9, 0x00, 0x00, 0xFF, 0x61, 0x08, 0xE3, 0x61, 0x08, 0x39, 0x00, 0x00, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x20, 0x00, 0x48, 0x21, 0x00, 0xB4, 0x21, 0x00, 0xD4, 0x21, 0x00, 0xB1, 0x20, 0x00, 0x81, 0x21, 0x00, 0x56, 0x40, 0x00, 0x2B, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x06, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x82, 0x10, 0x7E, 0x00, 0x00, 0xFF, 0x00, 0x00, 0xFF, 0xCF, 0x73, 0xFA, 0xBF, 0xEF, 0xFF, 0xDF, 0xEF, 0xFF, 0x7F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x7E, 0xE7, 0xFF, 0xFF, 0xFF, 0xFF, 0x1D, 0xD7, 0xFE, 0x08, 0x3A, 0xF9, 0x41, 0x00, 0xFE, 0x41, 0x00, 0xE8, 0x20, 0x00, 0x51, 0x86, 0x01, 0x05, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x61, 0x08, 0x15, 0x20, 0x00, 0x47, 0x20, 0x00, 0x67, 0x41, 0x08, 0x3E, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x05, 0x00, 0x00, 0x04, 0x00, 0x00, 0x02, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x06, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x82, 0x08, 0x81, 0x00, 0x00, 0xFE, 0x00, 0x00, 0xFF, 0x10, 0x7C, 0xF9, 0xFF, 0xFF, 0xFF, 0xFF, 0xF7, 0xFF, 0x7E, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x7E, 0xE7, 0xFF, 0xFF, 0xF7, 0xFF, 0xFC, 0xD6, 0xFE, 0x2D, 0x5B, 0xFA, 0x82, 0x10, 0xFF, 0x20, 0x00, 0xE9, 0x00, 0x00, 0x61, 0x45, 0x11, 0x0C, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x07, 0x00, 0x00, 0x0C, 0x00, 0x00, 0x05, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x06, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x82, 0x08, 0x81, 0x00, 0x00, 0xFF, 0x00, 0x00, 0xFF, 0xCF, 0x73, 0xF8, 0xFF, 0xF7, 0xFF, 0xDF, 0xEF, 0xFF, 0x7E, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x7E, 0xE7, 0xFF, 0xFF, 0xF7, 0xFF, 0xFC, 0xD6, 0xFE, 0x2D, 0x5B, 0xFA, 0x82, 0x10, 0xFF, 0x20, 0x00, 0xE9, 0x00, 0x00, 0x61, 0x45, 0x11, 0x0C, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x05, 0x00, 0x00, 0x03, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x06, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x82, 0x08, 0x75, 0x00, 0x00, 0xF8, 0x00, 0x00, 0xFF, 0x4D, 0x63, 0xFC, 0x3D, 0xDF, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x7E, 0xE7, 0xFF, 0xFF, 0xFF, 0xFF, 0xDC, 0xCE, 0xFE, 0x08, 0x3A, 0xF9, 0x41, 0x00, 0xFD, 0x41, 0x00, 0xE7, 0x20, 0x00, 0x51, 0x86, 0x01, 0x05, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x02, 0x00, 0x00, 0x03, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x05, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x82, 0x08, 0x5B, 0x00, 0x00, 0xDF, 0x00, 0x00, 0xFE, 0x29, 0x42, 0xFF, 0x76, 0xA5, 0xFE, 0x9F, 0xE7, 0xFF, 0xDF, 0xF7, 0xFF, 0x7F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0xFF, 0xF7, 0xFF, 0xF8, 0xB5, 0xFE, 0xE3, 0x18, 0xF9, 0x00, 0x00, 0xFF, 0x61, 0x08, 0xE3, 0x61, 0x08, 0x39, 0x00, 0x00, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x82, 0x08, 0x3B, 0x20, 0x00, 0xAB, 0x21, 0x00, 0xF4, 0x82, 0x08, 0xFD, 0x0C, 0x5B, 0xFC, 0x5E, 0xDF, 0xFF, 0xFF, 0xFF, 0xFF, 0x5E, 0xDF, 0xFF, 0x7F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x7F, 0xE7, 0xFF, 0xBF, 0xE7, 0xFF, 0xBF, 0xEF, 0xFF, 0xDC, 0xD6, 0xFE, 0x31, 0x7C, 0xFF, 0xA2, 0x10, 0xFA, 0x00, 0x00, 0xFF, 0x41, 0x08, 0xCC, 0x20, 0x00, 0x20, 0x00, 0x00, 0x00, 0x00, 0x00, 0x06, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x61, 0x08, 0x14, 0x21, 0x00, 0x61, 0x41, 0x00, 0xF2, 0x00, 0x00, 0xFF, 0x24, 0x21, 0xF8, 0xD3, 0x94, 0xFE, 0x5D, 0xE7, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xF7, 0xFF, 0x7E, 0xE7, 0xFF, 0x7E, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x7E, 0xE7, 0xFF, 0x7E, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0xFF, 0xF7, 0xFF, 0xFF, 0xF7, 0xFF, 0x35, 0x9D, 0xFC, 0xA6, 0x31, 0xFD, 0x41, 0x08, 0xFE, 0x20, 0x00, 0xE5, 0x41, 0x00, 0x88, 0x00, 0x00, 0x0E, 0x00, 0x00, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0x20, 0x00, 0x21, 0x41, 0x00, 0xBE, 0x00, 0x00, 0xFA, 0x41, 0x00, 0xFF, 0xA7, 0x31, 0xFF, 0xD3, 0x94, 0xFE, 0x5D, 0xDF, 0xFF, 0x9F, 0xE7, 0xFF, 0xBF, 0xEF, 0xFF, 0xFF, 0xF7, 0xFF, 0xDF, 0xEF, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0xBF, 0xEF, 0xFF, 0xBF, 0xEF, 0xFF, 0xDF, 0xEF, 0xFF, 0xDF, 0xEF, 0xFF, 0xBF, 0xEF, 0xFF, 0x5E, 0xDF, 0xFF, 0x19, 0xBE, 0xFE, 0xCB, 0x52, 0xFB, 0x00, 0x00, 0xFF, 0x00, 0x00, 0xFF, 0x41, 0x08, 0xAB, 0x41, 0x00, 0x35, 0x00, 0x00, 0x04, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x05, 0x21, 0x08, 0x4F, 0x21, 0x00, 0xC5, 0x20, 0x00, 0xFF, 0x41, 0x08, 0xFC, 0x25, 0x21, 0xF7, 0x0C, 0x5B, 0xFD, 0x76, 0xA5, 0xFE, 0x7E, 0xE7, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xEF, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0xDF, 0xEF, 0xFF, 0xFF, 0xF7, 0xFF, 0xFF, 0xF7, 0xFF, 0xDC, 0xCE, 0xFF, 0x92, 0x8C, 0xFE, 0xE7, 0x39, 0xFA, 0x61, 0x08, 0xFA, 0x20, 0x00, 0xFF, 0x20, 0x00, 0xEA, 0x41, 0x00, 0x69, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0x00, 0x00, 0x05, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x10, 0x0C, 0x41, 0x08, 0x63, 0x21, 0x00, 0xCA, 0x20, 0x00, 0xFF, 0x00, 0x00, 0xFF, 0x82, 0x08, 0xFF, 0x29, 0x42, 0xFE, 0x4D, 0x63, 0xFD, 0x51, 0x84, 0xFF, 0x5A, 0xBE, 0xFF, 0x7E, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0xBF, 0xEF, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x7E, 0xE7, 0xFF, 0x59, 0xBE, 0xFF, 0xD3, 0x94, 0xFE, 0xD0, 0x73, 0xFB, 0xEC, 0x5A, 0xF8, 0x86, 0x29, 0xFF, 0x00, 0x00, 0xFF, 0x00, 0x00, 0xFF, 0x41, 0x08, 0xE3, 0x41, 0x00, 0x7E, 0x20, 0x00, 0x22, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x12, 0x41, 0x08, 0x5F, 0x41, 0x00, 0xC1, 0x41, 0x08, 0xEB, 0x20, 0x00, 0xF7, 0x00, 0x00, 0xFF, 0x00, 0x00, 0xFF, 0x00, 0x00, 0xFF, 0x2D, 0x63, 0xFF, 0x7A, 0xC6, 0xFF, 0xDF, 0xEF, 0xFF, 0xBF, 0xEF, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0xBF, 0xEF, 0xFF, 0x9F, 0xE7, 0xFF, 0x5A, 0xBE, 0xFF, 0x8E, 0x6B, 0xFF, 0xC3, 0x18, 0xFF, 0x00, 0x00, 0xFF, 0x00, 0x00, 0xFF, 0x00, 0x00, 0xFF, 0x41, 0x00, 0xF2, 0x41, 0x08, 0xD8, 0x20, 0x00, 0x88, 0x01, 0x00, 0x13, 0x00, 0x00, 0x00, 0x00, 0x00, 0x05, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x0A, 0x21, 0x00, 0x21, 0x20, 0x00, 0x66, 0x20, 0x00, 0xBB, 0x00, 0x00, 0xED, 0x00, 0x00, 0xFF, 0x00, 0x00, 0xFC, 0x82, 0x08, 0xFF, 0x72, 0x84, 0xFE, 0xFF, 0xF7, 0xFF, 0xBF, 0xEF, 0xFF, 0x7E, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x7E, 0xE7, 0xFF, 0xFF, 0xF7, 0xFF, 0x3D, 0xDF, 0xFF, 0xF0, 0x73, 0xFF, 0x24, 0x21, 0xFD, 0x00, 0x00, 0xFE, 0x00, 0x00, 0xFF, 0x00, 0x00, 0xFF, 0x00, 0x00, 0xE7, 0x20, 0x00, 0x92, 0x20, 0x00, 0x40, 0x00, 0x00, 0x12, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x61, 0x00, 0x13, 0x61, 0x08, 0x47, 0x61, 0x08, 0x67, 0xA2, 0x10, 0xB9, 0x20, 0x00, 0xFF, 0x00, 0x00, 0xFD, 0x69, 0x42, 0xFB, 0x39, 0xBE, 0xFF, 0xFF, 0xF7, 0xFF, 0xFF, 0xF7, 0xFF, 0x7E, 0xE7, 0xFF, 0x7E, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x7F, 0xE7, 0xFF, 0x7E, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x7E, 0xE7, 0xFF, 0x7E, 0xE7, 0xFF, 0x7E, 0xE7, 0xFF, 0x7F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x7E, 0xE7, 0xFF, 0x7F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0xFF, 0xFF, 0xFF, 0x7A, 0xC6, 0xFE, 0xC7, 0x39, 0xFB, 0x00, 0x00, 0xFF, 0x41, 0x00, 0xFC, 0x62, 0x08, 0xAD, 0xA2, 0x10, 0x7E, 0x61, 0x08, 0x63, 0x41, 0x00, 0x2C, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x03, 0x00, 0x00, 0x05, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x41, 0x08, 0x57, 0x20, 0x00, 0xE7, 0x41, 0x00, 0xFF, 0xC3, 0x10, 0xFF, 0x0C, 0x5B, 0xFD, 0x9B, 0xC6, 0xFF, 0xFF, 0xF7, 0xFF, 0xBF, 0xEF, 0xFF, 0xDF, 0xEF, 0xFF, 0xBF, 0xEF, 0xFF, 0xBF, 0xEF, 0xFF, 0xBF, 0xEF, 0xFF, 0xDF, 0xEF, 0xFF, 0xDF, 0xEF, 0xFF, 0xDF, 0xEF, 0xFF, 0xDF, 0xEF, 0xFF, 0xDF, 0xEF, 0xFF, 0xBF, 0xEF, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0xBF, 0xEF, 0xFF, 0xDF, 0xEF, 0xFF, 0xFF, 0xF7, 0xFF, 0xDF, 0xEF, 0xFF, 0xDF, 0xEF, 0xFF, 0xBF, 0xEF, 0xFF, 0xBF, 0xEF, 0xFF, 0xBF, 0xEF, 0xFF, 0xBF, 0xEF, 0xFF, 0xDF, 0xEF, 0xFF, 0xFF, 0xF7, 0xFF, 0xBF, 0xEF, 0xFF, 0xDC, 0xCE, 0xFE, 0x31, 0x7C, 0xFE, 0xA2, 0x10, 0xFB, 0x00, 0x00, 0xFE, 0x61, 0x08, 0xDA, 0x41, 0x08, 0x38, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x04, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x08, 0x1D, 0x21, 0x00, 0x86, 0x41, 0x00, 0xFA, 0x00, 0x00, 0xFF, 0xA3, 0x10, 0xF7, 0x0C, 0x5B, 0xFD, 0x19, 0xBE, 0xFF, 0xFF, 0xF7, 0xFF, 0xFF, 0xF7, 0xFF, 0xDF, 0xEF, 0xFF, 0xDF, 0xEF, 0xFF, 0xDF, 0xEF, 0xFF, 0xFF, 0xF7, 0xFF, 0xFF, 0xF7, 0xFF, 0x7E, 0xE7, 0xFF, 0x7E, 0xE7, 0xFF, 0xBF, 0xEF, 0xFF, 0xBF, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0xBF, 0xEF, 0xFF, 0x9F, 0xE7, 0xFF, 0x7F, 0xE7, 0xFF, 0xDF, 0xEF, 0xFF, 0xFF, 0xF7, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xF7, 0xFF, 0xFF, 0xF7, 0xFF, 0xDF, 0xEF, 0xFF, 0xBF, 0xEF, 0xFF, 0x9F, 0xE7, 0xFF, 0xBF, 0xEF, 0xFF, 0xFF, 0xF7, 0xFF, 0xFF, 0xF7, 0xFF, 0x1D, 0xD7, 0xFF, 0xD0, 0x73, 0xFB, 0xC3, 0x10, 0xFB, 0x00, 0x00, 0xFB, 0x21, 0x00, 0xE2, 0x41, 0x00, 0x8B, 0x00, 0x00, 0x10, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x04, 0x00, 0x00, 0x06, 0x00, 0x00, 0x04, 0x21, 0x08, 0x2B, 0x41, 0x08, 0x9F, 0x00, 0x00, 0xEF, 0x00, 0x00, 0xFF, 0xC3, 0x10, 0xFF, 0x8A, 0x4A, 0xF7, 0x72, 0x84, 0xFB, 0x96, 0xA5, 0xFC, 0x19, 0xB6, 0xFC, 0x5A, 0xBE, 0xFC, 0x5A, 0xC6, 0xFC, 0xB7, 0xAD, 0xFC, 0x92, 0x8C, 0xFB, 0x8E, 0x6B, 0xF9, 0x4D, 0x63, 0xFB, 0x72, 0x84, 0xFE, 0x1D, 0xD7, 0xFF, 0xFF, 0xF7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x7E, 0xE7, 0xFF, 0xBF, 0xEF, 0xFF, 0xFF, 0xF7, 0xFF, 0x9B, 0xC6, 0xFF, 0x52, 0x84, 0xFE, 0xF0, 0x73, 0xFB, 0x72, 0x84, 0xFB, 0x56, 0xA5, 0xFC, 0x59, 0xBE, 0xFD, 0x1D, 0xDF, 0xFD, 0x5E, 0xDF, 0xFD, 0xBB, 0xCE, 0xFD, 0xD8, 0xB5, 0xFD, 0xD4, 0x94, 0xFB, 0x4D, 0x63, 0xF9, 0x04, 0x21, 0xFD, 0x00, 0x00, 0xFF, 0x20, 0x00, 0xFF, 0x41, 0x08, 0xA9, 0x21, 0x00, 0x2D, 0x00, 0x00, 0x04, 0x00, 0x00, 0x08, 0x00, 0x00, 0x07, 0x00, 0x00, 0x03, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x20, 0x00, 0x31, 0x41, 0x08, 0x9F, 0x41, 0x00, 0xED, 0x20, 0x00, 0xFF, 0x00, 0x00, 0xFF, 0x61, 0x08, 0xFF, 0xE8, 0x39, 0xFF, 0xEC, 0x52, 0xFF, 0x2D, 0x63, 0xFF, 0x4D, 0x63, 0xFF, 0x29, 0x42, 0xFF, 0x82, 0x10, 0xFF, 0x00, 0x00, 0xFF, 0x00, 0x00, 0xFF, 0xC3, 0x10, 0xFF, 0x93, 0x8C, 0xFF, 0x1D, 0xDF, 0xFF, 0xBF, 0xEF, 0xFF, 0xDF, 0xEF, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0xBF, 0xEF, 0xFF, 0xBF, 0xEF, 0xFF, 0xDF, 0xEF, 0xFF, 0x1D, 0xD7, 0xFF, 0xAF, 0x73, 0xFF, 0x41, 0x00, 0xFF, 0x00, 0x00, 0xFF, 0x41, 0x00, 0xFF, 0xC7, 0x31, 0xFF, 0x2D, 0x63, 0xFF, 0x92, 0x8C, 0xFF, 0xF4, 0x94, 0xFF, 0xF0, 0x73, 0xFF, 0x8A, 0x4A, 0xFF, 0x04, 0x19, 0xFF, 0x00, 0x00, 0xFF, 0x00, 0x00, 0xFF, 0x61, 0x08, 0xF2, 0x41, 0x00, 0xC7, 0x20, 0x00, 0x56, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x60, 0x00, 0x23, 0x41, 0x00, 0x75, 0x20, 0x00, 0xE1, 0x00, 0x00, 0xFF, 0x00, 0x00, 0xFF, 0x41, 0x08, 0xFF, 0x82, 0x08, 0xFF, 0x82, 0x10, 0xFF, 0x82, 0x10, 0xFF, 0x61, 0x08, 0xFF, 0x20, 0x00, 0xFF, 0x00, 0x00, 0xFF, 0x00, 0x00, 0xFF, 0x00, 0x00, 0xFC, 0xC3, 0x10, 0xFD, 0x31, 0x7C, 0xFF, 0x5E, 0xE7, 0xFF, 0xDF, 0xEF, 0xFF, 0x9F, 0xE7, 0xFF, 0x7E, 0xE7, 0xFF, 0x7E, 0xE7, 0xFF, 0x7F, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0x7F, 0xE7, 0xFF, 0x7E, 0xE7, 0xFF, 0x7E, 0xE7, 0xFF, 0x9F, 0xE7, 0xFF, 0xFF, 0xFF, 0xFF, 0x1D, 0xD7, 0xFF, 0x4D, 0x63, 0xFF, 0xC3, 0x10, 0xFC, 0x00, 0x00, 0xFD, 0x00, 0x00, 0xFF, 0x00, 0x00, 0xFF, 0x41, 0x08, 0xFF, 0x82, 0x10, 0xFF, 0xC3, 0x10, 0xFF, 0xC3, 0x18, 0xFF, 0xA3, 0x10, 0xFF, 0x61, 0x08, 0xFF, 0x20, 0x00, 0xFF, 0x00, 0x00, 0xFF, 0x00, 0x00, 0xED, 0x21, 0x00, 0x8F, 0x20, 0x00, 0x2A, 0x00, 0x00, 0x0A, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x41, 0x00, 0x19, 0x41, 0x08, 0x5F, 0x62, 0x08, 0x8F, 0x41, 0x00, 0xAE, 0x00, 0x00, 0xCA, 0x00, 0x00, 0xD0, 0x00, 0x00, 0xCD, 0x00, 0x00, 0xCE, 0x00, 0x00, 0xCB, 0x41, 0x00, 0xAF, 0x62, 0x08, 0x8F, 0x82, 0x08, 0xC2, 0x20, 0x00, 0xFF, 0x00, 0x00, 0xFF, 0x45, 0x21, 0xFA, 0x10, 0x7C, 0xFB, 0x19, 0xBE, 0xFE, 0x9F, 0xE7, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xF7, 0xFF, 0xFF, 0xF7, 0xFF, 0xFF, 0xF7, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0x5E, 0xDF, 0xFF, 0xF7, 0xB5, 0xFE, 0x8E, 0x6B, 0xFB, 0xA3, 0x10, 0xFA, 0x00, 0x00, 0xFF, 0x41, 0x08, 0xFF, 0x62, 0x08, 0xBC, 0x41, 0x08, 0xAC, 0x00, 0x00, 0xCC, 0x00, 0x00, 0xE6, 0x00, 0x00, 0xF3, 0x00, 0x00, 0xF4, 0x00, 0x00, 0xEE, 0x00, 0x00, 0xD9, 0x21, 0x00, 0xBB, 0x61, 0x08, 0x99, 0x61, 0x08, 0x6C, 0x20, 0x00, 0x2B, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x05, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x05, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x41, 0x00, 0x35, 0x61, 0x08, 0x60, 0x61, 0x08, 0x6A, 0x61, 0x08, 0x64, 0x61, 0x08, 0x66, 0x61, 0x08, 0x61, 0x41, 0x08, 0x36, 0x80, 0x31, 0x05, 0x40, 0x00, 0x52, 0x41, 0x00, 0xCC, 0x61, 0x08, 0xFC, 0x00, 0x00, 0xFF, 0x82, 0x08, 0xFF, 0xEC, 0x5A, 0xFF, 0x35, 0x9D, 0xFE, 0x9A, 0xC6, 0xFE, 0xFC, 0xD6, 0xFE, 0x3D, 0xD7, 0xFF, 0x3D, 0xDF, 0xFF, 0xFC, 0xD6, 0xFF, 0x1C, 0xD7, 0xFE, 0xBB, 0xCE, 0xFE, 0x15, 0x9D, 0xFE, 0x49, 0x42, 0xFF, 0x41, 0x00, 0xFF, 0x20, 0x00, 0xFF, 0x41, 0x08, 0xF5, 0x41, 0x00, 0xBE, 0x21, 0x00, 0x4A, 0x41, 0x08, 0x30, 0x41, 0x00, 0x64, 0x61, 0x08, 0x8A, 0x61, 0x08, 0x9F, 0x61, 0x08, 0xA1, 0x61, 0x08, 0x98, 0x61, 0x08, 0x7A, 0x41, 0x08, 0x49, 0x60, 0x08, 0x13, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x04, 0x00, 0x00, 0x04, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0xC3, 0x18, 0x0A, 0xA2, 0x10, 0x0C, 0xA2, 0x10, 0x0B, 0xA2, 0x10, 0x0C, 0xA2, 0x10, 0x0B, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x08, 0x21, 0x00, 0x43, 0x41, 0x00, 0xCB, 0x20, 0x00, 0xFF, 0x00, 0x00, 0xFF, 0x82, 0x08, 0xFE, 0x04, 0x19, 0xF9, 0xC7, 0x31, 0xFA, 0xAB, 0x52, 0xFA, 0xF0, 0x73, 0xFB, 0x31, 0x7C, 0xFC, 0x2D, 0x63, 0xFB, 0x6A, 0x4A, 0xFB, 0xE8, 0x39, 0xFA, 0xE4, 0x18, 0xF9, 0x41, 0x08, 0xFE, 0x00, 0x00, 0xFF, 0x20, 0x00, 0xFF, 0x21, 0x00, 0xA3, 0x21, 0x08, 0x36, 0x00, 0x00, 0x07, 0x00, 0x00, 0x02, 0x02, 0x00, 0x0C, 0x61, 0x08, 0x12, 0x41, 0x08, 0x16, 0x41, 0x08, 0x16, 0x61, 0x08, 0x14, 0x82, 0x00, 0x0F, 0x05, 0x00, 0x06, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x05, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x05, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x20, 0x00, 0x51, 0x61, 0x08, 0x93, 0x41, 0x00, 0xC8, 0x00, 0x00, 0xFF, 0x00, 0x00, 0xFF, 0x00, 0x00, 0xFF, 0x41, 0x08, 0xFF, 0x24, 0x21, 0xFF, 0x45, 0x21, 0xFF, 0xA3, 0x10, 0xFF, 0x20, 0x00, 0xFF, 0x00, 0x00, 0xFF, 0x00, 0x00, 0xFF, 0x00, 0x00, 0xF6, 0x41, 0x08, 0xC0, 0x41, 0x00, 0x87, 0x41, 0x00, 0x37, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x04, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x02, 0x00, 0x00, 0x03, 0x00, 0x00, 0x03, 0x00, 0x00, 0x03, 0x00, 0x00, 0x03, 0x00, 0x00, 0x03, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x05, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x0D, 0x41, 0x00, 0x5D, 0x41, 0x08, 0xB1, 0x41, 0x08, 0xDF, 0x41, 0x08, 0xE6, 0x21, 0x00, 0xE8, 0x00, 0x00, 0xEE, 0x00, 0x00, 0xF4, 0x20, 0x00, 0xF0, 0x41, 0x00, 0xEB, 0x41, 0x08, 0xE7, 0x41, 0x08, 0xD8, 0x61, 0x08, 0xA4, 0x41, 0x00, 0x51, 0x00, 0x00, 0x07, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x02, 0x00, 0x00, 0x02, 0x00, 0x00, 0x03, 0x00, 0x00, 0x04, 0x00, 0x00, 0x05, 0x00, 0x00, 0x05, 0x00, 0x00, 0x04, 0x00, 0x00, 0x04, 0x00, 0x00, 0x02, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0xC0, 0x00, 0x0A, 0x41, 0x08, 0x19, 0x21, 0x08, 0x37, 0x21, 0x00, 0x51, 0x00, 0x00, 0x58, 0x00, 0x00, 0x7F, 0x00, 0x00, 0x9D, 0x00, 0x00, 0x84, 0x20, 0x00, 0x6F, 0x41, 0x00, 0x54, 0x20, 0x00, 0x26, 0x41, 0x08, 0x17, 0x00, 0x00, 0x0A, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x04, 0x00, 0x00, 0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x0A, 0x50, 0x03, 0x49, 0x22, 0x07, 0xA2, 0x10, 0x20, 0xA2, 0x10, 0x33, 0xA2, 0x08, 0x23, 0xA2, 0x08, 0x16, 0x86, 0x31, 0x05, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x02, 0x00, 0x00, 0x03, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x03, 0x00, 0x00, 0x05, 0x00, 0x00, 0x04, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x05, 0x00, 0x00, 0x05, 0x00, 0x00, 0x02, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0x00, 0x00, 0x01, 0x00, 0x00, 0x02, 0x00, 0x00, 0x03, 0x00, 0x00, 0x03, 0x00, 0x00, 0x02, 0x00, 0x00, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-    0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 
-};
+// Pixel data is embedded from partly_cloudy_day.bin
+// Payload SHA-256: 1b38ac3d4823a7699e8b52fbcd38145818694b6f735fa935b9888fc6907c88fa
+__asm__(
+    ".section .rodata\n"
+    ".balign 4\n"
+    ".global partly_cloudy_day_data\n"
+    "partly_cloudy_day_data:\n"
+    ".incbin \"src/weather_icons/partly_cloudy_day.bin\"\n"
+    ".previous\n"
+);
+extern "C" const uint8_t partly_cloudy_day_data[];
 
 extern const lv_img_dsc_t partly_cloudy_day = {
     .header = {